@@ -7,9 +7,12 @@ import time
 import threading
 import logging
 from enum import Enum
-from typing import Dict, Any
+from typing import Dict, Any, List
 import json
 
+from .mission_journal import MissionJournal
+from ..navigation.live_coverage import LiveCoverageMap
+
 
 class RobotState(Enum):
     """Robot durumları"""
@@ -39,13 +42,33 @@ class MainController:
         # Konfigürasyon yükleme
         self.config = self._load_config(config_path)
 
+        # Görev kontrol noktası günlüğü (şarj/çökme sonrası devam için)
+        mission_config = self.config.get("mission", {})
+        self.mission_journal = MissionJournal(
+            path=mission_config.get("journal_path", "logs/mission_journal.jsonl"),
+            min_interval=mission_config.get("checkpoint_interval", 5.0),
+        )
+
+        # Bıçağın gerçekten geçtiği hücreler (odometriden canlı güncellenir)
+        self.coverage_map = LiveCoverageMap(
+            resolution=mission_config.get("coverage_resolution", 0.1)
+        )
+        self.coverage_path = mission_config.get(
+            "coverage_path", "logs/coverage_map.npz"
+        )
+        self.coverage_plan = None  # Haritanın ait olduğu (plan_id, plan_hash)
+
         # Diğer modüllerin referansları (lazy loading)
         self.odometry = None
+        self.measurement_queue = None  # Zaman damgalı sensör ölçümleri
+        self.pose_history = None  # Zaman damgalı poz geçmişi
         self.path_planner = None
+        self.planning_service = None  # Rota planlama process havuzu
         self.power_manager = None
         self.docking_controller = None
         self.motor_controller = None
         self.obstacle_avoidance = None  # YENİ: Engel kaçınma modülü
+        self.path_tracker = None  # Pure pursuit rota takipçisi
         self.sensor_manager = None  # YENİ: Sensör yönetimi
 
         # Navigation loop için
@@ -53,6 +76,10 @@ class MainController:
         self.navigation_running = False
         self.last_gps_update = 0
 
+        # Kontrol döngüsü periyodu (varsayılan 20Hz)
+        control_rate = self.config.get("navigation", {}).get("control_rate_hz", 20)
+        self.control_period = 1.0 / control_rate
+
         # İstatistikler
         self.stats = {
             "total_runtime": 0,
@@ -118,19 +145,56 @@ class MainController:
         """Diğer modülleri başlat"""
         try:
             from ..navigation.kalman_odometry import KalmanOdometry
+            from ..navigation.unicycle_ekf import UnicycleEKF
+            from ..navigation.measurement_queue import MeasurementQueue
+            from ..navigation.pose_history import PoseHistory
             from ..navigation.path_planner import PathPlanner
+            from ..navigation.planning_service import PlanningService
             from ..navigation.obstacle_avoidance import ObstacleAvoidance
+            from ..navigation.path_tracker import PurePursuitTracker
             from ..hardware.power_manager import PowerManager
             from ..navigation.docking_controller import DockingController
             from ..hardware.motor_controller import MotorController
 
-            self.odometry = KalmanOdometry(simulate=self.simulate)
+            nav_config = self.config.get("navigation", {})
+
+            # Odometri modeli: "unicycle_ekf" veya "kalman" (sabit hız modeli)
+            if nav_config.get("odometry_model", "kalman") == "unicycle_ekf":
+                self.odometry = UnicycleEKF(simulate=self.simulate)
+            else:
+                self.odometry = KalmanOdometry(simulate=self.simulate)
+            self.pose_history = PoseHistory()
+            self.measurement_queue = MeasurementQueue(
+                self.odometry,
+                replay_window=nav_config.get("measurement_replay_window", 0.5),
+                pose_history=self.pose_history,
+            )
             self.path_planner = PathPlanner()
             self.obstacle_avoidance = ObstacleAvoidance(simulate=self.simulate)
+            self.obstacle_avoidance.pose_history = self.pose_history
+
+            # Rota planlama kontrol döngüsünü bloklamasın (0: aynı process'te thread)
+            planning_workers = nav_config.get("planning_workers", 1)
+            if planning_workers > 0:
+                self.planning_service = PlanningService(
+                    max_workers=planning_workers,
+                    buffer_chunks=self.path_planner.stream_buffer_chunks,
+                )
+                self.path_planner.planning_service = self.planning_service
+            self.path_tracker = PurePursuitTracker(
+                max_linear=nav_config.get("max_speed", 1.0),
+                max_angular=nav_config.get("max_angular_speed", 1.0),
+            )
             self.power_manager = PowerManager(simulate=self.simulate)
             self.docking_controller = DockingController(simulate=self.simulate)
             self.motor_controller = MotorController(simulate=self.simulate)
 
+            # Enkoder ve IMU örnekleri okundukları zamanla kuyruğa yazılır
+            self.motor_controller.measurement_queue = self.measurement_queue
+            self.motor_controller.start_monitoring()
+            if self.sensor_manager:
+                self.sensor_manager.measurement_queue = self.measurement_queue
+
             # GPS koordinat sistemi kurulumu
             self._setup_gps_coordinate_system()
 
@@ -139,6 +203,10 @@ class MainController:
 
             self.logger.info("Tüm modüller başarıyla başlatıldı")
 
+            # Çökme veya şarj sonrası yarım kalan görev varsa devam et
+            if self.config.get("mission", {}).get("auto_resume", True):
+                self._resume_interrupted_mission(boot=True)
+
         except ImportError as e:
             self.logger.error(f"Modül yükleme hatası: {e}")
             self.state = RobotState.ERROR
@@ -159,8 +227,17 @@ class MainController:
 
     def stop(self):
         """Robotu durdur"""
+        # Temiz kapanışta biçilen görev açılışta kendiliğinden başlamasın
+        if self.state in (RobotState.MOWING, RobotState.PAUSED):
+            self._cancel_mission()
+            if self.motor_controller:
+                self.motor_controller.stop_blade()
         self.running = False
         self._stop_navigation_loop()
+        if self.motor_controller:
+            self.motor_controller.stop_monitoring()
+        if self.planning_service:
+            self.planning_service.shutdown()
         self.logger.info("Robot durduruluyor...")
 
     def emergency_stop(self):
@@ -176,6 +253,9 @@ class MainController:
         if self.motor_controller:
             self.motor_controller.stop_all()
 
+        # Acil durdurulan görev şarj veya açılış sonrası kendiliğinden sürmez
+        self._cancel_mission()
+
     def clear_emergency_stop(self):
         """Acil durdurma kaldır"""
         if self.emergency_stop_active:
@@ -185,6 +265,7 @@ class MainController:
 
     def _main_loop(self):
         """Ana kontrol döngüsü"""
+        next_tick = time.monotonic()
         while self.running:
             try:
                 if not self.emergency_stop_active:
@@ -197,12 +278,19 @@ class MainController:
                     pos = self.odometry.get_position_dict()
                     self.stats["current_position"] = pos
 
-                time.sleep(0.1)  # 10Hz kontrol döngüsü
+                # Sabit frekanslı kontrol döngüsü (geride kalınırsa yakala)
+                next_tick += self.control_period
+                delay = next_tick - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    next_tick = time.monotonic()
 
             except Exception as e:
                 self.logger.error(f"Ana döngü hatası: {e}")
                 self.state = RobotState.ERROR
                 time.sleep(1)
+                next_tick = time.monotonic()
 
     def _state_machine(self):
         """Durum makinesi - robot durumlarını yönet"""
@@ -245,6 +333,8 @@ class MainController:
         if self.power_manager:
             battery_level = self.power_manager.get_battery_level()
             if battery_level < self.config["battery"]["low_threshold"]:
+                self._suspend_mission()
+                self.motor_controller.stop_blade()
                 self.state = RobotState.RETURNING_TO_CHARGE
                 self.logger.info("Biçme sırasında batarya düştü, " "şarja dönülüyor")
                 return
@@ -253,16 +343,35 @@ class MainController:
         current_pos = self.odometry.get_position_dict()
         next_waypoint = self.path_planner.get_next_waypoint(current_pos)
 
+        # Rotanın devamı henüz planlanmadıysa yerinde bekle
+        if next_waypoint is None and self.path_planner.planning:
+            self.motor_controller.set_drive_speed(0.0, 0.0)
+            return
+
         if next_waypoint:
+            self._apply_blade_action()
+
+            # Kalan rotaya göre sürekli eğrilik komutu
+            if self.path_tracker:
+                command = self.path_tracker.compute_command(
+                    current_pos,
+                    self.path_planner.current_path,
+                    self.path_planner.current_waypoint_index,
+                    next_waypoint.speed,
+                )
+                planned_linear = command["linear"]
+                planned_angular = command["angular"]
+            else:
+                planned_linear = next_waypoint.speed
+                planned_angular = 0.0
+
             # YENİ: Engel kaçınma sistemi entegrasyonu
             if self.obstacle_avoidance:
                 # Sensör verilerini güncelle
                 ir_readings = self.obstacle_avoidance.get_real_ir_readings()
-                self.obstacle_avoidance.update_ir_sensors(ir_readings)
-
-                # Planned hareket komutunu al
-                planned_linear = 0.5  # Biçme hızı
-                planned_angular = 0.0  # Düz git
+                self.obstacle_avoidance.update_ir_sensors(
+                    ir_readings, timestamp=time.time()
+                )
 
                 # Engel kaçınma komutu al
                 safe_command = self.obstacle_avoidance.get_avoidance_command(
@@ -276,16 +385,145 @@ class MainController:
 
                 if self.obstacle_avoidance.avoidance_active:
                     self.logger.info("🚧 Engel kaçınma aktif!")
+            elif self.path_tracker:
+                self.motor_controller.set_drive_speed(planned_linear, planned_angular)
             else:
                 # Fallback: Normal hareket
                 self.motor_controller.move_to_waypoint(next_waypoint)
 
-            self.stats["mowing_time"] += 0.1
+            self.stats["mowing_time"] += self.control_period
+            self._checkpoint_mission()
+        elif self.path_planner.planning_error:
+            # Eksik planlanan rota tamamlanmış sayılmaz
+            self.motor_controller.stop_all()
+            self.state = RobotState.ERROR
+            self.logger.error(
+                f"Rota planlanamadı, görev durduruldu: "
+                f"{self.path_planner.planning_error}"
+            )
         else:
             # Görev tamamlandı
+            if self.path_planner.current_plan_id:
+                self.mission_journal.complete(
+                    self.path_planner.current_plan_id,
+                    self.path_planner.current_plan_hash,
+                    self.path_planner.current_waypoint_index,
+                )
+            self._save_coverage()
+            self.motor_controller.stop_blade()
             self.state = RobotState.IDLE
             self.logger.info("Biçme görevi tamamlandı")
 
+    def _apply_blade_action(self):
+        """
+        Bıçağı rotadaki blade_on/blade_off eylemlerine göre sür.
+
+        Öncesinde eylem olmayan segmentler (tek alan rotası) biçilir.
+        """
+        enabled = self.path_planner.blade_enabled() is not False
+        if enabled == self.motor_controller.blade_running:
+            return
+        if enabled:
+            self.motor_controller.start_blade()
+        else:
+            self.motor_controller.stop_blade()
+
+    def _checkpoint_mission(self, force: bool = False):
+        """Tamamlanan waypoint indeksini görev günlüğüne yaz"""
+        planner = self.path_planner
+        if planner and planner.current_plan_id:
+            written = self.mission_journal.record_progress(
+                planner.current_plan_id,
+                planner.current_plan_hash,
+                planner.current_waypoint_index,
+                force=force,
+            )
+            # Kapsama haritası kontrol noktasıyla aynı sıklıkta kaydedilir
+            if written or force:
+                self._save_coverage()
+
+    def _suspend_mission(self):
+        """Görevi şarj dönüşünde devam edilmek üzere bırak"""
+        planner = self.path_planner
+        if planner and planner.current_plan_id:
+            self.mission_journal.suspend(
+                planner.current_plan_id,
+                planner.current_plan_hash,
+                planner.current_waypoint_index,
+            )
+            self._save_coverage()
+
+    def _cancel_mission(self):
+        """Açık görevi iptal olarak kapat (şarj veya açılışta devam edilmez)"""
+        checkpoint = self.mission_journal.resumable_checkpoint(boot=True)
+        if not checkpoint:
+            return
+        index = checkpoint["index"]
+        planner = self.path_planner
+        if planner and planner.current_plan_id == checkpoint["area_id"]:
+            index = planner.current_waypoint_index
+        self.mission_journal.cancel(
+            checkpoint["area_id"], checkpoint["plan_hash"], index
+        )
+        self._save_coverage()
+        self.logger.info(f"Görev iptal edildi: {checkpoint['area_id']}")
+
+    def _update_coverage(self):
+        """Bıçak çalışırken odometri pozunu kapsama haritasına işle"""
+        if not self.odometry:
+            return
+        cutting = bool(getattr(self.motor_controller, "blade_running", False))
+        position = self.odometry.get_position_dict()
+        self.coverage_map.update(position["x"], position["y"], cutting)
+        self.stats["area_covered"] = self.coverage_map.covered_area
+
+    def _save_coverage(self):
+        """Kapsama haritasını ait olduğu planla birlikte diske yaz"""
+        if self.coverage_plan:
+            plan_id, plan_hash = self.coverage_plan
+            self.coverage_map.save(
+                self.coverage_path, plan_id=plan_id, plan_hash=plan_hash
+            )
+
+    def _prepare_coverage(self, resumed: bool):
+        """
+        Görev başında kapsama haritasını hazırla.
+
+        Devam eden görevde aynı planın haritası korunur veya diskten
+        yüklenir; yeni görevde harita temizlenir.
+        """
+        plan = (self.path_planner.current_plan_id, self.path_planner.current_plan_hash)
+        self.coverage_map.blade_width = self.path_planner.blade_width
+        if resumed and self.coverage_plan != plan:
+            metadata = self.coverage_map.load(self.coverage_path)
+            if (
+                metadata
+                and (metadata.get("plan_id"), metadata.get("plan_hash")) == plan
+            ):
+                self.coverage_plan = plan
+        if not resumed or self.coverage_plan != plan:
+            self.coverage_map.clear()
+            self.coverage_plan = plan
+        self.stats["area_covered"] = self.coverage_map.covered_area
+
+    def _resume_interrupted_mission(self, boot: bool = False) -> bool:
+        """
+        Şarj için bırakılan (açılışta ayrıca çökmeyle kesilen) görev varsa son
+        tamamlanan şeritten devam et. İptal edilen görevlere devam edilmez.
+        """
+        checkpoint = self.mission_journal.resumable_checkpoint(boot)
+        if not checkpoint:
+            return False
+
+        self.logger.info(
+            f"Yarım kalan görev bulundu: {checkpoint['area_id']} "
+            f"(waypoint {checkpoint['index']})"
+        )
+        area_ids = self.path_planner.mission_area_ids(checkpoint["area_id"])
+        if area_ids:
+            return self.start_mission(area_ids, resume=True)
+        return self.start_mowing_task(checkpoint["area_id"], resume=True)
+
     def _handle_returning_state(self):
         """Şarja dönme durumu"""
         if not self.docking_controller or not self.odometry:
@@ -323,6 +561,9 @@ class MainController:
             self.stats["charging_cycles"] += 1
             self.logger.info("Şarj tamamlandı")
 
+            # Şarj için yarıda kalan görev varsa devam et
+            self._resume_interrupted_mission()
+
     def _handle_manual_control_state(self):
         """Manuel kontrol durumu"""
         # Web arayüzünden gelen komutları işle
@@ -342,19 +583,100 @@ class MainController:
 
         time.sleep(0.5)
 
-    def start_mowing_task(self, area_id: str):
-        """Biçme görevini başlat"""
+    def stop_mowing_task(self):
+        """Görevi operatör isteğiyle durdur ve iptal et"""
+        self._cancel_mission()
+        self.state = RobotState.IDLE
+        if self.motor_controller:
+            self.motor_controller.stop_all()
+        self.logger.info("Biçme görevi durduruldu")
+
+    def start_mowing_task(self, area_id: str, resume: bool = True):
+        """Biçme görevini başlat (resume: günlükteki kontrol noktasından devam)"""
+        if self.state in [RobotState.IDLE, RobotState.MANUAL_CONTROL]:
+            if self.path_planner:
+                # Rota arka planda üretilirken ilk şeritten biçmeye başla
+                if not self.path_planner.load_area(area_id, stream=True):
+                    return False
+                return self._begin_mowing(resume)
+        return False
+
+    def start_mission(self, area_ids: List[str], resume: bool = True):
+        """Birden fazla alanı şarj istasyonundan başlayan tek görevde biç"""
+        if len(area_ids) == 1:
+            return self.start_mowing_task(area_ids[0], resume)
+
         if self.state in [RobotState.IDLE, RobotState.MANUAL_CONTROL]:
             if self.path_planner:
-                self.path_planner.load_area(area_id)
-                self.state = RobotState.MOWING
-                self.logger.info(f"Biçme görevi başlatıldı: {area_id}")
-                return True
+                station = self.config["charging_station"]["position"]
+                # Alan rotaları arka planda planlanır, kontrol döngüsü bloklanmaz
+                if not self.path_planner.load_mission(
+                    area_ids, (station["x"], station["y"]), stream=True
+                ):
+                    return False
+                return self._begin_mowing(resume)
         return False
 
+    def start_gap_fill(self, area_id: str) -> bool:
+        """
+        Alanın kapsama haritasında biçilmemiş kalan bölgeleri biç.
+
+        Kapsama haritası temizlenmez; doldurulan hücreler mevcut görevin
+        haritasına eklenir. Rota görev günlüğüne yazılmaz.
+        """
+        if self.state not in [RobotState.IDLE, RobotState.MANUAL_CONTROL]:
+            return False
+        if not self.path_planner or area_id not in self.path_planner.areas:
+            return False
+
+        area = self.path_planner.areas[area_id]
+        grid = self.coverage_map.coverage_grid(area.boundary, area.obstacles)
+        position = self.stats["current_position"]
+        if self.odometry:
+            position = self.odometry.get_position_dict()
+
+        if not self.path_planner.load_gap_fill(
+            area_id, grid, (position["x"], position["y"])
+        ):
+            return False
+
+        self.coverage_map.blade_width = self.path_planner.blade_width
+        self.state = RobotState.MOWING
+        self.logger.info(
+            f"Boşluk doldurma başlatıldı: {area_id} "
+            f"({len(self.path_planner.current_path)} waypoint)"
+        )
+        return True
+
+    def _begin_mowing(self, resume: bool) -> bool:
+        """Yüklenen rotayı (gerekirse kontrol noktasından) başlat"""
+        plan_id = self.path_planner.current_plan_id
+        start_index = 0
+        checkpoint = self.mission_journal.last_checkpoint()
+        resumed = bool(
+            resume
+            and checkpoint
+            and checkpoint["area_id"] == plan_id
+            and checkpoint["plan_hash"] == self.path_planner.current_plan_hash
+        )
+        if resumed:
+            start_index = self.path_planner.resume_from(checkpoint["index"])
+        self._prepare_coverage(resumed)
+
+        self.mission_journal.start(
+            plan_id, self.path_planner.current_plan_hash, start_index
+        )
+        self.state = RobotState.MOWING
+        self.logger.info(f"Biçme görevi başlatıldı: {plan_id} (waypoint {start_index})")
+        return True
+
     def set_manual_control(self, enabled: bool):
         """Manuel kontrol modunu aç/kapat"""
         if enabled and self.state != RobotState.EMERGENCY_STOP:
+            # Operatör devraldı: yarım görev kendiliğinden sürdürülmez
+            self._cancel_mission()
+            if self.motor_controller:
+                self.motor_controller.stop_blade()
             self.previous_state = self.state
             self.state = RobotState.MANUAL_CONTROL
             self.logger.info("Manuel kontrol modu aktif")
@@ -375,6 +697,7 @@ class MainController:
             "emergency_stop": self.emergency_stop_active,
             "uptime": self.stats["total_runtime"],
             "mowing_time": self.stats["mowing_time"],
+            "area_covered": self.stats["area_covered"],
             "charging_cycles": self.stats["charging_cycles"],
         }
 
@@ -417,6 +740,12 @@ class MainController:
         """Profesyonel navigasyon döngüsü"""
         while self.navigation_running and self.running:
             try:
+                # Sensör thread'lerinin ölçümlerini zaman sırasıyla filtreye uygula
+                if self.measurement_queue:
+                    self.measurement_queue.process()
+
+                self._update_coverage()
+
                 if self.sensor_manager and self.path_planner:
                     # Sensor fusion verilerini al
                     nav_data = self.sensor_manager.get_navigation_data()
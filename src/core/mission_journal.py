@@ -0,0 +1,145 @@
+"""
+Görev Günlüğü Modülü
+Biçme görevinin ilerlemesini yalnızca-ekleme (append-only) JSONL dosyasına yazar.
+Şarj dönüşü veya çökme sonrası kalınan yerden devam etmek için kullanılır.
+"""
+
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+class MissionJournal:
+    """Sınırlı hızda kayıt tutan görev kontrol noktası günlüğü"""
+
+    def __init__(
+        self,
+        path: str = "logs/mission_journal.jsonl",
+        min_interval: float = 5.0,
+        max_bytes: int = 256 * 1024,
+    ):
+        self.logger = logging.getLogger("MissionJournal")
+        self.path = Path(path)
+        self.min_interval = min_interval
+        self.max_bytes = max_bytes
+
+        self._last_write = 0.0
+        self._last_record: Optional[Dict[str, Any]] = None
+
+    def start(self, area_id: str, plan_hash: Optional[str], index: int = 0):
+        """Görev başlangıcını kaydet"""
+        self._append("start", area_id, plan_hash, index)
+
+    def record_progress(
+        self,
+        area_id: str,
+        plan_hash: Optional[str],
+        index: int,
+        force: bool = False,
+    ) -> bool:
+        """Tamamlanan waypoint indeksini kaydet (en fazla min_interval'da bir)"""
+        last = self._last_record
+        if (
+            last is not None
+            and last["area_id"] == area_id
+            and last["index"] == index
+            and last["event"] != "complete"
+        ):
+            return False
+
+        if not force and time.time() - self._last_write < self.min_interval:
+            return False
+
+        self._append("progress", area_id, plan_hash, index)
+        return True
+
+    def complete(self, area_id: str, plan_hash: Optional[str], index: int):
+        """Görev tamamlandı - artık devam edilecek görev yok"""
+        self._append("complete", area_id, plan_hash, index)
+
+    def suspend(self, area_id: str, plan_hash: Optional[str], index: int):
+        """Görev şarj için bırakıldı - şarjdan sonra otomatik devam edilir"""
+        self._append("suspend", area_id, plan_hash, index)
+
+    def cancel(self, area_id: str, plan_hash: Optional[str], index: int):
+        """Görev operatör veya acil durdurma ile kesildi - otomatik devam yok"""
+        self._append("cancel", area_id, plan_hash, index)
+
+    def last_checkpoint(self) -> Optional[Dict[str, Any]]:
+        """Yarım kalan görevin son kaydı (tamamlandıysa veya yoksa None)"""
+        record = self._last_record or self._read_last_record()
+        if record is None or record["event"] == "complete":
+            return None
+        return record
+
+    def resumable_checkpoint(self, boot: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Kendiliğinden devam edilebilecek görevin son kaydı.
+
+        Şarj için bırakılan (suspend) görev her zaman; açılışta ayrıca
+        kapanış kaydı olmadan kesilmiş (start/progress, çökme veya elektrik
+        kesintisi) görev döner. İptal edilen görev hiçbir zaman dönmez.
+        """
+        record = self.last_checkpoint()
+        if record is None:
+            return None
+        if record["event"] == "suspend":
+            return record
+        if boot and record["event"] in ("start", "progress"):
+            return record
+        return None
+
+    def _append(self, event: str, area_id: str, plan_hash: Optional[str], index: int):
+        record = {
+            "timestamp": time.time(),
+            "event": event,
+            "area_id": area_id,
+            "plan_hash": plan_hash,
+            "index": int(index),
+        }
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            if self.path.exists() and self.path.stat().st_size > self.max_bytes:
+                self._compact()
+
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+        except OSError as e:
+            self.logger.warning(f"Görev günlüğü yazılamadı: {e}")
+
+        self._last_record = record
+        self._last_write = record["timestamp"]
+
+    def _compact(self):
+        """Dosyayı yalnızca son kayda indir"""
+        record = self._last_record or self._read_last_record()
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            if record is not None:
+                f.write(json.dumps(record) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    def _read_last_record(self) -> Optional[Dict[str, Any]]:
+        """Dosyadaki son geçerli kaydı oku (yarım yazılmış satırları atla)"""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return None
+
+        for line in reversed(lines):
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(record, dict) and "area_id" in record:
+                return record
+        return None
@@ -117,6 +117,8 @@ class MotorController:
         # Enkoder sayaçları
         self.encoder_counts = {MotorType.LEFT_DRIVE: 0, MotorType.RIGHT_DRIVE: 0}
         self.last_encoder_time = time.time()
+        # Varsa enkoder artışları okundukları zamanla ölçüm kuyruğuna yazılır
+        self.measurement_queue = None
 
         self._initialize_motors()
 
@@ -369,6 +371,7 @@ class MotorController:
         """Enkoder sayaçlarını güncelle"""
         current_time = time.time()
         dt = current_time - self.last_encoder_time
+        deltas = {MotorType.LEFT_DRIVE: 0, MotorType.RIGHT_DRIVE: 0}
 
         # Simüle edilmiş enkoder sayıları
         for motor_type in [MotorType.LEFT_DRIVE, MotorType.RIGHT_DRIVE]:
@@ -384,9 +387,18 @@ class MotorController:
 
                     self.encoder_counts[motor_type] += new_ticks
                     status.encoder_position = self.encoder_counts[motor_type]
+                    deltas[motor_type] = new_ticks
 
         self.last_encoder_time = current_time
 
+        if self.measurement_queue is not None:
+            self.measurement_queue.push_encoder(
+                current_time,
+                deltas[MotorType.LEFT_DRIVE],
+                deltas[MotorType.RIGHT_DRIVE],
+                self.motor_params[MotorType.LEFT_DRIVE].encoder_ticks_per_rev,
+            )
+
     def move(self, linear_velocity: float, angular_velocity: float):
         """Robot hareketi - linear (m/s) ve angular (rad/s)"""
         if self.emergency_stop_active:
@@ -712,17 +724,6 @@ class MotorController:
                 )
 
             # Diferansiyel sürüş hesaplaması
-            wheel_diameter = self.motor_params.get(
-                MotorType.LEFT_DRIVE,
-                MotorParameters(
-                    max_rpm=300,
-                    max_current=10.0,
-                    encoder_ticks_per_rev=1000,
-                    gear_ratio=20.0,
-                    wheel_diameter=0.2,
-                ),
-            ).wheel_diameter
-
             left_wheel_speed = linear_velocity - (
                 angular_velocity * self.wheel_base / 2
             )
@@ -730,13 +731,9 @@ class MotorController:
                 angular_velocity * self.wheel_base / 2
             )
 
-            # m/s'yi RPM'e çevir
-            left_rpm = (left_wheel_speed * 60) / (math.pi * wheel_diameter)
-            right_rpm = (right_wheel_speed * 60) / (math.pi * wheel_diameter)
-
-            # Motor hızlarını ayarla
-            self.set_motor_speed(MotorType.LEFT_DRIVE, left_rpm)
-            self.set_motor_speed(MotorType.RIGHT_DRIVE, right_rpm)
+            # Motor hızlarını ayarla (set_motor_speed m/s'yi RPM'e çevirir)
+            self.set_motor_speed(MotorType.LEFT_DRIVE, left_wheel_speed)
+            self.set_motor_speed(MotorType.RIGHT_DRIVE, right_wheel_speed)
 
             self.logger.info(
                 f"Sürüş hızı ayarlandı: linear={linear_velocity:.2f}, angular={angular_velocity:.2f}"
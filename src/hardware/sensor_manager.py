@@ -3,6 +3,7 @@ Sensör Yönetimi Modülü
 Tüm sensörlerden veri toplama ve yönetme
 """
 
+import math
 import os
 import time
 import logging
@@ -58,6 +59,9 @@ class SensorManager:
         self.sensor_thread = None
         self.readings: Dict[SensorType, SensorReading] = {}
 
+        # Varsa gerçek IMU yönü okunduğu zamanla ölçüm kuyruğuna yazılır
+        self.measurement_queue = None
+
         # Hardware interfaces (sadece gerçek modda)
         self.imu = None
         self.temp_sensor = None
@@ -195,8 +199,10 @@ class SensorManager:
             else:
                 # Gerçek IMU
                 if self.imu:
-                    heading = self.imu.euler[0]  # Yaw
-                    inclination = self.imu.euler[1]  # Pitch
+                    euler = self.imu.euler
+                    sample_time = time.time()
+                    heading = euler[0]  # Yaw
+                    inclination = euler[1]  # Pitch
                     temp = self.imu.temperature
                     cal_status = self.imu.calibration_status
 
@@ -212,10 +218,16 @@ class SensorManager:
                             "calibration": cal_quality,
                         },
                         unit="degrees",
-                        timestamp=time.time(),
+                        timestamp=sample_time,
                         quality=cal_status[0] / 3.0 if cal_status else 0.5,
                     )
 
+                    # BNO055 yönü saat yönünde derece; filtre saat yönü tersi radyan
+                    if self.measurement_queue is not None and heading is not None:
+                        self.measurement_queue.push_imu(
+                            sample_time, math.radians(-heading)
+                        )
+
         except Exception as e:
             self.logger.error(f"IMU okuma hatası: {e}")
 
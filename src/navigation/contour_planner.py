@@ -0,0 +1,184 @@
+"""
+Kontur Paralel Planlama Modülü
+Sınırın art arda içe ötelenmiş halkalarını tek sürekli spirale bağlar ve
+sabit yay uzunluğu aralıklarla örnekler
+"""
+
+import math
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Sequence
+
+import numpy as np
+
+from .polygon_geometry import (
+    PreparedPolygon,
+    VisibilityGraph,
+    offset_polygon,
+    offset_rings,
+)
+
+
+@dataclass
+class _ContourNode:
+    """Öteleme ağacında bir halka ve içindeki bir sonraki seviye halkaları"""
+
+    ring: np.ndarray
+    children: List["_ContourNode"] = field(default_factory=list)
+
+
+def resample_polyline(
+    points: Any, spacing: float, corner_angle: float = math.radians(30)
+) -> np.ndarray:
+    """
+    Çoklu çizgiyi sabit yay uzunluğu aralıklarla örnekle.
+
+    Uçlar ve yön değişimi corner_angle'dan büyük köşeler korunur; aradaki
+    her parça eşit aralıklara (en fazla spacing) bölünür. Yay birleşimlerinin
+    kısa kirişleri böylece tek aralıkta toplanır, keskin köşeler kesilmez.
+    """
+    xy = np.asarray(points, dtype=float).reshape(-1, 2)
+    if len(xy) < 2:
+        return xy.copy()
+    steps = np.diff(xy, axis=0)
+    lengths = np.hypot(steps[:, 0], steps[:, 1])
+    xy = np.vstack((xy[:1], xy[1:][lengths > 1e-12]))
+    steps = steps[lengths > 1e-12]
+    lengths = lengths[lengths > 1e-12]
+    if len(lengths) == 0:
+        return xy[:1].copy()
+
+    headings = np.arctan2(steps[:, 1], steps[:, 0])
+    turns = np.abs((np.diff(headings) + math.pi) % (2 * math.pi) - math.pi)
+    anchors = np.concatenate(
+        ([0], np.flatnonzero(turns > corner_angle) + 1, [len(xy) - 1])
+    )
+
+    arc = np.concatenate(([0.0], np.cumsum(lengths)))
+    samples = [xy[:1]]
+    for lo, hi in zip(anchors[:-1], anchors[1:]):
+        count = max(1, int(math.ceil((arc[hi] - arc[lo]) / spacing - 1e-9)))
+        s = np.linspace(arc[lo], arc[hi], count + 1)[1:]
+        section = slice(lo, hi + 1)
+        samples.append(
+            np.stack(
+                (
+                    np.interp(s, arc[section], xy[section, 0]),
+                    np.interp(s, arc[section], xy[section, 1]),
+                ),
+                axis=1,
+            )
+        )
+    return np.vstack(samples)
+
+
+def _start_ring_at(ring: np.ndarray, point: np.ndarray) -> np.ndarray:
+    """Halkayı verilen noktanın halka üzerindeki izdüşümünden başlat"""
+    starts = ring
+    steps = np.roll(ring, -1, axis=0) - ring
+    lengths_sq = np.maximum(np.einsum("ij,ij->i", steps, steps), 1e-24)
+    t = np.clip(np.einsum("ij,ij->i", point - starts, steps) / lengths_sq, 0.0, 1.0)
+    projections = starts + steps * t[:, None]
+    k = int(np.argmin(np.hypot(*(projections - point).T)))
+
+    rolled = np.roll(ring, -(k + 1), axis=0)
+    return np.vstack((projections[k], rolled))
+
+
+def _cut_tail(closed: np.ndarray, length: float) -> np.ndarray:
+    """Kapalı halka yolunun son length metresini kes"""
+    steps = np.diff(closed, axis=0)
+    arc = np.concatenate(([0.0], np.cumsum(np.hypot(steps[:, 0], steps[:, 1]))))
+    end = arc[-1] - length
+    if end <= 0:
+        return closed[:1]
+    k = int(np.searchsorted(arc, end, side="right"))
+    t = (end - arc[k - 1]) / max(arc[k] - arc[k - 1], 1e-12)
+    return np.vstack((closed[:k], closed[k - 1] + t * (closed[k] - closed[k - 1])))
+
+
+def _build_tree(levels: List[List[np.ndarray]]) -> List[List[_ContourNode]]:
+    """Her halkayı onu içeren bir önceki seviye halkasına bağla"""
+    tree = [[_ContourNode(ring) for ring in levels[0]]] if levels else []
+    for level in levels[1:]:
+        _attach(tree[-1], level)
+        tree.append([node for parent in tree[-1] for node in parent.children])
+    return tree
+
+
+def _attach(parents: List[_ContourNode], rings: List[np.ndarray]) -> None:
+    """Halkaları, ilk noktalarını içeren ebeveyn halkanın çocuğu yap"""
+    prepared = [PreparedPolygon(node.ring) for node in parents]
+    for ring in rings:
+        for parent, polygon in zip(parents, prepared):
+            if polygon.contains(ring[0]):
+                parent.children.append(_ContourNode(ring))
+                break
+
+
+def contour_spiral(
+    boundary: Any,
+    first: float,
+    spacing: float,
+    sample_spacing: Optional[float] = None,
+    obstacles: Optional[Sequence[Any]] = None,
+) -> np.ndarray:
+    """
+    Kontur paralel spiral rota.
+
+    Halkalar sınırdan first, first + spacing, ... mesafede ötelenir. Her
+    halkanın son spacing metresi kesilip bir içteki halkanın en yakın
+    noktasına geçilir; böylece halkalar tek sürekli spirale bağlanır. Dar
+    boğazda alan bölünürse kollar sırayla (en yakın önce) biçilir ve kollar
+    arası geçiş biçilmiş alan içinden görünürlük grafıyla yapılır.
+
+    Args:
+        boundary: Alan sınırı
+        first: İlk halkanın sınıra uzaklığı (metre)
+        spacing: Halkalar arası mesafe (metre)
+        sample_spacing: Rota noktaları arası yay uzunluğu (varsayılan spacing)
+        obstacles: Kollar arası geçişte kaçınılacak engeller
+
+    Returns:
+        (N, 2) rota noktaları, dıştan içe
+    """
+    tree = _build_tree(offset_rings(boundary, first, spacing))
+    if not tree:
+        return np.zeros((0, 2))
+
+    # Orta eksende kalan spacing'den dar şerit için yaprak halkaların
+    # içine yarım adımlı son bir halka eklenir
+    for k, nodes in enumerate(tree):
+        leaves = [node for node in nodes if not node.children]
+        if leaves:
+            distance = first + (k + 0.5) * spacing
+            _attach(leaves, offset_polygon(boundary, distance))
+
+    graph = VisibilityGraph(boundary, list(obstacles or []), first / 2)
+    pieces: List[np.ndarray] = []
+    position: Optional[np.ndarray] = None
+
+    # Derinlik öncelikli: halkalar tek çocukta spiral olarak devam eder
+    stack = [(tree[0], True)]
+    while stack:
+        nodes, linked = stack.pop()
+        if not nodes:
+            continue
+        if position is None:
+            node, rest = nodes[0], nodes[1:]
+        else:
+            gaps = [np.hypot(*(n.ring - position).T).min() for n in nodes]
+            k = int(np.argmin(gaps))
+            node, rest = nodes[k], nodes[:k] + nodes[k + 1 :]
+        stack.append((rest, False))
+
+        ring = node.ring if position is None else _start_ring_at(node.ring, position)
+        closed = np.vstack((ring, ring[:1]))
+        if position is not None and not linked:
+            pieces.append(graph.shortest_path(position, closed[0])[1:-1])
+        if len(node.children) == 1:
+            closed = _cut_tail(closed, spacing)
+        pieces.append(closed)
+        position = closed[-1]
+        stack.append((node.children, len(node.children) == 1))
+
+    return resample_polyline(np.vstack(pieces), sample_spacing or spacing)
@@ -0,0 +1,312 @@
+"""
+Kapsama Haritası Modülü
+Bıçak izini (blade_width genişliğinde süpürülen alan) ızgaraya işleyerek
+gerçek biçilen alanı, kaçırılan bölgeleri ve çift biçimi hesaplar
+"""
+
+import math
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .polygon_geometry import (
+    chain_segments,
+    polygon_to_array,
+    scanline_segments,
+    signed_area,
+)
+
+
+@dataclass
+class CoverageReport:
+    """Izgara kapsama raporu (alanlar m²)"""
+
+    target_area: float  # Biçilecek alan (sınır içi, engel dışı)
+    covered_area: float  # En az bir kez biçilen hedef alan
+    double_cut_area: float  # İki veya daha fazla kez biçilen hedef alan
+    resolution: float  # Hücre kenarı (metre)
+    missed_polygons: List[np.ndarray] = field(default_factory=list)
+
+    @property
+    def coverage(self) -> float:
+        """Biçilen alan oranı [0, 1]"""
+        return self.covered_area / self.target_area if self.target_area > 0 else 0.0
+
+    @property
+    def missed_area(self) -> float:
+        return self.target_area - self.covered_area
+
+    @property
+    def double_cut_percent(self) -> float:
+        """Biçilen alanın yüzde kaçı birden fazla kez biçildi"""
+        if self.covered_area <= 0:
+            return 0.0
+        return 100.0 * self.double_cut_area / self.covered_area
+
+
+def _linear_bounds(
+    coef: np.ndarray, const: np.ndarray, lo: Any, hi: Any
+) -> Tuple[np.ndarray, np.ndarray]:
+    """lo <= coef * x + const <= hi eşitsizliğinin x aralığı (boşsa inf, -inf)"""
+    flat = np.abs(coef) < 1e-12
+    safe = np.where(flat, 1.0, coef)
+    a = (lo - const) / safe
+    b = (hi - const) / safe
+    inside = (const >= lo) & (const <= hi)
+    start = np.where(flat, np.where(inside, -np.inf, np.inf), np.minimum(a, b))
+    end = np.where(flat, np.where(inside, np.inf, -np.inf), np.maximum(a, b))
+    return start, end
+
+
+def swath_row_intervals(
+    starts: np.ndarray,
+    ends: np.ndarray,
+    radius: float,
+    ys: np.ndarray,
+    segment: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Segment kapsülünün (segment + radius diski) yatay çizgilerle kesişimi.
+
+    Kapsül dışbükey olduğundan her çizgiyle kesişimi tek aralıktır: iki uç
+    diskinin ve kenarlara paralel şeridin aralıklarının birleşimi.
+
+    Args:
+        starts, ends: (S, 2) segment uçları
+        radius: Yarım bıçak genişliği
+        ys: (P,) çizgi y değerleri
+        segment: (P,) her çizginin segment indeksi
+
+    Returns:
+        (x_start, x_end): (P,) aralıklar; kesişim yoksa x_start > x_end
+    """
+    p0 = starts[segment]
+    p1 = ends[segment]
+    low = np.full(len(ys), np.inf)
+    high = np.full(len(ys), -np.inf)
+
+    for center in (p0, p1):
+        h = radius * radius - (ys - center[:, 1]) ** 2
+        half = np.sqrt(np.maximum(h, 0.0))
+        low = np.where(h >= 0, np.minimum(low, center[:, 0] - half), low)
+        high = np.where(h >= 0, np.maximum(high, center[:, 0] + half), high)
+
+    direction = p1 - p0
+    length = np.hypot(direction[:, 0], direction[:, 1])
+    moving = length > 1e-12
+    u = direction / np.where(moving, length, 1.0)[:, None]
+    dy = ys - p0[:, 1]
+
+    # Segment boyunca 0 <= u·(p - p0) <= L, dik yönde |n·(p - p0)| <= r
+    along = _linear_bounds(u[:, 0], -u[:, 0] * p0[:, 0] + u[:, 1] * dy, 0.0, length)
+    across = _linear_bounds(
+        -u[:, 1], u[:, 1] * p0[:, 0] + u[:, 0] * dy, -radius, radius
+    )
+    slab_low = np.maximum(along[0], across[0])
+    slab_high = np.minimum(along[1], across[1])
+    slab = moving & (slab_low <= slab_high)
+    low = np.where(slab, np.minimum(low, slab_low), low)
+    high = np.where(slab, np.maximum(high, slab_high), high)
+
+    return low, high
+
+
+class CoverageGrid:
+    """
+    Alan üzerinde doluluk ızgarası.
+
+    Her hücre için bıçağın hücre merkezinin üzerinden kaç ayrı geçişte
+    geçtiği tutulur. Ardışık segmentler aynı geçiş sayılır; böylece sık
+    örneklenmiş rotalar ve dönüş kirişleri çift biçim üretmez.
+    """
+
+    def __init__(
+        self,
+        boundary: Any,
+        obstacles: Optional[Sequence[Any]] = None,
+        resolution: float = 0.1,
+    ):
+        self.resolution = resolution
+        ring = polygon_to_array(boundary)
+        self.origin = ring.min(axis=0) if len(ring) else np.zeros(2)
+        extent = ring.max(axis=0) - self.origin if len(ring) else np.zeros(2)
+        self.width = max(1, int(math.ceil(extent[0] / resolution)))
+        self.height = max(1, int(math.ceil(extent[1] / resolution)))
+        self.passes = np.zeros((self.height, self.width), dtype=np.uint16)
+
+        # Hedef hücreler: merkezi sınır içinde ve engel dışında olanlar
+        rings = [ring] + [polygon_to_array(obs) for obs in (obstacles or [])]
+        rows, x_start, x_end = scanline_segments(rings, self.row_centers())
+        self.target = self._fill_rows(rows, x_start, x_end)
+
+    def row_centers(self) -> np.ndarray:
+        return self.origin[1] + (np.arange(self.height) + 0.5) * self.resolution
+
+    def _column_range(
+        self, x_start: np.ndarray, x_end: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Merkezi [x_start, x_end) içinde kalan sütunlar (kırpılmış)"""
+        return self._index_range(x_start, x_end, self.origin[0], self.width)
+
+    def _index_range(
+        self, start: np.ndarray, end: np.ndarray, origin: float, size: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Merkezi yarı açık [start, end) aralığında kalan hücre indeksleri.
+
+        Yarı açık kural, hücre merkezine denk gelen iz kenarının iki komşu
+        geçişte iki kez sayılmasını önler.
+        """
+        scaled_start = np.clip((start - origin) / self.resolution - 0.5, -1, size)
+        scaled_end = np.clip((end - origin) / self.resolution - 0.5, -1, size)
+        first = np.ceil(scaled_start).astype(int)
+        last = np.ceil(scaled_end).astype(int) - 1
+        return np.maximum(first, 0), np.minimum(last, size - 1)
+
+    def _fill_rows(
+        self, rows: np.ndarray, x_start: np.ndarray, x_end: np.ndarray
+    ) -> np.ndarray:
+        """Satır aralıklarını fark dizisiyle ızgaraya doldur (boolean maske)"""
+        first, last = self._column_range(x_start, x_end)
+        valid = first <= last
+        diff = np.zeros((self.height, self.width + 1), dtype=np.int32)
+        np.add.at(diff, (rows[valid], first[valid]), 1)
+        np.add.at(diff, (rows[valid], last[valid] + 1), -1)
+        return np.cumsum(diff[:, :-1], axis=1) > 0
+
+    def swath_cells(
+        self, points: Any, width: float, cutting: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Rota izinin kapladığı (hücre, segment) çiftleri.
+
+        Args:
+            points: (N, 2) rota noktaları
+            width: Bıçak genişliği (metre)
+            cutting: (N-1,) bıçak açık segmentler; verilmezse tümü
+
+        Returns:
+            (cells, segments): Düz hücre indeksleri ve segment indeksleri
+        """
+        xy = polygon_to_array(points)
+        if len(xy) == 1:
+            xy = np.vstack((xy, xy))
+        segments = np.arange(max(len(xy) - 1, 0))
+        if cutting is not None:
+            segments = segments[np.asarray(cutting, dtype=bool)]
+        if len(segments) == 0:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty
+
+        radius = width / 2
+        starts, ends = xy[segments], xy[segments + 1]
+
+        # Her segmentin kapsülünün kestiği satırlar
+        y_low = np.minimum(starts[:, 1], ends[:, 1]) - radius
+        y_high = np.maximum(starts[:, 1], ends[:, 1]) + radius
+        first, last = self._index_range(y_low, y_high, self.origin[1], self.height)
+        counts = np.maximum(last - first + 1, 0)
+
+        owner = np.repeat(np.arange(len(segments)), counts)
+        offsets = np.arange(counts.sum()) - np.repeat(
+            np.cumsum(counts) - counts, counts
+        )
+        rows = np.repeat(first, counts) + offsets
+        ys = self.origin[1] + (rows + 0.5) * self.resolution
+
+        x_start, x_end = swath_row_intervals(starts, ends, radius, ys, owner)
+        col_first, col_last = self._column_range(x_start, x_end)
+        counts = np.maximum(col_last - col_first + 1, 0)
+
+        base = np.repeat(rows * self.width + col_first, counts)
+        offsets = np.arange(counts.sum()) - np.repeat(
+            np.cumsum(counts) - counts, counts
+        )
+        cells = base + offsets
+        return cells.astype(np.int64), np.repeat(segments[owner], counts)
+
+    def add_path(
+        self, points: Any, width: float, cutting: Optional[np.ndarray] = None
+    ) -> None:
+        """Rota izini ızgaraya ekle (her ayrı geçiş bir kez sayılır)"""
+        cells, segments = self.swath_cells(points, width, cutting)
+        if len(cells) == 0:
+            return
+
+        # (hücre, segment) sıralaması; aynı hücrede segment sırası kopunca
+        # yeni geçiş başlar
+        stride = int(segments.max()) + 2
+        keys = np.sort(cells * stride + segments)
+        cells, segments = keys // stride, keys % stride
+        new_pass = np.ones(len(keys), dtype=bool)
+        new_pass[1:] = (cells[1:] != cells[:-1]) | (segments[1:] != segments[:-1] + 1)
+
+        visits = np.bincount(cells[new_pass], minlength=self.passes.size)
+        total = self.passes.reshape(-1).astype(np.int64) + visits
+        self.passes = np.minimum(total, np.iinfo(np.uint16).max).astype(np.uint16)
+        self.passes = self.passes.reshape(self.height, self.width)
+
+    def missed_polygons(self, min_area: float = 0.0) -> List[np.ndarray]:
+        """Biçilmemiş hedef bölgelerin dış sınırları (saat yönü tersi)"""
+        missed = self.target & (self.passes == 0)
+        padded = np.pad(missed, 1)
+        inner = padded[1:-1, 1:-1]
+        stride = self.width + 1
+
+        # Bölge dışına bakan hücre kenarları, bölge solda kalacak yönde
+        starts, ends = [], []
+        for neighbour, start, end in (
+            (padded[:-2, 1:-1], (0, 0), (0, 1)),  # alt
+            (padded[1:-1, 2:], (0, 1), (1, 1)),  # sağ
+            (padded[2:, 1:-1], (1, 1), (1, 0)),  # üst
+            (padded[1:-1, :-2], (1, 0), (0, 0)),  # sol
+        ):
+            r, c = np.nonzero(inner & ~neighbour)
+            starts.append((r + start[0]) * stride + c + start[1])
+            ends.append((r + end[0]) * stride + c + end[1])
+        start_node = np.concatenate(starts)
+        end_node = np.concatenate(ends)
+        corners = np.stack((start_node % stride, start_node // stride), axis=1).astype(
+            float
+        )
+        corners = self.origin + corners * self.resolution
+
+        polygons = []
+        for ring in chain_segments(corners, start_node, end_node):
+            # Eksen hizalı halkada düz devam eden köşeleri at
+            incoming = ring - np.roll(ring, 1, axis=0)
+            outgoing = np.roll(ring, -1, axis=0) - ring
+            turn = incoming[:, 0] * outgoing[:, 1] - incoming[:, 1] * outgoing[:, 0]
+            ring = ring[np.abs(turn) > 1e-12]
+            area = signed_area(ring)
+            if area > 0 and area >= min_area:
+                polygons.append(ring)
+        return polygons
+
+    def report(self, min_missed_area: float = 0.0) -> CoverageReport:
+        """Kapsama raporu"""
+        cell_area = self.resolution**2
+        covered = self.target & (self.passes > 0)
+        return CoverageReport(
+            target_area=float(self.target.sum()) * cell_area,
+            covered_area=float(covered.sum()) * cell_area,
+            double_cut_area=float((self.target & (self.passes > 1)).sum()) * cell_area,
+            resolution=self.resolution,
+            missed_polygons=self.missed_polygons(min_missed_area),
+        )
+
+
+def coverage_report(
+    boundary: Any,
+    path: Any,
+    width: float,
+    obstacles: Optional[Sequence[Any]] = None,
+    resolution: float = 0.1,
+    cutting: Optional[np.ndarray] = None,
+    min_missed_area: float = 0.0,
+) -> CoverageReport:
+    """Tek rota için ızgara kapsama raporu"""
+    grid = CoverageGrid(boundary, obstacles, resolution)
+    grid.add_path(path, width, cutting)
+    return grid.report(min_missed_area)
@@ -0,0 +1,170 @@
+"""
+Boşluk Doldurma Planlama Modülü
+Biçilmemiş bölgeleri (kapsama ızgarasından veya kaçırılan alan
+poligonlarından) yalnızca bu bölgeleri kaplayan kısa şeritlerle planlar
+"""
+
+import math
+from typing import Any, List, Sequence, Tuple
+
+import numpy as np
+
+from .polygon_geometry import (
+    polygon_to_array,
+    rotate_points,
+    scanline_intervals,
+    signed_area,
+)
+from .sweep_optimizer import candidate_angles
+
+
+def _intersect_intervals(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Sıralı, ayrık iki aralık kümesinin kesişimi"""
+    result = []
+    i = j = 0
+    while i < len(a) and j < len(b):
+        start = max(a[i][0], b[j][0])
+        end = min(a[i][1], b[j][1])
+        if start <= end:
+            result.append((start, end))
+        if a[i][1] < b[j][1]:
+            i += 1
+        else:
+            j += 1
+    return np.array(result).reshape(-1, 2)
+
+
+def _union_intervals(levels: Sequence[np.ndarray]) -> np.ndarray:
+    """Aralık kümelerinin birleşimi (sıralı, ayrık)"""
+    stacked = np.concatenate([level.reshape(-1, 2) for level in levels])
+    if len(stacked) == 0:
+        return stacked
+    stacked = stacked[np.argsort(stacked[:, 0], kind="stable")]
+    result = [list(stacked[0])]
+    for start, end in stacked[1:]:
+        if start <= result[-1][1]:
+            result[-1][1] = max(result[-1][1], end)
+        else:
+            result.append([start, end])
+    return np.array(result)
+
+
+def _gap_stripes(
+    rotated: np.ndarray, spacing: float
+) -> Tuple[np.ndarray, List[np.ndarray]]:
+    """
+    Döndürülmüş boşlukta şerit y'leri ve şerit başına x aralıkları.
+
+    Yüksekliği h olan boşluğa ceil(h / spacing) şerit eşit aralıkla
+    yerleştirilir. Her şerit kendi bandında boşluğun en geniş kısmını
+    kaplar (bant kenarları ve ortası birleştirilir).
+    """
+    low, high = rotated[:, 1].min(), rotated[:, 1].max()
+    count = max(1, int(math.ceil((high - low) / spacing - 1e-9)))
+    ys = low + (np.arange(count) + 0.5) * (high - low) / count
+
+    band = 0.5 * (high - low) / count * (1 - 1e-6)
+    levels = [scanline_intervals([rotated], ys + dy) for dy in (-band, 0.0, band)]
+    return ys, [_union_intervals([level[k] for level in levels]) for k in range(count)]
+
+
+def gap_sweep_angle(ring: np.ndarray, spacing: float, turn_cost: float) -> float:
+    """Dönüş sayısı x turn_cost + şerit uzunluğunu en aza indiren aday açı"""
+    angles = candidate_angles(ring)
+    cost = np.zeros(len(angles))
+    for k, angle in enumerate(angles):
+        ys, stripes = _gap_stripes(rotate_points(ring, -angle), spacing)
+        length = sum(float(np.sum(seg[:, 1] - seg[:, 0])) for seg in stripes)
+        cost[k] = (len(ys) - 1) * turn_cost + length
+    return float(angles[np.argmin(cost)])
+
+
+def gap_stripes(
+    gap: Any,
+    free_rings: Sequence[Any],
+    spacing: float,
+    turn_cost: float,
+    margin: float = 0.0,
+) -> np.ndarray:
+    """
+    Tek bir boşluk poligonunu kaplayan boustrophedon şerit noktaları.
+
+    Şerit yönü boşluğa göre seçilir. Boşluğun yüksekliği h ise
+    ceil(h / spacing) şerit eşit aralıkla yerleştirilir; böylece
+    spacing'den ince boşluklar da tek şeritle kapanır. Izgaradan gelen
+    basamaklı boşluklarda şerit, kapladığı bant boyunca boşluğun en geniş
+    kısmını sürer. Şeritler serbest alanla (sınır - engeller) kesiştirilir
+    ve margin kadar uzak tutulur; robotun ulaşamadığı kısımlar atlanır.
+
+    Args:
+        gap: Boşluk poligonu
+        free_rings: İlk halka alan sınırı, diğerleri engeller
+        spacing: Şerit aralığı (metre)
+        turn_cost: Şerit yönü seçiminde dönüş başına maliyet (metre)
+        margin: Sınır ve engellere en yakın şerit mesafesi
+
+    Returns:
+        (2K, 2) şerit başı/sonu noktaları, sürüş sırasıyla
+    """
+    ring = polygon_to_array(gap)
+    if len(ring) < 3:
+        return np.zeros((0, 2))
+
+    angle = gap_sweep_angle(ring, spacing, turn_cost)
+    rotated = rotate_points(ring, -angle)
+    free = [rotate_points(polygon_to_array(r), -angle) for r in free_rings]
+
+    ys, gaps = _gap_stripes(rotated, spacing)
+    count = len(ys)
+    center = 0.5 * (rotated[:, 1].min() + rotated[:, 1].max())
+
+    def clip(stripe_ys: np.ndarray, indices: np.ndarray) -> List[np.ndarray]:
+        """Şeritleri y ve y ± margin'de margin kadar serbest kalan kısma kırp"""
+        offsets = (-margin, 0.0, margin) if margin > 0 else (0.0,)
+        free_at = [scanline_intervals(free, stripe_ys + dy) for dy in offsets]
+        result = []
+        for i, k in enumerate(indices):
+            segments = gaps[k]
+            for level in free_at:
+                shrunk = level[i] + np.array([margin, -margin])
+                shrunk = shrunk[shrunk[:, 0] <= shrunk[:, 1]]
+                segments = _intersect_intervals(segments, shrunk)
+            result.append(segments)
+        return result
+
+    stripes = clip(ys, np.arange(count))
+
+    # Sınıra margin'den yakın kalan şeritler boşluğun içine doğru kaydırılır
+    for step in np.linspace(spacing / 8, spacing / 2, 4):
+        empty = np.array([k for k in range(count) if len(stripes[k]) == 0], dtype=int)
+        if len(empty) == 0:
+            break
+        shifted = ys[empty] + np.sign(center - ys[empty]) * step
+        for k, y, segments in zip(empty, shifted, clip(shifted, empty)):
+            if len(segments):
+                ys[k], stripes[k] = y, segments
+
+    coords = []
+    direction = 1
+    for y, segments in zip(ys, stripes):
+        if len(segments) == 0:
+            continue
+        if direction == -1:
+            segments = segments[::-1, ::-1]
+        for seg_start, seg_end in segments:
+            coords.append((seg_start, y))
+            coords.append((seg_end, y))
+        direction *= -1
+
+    return rotate_points(np.array(coords).reshape(-1, 2), angle)
+
+
+def gap_polygons(polygons: Sequence[Any], min_area: float = 0.0) -> List[np.ndarray]:
+    """min_area'dan küçük boşlukları ele, kalanları saat yönü tersine çevir"""
+    result = []
+    for polygon in polygons:
+        ring = polygon_to_array(polygon)
+        area = signed_area(ring)
+        if len(ring) >= 3 and abs(area) >= max(min_area, 1e-12):
+            result.append(ring if area > 0 else ring[::-1])
+    return result
@@ -3,10 +3,11 @@ Kalman Filtresi Tabanlı Odometri Modülü
 Enkoder ve IMU verilerini birleştirerek hassas konum tahmini yapar
 """
 
+import math
 import numpy as np
 import time
 import logging
-from typing import Dict, Tuple, Optional
+from typing import Callable, Dict, Tuple, Optional
 from dataclasses import dataclass
 
 
@@ -24,11 +25,23 @@ class KalmanOdometry:
     """
     Kalman Filtresi kullanarak enkoder ve IMU verilerini birleştiren odometri sınıfı
     State Vector: [x, y, heading, vx, vy, angular_velocity]
+
+    Filtre çekirdeği tahsissizdir: F ve H matrisleri kurulmaz, tahmin F'nin
+    seyrek yapısıyla yerinde yapılır. Enkoder ölçümü (H = [I3 0]) 3x3
+    Cholesky ile, IMU yön ölçümü kapalı form skaler güncellemeyle işlenir;
+    ara sonuçlar önceden ayrılmış tamponlara yazılır.
     """
 
-    def __init__(self, simulate: bool = False):
+    HEADING = 2  # Durum vektöründe yön indeksi
+
+    def __init__(
+        self, simulate: bool = False, clock: Optional[Callable[[], float]] = None
+    ):
         self.logger = logging.getLogger("KalmanOdometry")
 
+        # Zaman kaynağı (None: time.time; kayıt oynatmada sanal saat verilir)
+        self.clock = clock
+
         # Simülasyon kontrolü
         self.simulate = simulate
         if self.simulate:
@@ -49,12 +62,19 @@ class KalmanOdometry:
         self.R_encoder = np.diag([0.05, 0.05, 0.01])  # x, y, theta for encoder
         self.R_imu = np.diag([0.01])  # heading for IMU
 
+        # Çekirdek tamponları (her adımda yeniden kullanılır)
+        self._allocate_buffers()
+
         # Robot fiziksel parametreleri
         self.wheel_base = 0.5  # tekerlekler arası mesafe (metre)
         self.wheel_radius = 0.1  # tekerlek yarıçapı (metre)
 
         # Son güncelleme zamanı
-        self.last_update_time = time.time()
+        self.last_update_time = self._now()
+
+        # Yumuşatıcı için tahmin sonrası durum ve geçiş Jacobian'ı (x, P, F)
+        self.keep_prior = False
+        self.prior: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
 
         # Kalibrasyon parametreleri
         self.position_offset = Position()
@@ -64,6 +84,25 @@ class KalmanOdometry:
         self.total_distance = 0.0
         self.last_position = Position()
 
+    def _allocate_buffers(self):
+        """Durum boyutuna göre çekirdek tamponlarını ayır"""
+        n = len(self.state)
+        self._gain = np.zeros(n)
+        self._column = np.zeros(n)
+        self._outer = np.zeros((n, n))
+        self._block = np.zeros((n, 3))
+        self._weights = np.zeros((n, 3))
+        self._small = np.zeros((3, 3))
+        self._vector = np.zeros(3)
+
+    def _now(self) -> float:
+        """Saat kaynağından şimdiki zaman"""
+        return time.time() if self.clock is None else self.clock()
+
+    def _keep_prior(self, F: np.ndarray):
+        """Tahmin sonrası durumu ve Jacobian'ı sakla (keep_prior açıkken)"""
+        self.prior = (self.state.copy(), self.P.copy(), F)
+
     def reset_position(self, x: float = 0.0, y: float = 0.0, heading: float = 0.0):
         """Pozisyonu sıfırla"""
         self.state[0] = x
@@ -71,37 +110,55 @@ class KalmanOdometry:
         self.state[2] = heading
         self.state[3:] = 0  # Hızları sıfırla
 
-        self.P = np.eye(6) * 0.1  # Kovaryansı sıfırla
-        self.last_update_time = time.time()
+        self.P = np.eye(len(self.state)) * 0.1  # Kovaryansı sıfırla
+        self.last_update_time = self._now()
 
         self.logger.info(f"Pozisyon sıfırlandı: x={x}, y={y}, heading={heading}")
 
     def predict(self, dt: float):
         """
         Kalman Filtresi tahmin aşaması
+
+        F = I + dt·E (E: konum <- hız); F P Fᵀ önce sütunlara, sonra
+        satırlara dt katı hız bloğu eklenerek yerinde hesaplanır.
         """
-        # State transition matrix (kinematik model)
-        F = np.eye(6)
-        F[0, 3] = dt  # x = x + vx * dt
-        F[1, 4] = dt  # y = y + vy * dt
-        F[2, 5] = dt  # theta = theta + omega * dt
+        state, P = self.state, self.P
+        block = self._block
 
-        # Tahmin
-        self.state = F @ self.state
+        # x += vx dt, y += vy dt, theta += omega dt
+        np.multiply(state[3:], dt, out=self._vector)
+        state[:3] += self._vector
 
         # Açıyı [-pi, pi] aralığında tut
-        self.state[2] = self._normalize_angle(self.state[2])
+        state[2] = self._normalize_angle(state[2])
+
+        # Kovaryans tahmini: P F^T (sütunlar), sonra F (P F^T) (satırlar)
+        np.multiply(P[:, 3:], dt, out=block)
+        P[:, :3] += block
+        np.multiply(P[3:, :].T, dt, out=block)
+        P[:3, :] += block.T
+
+        np.multiply(self.Q, dt, out=self._outer)
+        P += self._outer
 
-        # Kovaryans tahmini
-        self.P = F @ self.P @ F.T + self.Q * dt
+        if self.keep_prior:
+            F = np.eye(6)
+            F[:3, 3:] += np.eye(3) * dt
+            self._keep_prior(F)
 
     def update_encoder(
-        self, left_ticks: int, right_ticks: int, ticks_per_revolution: int
+        self,
+        left_ticks: int,
+        right_ticks: int,
+        ticks_per_revolution: int,
+        timestamp: Optional[float] = None,
     ):
         """
         Enkoder verilerini kullanarak güncelleme
+
+        timestamp verilirse dt örnekleme zamanından hesaplanır (yoksa şu an).
         """
-        current_time = time.time()
+        current_time = self._now() if timestamp is None else timestamp
         dt = current_time - self.last_update_time
 
         if dt <= 0:
@@ -123,27 +180,21 @@ class KalmanOdometry:
         self.predict(dt)
 
         # Ölçüm modeli (enkoder verilerinden pozisyon hesapla)
-        theta = self.state[2]
-        dx = linear_velocity * dt * np.cos(theta)
-        dy = linear_velocity * dt * np.sin(theta)
+        state = self.state
+        theta = float(state[2])
+        cos_theta, sin_theta = math.cos(theta), math.sin(theta)
+        dx = linear_velocity * dt * cos_theta
+        dy = linear_velocity * dt * sin_theta
         dtheta = angular_velocity * dt
 
-        # Ölçüm vektörü
-        z = np.array([self.state[0] + dx, self.state[1] + dy, self.state[2] + dtheta])
-
-        # Ölçüm matrisi
-        H = np.zeros((3, 6))
-        H[0, 0] = 1  # x
-        H[1, 1] = 1  # y
-        H[2, 2] = 1  # theta
-
-        # Kalman güncellemesi
-        self._kalman_update(z, H, self.R_encoder)
+        # Ölçüm z = [x + dx, y + dy, theta + dtheta], H = [I3 0]
+        # Yenilik z - Hx doğrudan (dx, dy, dtheta)
+        self._position_update(dx, dy, dtheta, self.R_encoder)
 
         # Hızları güncelle
-        self.state[3] = linear_velocity * np.cos(theta)
-        self.state[4] = linear_velocity * np.sin(theta)
-        self.state[5] = angular_velocity
+        state[3] = linear_velocity * cos_theta
+        state[4] = linear_velocity * sin_theta
+        state[5] = angular_velocity
 
         self.last_update_time = current_time
 
@@ -158,60 +209,176 @@ class KalmanOdometry:
         # Heading'i normalize et
         heading = self._normalize_angle(heading - self.heading_offset)
 
-        # Ölçüm vektörü (sadece heading)
-        z = np.array([heading])
-
-        # Ölçüm matrisi
-        H = np.zeros((1, 6))
-        H[0, 2] = 1  # theta
-
-        # Kalman güncellemesi
-        self._kalman_update(z, H, self.R_imu)
+        # Tek boyutlu ölçüm (H = e_theta): kapalı form skaler güncelleme
+        self._scalar_update(
+            self.HEADING,
+            heading - float(self.state[self.HEADING]),
+            float(self.R_imu[0, 0]),
+        )
 
         # Eğer açısal hız varsa güncelle
         if angular_velocity is not None:
             self.state[5] = angular_velocity
 
+    def update_position(self, x: float, y: float, variance: float):
+        """
+        Mutlak konum ölçümüyle (GPS, yerel koordinat) güncelleme
+        """
+        n = len(self.state)
+        self._kalman_update(np.array([x, y]), np.eye(2, n), np.eye(2) * variance)
+
+    def snapshot(self) -> Tuple[np.ndarray, np.ndarray, float, float]:
+        """Filtre durumunun kopyası (restore ile geri yüklenir)"""
+        return (
+            self.state.copy(),
+            self.P.copy(),
+            self.last_update_time,
+            self.total_distance,
+        )
+
+    def restore(self, snapshot: Tuple[np.ndarray, np.ndarray, float, float]):
+        """snapshot ile alınan duruma yerinde geri dön"""
+        state, P, self.last_update_time, self.total_distance = snapshot
+        self.state[:] = state
+        self.P[...] = P
+
+    def _scalar_update(self, index: int, innovation: float, variance: float):
+        """
+        Tek durum bileşeninin doğrudan ölçümü (H = e_index), kapalı form.
+
+        p = P[:, i], s = P[i, i] + r: x += p y / s, P -= p pᵀ / s.
+        Dış çarpım simetrik olduğundan P tam simetrik kalır; matris tersi
+        ve geçici dizi yoktur.
+        """
+        state, P = self.state, self.P
+        column, outer = self._column, self._outer
+
+        s = float(P[index, index]) + variance
+        if not s > 0:
+            self.logger.warning("Kalman kazancı hesaplanamadı")
+            return
+        if index == self.HEADING:
+            innovation = self._normalize_angle(innovation)
+
+        np.copyto(column, P[:, index])
+        np.multiply(column, innovation / s, out=self._gain)
+        state += self._gain
+        if index == self.HEADING:
+            state[index] = self._normalize_angle(state[index])
+
+        np.multiply(column[:, None], column[None, :], out=outer)
+        outer *= 1.0 / s
+        P -= outer
+
+    def _position_update(self, dx: float, dy: float, dtheta: float, R: np.ndarray):
+        """
+        Konum ve yön ölçümü (H = [I3 0]) için blok güncelleme.
+
+        S = P[:3, :3] + R = L Lᵀ (3x3 Cholesky, skaler aritmetikle),
+        W = P[:, :3] L⁻ᵀ ve v = L⁻¹ y ile: x += W v, P -= W Wᵀ.
+        """
+        state, P = self.state, self.P
+        block, weights, small = self._block, self._weights, self._small
+
+        np.copyto(block, P[:, :3])
+        np.add(block[:3], R, out=small)
+        (s00, s01, s02), (_, s11, s12), (_, _, s22) = small.tolist()
+
+        # Cholesky: S = L Lᵀ
+        d0 = s00
+        if not d0 > 0:
+            self.logger.warning("Kalman kazancı hesaplanamadı")
+            return
+        l00 = math.sqrt(d0)
+        l10, l20 = s01 / l00, s02 / l00
+        d1 = s11 - l10 * l10
+        if not d1 > 0:
+            self.logger.warning("Kalman kazancı hesaplanamadı")
+            return
+        l11 = math.sqrt(d1)
+        l21 = (s12 - l20 * l10) / l11
+        d2 = s22 - l20 * l20 - l21 * l21
+        if not d2 > 0:
+            self.logger.warning("Kalman kazancı hesaplanamadı")
+            return
+        l22 = math.sqrt(d2)
+
+        # M = L⁻¹ (alt üçgen)
+        m00, m11, m22 = 1.0 / l00, 1.0 / l11, 1.0 / l22
+        m10 = -l10 * m00 * m11
+        m21 = -l21 * m11 * m22
+        m20 = -(l20 * m00 + l21 * m10) * m22
+
+        # Beyazlatılmış yenilik v = M y
+        dtheta = self._normalize_angle(dtheta)
+        vector = self._vector
+        vector[0] = m00 * dx
+        vector[1] = m10 * dx + m11 * dy
+        vector[2] = m20 * dx + m21 * dy + m22 * dtheta
+
+        # W = P Hᵀ Mᵀ
+        small[0, 0], small[0, 1], small[0, 2] = m00, m10, m20
+        small[1, 0], small[1, 1], small[1, 2] = 0.0, m11, m21
+        small[2, 0], small[2, 1], small[2, 2] = 0.0, 0.0, m22
+        np.matmul(block, small, out=weights)
+
+        np.matmul(weights, vector, out=self._gain)
+        state += self._gain
+        state[2] = self._normalize_angle(state[2])
+
+        np.matmul(weights, weights.T, out=self._outer)
+        P -= self._outer
+
     def _kalman_update(self, z: np.ndarray, H: np.ndarray, R: np.ndarray):
         """
-        Kalman Filtresi güncelleme aşaması
+        Kalman Filtresi güncelleme aşaması (genel H ve R)
+
+        Enkoder (H = [I3 0]) ve tek bileşen ölçümleri hızlı yollara
+        yönlendirilir; diğer durumlarda kazanç S'nin Cholesky çarpanlarıyla
+        çözülür ve kovaryans Joseph formunda güncellenir.
         """
-        # Yenilik (innovation)
-        y = z - H @ self.state
+        z = np.atleast_1d(np.asarray(z, dtype=float))
+        H = np.atleast_2d(np.asarray(H, dtype=float))
+        R = np.atleast_2d(np.asarray(R, dtype=float))
 
-        # Açıları normalize et
-        if len(y) >= 3:  # Enkoder güncellemesinde
-            y[2] = self._normalize_angle(y[2])
-        elif len(y) == 1:  # IMU güncellemesinde
-            y[0] = self._normalize_angle(y[0])
+        n = len(self.state)
+        if H.shape == (3, n) and np.array_equal(H, np.eye(3, n)):
+            self._position_update(*(z - self.state[:3]), R)
+            return
+        if H.shape == (1, n) and np.count_nonzero(H) == 1 and H.max() == 1.0:
+            index = int(np.argmax(H))
+            self._scalar_update(index, z[0] - float(self.state[index]), R[0, 0])
+            return
 
-        # Yenilik kovaryansı
-        S = H @ self.P @ H.T + R
+        # Yenilik (innovation); yalnızca yönü ölçen satırlar normalize edilir
+        y = z - H @ self.state
+        heading_rows = (H[:, self.HEADING] != 0) & (np.count_nonzero(H, axis=1) == 1)
+        for row in np.flatnonzero(heading_rows):
+            y[row] = self._normalize_angle(y[row])
 
-        # Kalman kazancı
+        # Yenilik kovaryansı ve kazanç: K = P Hᵀ S⁻¹ (S = L Lᵀ)
+        PHt = self.P @ H.T
+        S = H @ PHt + R
         try:
-            K = self.P @ H.T @ np.linalg.inv(S)
+            L = np.linalg.cholesky(S)
+            K = np.linalg.solve(L.T, np.linalg.solve(L, PHt.T)).T
         except np.linalg.LinAlgError:
             self.logger.warning("Kalman kazancı hesaplanamadı")
             return
 
         # Durum güncellemesi
-        self.state = self.state + K @ y
+        self.state += K @ y
 
         # Açıyı normalize et
         self.state[2] = self._normalize_angle(self.state[2])
 
-        # Kovaryans güncellemesi
-        I = np.eye(len(self.state))
-        self.P = (I - K @ H) @ self.P
+        # Kovaryans güncellemesi (Joseph formu)
+        I_KH = np.eye(n) - K @ H
+        self.P[...] = I_KH @ self.P @ I_KH.T + K @ R @ K.T
 
     def _normalize_angle(self, angle: float) -> float:
         """Açıyı [-pi, pi] aralığında normalize et"""
-        while angle > np.pi:
-            angle -= 2 * np.pi
-        while angle < -np.pi:
-            angle += 2 * np.pi
-        return angle
+        return math.remainder(angle, 2 * math.pi)
 
     def get_position(self) -> Position:
         """Mevcut pozisyonu Position objesi olarak döndür - testlerin beklediği format"""
@@ -219,7 +386,7 @@ class KalmanOdometry:
             x=float(self.state[0]),
             y=float(self.state[1]),
             heading=float(self.state[2]),
-            timestamp=time.time(),
+            timestamp=self._now(),
         )
 
     def get_position_dict(self) -> Dict[str, float]:
@@ -228,7 +395,7 @@ class KalmanOdometry:
             "x": float(self.state[0]),
             "y": float(self.state[1]),
             "heading": float(self.state[2]),
-            "timestamp": time.time(),
+            "timestamp": self._now(),
         }
 
     def get_velocity(self) -> Dict[str, float]:
@@ -252,6 +419,10 @@ class KalmanOdometry:
             "heading_std": float(std_devs[2]),
         }
 
+    def _velocity_variances(self) -> Tuple[float, float]:
+        """Doğrusal ve açısal hız varyansları"""
+        return float(self.P[3, 3] + self.P[4, 4]), float(self.P[5, 5])
+
     def calibrate_heading(self, true_heading: float):
         """Başlık kalibrasyonu"""
         current_heading = self.state[2]
@@ -267,22 +438,24 @@ class KalmanOdometry:
     def get_statistics(self) -> Dict[str, float]:
         """İstatistikleri döndür"""
         position_uncertainty = np.sqrt(np.trace(self.P[:2, :2]))  # X-Y belirsizliği
+        velocity = self.get_velocity()
+        linear_variance, angular_variance = self._velocity_variances()
 
         stats = {
             "total_distance": self.total_distance,
             "position_uncertainty": position_uncertainty,
             "heading_uncertainty": np.sqrt(self.P[2, 2]),
-            "velocity_uncertainty": np.sqrt(self.P[3, 3] + self.P[4, 4]),
-            "angular_velocity_uncertainty": np.sqrt(self.P[5, 5]),
+            "velocity_uncertainty": np.sqrt(linear_variance),
+            "angular_velocity_uncertainty": np.sqrt(angular_variance),
             "position": {  # Testlerin beklediği format
                 "x": self.state[0],
                 "y": self.state[1],
                 "heading": self.state[2],
             },
             "velocity": {  # Testlerin beklediği format
-                "vx": self.state[3],
-                "vy": self.state[4],
-                "angular": self.state[5],
+                "vx": velocity["linear_x"],
+                "vy": velocity["linear_y"],
+                "angular": velocity["angular"],
             },
             "covariance_trace": float(np.trace(self.P)),
             "last_update": getattr(self, "last_update_time", 0.0),
@@ -394,11 +567,18 @@ class KalmanOdometry:
 
 # Test ve simülasyon için yardımcı sınıf
 class OdometrySimulator:
-    """Odometri test ve simülasyon sınıfı"""
+    """
+    Odometri test ve simülasyon sınıfı
+
+    Ölçümler sanal zaman damgasıyla verilir; realtime=True değilse adımlar
+    arasında beklenmez (simülasyon CPU hızında koşar).
+    """
 
-    def __init__(self, odometry: KalmanOdometry):
+    def __init__(self, odometry: KalmanOdometry, realtime: bool = False):
         self.odometry = odometry
         self.true_position = Position()
+        self.realtime = realtime
+        self.sim_time: Optional[float] = None  # Son ölçümün sanal zamanı
 
     def simulate_movement(
         self,
@@ -410,8 +590,12 @@ class OdometrySimulator:
         """Hareket simülasyonu"""
         dt = 0.1  # 10Hz simülasyon
         steps = int(duration / dt)
+        if self.sim_time is None:
+            self.sim_time = self.odometry.last_update_time
 
         for _ in range(steps):
+            self.sim_time += dt
+
             # Gerçek pozisyonu güncelle
             self.true_position.x += linear_vel * np.cos(self.true_position.heading) * dt
             self.true_position.y += linear_vel * np.sin(self.true_position.heading) * dt
@@ -441,24 +625,27 @@ class OdometrySimulator:
             )
 
             # Odometri güncelle
-            self.odometry.update_encoder(left_ticks, right_ticks, ticks_per_rev)
+            self.odometry.update_encoder(
+                left_ticks, right_ticks, ticks_per_rev, timestamp=self.sim_time
+            )
 
             # IMU güncellemesi (az gürültü ile)
             imu_heading = self.true_position.heading + np.random.normal(0, 0.001)
             self.odometry.update_imu(imu_heading, angular_vel)
 
-            time.sleep(dt)
+            if self.realtime:
+                time.sleep(dt)
 
     def get_error(self) -> Dict[str, float]:
         """Gerçek pozisyon ile tahmin arasındaki hata"""
         estimated = self.odometry.get_position()
 
         return {
-            "x_error": abs(self.true_position.x - estimated["x"]),
-            "y_error": abs(self.true_position.y - estimated["y"]),
+            "x_error": abs(self.true_position.x - estimated.x),
+            "y_error": abs(self.true_position.y - estimated.y),
             "heading_error": abs(
                 self.odometry._normalize_angle(
-                    self.true_position.heading - estimated["heading"]
+                    self.true_position.heading - estimated.heading
                 )
             ),
         }
@@ -488,7 +675,7 @@ if __name__ == "__main__":
     stats = odometry.get_statistics()
 
     print(
-        f"Final pozisyon: x={final_pos['x']:.3f}, y={final_pos['y']:.3f}, heading={final_pos['heading']:.3f}"
+        f"Final pozisyon: x={final_pos.x:.3f}, y={final_pos.y:.3f}, heading={final_pos.heading:.3f}"
     )
     print(
         f"Pozisyon hatası: x={error['x_error']:.3f}, y={error['y_error']:.3f}, heading={error['heading_error']:.3f}"
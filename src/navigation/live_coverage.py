@@ -0,0 +1,303 @@
+"""
+Canlı Kapsama Haritası Modülü
+Görev sırasında odometri pozlarından bıçağın gerçekten geçtiği hücreleri
+bit paketli karolarda (tile) tutar; diske kaydeder ve web arayüzüne yalnızca
+değişen karoları gönderir
+"""
+
+import base64
+import logging
+import math
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .coverage_map import CoverageGrid, swath_row_intervals
+
+
+class LiveCoverageMap:
+    """
+    Sınırsız dünya ızgarası üzerinde bit paketli kapsama karoları.
+
+    Hücre (ix, iy), [ix * res, (ix + 1) * res) aralığını kaplar. Karolar
+    tile_size x tile_size hücredir ve np.packbits ile saklanır (64'lük
+    karo 512 bayt). Karo sayısı max_tiles ile sınırlıdır; sınır dolunca
+    yeni karolara düşen hücreler atlanır ve dropped_cells'te sayılır.
+    """
+
+    def __init__(
+        self,
+        resolution: float = 0.1,
+        blade_width: float = 0.5,
+        tile_size: int = 64,
+        max_tiles: int = 16384,
+        max_step: float = 2.0,
+    ):
+        self.logger = logging.getLogger("LiveCoverageMap")
+        self.resolution = resolution
+        self.blade_width = blade_width
+        self.tile_size = tile_size
+        self.max_tiles = max_tiles
+        self.max_step = max_step  # Daha uzun poz sıçramaları iz sayılmaz
+
+        self.tiles: Dict[Tuple[int, int], np.ndarray] = {}
+        self.tile_versions: Dict[Tuple[int, int], int] = {}
+        self.version = 0  # Her değişiklikte artar (temizlemede sıfırlanmaz)
+        self.reset_version = 0  # Son temizlemenin sürümü
+        self.covered_cells = 0
+        self.dropped_cells = 0
+        self._last_point: Optional[np.ndarray] = None
+        self._lock = threading.Lock()
+
+    @property
+    def covered_area(self) -> float:
+        """Biçilen alan (m²)"""
+        return self.covered_cells * self.resolution**2
+
+    def clear(self):
+        """Haritayı boşalt (yeni görev)"""
+        with self._lock:
+            self.tiles.clear()
+            self.tile_versions.clear()
+            self.version += 1
+            self.reset_version = self.version
+            self.covered_cells = 0
+            self.dropped_cells = 0
+            self._last_point = None
+
+    def update(self, x: float, y: float, cutting: bool) -> int:
+        """
+        Yeni pozu işle: bıçak açıksa önceki pozdan bu poza izi ekle.
+
+        Returns:
+            Yeni biçilen hücre sayısı
+        """
+        point = np.array([x, y], dtype=float)
+        with self._lock:
+            if not cutting:
+                self._last_point = None
+                return 0
+
+            start = self._last_point
+            if start is None or math.hypot(*(point - start)) > self.max_step:
+                start = point
+            self._last_point = point
+            return self._mark(start[None], point[None])
+
+    def add_path(self, points: Any) -> int:
+        """Bıçak açık sürülmüş bir rotayı toplu ekle"""
+        xy = np.asarray(points, dtype=float).reshape(-1, 2)
+        if len(xy) == 0:
+            return 0
+        if len(xy) == 1:
+            xy = np.vstack((xy, xy))
+        with self._lock:
+            return self._mark(xy[:-1], xy[1:])
+
+    def _index_range(
+        self, start: np.ndarray, end: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Merkezi yarı açık [start, end) aralığında kalan hücre indeksleri"""
+        first = np.ceil(start / self.resolution - 0.5).astype(np.int64)
+        last = np.ceil(end / self.resolution - 0.5).astype(np.int64) - 1
+        return first, last
+
+    def _mark(self, starts: np.ndarray, ends: np.ndarray) -> int:
+        """Segment kapsüllerinin hücrelerini karolara işle"""
+        radius = self.blade_width / 2
+        row_first, row_last = self._index_range(
+            np.minimum(starts[:, 1], ends[:, 1]) - radius,
+            np.maximum(starts[:, 1], ends[:, 1]) + radius,
+        )
+        counts = np.maximum(row_last - row_first + 1, 0)
+        owner = np.repeat(np.arange(len(starts)), counts)
+        offsets = np.arange(counts.sum()) - np.repeat(
+            np.cumsum(counts) - counts, counts
+        )
+        rows = np.repeat(row_first, counts) + offsets
+        ys = (rows + 0.5) * self.resolution
+
+        x_start, x_end = swath_row_intervals(starts, ends, radius, ys, owner)
+        col_first, col_last = self._index_range(x_start, x_end)
+        counts = np.maximum(col_last - col_first + 1, 0)
+        offsets = np.arange(counts.sum()) - np.repeat(
+            np.cumsum(counts) - counts, counts
+        )
+        ix = np.repeat(col_first, counts) + offsets
+        iy = np.repeat(rows, counts)
+        if len(ix) == 0:
+            return 0
+
+        tiles, local, groups = self._group_by_tile(ix, iy)
+        size = self.tile_size
+
+        added = 0
+        version = self.version + 1
+        for k, (tx, ty) in enumerate(tiles):
+            key = (int(tx), int(ty))
+            cells = np.unique(local[groups[k]])
+            packed = self.tiles.get(key)
+            if packed is None:
+                if len(self.tiles) >= self.max_tiles:
+                    self.dropped_cells += len(cells)
+                    continue
+                bits = np.zeros(size * size, dtype=bool)
+            else:
+                bits = np.unpackbits(packed, count=size * size).astype(bool)
+
+            new = cells[~bits[cells]]
+            if len(new) == 0:
+                continue
+            bits[new] = True
+            self.tiles[key] = np.packbits(bits)
+            self.tile_versions[key] = version
+            added += len(new)
+
+        if added:
+            self.version = version
+            self.covered_cells += added
+        return added
+
+    def _group_by_tile(self, ix: np.ndarray, iy: np.ndarray):
+        """
+        Hücreleri karolara göre grupla.
+
+        Returns:
+            (tiles, local, groups): (T, 2) karo koordinatları, karo içi bit
+            indeksleri ve her karo için hücre indeks dizileri
+        """
+        # Negatif koordinatlarda da taban bölme
+        size = self.tile_size
+        tile_xy = np.stack((ix // size, iy // size), axis=1)
+        local = (iy - tile_xy[:, 1] * size) * size + (ix - tile_xy[:, 0] * size)
+        tiles, inverse = np.unique(tile_xy, axis=0, return_inverse=True)
+        order = np.argsort(inverse.reshape(-1), kind="stable")
+        bounds = np.searchsorted(inverse.reshape(-1)[order], np.arange(len(tiles) + 1))
+        groups = [order[bounds[k] : bounds[k + 1]] for k in range(len(tiles))]
+        return tiles, local, groups
+
+    def covered(self, points: Any) -> np.ndarray:
+        """Noktaların bulunduğu hücreler biçildi mi?"""
+        xy = np.asarray(points, dtype=float).reshape(-1, 2)
+        ix = np.floor(xy[:, 0] / self.resolution).astype(np.int64)
+        iy = np.floor(xy[:, 1] / self.resolution).astype(np.int64)
+        result = np.zeros(len(xy), dtype=bool)
+        if len(xy) == 0:
+            return result
+
+        tiles, local, groups = self._group_by_tile(ix, iy)
+        count = self.tile_size * self.tile_size
+        with self._lock:
+            for (tx, ty), group in zip(tiles, groups):
+                packed = self.tiles.get((int(tx), int(ty)))
+                if packed is not None:
+                    bits = np.unpackbits(packed, count=count).astype(bool)
+                    result[group] = bits[local[group]]
+        return result
+
+    def coverage_grid(
+        self, boundary: Any, obstacles: Optional[Sequence[Any]] = None
+    ) -> CoverageGrid:
+        """
+        Alan için kapsama ızgarası (biçilen hücrelerde passes = 1).
+
+        Kaçırılan bölgeler report().missed_polygons ile alınabilir.
+        """
+        grid = CoverageGrid(boundary, obstacles, self.resolution)
+        xs = grid.origin[0] + (np.arange(grid.width) + 0.5) * grid.resolution
+        centers = np.stack(np.meshgrid(xs, grid.row_centers()), axis=-1)
+        covered = self.covered(centers.reshape(-1, 2))
+        grid.passes = covered.reshape(grid.height, grid.width).astype(np.uint16)
+        return grid
+
+    def delta(self, since: int = 0) -> Dict[str, Any]:
+        """
+        since sürümünden sonra değişen karolar (base64 bit paketleri).
+
+        İstemci since'i önceki yanıttaki version ile gönderir. Harita o
+        tarihten sonra temizlendiyse reset=True ile tüm karolar döner.
+        """
+        with self._lock:
+            reset = since < self.reset_version
+            tiles = [
+                {
+                    "x": key[0],
+                    "y": key[1],
+                    "bits": base64.b64encode(self.tiles[key].tobytes()).decode(),
+                }
+                for key, version in self.tile_versions.items()
+                if reset or version > since
+            ]
+            return {
+                "version": self.version,
+                "reset": reset,
+                "resolution": self.resolution,
+                "tile_size": self.tile_size,
+                "covered_area": self.covered_area,
+                "tiles": tiles,
+            }
+
+    def save(self, path: str, **metadata: str) -> bool:
+        """Karoları sıkıştırılmış npz olarak kaydet (atomik)"""
+        with self._lock:
+            keys = list(self.tiles)
+            arrays = {
+                "tile_xy": np.array(keys, dtype=np.int64).reshape(-1, 2),
+                "bits": np.array([self.tiles[k] for k in keys], dtype=np.uint8),
+                "resolution": np.array(self.resolution),
+                "tile_size": np.array(self.tile_size),
+            }
+        for name, value in metadata.items():
+            arrays[f"meta_{name}"] = np.array(str(value))
+
+        try:
+            target = Path(path)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = target.with_suffix(".tmp")
+            with open(tmp_path, "wb") as f:
+                np.savez_compressed(f, **arrays)
+            os.replace(tmp_path, target)
+        except OSError as e:
+            self.logger.warning(f"Kapsama haritası yazılamadı: {e}")
+            return False
+        return True
+
+    def load(self, path: str) -> Optional[Dict[str, str]]:
+        """
+        Kayıtlı karoları yükle (mevcut harita değiştirilir).
+
+        Returns:
+            Kayıt metadata'sı; dosya yoksa, bozuksa veya ızgara farklıysa None
+        """
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                tile_xy = data["tile_xy"]
+                bits = data["bits"]
+                resolution = float(data["resolution"])
+                tile_size = int(data["tile_size"])
+                metadata = {
+                    name[len("meta_") :]: str(data[name])
+                    for name in data.files
+                    if name.startswith("meta_")
+                }
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.warning(f"Kapsama haritası okunamadı: {path} ({e})")
+            return None
+
+        if resolution != self.resolution or tile_size != self.tile_size:
+            return None
+
+        self.clear()
+        with self._lock:
+            for (tx, ty), packed in zip(tile_xy, bits):
+                key = (int(tx), int(ty))
+                self.tiles[key] = packed.copy()
+                self.tile_versions[key] = self.version
+                count = tile_size * tile_size
+                self.covered_cells += int(np.unpackbits(packed, count=count).sum())
+        return metadata
@@ -0,0 +1,229 @@
+"""
+Ölçüm Kuyruğu Modülü
+Zaman damgalı enkoder, IMU ve GPS ölçümlerini sensör thread'lerinden alır
+ve odometri filtresine örnekleme zamanı sırasıyla uygular
+"""
+
+import bisect
+import logging
+import math
+from collections import deque
+from typing import Any, Deque, List, Optional, Tuple
+
+import numpy as np
+
+# Ölçüm türleri (aynı zaman damgasında bu sırayla uygulanır)
+ENCODER = 0
+IMU = 1
+GPS = 2
+
+
+def apply_measurement(odometry: Any, kind: int, values: List[float], timestamp: float):
+    """Tek ölçümü türüne göre filtreye uygula"""
+    if kind == ENCODER:
+        odometry.update_encoder(
+            int(values[0]), int(values[1]), int(values[2]), timestamp=timestamp
+        )
+    elif kind == IMU:
+        rate = None if math.isnan(values[1]) else values[1]
+        odometry.update_imu(values[0], rate)
+    else:
+        odometry.update_position(values[0], values[1], values[2])
+
+
+class SensorRing:
+    """
+    Tek üreticili, tek tüketicili (SPSC) ölçüm halkası.
+
+    Üretici yalnızca _head'i, tüketici yalnızca _tail'i yazar; head slot
+    yazıldıktan sonra artırıldığından tüketici yarım ölçüm görmez ve kilit
+    gerekmez. Halka doluysa yeni ölçüm düşürülür (dropped).
+    """
+
+    def __init__(self, capacity: int = 256, width: int = 3):
+        self.capacity = capacity
+        self.timestamps = np.zeros(capacity)
+        self.values = np.zeros((capacity, width))
+        self.dropped = 0
+
+        self._head = 0  # Yazılan toplam ölçüm (üretici)
+        self._tail = 0  # Okunan toplam ölçüm (tüketici)
+
+    def __len__(self) -> int:
+        return self._head - self._tail
+
+    def push(self, timestamp: float, *values: float) -> bool:
+        """Ölçüm ekle (üretici thread; halka doluysa False)"""
+        head = self._head
+        if head - self._tail >= self.capacity:
+            self.dropped += 1
+            return False
+        slot = head % self.capacity
+        self.timestamps[slot] = timestamp
+        self.values[slot, : len(values)] = values
+        self._head = head + 1
+        return True
+
+    def drain(self) -> Tuple[List[float], List[List[float]]]:
+        """Hazır ölçümlerin tümünü al (tüketici thread)"""
+        tail, head = self._tail, self._head
+        slots = np.arange(tail, head) % self.capacity
+        timestamps = self.timestamps[slots].tolist()
+        values = self.values[slots].tolist()
+        self._tail = head
+        return timestamps, values
+
+
+class MeasurementQueue:
+    """
+    Odometri filtresi için zaman damgalı ölçüm kuyruğu.
+
+    Her sensörün kendi SensorRing'i vardır (her biri tek üretici). process()
+    halkaları boşaltır ve ölçümleri zaman damgası sırasıyla filtreye uygular.
+    Son uygulanan ölçümden eski (geç gelen) bir ölçüm replay_window içindeyse
+    filtre o anın anlık görüntüsüne döndürülür ve sonraki ölçümler yeniden
+    uygulanır; daha eski ölçümler atılır (stale). pose_history verilirse her
+    ölçümden sonraki poz kaydedilir, yeniden oynatmada düzeltilir. record
+    açıkken işlenen ölçümler recorded listesine (zaman, tür, değerler)
+    eklenir; SensorLog.from_records ile kayıt oynatılabilir.
+    """
+
+    def __init__(
+        self,
+        odometry: Any,
+        replay_window: float = 0.5,
+        capacity: int = 256,
+        pose_history: Optional[Any] = None,
+        record: bool = False,
+    ):
+        self.logger = logging.getLogger("MeasurementQueue")
+        self.odometry = odometry
+        self.replay_window = replay_window
+        self.pose_history = pose_history
+        self.record = record
+        self.recorded: List[Tuple[float, int, List[float]]] = []
+        self.rings = {
+            ENCODER: SensorRing(capacity),
+            IMU: SensorRing(capacity),
+            GPS: SensorRing(capacity),
+        }
+
+        # İstatistikler
+        self.applied = 0
+        self.late = 0  # Yeniden oynatmayla yerine konan ölçüm
+        self.replayed = 0  # Yeniden uygulanan ölçüm
+        self.stale = 0  # Pencere dışında kalıp atılan ölçüm
+
+        # Uygulanan ölçümler: (zaman, tür, değerler, uygulamadan önceki durum)
+        self._history: Deque[Tuple[float, int, List[float], tuple]] = deque()
+        self._times: Deque[float] = deque()
+        self._sync_time: Optional[float] = None  # İlk enkoder örneğinin zamanı
+
+    def push_encoder(
+        self,
+        timestamp: float,
+        left_ticks: int,
+        right_ticks: int,
+        ticks_per_revolution: int = 1000,
+    ) -> bool:
+        """Enkoder artışı (son örnekten bu yana tick'ler)"""
+        return self.rings[ENCODER].push(
+            timestamp, left_ticks, right_ticks, ticks_per_revolution
+        )
+
+    def push_imu(
+        self, timestamp: float, heading: float, angular_velocity: Optional[float] = None
+    ) -> bool:
+        """IMU yönü ve (varsa) jiroskop hızı"""
+        rate = math.nan if angular_velocity is None else angular_velocity
+        return self.rings[IMU].push(timestamp, heading, rate)
+
+    def push_gps(self, timestamp: float, x: float, y: float, variance: float) -> bool:
+        """Yerel koordinatta GPS konumu ve varyansı (m²)"""
+        return self.rings[GPS].push(timestamp, x, y, variance)
+
+    @property
+    def dropped(self) -> int:
+        """Halka dolduğu için düşen ölçüm sayısı"""
+        return sum(ring.dropped for ring in self.rings.values())
+
+    @property
+    def last_timestamp(self) -> Optional[float]:
+        """Son uygulanan ölçümün zamanı"""
+        return self._times[-1] if self._times else None
+
+    def process(self) -> int:
+        """Bekleyen ölçümleri zaman sırasıyla uygula (uygulanan sayısı)"""
+        batch = []
+        for kind, ring in self.rings.items():
+            timestamps, values = ring.drain()
+            batch.extend((t, kind, v) for t, v in zip(timestamps, values))
+        if not batch:
+            return 0
+
+        batch.sort(key=lambda measurement: (measurement[0], measurement[1]))
+        if self.record:
+            self.recorded.extend(batch)
+        count = 0
+        for timestamp, kind, values in batch:
+            count += self._insert(timestamp, kind, values)
+        self._trim()
+        return count
+
+    def _insert(self, timestamp: float, kind: int, values: List[float]) -> int:
+        """Ölçümü sırasına yerleştir, gerekirse sonrakileri yeniden oynat"""
+        times = self._times
+        if not times or timestamp >= times[-1]:
+            self._apply(timestamp, kind, values)
+            self.applied += 1
+            return 1
+
+        if timestamp < times[-1] - self.replay_window or (
+            kind == ENCODER
+            and self._sync_time is not None
+            and timestamp <= self._sync_time
+        ):
+            self.stale += 1
+            return 0
+
+        index = bisect.bisect_right(times, timestamp)
+        self.odometry.restore(self._history[index][3])
+        later = [self._history.pop() for _ in range(len(times) - index)]
+        for _ in later:
+            times.pop()
+        if self.pose_history is not None:
+            self.pose_history.truncate(timestamp)
+
+        self._apply(timestamp, kind, values)
+        for entry in reversed(later):
+            self._apply(*entry[:3])
+        self.applied += 1
+        self.late += 1
+        self.replayed += len(later)
+        return 1
+
+    def _apply(self, timestamp: float, kind: int, values: List[float]):
+        """Tek ölçümü filtreye uygula ve geçmişe yaz"""
+        odometry = self.odometry
+        self._history.append((timestamp, kind, values, odometry.snapshot()))
+        self._times.append(timestamp)
+
+        if kind == ENCODER and (
+            self._sync_time is None or timestamp == self._sync_time
+        ):
+            # İlk örnek yalnızca zaman referansıdır (aralığı bilinmiyor)
+            odometry.last_update_time = timestamp
+            self._sync_time = timestamp
+        else:
+            apply_measurement(odometry, kind, values, timestamp)
+
+        if self.pose_history is not None:
+            self.pose_history.record(odometry, timestamp)
+
+    def _trim(self):
+        """Yeniden oynatma penceresinin dışındaki geçmişi at"""
+        times = self._times
+        oldest = times[-1] - self.replay_window
+        while times and times[0] < oldest:
+            times.popleft()
+            self._history.popleft()
@@ -0,0 +1,179 @@
+"""
+Görev Sıralama Modülü
+Birden fazla alanı tek görevde biçmek için ziyaret sırasını (en yakın komşu +
+2-opt) ve alanlar arası geçiş yollarını belirler
+"""
+
+import math
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .polygon_geometry import VisibilityGraph, polygon_to_array
+
+
+@dataclass
+class MissionPlan:
+    """Sıralanmış çok alanlı görev"""
+
+    order: List[str]  # Alan ziyaret sırası
+    reversed: List[bool]  # Alan rotası ters yönde mi sürülecek
+    transits: List[np.ndarray] = field(default_factory=list)  # Uçlar dahil (K, 2)
+    transit_length: float = 0.0  # Toplam geçiş yolu (metre)
+
+
+def _distance(a: np.ndarray, b: np.ndarray) -> float:
+    return float(math.hypot(a[0] - b[0], a[1] - b[1]))
+
+
+def order_areas(
+    start: Sequence[float],
+    entries: np.ndarray,
+    exits: np.ndarray,
+    return_to_start: bool = True,
+    max_passes: int = 50,
+) -> Tuple[List[int], List[bool]]:
+    """
+    Alan ziyaret sırası: en yakın komşu + 2-opt.
+
+    Her alan bir giriş ve bir çıkış noktasıyla temsil edilir ve ters
+    yönde de sürülebilir. 2-opt bir alt diziyi ters çevirdiğinde içindeki
+    alanların yönü de döner; iç geçişlerin uzunluğu değişmediği için
+    yalnızca iki uçtaki geçiş karşılaştırılır.
+
+    Args:
+        start: Başlangıç (şarj istasyonu) konumu
+        entries: (N, 2) alan giriş noktaları
+        exits: (N, 2) alan çıkış noktaları
+        return_to_start: Tur sonunda başlangıca dönülecek mi
+
+    Returns:
+        (sıra, ters_mi) listeleri
+    """
+    start = np.asarray(start, dtype=float)
+    entries = np.asarray(entries, dtype=float).reshape(-1, 2)
+    exits = np.asarray(exits, dtype=float).reshape(-1, 2)
+    n = len(entries)
+    if n == 0:
+        return [], []
+
+    # En yakın komşu: her adımda en yakın giriş ucu (ters yön dahil)
+    order: List[int] = []
+    flipped: List[bool] = []
+    remaining = set(range(n))
+    position = start
+    while remaining:
+        best = None
+        for k in sorted(remaining):
+            for flip in (False, True):
+                entry = exits[k] if flip else entries[k]
+                cost = _distance(position, entry)
+                if best is None or cost < best[0] - 1e-12:
+                    best = (cost, k, flip)
+        _, k, flip = best
+        order.append(k)
+        flipped.append(flip)
+        remaining.remove(k)
+        position = entries[k] if flip else exits[k]
+
+    # 2-opt
+    for _ in range(max_passes):
+        improved = False
+        heads = [exits[k] if f else entries[k] for k, f in zip(order, flipped)]
+        tails = [entries[k] if f else exits[k] for k, f in zip(order, flipped)]
+        for i in range(n):
+            prev_out = start if i == 0 else tails[i - 1]
+            for j in range(i, n):
+                if j + 1 < n:
+                    next_in = heads[j + 1]
+                elif return_to_start:
+                    next_in = start
+                else:
+                    next_in = None
+
+                before = _distance(prev_out, heads[i])
+                after = _distance(prev_out, tails[j])
+                if next_in is not None:
+                    before += _distance(tails[j], next_in)
+                    after += _distance(heads[i], next_in)
+
+                if after < before - 1e-9:
+                    order[i : j + 1] = order[i : j + 1][::-1]
+                    flipped[i : j + 1] = [not f for f in flipped[i : j + 1]][::-1]
+                    improved = True
+                    break
+            if improved:
+                break
+        if not improved:
+            break
+
+    return order, flipped
+
+
+class MissionSequencer:
+    """
+    Çok alanlı görev planlayıcı.
+
+    Alanların rotaları önceden planlanmış kabul edilir; sequencer yalnızca
+    ziyaret sırasını ve alanlar arası geçiş yollarını üretir. Geçişler tüm
+    alanların engelleri etrafından görünürlük grafı ile dolaşır.
+    """
+
+    def __init__(self, clearance: float = 0.3, margin: float = 5.0):
+        self.clearance = clearance  # Engellerden geçiş mesafesi (metre)
+        self.margin = margin  # Geçiş bölgesinin alanlar dışına taşma payı
+
+    def sequence(
+        self,
+        start: Sequence[float],
+        paths: Dict[str, Any],
+        obstacles: Optional[Sequence[Any]] = None,
+        return_to_start: bool = True,
+    ) -> MissionPlan:
+        """
+        Alanları sırala ve geçiş yollarını üret.
+
+        Args:
+            start: Şarj istasyonu konumu (x, y)
+            paths: {alan_id: rota noktaları}; boş rotalı alanlar atlanır
+            obstacles: Geçişte kaçınılacak engel poligonları
+            return_to_start: Son alandan istasyona dönüş geçişi eklensin mi
+
+        Returns:
+            transits[k], k. alana giden geçiştir; return_to_start ise son
+            eleman istasyona dönüştür
+        """
+        start = np.asarray(start, dtype=float)
+        ids = [area_id for area_id, path in paths.items() if len(path)]
+        arrays = [polygon_to_array(paths[area_id]) for area_id in ids]
+        if not ids:
+            return MissionPlan(order=[], reversed=[])
+
+        entries = np.array([xy[0] for xy in arrays])
+        exits = np.array([xy[-1] for xy in arrays])
+        order, flipped = order_areas(start, entries, exits, return_to_start)
+
+        # Geçiş bölgesi: tüm rotaları ve istasyonu kapsayan dikdörtgen
+        everything = np.vstack(arrays + [start[None]])
+        lo = everything.min(axis=0) - self.margin
+        hi = everything.max(axis=0) + self.margin
+        region = np.array(
+            [[lo[0], lo[1]], [hi[0], lo[1]], [hi[0], hi[1]], [lo[0], hi[1]]]
+        )
+        graph = VisibilityGraph(region, list(obstacles or []), self.clearance)
+
+        plan = MissionPlan(order=[ids[k] for k in order], reversed=flipped)
+        position = start
+        for k, flip in zip(order, flipped):
+            entry = exits[k] if flip else entries[k]
+            plan.transits.append(graph.shortest_path(position, entry))
+            position = entries[k] if flip else exits[k]
+        if return_to_start:
+            plan.transits.append(graph.shortest_path(position, start))
+
+        for transit in plan.transits:
+            steps = np.diff(transit, axis=0)
+            plan.transit_length += float(np.hypot(steps[:, 0], steps[:, 1]).sum())
+
+        return plan
@@ -6,7 +6,7 @@ Real-time engel algılama ve kaçınma algoritmaları
 import logging
 import time
 import math
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -30,6 +30,8 @@ class Obstacle:
     type: ObstacleType = ObstacleType.IR_DETECTED
     confidence: float = 1.0
     timestamp: float = 0.0
+    world_x: Optional[float] = None  # Örnek anındaki pozla dünya koordinatı
+    world_y: Optional[float] = None
 
 
 class ObstacleAvoidance:
@@ -53,6 +55,9 @@ class ObstacleAvoidance:
         self.detected_obstacles: List[Obstacle] = []
         self.last_sensor_update = 0
 
+        # Örnek anındaki robot pozu (PoseHistory; yoksa dünya koordinatı yok)
+        self.pose_history: Optional[Any] = None
+
         # Avoidance state
         self.avoidance_active = False
         self.last_avoidance_command = {"linear": 0, "angular": 0}
@@ -75,10 +80,12 @@ class ObstacleAvoidance:
         self.camera_objects = []
         self.sensor_weights = {"ir": 0.4, "lidar": 0.4, "camera": 0.2}
 
-    def update_ir_sensors(self, sensor_readings: Dict[str, float]):
-        """IR sensör verilerini güncelle"""
+    def update_ir_sensors(
+        self, sensor_readings: Dict[str, float], timestamp: Optional[float] = None
+    ):
+        """IR sensör verilerini güncelle (timestamp: örnekleme zamanı)"""
         try:
-            current_time = time.time()
+            current_time = time.time() if timestamp is None else timestamp
             new_obstacles = []
 
             for i, angle_deg in enumerate(self.ir_sensor_angles):
@@ -104,12 +111,15 @@ class ObstacleAvoidance:
                         )
                         new_obstacles.append(obstacle)
 
+            self._georeference(new_obstacles, current_time)
+
             # Eski engelleri temizle (5 saniyeden eski)
             self.detected_obstacles = [
                 obs
                 for obs in self.detected_obstacles
                 if current_time - obs.timestamp < 5.0
             ]
+            self._georeference_pending()
 
             # Yeni engelleri ekle
             self.detected_obstacles.extend(new_obstacles)
@@ -122,6 +132,25 @@ class ObstacleAvoidance:
         except Exception as e:
             self.logger.error(f"IR sensör güncelleme hatası: {e}")
 
+    def _georeference(self, obstacles: List[Obstacle], timestamp: float):
+        """Robot merkezli engellere örnek anındaki pozla dünya koordinatı ata"""
+        if self.pose_history is None or not obstacles:
+            return
+        pose = self.pose_history.pose_at(timestamp)
+        if pose is None:
+            return
+
+        cos_h, sin_h = math.cos(pose.heading), math.sin(pose.heading)
+        for obs in obstacles:
+            obs.world_x = pose.x + obs.x * cos_h - obs.y * sin_h
+            obs.world_y = pose.y + obs.x * sin_h + obs.y * cos_h
+
+    def _georeference_pending(self):
+        """Poz geçmişi örnek anına henüz yetişmemiş engelleri yeniden dene"""
+        for obs in self.detected_obstacles:
+            if obs.world_x is None:
+                self._georeference([obs], obs.timestamp)
+
     def check_path_clear(
         self,
         target_x: float,
@@ -322,10 +351,12 @@ class ObstacleAvoidance:
             ),
         }
 
-    def update_lidar_data(self, lidar_points: List[Tuple[float, float]]):
-        """LIDAR nokta bulutunu güncelle"""
+    def update_lidar_data(
+        self, lidar_points: List[Tuple[float, float]], timestamp: Optional[float] = None
+    ):
+        """LIDAR nokta bulutunu güncelle (timestamp: taramanın zamanı)"""
         try:
-            current_time = time.time()
+            current_time = time.time() if timestamp is None else timestamp
             new_obstacles = []
 
             # LIDAR noktalarını engellere çevir
@@ -344,16 +375,19 @@ class ObstacleAvoidance:
                     )
                     new_obstacles.append(obstacle)
 
+            self._georeference(new_obstacles, current_time)
             self.lidar_data = new_obstacles
             self.logger.debug(f"LIDAR güncellendi: {len(new_obstacles)} nokta")
 
         except Exception as e:
             self.logger.error(f"LIDAR güncelleme hatası: {e}")
 
-    def update_camera_objects(self, detected_objects: List[Dict]):
-        """Kamera nesne algılama sonuçlarını güncelle"""
+    def update_camera_objects(
+        self, detected_objects: List[Dict], timestamp: Optional[float] = None
+    ):
+        """Kamera nesne algılama sonuçlarını güncelle (timestamp: kare zamanı)"""
         try:
-            current_time = time.time()
+            current_time = time.time() if timestamp is None else timestamp
             new_obstacles = []
 
             for obj in detected_objects:
@@ -373,6 +407,7 @@ class ObstacleAvoidance:
                     )
                     new_obstacles.append(obstacle)
 
+            self._georeference(new_obstacles, current_time)
             self.camera_objects = new_obstacles
             self.logger.debug(f"Kamera güncellendi: {len(new_obstacles)} nesne")
 
@@ -456,6 +491,18 @@ class ObstacleAvoidance:
                     max_size = max(obs.size for obs in cluster)
                     avg_conf = total_conf / len(cluster)
 
+                    # Dünya koordinatı tüm engellerde varsa aynı ağırlıklarla
+                    world_x = world_y = None
+                    if all(obs.world_x is not None for obs in cluster):
+                        world_x = (
+                            sum(obs.world_x * obs.confidence for obs in cluster)
+                            / total_conf
+                        )
+                        world_y = (
+                            sum(obs.world_y * obs.confidence for obs in cluster)
+                            / total_conf
+                        )
+
                     fused_obs = Obstacle(
                         x=avg_x,
                         y=avg_y,
@@ -463,6 +510,8 @@ class ObstacleAvoidance:
                         type=cluster[0].type,  # İlk engelin tipini al
                         confidence=min(1.0, avg_conf),
                         timestamp=max(obs.timestamp for obs in cluster),
+                        world_x=world_x,
+                        world_y=world_y,
                     )
                     fused_obstacles.append(fused_obs)
 
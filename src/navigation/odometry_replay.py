@@ -0,0 +1,330 @@
+"""
+Odometri Kayıt Oynatma Modülü
+Kayıtlı veya sentetik enkoder/IMU/GPS akışlarını filtreden CPU hızında
+geçirir; görev sonrası iz Rauch-Tung-Striebel yumuşatıcısıyla yeniden
+kurulur ve Q/R ayarı toplu iş olarak yapılır
+"""
+
+import logging
+import math
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .measurement_queue import ENCODER, GPS, IMU, apply_measurement
+from .unicycle_ekf import unicycle_motion
+
+logger = logging.getLogger("OdometryReplay")
+
+
+class ManualClock:
+    """Elle ilerletilen saat (filtrenin clock parametresi için)"""
+
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, dt: float):
+        """Saati dt saniye ilerlet"""
+        self.now += dt
+
+
+class SensorLog:
+    """
+    Kayıtlı sensör ölçümleri (yapı dizileri).
+
+    Satırlar zaman, sonra tür (enkoder, IMU, GPS) sırasına dizilir. Değer
+    sütunları: enkoder (sol tick, sağ tick, tick/tur), IMU (yön, açısal hız
+    veya NaN, -), GPS (x, y, varyans).
+    """
+
+    def __init__(self, times: Any, kinds: Any, values: Any):
+        times = np.asarray(times, dtype=float)
+        kinds = np.asarray(kinds, dtype=np.int8)
+        values = np.asarray(values, dtype=float).reshape(len(times), 3)
+        order = np.lexsort((kinds, times))
+        self.times = times[order]
+        self.kinds = kinds[order]
+        self.values = values[order]
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    @classmethod
+    def from_records(cls, records: Iterable[Tuple[float, int, List[float]]]):
+        """(zaman, tür, değerler) kayıtlarından (MeasurementQueue.recorded)"""
+        records = list(records)
+        return cls(
+            [r[0] for r in records],
+            [r[1] for r in records],
+            np.array([list(r[2]) + [0.0] * (3 - len(r[2])) for r in records]),
+        )
+
+    def save(self, path: str) -> bool:
+        """Sıkıştırılmış npz olarak kaydet (atomik)"""
+        try:
+            target = Path(path)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = target.with_suffix(".tmp")
+            with open(tmp_path, "wb") as f:
+                np.savez_compressed(
+                    f, times=self.times, kinds=self.kinds, values=self.values
+                )
+            os.replace(tmp_path, target)
+        except OSError as e:
+            logger.warning(f"Sensör kaydı yazılamadı: {e}")
+            return False
+        return True
+
+    @classmethod
+    def load(cls, path: str) -> Optional["SensorLog"]:
+        """Kaydı yükle (dosya yoksa veya bozuksa None)"""
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                return cls(data["times"], data["kinds"], data["values"])
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Sensör kaydı okunamadı: {path} ({e})")
+            return None
+
+
+@dataclass
+class ReplayResult:
+    """Oynatma sonucu (her enkoder adımı bir epok)"""
+
+    times: np.ndarray  # (n,)
+    states: np.ndarray  # (n, d) filtre tahmini
+    covariances: np.ndarray  # (n, d, d)
+    smoothed_states: Optional[np.ndarray] = None  # RTS ile (n, d)
+    smoothed_covariances: Optional[np.ndarray] = None
+
+    def trajectory(self, smoothed: bool = False) -> np.ndarray:
+        """x, y, heading sütunları (n, 3)"""
+        states = self.smoothed_states if smoothed else self.states
+        return states[:, :3]
+
+
+def replay(log: SensorLog, odometry: Any, smooth: bool = False) -> ReplayResult:
+    """
+    Kaydı filtreden bekleme olmadan geçir.
+
+    Filtrenin saati ölçüm zamanlarına ayarlanan ManualClock olur. Her
+    tahmin (enkoder) adımı yeni bir epok açar; epokun değeri sonraki
+    tahmine kadarki güncellemelerden sonraki filtre durumudur. İlk enkoder
+    örneği yalnızca zaman referansıdır.
+    """
+    clock = ManualClock(float(log.times[0]) if len(log) else 0.0)
+    odometry.clock = clock
+    odometry.keep_prior = True
+    odometry.prior = None
+
+    n = int(np.count_nonzero(log.kinds == ENCODER)) + 1
+    dim = len(odometry.state)
+    times = np.empty(n)
+    states = np.empty((n, dim))
+    covariances = np.empty((n, dim, dim))
+    if smooth:
+        prior_states = np.empty((n, dim))
+        prior_covariances = np.empty((n, dim, dim))
+        transitions = np.empty((n, dim, dim))
+
+    epoch = 0
+    times[0] = clock.now
+    states[0] = odometry.state
+    covariances[0] = odometry.P
+    synced = False
+
+    for t, kind, values in zip(
+        log.times.tolist(), log.kinds.tolist(), log.values.tolist()
+    ):
+        clock.now = t
+        if kind == ENCODER and not synced:
+            odometry.last_update_time = t
+            synced = True
+        else:
+            apply_measurement(odometry, kind, values, t)
+
+        if odometry.prior is not None:
+            epoch += 1
+            times[epoch] = t
+            if smooth:
+                prior_states[epoch] = odometry.prior[0]
+                prior_covariances[epoch] = odometry.prior[1]
+                transitions[epoch] = odometry.prior[2]
+            odometry.prior = None
+        states[epoch] = odometry.state
+        covariances[epoch] = odometry.P
+
+    odometry.keep_prior = False
+    count = epoch + 1
+    result = ReplayResult(times[:count], states[:count], covariances[:count])
+    if smooth:
+        result.smoothed_states, result.smoothed_covariances = rts_smooth(
+            result.states,
+            result.covariances,
+            prior_states[:count],
+            prior_covariances[:count],
+            transitions[:count],
+        )
+    return result
+
+
+def rts_smooth(
+    states: np.ndarray,
+    covariances: np.ndarray,
+    prior_states: np.ndarray,
+    prior_covariances: np.ndarray,
+    transitions: np.ndarray,
+    heading_index: int = 2,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Rauch-Tung-Striebel geri yönlü yumuşatıcı.
+
+    k epokunun filtre tahmini (x_k, P_k), k+1'in tahmin öncesi değeri
+    (x⁻, P⁻) ve geçiş Jacobian'ı F ile: C = P_k Fᵀ (P⁻)⁻¹,
+    x_k' = x_k + C (x_{k+1}' - x⁻), P_k' = P_k + C (P_{k+1}' - P⁻) Cᵀ.
+    """
+    smoothed_states = states.copy()
+    smoothed_covariances = covariances.copy()
+
+    for k in range(len(states) - 2, -1, -1):
+        prior_P = prior_covariances[k + 1]
+        gain = np.linalg.solve(prior_P, transitions[k + 1] @ covariances[k]).T
+
+        delta = smoothed_states[k + 1] - prior_states[k + 1]
+        delta[heading_index] = math.remainder(delta[heading_index], 2 * math.pi)
+        state = states[k] + gain @ delta
+        state[heading_index] = math.remainder(state[heading_index], 2 * math.pi)
+        smoothed_states[k] = state
+        smoothed_covariances[k] = (
+            covariances[k] + gain @ (smoothed_covariances[k + 1] - prior_P) @ gain.T
+        )
+
+    return smoothed_states, smoothed_covariances
+
+
+def synthesize_log(
+    segments: Iterable[Tuple[float, float, float]],
+    dt: float = 0.05,
+    wheel_base: float = 0.5,
+    wheel_radius: float = 0.1,
+    ticks_per_revolution: int = 1000,
+    wheel_noise: float = 1e-4,
+    imu_noise: float = 0.01,
+    gyro_noise: float = 0.01,
+    gps_every: int = 0,
+    gps_noise: float = 0.5,
+    seed: int = 0,
+    start_time: float = 0.0,
+) -> Tuple[SensorLog, np.ndarray]:
+    """
+    (doğrusal hız, açısal hız, süre) parçalarından sentetik sensör kaydı.
+
+    Tekerlek yollarına yolla orantılı kayma gürültüsü eklenir, tick'ler
+    kalan taşınarak tamsayıya çevrilir. gps_every > 0 ise her o kadar
+    adımda bir GPS konumu eklenir. Gerçek iz (t, x, y, heading) ile döner.
+    """
+    rng = np.random.default_rng(seed)
+    per_tick = 2 * math.pi * wheel_radius / ticks_per_revolution
+
+    records = [(start_time, ENCODER, [0.0, 0.0, ticks_per_revolution])]
+    truth = [(start_time, 0.0, 0.0, 0.0)]
+    x = y = theta = 0.0
+    t = start_time
+    measured_left = measured_right = 0.0
+    ticks_left = ticks_right = 0
+    step = 0
+
+    for linear, angular, duration in segments:
+        for _ in range(int(round(duration / dt))):
+            step += 1
+            t = start_time + step * dt
+            left = (linear - angular * wheel_base / 2) * dt
+            right = (linear + angular * wheel_base / 2) * dt
+            x, y, theta, _, _ = unicycle_motion(
+                x, y, theta, left, right, wheel_base, dt
+            )
+            theta = math.remainder(theta, 2 * math.pi)
+            truth.append((t, x, y, theta))
+
+            measured_left += left + rng.normal(0, math.sqrt(wheel_noise * abs(left)))
+            measured_right += right + rng.normal(0, math.sqrt(wheel_noise * abs(right)))
+            new_left = math.floor(measured_left / per_tick)
+            new_right = math.floor(measured_right / per_tick)
+            records.append(
+                (
+                    t,
+                    ENCODER,
+                    [
+                        new_left - ticks_left,
+                        new_right - ticks_right,
+                        ticks_per_revolution,
+                    ],
+                )
+            )
+            ticks_left, ticks_right = new_left, new_right
+
+            records.append(
+                (
+                    t,
+                    IMU,
+                    [
+                        theta + rng.normal(0, imu_noise),
+                        angular + rng.normal(0, gyro_noise),
+                        0.0,
+                    ],
+                )
+            )
+            if gps_every and step % gps_every == 0:
+                records.append(
+                    (
+                        t,
+                        GPS,
+                        [
+                            x + rng.normal(0, gps_noise),
+                            y + rng.normal(0, gps_noise),
+                            gps_noise**2,
+                        ],
+                    )
+                )
+
+    return SensorLog.from_records(records), np.array(truth)
+
+
+def position_rmse(
+    result: ReplayResult, truth: np.ndarray, smoothed: bool = False
+) -> float:
+    """Gerçek ize (t, x, y, ...) göre konum hatasının karekök ortalaması"""
+    trajectory = result.trajectory(smoothed)
+    x = np.interp(truth[:, 0], result.times, trajectory[:, 0])
+    y = np.interp(truth[:, 0], result.times, trajectory[:, 1])
+    return float(np.sqrt(np.mean((x - truth[:, 1]) ** 2 + (y - truth[:, 2]) ** 2)))
+
+
+def tune(
+    log: SensorLog,
+    factory: Callable[[], Any],
+    candidates: Iterable[Dict[str, Any]],
+    truth: np.ndarray,
+    smooth: bool = False,
+) -> List[Tuple[float, Dict[str, Any]]]:
+    """
+    Q/R (veya herhangi bir filtre özniteliği) adaylarını kayıt üzerinde dene.
+
+    Her aday için factory() ile yeni filtre kurulur, öznitelikler atanır ve
+    kayıt oynatılır. (RMSE, aday) listesi en iyiden kötüye sıralı döner.
+    """
+    scores = []
+    for params in candidates:
+        odometry = factory()
+        for name, value in params.items():
+            setattr(odometry, name, value)
+        result = replay(log, odometry, smooth=smooth)
+        scores.append((position_rmse(result, truth, smooth), params))
+    return sorted(scores, key=lambda score: score[0])
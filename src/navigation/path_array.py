@@ -0,0 +1,201 @@
+"""
+Rota Veri Yapıları Modülü
+Nokta/waypoint veri sınıfları ve rotayı bitişik NumPy dizilerinde tutan
+PathArray (structure-of-arrays)
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, Sequence, Union
+
+import numpy as np
+
+# Waypoint eylem kodları (önbellek dosyalarıyla aynı sıra; değiştirilmemeli)
+ACTIONS = ("move", "turn", "stop", "blade_on", "blade_off")
+
+
+@dataclass
+class Point:
+    """2D nokta"""
+
+    x: float
+    y: float
+
+    def distance_to(self, other: "Point") -> float:
+        """İki nokta arasındaki mesafe"""
+        return math.sqrt((self.x - other.x) ** 2 + (self.y - other.y) ** 2)
+
+    def angle_to(self, other: "Point") -> float:
+        """İki nokta arasındaki açı (radyan)"""
+        return math.atan2(other.y - self.y, other.x - self.x)
+
+
+@dataclass
+class Waypoint:
+    """Rota noktası"""
+
+    position: Point
+    speed: float = 0.5
+    blade_height: int = 5
+    action: str = "move"  # "move", "turn", "stop", "blade_on", "blade_off"
+
+
+def action_code(action: str) -> int:
+    """Eylem adının kodu (bilinmeyen eylemler "move" sayılır)"""
+    return ACTIONS.index(action) if action in ACTIONS else 0
+
+
+class PathArray:
+    """
+    Rotayı beş bitişik dizide tutar: xy (N, 2) float64, speed float64,
+    blade_height int16 ve action (ACTIONS kodu) uint8.
+
+    Waypoint başına ~27 bayt yer kaplar (Waypoint + Point nesneleri birkaç
+    yüz bayttır). Tam sayı indeks Waypoint kopyası döndürür, dilimleme ise
+    aynı belleği paylaşan bir PathArray görünümü döndürür. Waypoint listesi
+    bekleyen kod (len, indeks, döngü, +) değişmeden çalışır.
+    """
+
+    __slots__ = ("xy", "speed", "blade_height", "action")
+
+    def __init__(
+        self,
+        xy: Any,
+        speed: Any,
+        blade_height: Any,
+        action: Any,
+    ):
+        self.xy = np.asarray(xy, dtype=float).reshape(-1, 2)
+        self.speed = np.asarray(speed, dtype=float).reshape(-1)
+        self.blade_height = np.asarray(blade_height, dtype=np.int16).reshape(-1)
+        self.action = np.asarray(action, dtype=np.uint8).reshape(-1)
+
+        n = len(self.xy)
+        if not (len(self.speed) == len(self.blade_height) == len(self.action) == n):
+            raise ValueError("PathArray dizi uzunlukları eşit olmalı")
+
+    @classmethod
+    def empty(cls) -> "PathArray":
+        """Boş rota"""
+        return cls(np.zeros((0, 2)), [], [], [])
+
+    @classmethod
+    def from_waypoints(cls, waypoints: Iterable[Any]) -> "PathArray":
+        """Waypoint listesinden (PathArray ise kendisi döner)"""
+        if isinstance(waypoints, PathArray):
+            return waypoints
+        waypoints = list(waypoints)
+        if not waypoints:
+            return cls.empty()
+        return cls(
+            [(w.position.x, w.position.y) for w in waypoints],
+            [w.speed for w in waypoints],
+            [w.blade_height for w in waypoints],
+            [action_code(w.action) for w in waypoints],
+        )
+
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, np.ndarray]) -> "PathArray":
+        """to_arrays() çıktısından (ör. rota önbelleği kaydı)"""
+        return cls(
+            arrays["xy"], arrays["speed"], arrays["blade_height"], arrays["action"]
+        )
+
+    @classmethod
+    def concatenate(cls, paths: Sequence[Any]) -> "PathArray":
+        """Rotaları sırayla birleştir (Waypoint listeleri de kabul edilir)"""
+        parts = [cls.from_waypoints(path) for path in paths]
+        parts = [part for part in parts if len(part)]
+        if not parts:
+            return cls.empty()
+        return cls(
+            np.concatenate([part.xy for part in parts]),
+            np.concatenate([part.speed for part in parts]),
+            np.concatenate([part.blade_height for part in parts]),
+            np.concatenate([part.action for part in parts]),
+        )
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """Ad -> dizi sözlüğü (np.savez ile kaydedilebilir)"""
+        return {
+            "xy": self.xy,
+            "speed": self.speed,
+            "blade_height": self.blade_height,
+            "action": self.action,
+        }
+
+    def copy(self) -> "PathArray":
+        """Belleği paylaşmayan kopya"""
+        return PathArray(
+            self.xy.copy(),
+            self.speed.copy(),
+            self.blade_height.copy(),
+            self.action.copy(),
+        )
+
+    def take(self, indices: Any) -> "PathArray":
+        """Verilen indekslerdeki waypoint'ler (yeni bellek)"""
+        return PathArray(
+            self.xy[indices],
+            self.speed[indices],
+            self.blade_height[indices],
+            self.action[indices],
+        )
+
+    def action_mask(self, *actions: str) -> np.ndarray:
+        """Eylemi verilenlerden biri olan waypoint'ler"""
+        return np.isin(self.action, [action_code(a) for a in actions])
+
+    @property
+    def nbytes(self) -> int:
+        """Dizilerin toplam bellek kullanımı (bayt)"""
+        return sum(array.nbytes for array in self.to_arrays().values())
+
+    def __len__(self) -> int:
+        return len(self.xy)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Waypoint, "PathArray"]:
+        if isinstance(index, slice):
+            return PathArray(
+                self.xy[index],
+                self.speed[index],
+                self.blade_height[index],
+                self.action[index],
+            )
+
+        x, y = self.xy[index]
+        return Waypoint(
+            position=Point(float(x), float(y)),
+            speed=float(self.speed[index]),
+            blade_height=int(self.blade_height[index]),
+            action=ACTIONS[self.action[index]],
+        )
+
+    def __iter__(self) -> Iterator[Waypoint]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __add__(self, other: Any) -> "PathArray":
+        return PathArray.concatenate([self, other])
+
+    def __radd__(self, other: Any) -> "PathArray":
+        return PathArray.concatenate([other, self])
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, PathArray):
+            try:
+                other = PathArray.from_waypoints(other)
+            except (AttributeError, TypeError):
+                return NotImplemented
+        return (
+            len(self) == len(other)
+            and np.array_equal(self.xy, other.xy)
+            and np.array_equal(self.speed, other.speed)
+            and np.array_equal(self.blade_height, other.blade_height)
+            and np.array_equal(self.action, other.action)
+        )
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"PathArray({len(self)} waypoint)"
@@ -0,0 +1,219 @@
+"""
+Rota Metrikleri Modülü
+Segment uzunlukları, yön değişimleri, eğrilik, segment hız sınırları ve
+ivme sınırlı süre tahmini tek vektörel geçişte
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from .path_array import PathArray
+
+
+def wrap_angles(angles: np.ndarray) -> np.ndarray:
+    """Açıları [-π, π) aralığına sar"""
+    return (angles + np.pi) % (2 * np.pi) - np.pi
+
+
+def segment_lengths(points: Any) -> np.ndarray:
+    """(N, 2) noktalar -> (N-1,) segment uzunlukları"""
+    seg = np.diff(np.asarray(points, dtype=float).reshape(-1, 2), axis=0)
+    return np.hypot(seg[:, 0], seg[:, 1])
+
+
+def _segment_times(
+    length: np.ndarray,
+    v_in: np.ndarray,
+    v_out: np.ndarray,
+    cruise: np.ndarray,
+    accel: float,
+    decel: float,
+) -> np.ndarray:
+    """
+    Trapez hız profiliyle segment süreleri.
+
+    v_in -> tepe hız -> v_out; tepe hız seyir hızını ve segment boyunca
+    ulaşılabilecek hızı aşmaz. Giriş/çıkış hızları ivme sınırına zaten
+    uygun olmalıdır (bkz. path_metrics).
+    """
+    reachable = np.sqrt(
+        np.maximum(
+            (2 * accel * decel * length + decel * v_in**2 + accel * v_out**2)
+            / (accel + decel),
+            0.0,
+        )
+    )
+    peak = np.maximum(np.minimum(cruise, reachable), np.maximum(v_in, v_out))
+    ramp_up = np.maximum(peak**2 - v_in**2, 0.0) / (2 * accel)
+    ramp_down = np.maximum(peak**2 - v_out**2, 0.0) / (2 * decel)
+    flat = np.maximum(length - ramp_up - ramp_down, 0.0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        time = (
+            np.maximum(peak - v_in, 0.0) / accel
+            + np.maximum(peak - v_out, 0.0) / decel
+            + np.where(peak > 0, flat / peak, 0.0)
+        )
+    return np.where(length > 1e-12, time, 0.0)
+
+
+@dataclass
+class PathMetrics:
+    """
+    Rota boyunca birikimli metrikler.
+
+    Diziler waypoint (N,) veya segment (N-1,) başınadır. Segment i,
+    waypoint i'den i+1'e gider ve hedef waypoint'in hızıyla sürülür.
+    """
+
+    segment_length: np.ndarray  # (N-1,) metre
+    heading: np.ndarray  # (N-1,) segment yönü (radyan)
+    heading_change: np.ndarray  # (N,) waypoint'teki işaretli yön değişimi
+    curvature: np.ndarray  # (N,) yaklaşık eğrilik (1/metre)
+    speed_limit: np.ndarray  # (N-1,) segment seyir hızı sınırı (m/s)
+    vertex_speed: np.ndarray  # (N,) ivme sınırlı waypoint geçiş hızı
+    segment_time: np.ndarray  # (N-1,) sürüş süresi (saniye)
+    pivot_time: np.ndarray  # (N,) yerinde dönüş süresi (saniye)
+    cumulative_length: np.ndarray  # (N,) başlangıçtan waypoint'e mesafe
+    cumulative_time: np.ndarray  # (N,) başlangıçtan waypoint'e süre
+
+    @property
+    def total_length(self) -> float:
+        return float(self.cumulative_length[-1]) if len(self.cumulative_length) else 0.0
+
+    @property
+    def total_time(self) -> float:
+        return float(self.cumulative_time[-1]) if len(self.cumulative_time) else 0.0
+
+    @property
+    def max_curvature(self) -> float:
+        return float(np.max(np.abs(self.curvature), initial=0.0))
+
+    def length_remaining(self, index: int) -> float:
+        """index. waypoint'ten rota sonuna mesafe"""
+        if index >= len(self.cumulative_length):
+            return 0.0
+        return self.total_length - float(self.cumulative_length[max(index, 0)])
+
+    def time_remaining(self, index: int, distance_to_target: float = 0.0) -> float:
+        """
+        index. waypoint hedefken kalan süre.
+
+        distance_to_target verilirse robotun hedef waypoint'e olan mesafesi
+        hedef segmentin hızıyla eklenir.
+        """
+        if index >= len(self.cumulative_time):
+            return 0.0
+        index = max(index, 0)
+        remaining = self.total_time - float(self.cumulative_time[index])
+        if distance_to_target > 0 and index > 0:
+            speed = max(float(self.speed_limit[index - 1]), 1e-6)
+            remaining += distance_to_target / speed
+        return remaining
+
+
+def path_metrics(
+    path: Any,
+    max_accel: float = 0.5,
+    max_decel: float = 0.5,
+    max_lateral_accel: float = 0.5,
+    max_angular: float = 1.0,
+    pivot_angle: float = math.pi / 4,
+) -> PathMetrics:
+    """
+    Rota metriklerini tek vektörel geçişte hesapla.
+
+    Segment seyir hızı hedef waypoint'in hızıdır. Waypoint geçiş hızı,
+    komşu segmentlerin seyir hızı, yanal ivme (v² κ ≤ a) ve açısal hız
+    (v κ ≤ ω) ile sınırlanır; pivot_angle'dan keskin köşelerde robot durup
+    yerinde döner. İvme/yavaşlama sınırları ileri ve geri geçişle
+    uygulanır:
+
+        v_i² ≤ min_j≤i (v_j² + 2a (s_i - s_j))  (ileri)
+        v_i² ≤ min_j≥i (v_j² + 2d (s_j - s_i))  (geri)
+
+    Her iki geçiş minimum.accumulate ile döngüsüz hesaplanır.
+
+    Args:
+        path: PathArray, Waypoint listesi veya (N, 2) dizi (hız 0.5 m/s)
+    """
+    if isinstance(path, np.ndarray):
+        xy = np.asarray(path, dtype=float).reshape(-1, 2)
+        speeds = np.full(len(xy), 0.5)
+    else:
+        path = PathArray.from_waypoints(path)
+        xy, speeds = path.xy, path.speed
+    n = len(xy)
+    if n < 2:
+        empty, zeros = np.zeros(0), np.zeros(n)
+        return PathMetrics(
+            empty, empty, zeros, zeros, empty, zeros, empty, zeros, zeros, zeros
+        )
+
+    seg = np.diff(xy, axis=0)
+    length = np.hypot(seg[:, 0], seg[:, 1])
+    cumulative_length = np.concatenate(([0.0], np.cumsum(length)))
+
+    # Sıfır uzunluklu segmentler önceki yönü korur (yön değişimi sayılmaz)
+    heading = np.arctan2(seg[:, 1], seg[:, 0])
+    moving = np.flatnonzero(length > 1e-9)
+    if len(moving):
+        last = np.maximum.accumulate(np.where(length > 1e-9, np.arange(n - 1), -1))
+        heading = heading[np.where(last >= 0, last, moving[0])]
+
+    heading_change = np.zeros(n)
+    curvature = np.zeros(n)
+    if n > 2:
+        heading_change[1:-1] = wrap_angles(np.diff(heading))
+        span = 0.5 * (length[:-1] + length[1:])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            curvature[1:-1] = np.where(span > 1e-9, heading_change[1:-1] / span, 0.0)
+
+    speed_limit = np.maximum(speeds[1:], 1e-6)
+
+    # Waypoint geçiş hızı sınırları
+    vertex = np.full(n, np.inf)
+    vertex[:-1] = speed_limit
+    vertex[1:] = np.minimum(vertex[1:], speed_limit)
+    kappa = np.abs(curvature)
+    with np.errstate(divide="ignore"):
+        vertex = np.minimum(vertex, np.sqrt(max_lateral_accel / kappa))
+        vertex = np.minimum(vertex, max_angular / kappa)
+    pivot = np.abs(heading_change) > pivot_angle
+    vertex[pivot] = 0.0
+    vertex[0] = 0.0
+    vertex[-1] = 0.0
+
+    # İleri (ivmelenme) ve geri (yavaşlama) geçişler
+    s = cumulative_length
+    v_sq = vertex**2
+    v_sq = np.minimum(
+        v_sq, 2 * max_accel * s + np.minimum.accumulate(v_sq - 2 * max_accel * s)
+    )
+    backward = np.minimum.accumulate((v_sq + 2 * max_decel * s)[::-1])[::-1]
+    v_sq = np.minimum(v_sq, backward - 2 * max_decel * s)
+    vertex_speed = np.sqrt(np.maximum(v_sq, 0.0))
+
+    segment_time = _segment_times(
+        length, vertex_speed[:-1], vertex_speed[1:], speed_limit, max_accel, max_decel
+    )
+    pivot_time = np.where(pivot, np.abs(heading_change) / max_angular, 0.0)
+
+    # Waypoint i'ye varış: önceki segmentler + önceki waypoint'lerdeki dönüşler
+    cumulative_time = np.concatenate(([0.0], np.cumsum(segment_time + pivot_time[:-1])))
+
+    return PathMetrics(
+        segment_length=length,
+        heading=heading,
+        heading_change=heading_change,
+        curvature=curvature,
+        speed_limit=speed_limit,
+        vertex_speed=vertex_speed,
+        segment_time=segment_time,
+        pivot_time=pivot_time,
+        cumulative_length=cumulative_length,
+        cumulative_time=cumulative_time,
+    )
@@ -4,14 +4,44 @@ Alan verilerine göre biçerdöver rotası oluşturur
 GPS entegrasyonu ile profesyonel navigasyon
 """
 
+import hashlib
 import json
 import math
 import logging
 import time
+from itertools import groupby
+import numpy as np
 import utm
-from typing import List, Dict, Tuple, Optional, Any
-from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from dataclasses import dataclass, field, replace
 from enum import Enum
+from pathlib import Path
+
+from .contour_planner import contour_spiral
+from .coverage_map import CoverageGrid, CoverageReport, coverage_report
+from .gap_planner import gap_polygons, gap_stripes
+from .mission_sequencer import MissionPlan, MissionSequencer, order_areas
+from .path_array import PathArray, Point, Waypoint, action_code
+from .path_metrics import PathMetrics, path_metrics, segment_lengths
+from .path_simplify import simplify_path
+from .path_stream import PathStream
+from .plan_cache import PlanCache
+from .polygon_geometry import (
+    PreparedPolygon,
+    VisibilityGraph,
+    contains_any,
+    offset_polygon,
+    offset_rings,
+    polygon_to_array,
+    rotate_points,
+    scanline_segments,
+)
+from .sweep_optimizer import optimize_sweep_angle
+from .turn_planner import TurnPlanner
+from .waypoint_index import WaypointIndex
+
+# Çok alanlı görev kimliği öneki
+MISSION_PREFIX = "mission:"
 
 
 class PatternType(Enum):
@@ -21,32 +51,7 @@ class PatternType(Enum):
     SPIRAL = "spiral"  # Spiral desen
     RANDOM = "random"  # Rastgele desen
     PERIMETER_FIRST = "perimeter_first"  # Önce çevre
-
-
-@dataclass
-class Point:
-    """2D nokta"""
-
-    x: float
-    y: float
-
-    def distance_to(self, other: "Point") -> float:
-        """İki nokta arasındaki mesafe"""
-        return math.sqrt((self.x - other.x) ** 2 + (self.y - other.y) ** 2)
-
-    def angle_to(self, other: "Point") -> float:
-        """İki nokta arasındaki açı (radyan)"""
-        return math.atan2(other.y - self.y, other.x - self.x)
-
-
-@dataclass
-class Waypoint:
-    """Rota noktası"""
-
-    position: Point
-    speed: float = 0.5
-    blade_height: int = 5
-    action: str = "move"  # "move", "turn", "stop", "blade_on", "blade_off"
+    BOUSTROPHEDON = "boustrophedon"  # Engel etrafında hücre ayrıştırmalı
 
 
 @dataclass
@@ -61,27 +66,106 @@ class Area:
     blade_height: int = 5
     speed: float = 0.5
     overlap: float = 0.1  # %10 örtüşme
+    sweep_angle: Optional[float] = None  # Şerit yönü (radyan), None: otomatik
+
+    # Hazırlanmış poligon önbelleği (geometri anahtarı ile geçersizleşir)
+    _prepared: Optional[Tuple[Tuple, PreparedPolygon, List[PreparedPolygon]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def geometry_key(self) -> Tuple:
+        """Sınır ve engel koordinatlarından oluşan geometri anahtarı"""
+        return (
+            tuple((p.x, p.y) for p in self.boundary),
+            tuple(tuple((p.x, p.y) for p in obs) for obs in (self.obstacles or [])),
+        )
+
+    def _prepare(self) -> Tuple[PreparedPolygon, List[PreparedPolygon]]:
+        """Geometri değişmediyse önbellekteki hazırlanmış poligonları döndür"""
+        key = self.geometry_key()
+        if self._prepared is None or self._prepared[0] != key:
+            self._prepared = (
+                key,
+                PreparedPolygon(self.boundary),
+                [PreparedPolygon(obs) for obs in (self.obstacles or [])],
+            )
+        return self._prepared[1], self._prepared[2]
+
+    def prepared_boundary(self) -> PreparedPolygon:
+        """Sınır poligonu (kenar dizileri önbellekte)"""
+        return self._prepare()[0]
+
+    def prepared_obstacles(self) -> List[PreparedPolygon]:
+        """Engel poligonları (kenar dizileri önbellekte)"""
+        return self._prepare()[1]
 
 
 class PathPlanner:
     """Rota planlama sınıfı - GPS+IMU+Odometry entegrasyonu ile"""
 
-    def __init__(self, config_path: str = "config/areas.json"):
+    def __init__(
+        self,
+        config_path: str = "config/areas.json",
+        cache_dir: Optional[str] = None,
+    ):
         self.logger = logging.getLogger("PathPlanner")
         self.config_path = config_path
         self.areas: Dict[str, Area] = {}
         self.current_area: Optional[Area] = None
-        self.current_path: List[Waypoint] = []
+        self.current_path: PathArray = PathArray.empty()
         self.current_waypoint_index = 0
+        self.current_plan_hash: Optional[str] = None
+        self.current_plan_id: Optional[str] = None  # Alan veya görev kimliği
+        self.current_mission: Optional[MissionPlan] = None
+
+        # Rota önbelleği (varsayılan: alan dosyasının yanında plan_cache/)
+        self.plan_cache = PlanCache(
+            cache_dir or str(Path(config_path).with_name("plan_cache"))
+        )
 
         # Robot fiziksel parametreleri
         self.robot_width = 0.6  # Robot genişliği (metre)
         self.blade_width = 0.5  # Bıçak genişliği (metre)
         self.turning_radius = 0.3  # Dönüş yarıçapı
+        self.max_angular_speed = 1.0  # Yerinde dönüş hızı (rad/s)
+        self.max_acceleration = 0.5  # Doğrusal ivme sınırı (m/s²)
+        self.max_deceleration = 0.5  # Doğrusal yavaşlama sınırı (m/s²)
+        self.max_lateral_accel = 0.5  # Virajda yanal ivme sınırı (m/s²)
 
         # Planlama parametreleri
         self.safety_margin = 0.2  # Güvenlik mesafesi
         self.max_line_length = 50  # Maksimum çizgi uzunluğu
+        self.headland_passes = 2  # Önce çevre deseninde çevre turu sayısı
+        self.coverage_resolution = 0.1  # Kapsama ızgarası hücre boyu (metre)
+        self.gap_min_area = 0.05  # Boşluk doldurmada atlanan en küçük alan (m²)
+        self.simplify_ratio = 0.1  # Sadeleştirme toleransı (bıçak genişliği oranı)
+        self._polygon_cache: Dict[Tuple, PreparedPolygon] = {}  # point_in_polygon
+        self.polygon_cache_size = 16  # Önbellekte tutulan en fazla poligon
+
+        # Rota takibi
+        self.waypoint_tolerance = 0.5  # Waypoint'e ulaşma toleransı (metre)
+        self.lookahead_waypoints = 50  # Yeniden yakalama için ileri bakış penceresi
+        self.reacquire_ratio = 0.4  # Yeniden yakalama yarıçapı / şerit aralığı (<0.5)
+        self.reacquire_heading_error = math.pi / 4  # Segment yönüne izin (radyan)
+        self._waypoint_index: Optional[WaypointIndex] = None
+        self._indexed_path: Optional[List[Waypoint]] = None
+        self._track_leg = 0  # Robotun en son üzerinde görüldüğü segment (sonu)
+        self._metrics: Optional[PathMetrics] = None
+        self._metrics_path: Optional[List[Waypoint]] = None
+
+        # Akış planlama: rota arka planda parça parça üretilir
+        self.stream_chunk_size = 64  # Parça başına waypoint
+        self.stream_buffer_chunks = 4  # Robotun önünde hazırlanan en fazla parça
+        self.stream_wait = 0.05  # Parça yoksa kontrol döngüsünde bekleme (saniye)
+        self.planning_service: Optional[Any] = None  # Varsa process havuzunda
+        self._stream: Optional[PathStream] = None
+        self._stream_key: Optional[Tuple[str, str]] = None  # Bitince önbelleğe
+        self._mission_jobs: List[Any] = []  # Akış görevinin alan planlama işleri
+        self._resume_index: Optional[int] = None  # Henüz planlanmamış devam noktası
+        self.planning_error: Optional[str] = None  # Akış planlama hatası
+
+        # Son planlamada dönüşlerin eklediği yol ve süre
+        self.last_turn_report: Dict[str, Any] = {}
 
         # GPS koordinat sistemi
         self.gps_origin = None  # GPS koordinat sistemi orjini
@@ -231,6 +315,7 @@ class PathPlanner:
                     blade_height=area_data.get("blade_height", 5),
                     speed=area_data.get("speed", 0.5),
                     overlap=area_data.get("overlap", 0.1),
+                    sweep_angle=area_data.get("sweep_angle"),
                 )
                 self.areas[area.id] = area
 
@@ -289,292 +374,1117 @@ class PathPlanner:
                     "blade_height": area.blade_height,
                     "speed": area.speed,
                     "overlap": area.overlap,
+                    "sweep_angle": area.sweep_angle,
                 }
                 data["areas"].append(area_data)
 
             with open(self.config_path, "w", encoding="utf-8") as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
 
+            # Değişen alanların eski rotalarını önbellekten at
+            for area in self.areas.values():
+                self.plan_cache.invalidate(area.id, keep=self.plan_key(area))
+
             self.logger.info(f"Alanlar kaydedildi: {self.config_path}")
 
         except Exception as e:
             self.logger.error(f"Alan kaydetme hatası: {e}")
 
-    def load_area(self, area_id: str) -> bool:
-        """Belirli bir alanı yükle ve rota planla"""
+    def load_area(self, area_id: str, stream: bool = False) -> bool:
+        """
+        Belirli bir alanı yükle ve rota planla.
+
+        stream=True ise (rota önbellekte yoksa) ilk parça hazır olur olmaz
+        dönülür; kalan rota arka planda üretilip get_next_waypoint ile
+        sınırlı bir ileri bakış tamponu halinde eklenir.
+        """
         if area_id not in self.areas:
             self.logger.error(f"Alan bulunamadı: {area_id}")
             return False
 
+        self.cancel_stream()
         self.current_area = self.areas[area_id]
-        self.current_path = self._plan_path(self.current_area)
+        if stream:
+            self.current_path = self._start_stream(self.current_area)
+        else:
+            self.current_path = self.area_path(self.current_area)
+        self.current_plan_hash = self.plan_key(self.current_area)
+        self.current_plan_id = area_id
+        self.current_mission = None
+        self.current_waypoint_index = 0
+
+        self.logger.info(f"Alan yüklendi: {area_id}, {len(self.current_path)} waypoint")
+        return True
+
+    def area_path(self, area: Area) -> PathArray:
+        """Alanın rotası (önbellekte varsa yeniden planlanmaz)"""
+        self.resolve_sweep_angle(area)
+        key = self.plan_key(area)
+
+        cached = self.plan_cache.get(area.id, key)
+        if cached is not None:
+            return PathArray.from_arrays(cached)
+
+        path = PathArray.from_waypoints(self._plan_path(area))
+        self.plan_cache.put(area.id, key, path)
+        return path
+
+    def _start_stream(self, area: Area) -> PathArray:
+        """Akış planlamayı başlat, ilk parçayı döndür"""
+        self.resolve_sweep_angle(area)
+        key = self.plan_key(area)
+
+        cached = self.plan_cache.get(area.id, key)
+        if cached is not None:
+            return PathArray.from_arrays(cached)
+
+        if self.planning_service is not None:
+            self._stream = self.planning_service.submit(self, area)
+        else:
+            self._stream = PathStream(self.iter_plan(area), self.stream_buffer_chunks)
+        self._stream_key = (area.id, key)
+        self.current_path = PathArray.empty()
+        self.current_waypoint_index = 0
+        self._fill_stream(0)
+        return self.current_path
+
+    @property
+    def planning(self) -> bool:
+        """Rotanın bir kısmı hâlâ arka planda üretiliyor mu"""
+        return self._stream is not None
+
+    def planning_progress(self) -> float:
+        """Arka plan planlamanın ilerlemesi (0-1, planlanan şerit oranı)"""
+        if self._stream is None:
+            return 1.0
+        # Thread akışında dönüş raporu aynı process'te güncellenir
+        return getattr(
+            self._stream, "progress", self.last_turn_report.get("progress", 0.0)
+        )
+
+    def _fill_stream(self, until: int, wait: bool = False):
+        """
+        Akıştan gelen parçaları until indeksi rotaya girene kadar ekle.
+
+        Hazır parça yoksa beklenmez; sürülecek waypoint kalmadıysa en fazla
+        stream_wait, wait verildiyse süresiz beklenir.
+        """
+        while self._stream is not None and len(self.current_path) <= until:
+            block = wait or self.current_waypoint_index >= len(self.current_path)
+            chunk = self._stream.get(
+                block=block, timeout=None if wait else self.stream_wait
+            )
+            if chunk is not None:
+                self.current_path = self.current_path + chunk
+                continue
+            if self._stream.done:
+                self._finish_stream()
+            return
+
+    def _finish_stream(self):
+        """
+        Akış bitti: tam rotayı önbelleğe yaz.
+
+        Hata ile biten akışın rotası eksiktir; önbelleğe yazılmaz ve hata
+        planning_error'a kaydedilir (görev tamamlanmış sayılmamalı).
+        """
+        stream, self._stream = self._stream, None
+        self._mission_jobs = []
+        if stream.error is not None:
+            self.planning_error = str(stream.error)
+            self.logger.error(f"Akış planlama başarısız: {self.planning_error}")
+        elif self._stream_key is not None:
+            self.plan_cache.put(*self._stream_key, self.current_path)
+            self.logger.info(f"Akış planlama bitti: {len(self.current_path)} waypoint")
+        self._stream_key = None
+
+    def cancel_stream(self):
+        """Süren akış planlamayı durdur"""
+        if self._stream is not None:
+            self._stream.cancel()
+            self._stream = None
+            self._stream_key = None
+        for job in self._mission_jobs:
+            job.cancel()
+        self._mission_jobs = []
+        self._resume_index = None
+        self.planning_error = None
+
+    def area_changed(self, area_id: str):
+        """
+        Alan düzenlendi veya silindi: eskiyen planlama işlerini iptal et.
+
+        Düzenleme rota anahtarını değiştirmiyorsa (ör. yalnızca ad) işler
+        sürer.
+        """
+        area = self.areas.get(area_id)
+        key = self.plan_key(area) if area else None
+
+        if self._stream_key and self._stream_key[0] == area_id:
+            if self._stream_key[1] != key:
+                self.logger.warning(f"Alan değişti, akış planlama iptal: {area_id}")
+                self.cancel_stream()
+        if self.planning_service is not None:
+            self.planning_service.cancel(area_id, keep_key=key)
+
+    @staticmethod
+    def mission_id(area_ids: List[str]) -> str:
+        """Çok alanlı görev kimliği (alan sırasından bağımsız)"""
+        return MISSION_PREFIX + ",".join(sorted(area_ids))
+
+    @staticmethod
+    def mission_area_ids(plan_id: str) -> Optional[List[str]]:
+        """Görev kimliğinden alan listesi; tek alan kimliğiyse None"""
+        if not plan_id.startswith(MISSION_PREFIX):
+            return None
+        return plan_id[len(MISSION_PREFIX) :].split(",")
+
+    def load_mission(
+        self,
+        area_ids: List[str],
+        start: Tuple[float, float],
+        return_to_start: bool = True,
+        stream: bool = False,
+    ) -> bool:
+        """
+        Birden fazla alanı tek rotada birleştir.
+
+        Alanlar şarj istasyonundan başlayarak en kısa geçiş sırasıyla
+        ziyaret edilir. Geçiş yollarında bıçak kapalıdır: ilk geçiş noktası
+        "blade_off", alan girişi "blade_on" olarak işaretlenir.
+
+        stream=True ise önbellekte olmayan alanlar arka planda (varsa
+        planlama servisinde) planlanır ve hemen dönülür; birleşik rota tüm
+        alanlar hazır olunca akış olarak eklenir.
+        """
+        missing = [area_id for area_id in area_ids if area_id not in self.areas]
+        if missing or not area_ids:
+            self.logger.error(f"Alan bulunamadı: {missing}")
+            return False
+
+        # Sıralama istek sırasından bağımsız olsun (aynı görev, aynı rota)
+        areas = [self.areas[area_id] for area_id in sorted(set(area_ids))]
+
+        # Görev hash'i: başlangıç ve alan rota anahtarlarından (şerit yönü
+        # anahtara girdiğinden planlamadan önce belirlenir)
+        digest = hashlib.sha256()
+        digest.update(json.dumps([list(map(float, start)), return_to_start]).encode())
+        for area in areas:
+            self.resolve_sweep_angle(area)
+            digest.update(self.plan_key(area).encode())
+
+        if stream:
+            self.cancel_stream()
+            self._start_mission_stream(areas, start, return_to_start)
+        else:
+            paths = {area.id: self.area_path(area) for area in areas}
+            mission, combined = self._sequence_mission(
+                areas, paths, start, return_to_start
+            )
+            if not mission.order:
+                self.logger.error("Görevde planlanabilir alan yok")
+                return False
+            self.cancel_stream()
+            self.current_area = self.areas[mission.order[0]]
+            self.current_mission = mission
+            self.current_path = combined
+
+        self.current_plan_hash = digest.hexdigest()
+        self.current_plan_id = self.mission_id([area.id for area in areas])
         self.current_waypoint_index = 0
 
+        if stream:
+            self.logger.info(f"Görev planlanıyor: {len(areas)} alan")
+        else:
+            self.logger.info(
+                f"Görev yüklendi: {' -> '.join(self.current_mission.order)}, "
+                f"{len(self.current_path)} waypoint, "
+                f"geçiş {self.current_mission.transit_length:.1f} m"
+            )
+        return True
+
+    def _start_mission_stream(
+        self, areas: List[Area], start: Tuple[float, float], return_to_start: bool
+    ):
+        """Görev akışını başlat (alan işleri bu thread'den gönderilir)"""
+        paths: Dict[str, PathArray] = {}
+        jobs: Dict[str, Any] = {}
+        for area in areas:
+            cached = self.plan_cache.get(area.id, self.plan_key(area))
+            if cached is not None:
+                paths[area.id] = PathArray.from_arrays(cached)
+            elif self.planning_service is not None:
+                jobs[area.id] = self.planning_service.submit(self, area)
+
+        self._mission_jobs = list(jobs.values())
+        self._stream = PathStream(
+            self._iter_mission(areas, paths, jobs, start, return_to_start),
+            self.stream_buffer_chunks,
+        )
+        self.current_area = areas[0]
+        self.current_mission = None
+        self.current_path = PathArray.empty()
+        self.current_waypoint_index = 0
+        self._fill_stream(0)
+
+    def _iter_mission(
+        self,
+        areas: List[Area],
+        paths: Dict[str, PathArray],
+        jobs: Dict[str, Any],
+        start: Tuple[float, float],
+        return_to_start: bool,
+    ) -> Iterator[PathArray]:
+        """
+        Görev rotasını arka planda kur ve parça parça üret.
+
+        Önbellekte olmayan alanların rotası planlama işlerinden toplanır
+        (servis yoksa bu thread'de planlanır). Sıralama tüm alan rotaları
+        hazır olunca yapılabildiğinden ilk parça en son alan bitince gelir.
+        """
+        for area in areas:
+            if area.id in jobs:
+                paths[area.id] = self._collect_job(jobs[area.id])
+            elif area.id not in paths:
+                paths[area.id] = self.area_path(area)
+
+        mission, combined = self._sequence_mission(areas, paths, start, return_to_start)
+        if not mission.order:
+            raise RuntimeError("Görevde planlanabilir alan yok")
+        self.current_area = self.areas[mission.order[0]]
+        self.current_mission = mission
         self.logger.info(
-            f"Alan yüklendi: {area_id}, {len(self.current_path)} waypoint oluşturuldu"
+            f"Görev planlandı: {' -> '.join(mission.order)}, "
+            f"{len(combined)} waypoint, geçiş {mission.transit_length:.1f} m"
         )
+
+        for begin in range(0, len(combined), self.stream_chunk_size):
+            yield combined[begin : begin + self.stream_chunk_size]
+
+    def _collect_job(self, job: Any) -> PathArray:
+        """Planlama işinin tüm parçalarını topla ve rotayı önbelleğe yaz"""
+        chunks = []
+        while not job.done:
+            chunk = job.get(block=True, timeout=self.stream_wait)
+            if chunk is not None:
+                chunks.append(chunk)
+        if job.error is not None:
+            raise RuntimeError(f"{job.area_id} planlanamadı: {job.error}")
+        if job.cancelled:
+            raise RuntimeError(f"{job.area_id} planlama işi iptal edildi")
+
+        path = PathArray.concatenate(chunks)
+        self.plan_cache.put(job.area_id, job.plan_key, path)
+        return path
+
+    def _sequence_mission(
+        self,
+        areas: List[Area],
+        paths: Dict[str, PathArray],
+        start: Tuple[float, float],
+        return_to_start: bool,
+    ) -> Tuple[MissionPlan, PathArray]:
+        """Alan rotalarını sırala ve geçişlerle tek rotada birleştir"""
+        obstacles = [obs for area in areas for obs in (area.obstacles or [])]
+        sequencer = MissionSequencer(clearance=self.safety_margin)
+        mission = sequencer.sequence(start, paths, obstacles, return_to_start)
+        if not mission.order:
+            return mission, PathArray.empty()
+
+        parts: List[Any] = []
+        for k, area_id in enumerate(mission.order):
+            area = self.areas[area_id]
+            path = paths[area_id][::-1] if mission.reversed[k] else paths[area_id]
+            parts.append(self._transit_waypoints(mission.transits[k], area))
+            parts.append([replace(path[0], action="blade_on")])
+            parts.append(path[1:])
+        if return_to_start and mission.transits:
+            last = self.areas[mission.order[-1]]
+            parts.append(self._transit_waypoints(mission.transits[-1], last))
+            parts.append(
+                [
+                    Waypoint(
+                        position=Point(float(start[0]), float(start[1])),
+                        speed=last.speed,
+                        blade_height=last.blade_height,
+                        action="stop",
+                    )
+                ]
+            )
+        return mission, PathArray.concatenate(parts)
+
+    def _transit_waypoints(self, transit: np.ndarray, area: Area) -> List[Waypoint]:
+        """Geçiş yolu waypoint'leri (bitiş hariç, ilk nokta bıçak kapatma)"""
+        return [
+            Waypoint(
+                position=Point(float(x), float(y)),
+                speed=area.speed,
+                blade_height=area.blade_height,
+                action="blade_off" if k == 0 else "move",
+            )
+            for k, (x, y) in enumerate(transit[:-1])
+        ]
+
+    def plan_gap_fill(
+        self,
+        area: Area,
+        missed: Any,
+        start: Optional[Tuple[float, float]] = None,
+        min_area: Optional[float] = None,
+    ) -> List[Waypoint]:
+        """
+        Yalnızca biçilmemiş bölgeleri kaplayan rota.
+
+        Args:
+            area: Boşlukların bulunduğu alan
+            missed: CoverageGrid, CoverageReport veya boşluk poligonları
+            start: Robotun konumu (ilk boşluğa buradan geçilir)
+            min_area: Bundan küçük boşluklar atlanır (m²)
+
+        Her boşluk kendi şerit yönüyle kaplanır; boşluklar en yakın komşu +
+        2-opt ile sıralanır. Boşluklar arası geçişler engellerin etrafından
+        bıçak kapalı sürülür.
+        """
+        if min_area is None:
+            min_area = self.gap_min_area
+        if isinstance(missed, CoverageGrid):
+            missed = missed.missed_polygons(min_area)
+        elif isinstance(missed, CoverageReport):
+            missed = missed.missed_polygons
+
+        spacing = self.blade_width * (1 - area.overlap)
+        turn_cost = self._turn_cost(area)
+        free_rings = [area.boundary] + list(area.obstacles or [])
+        clusters = []
+        for gap in gap_polygons(missed, min_area):
+            coords = gap_stripes(
+                gap, free_rings, spacing, turn_cost, margin=self.safety_margin
+            )
+            if len(coords):
+                clusters.append(coords)
+        if not clusters:
+            return []
+
+        entries = np.array([coords[0] for coords in clusters])
+        exits = np.array([coords[-1] for coords in clusters])
+        position = entries[0] if start is None else np.asarray(start, dtype=float)
+        order, flipped = order_areas(position, entries, exits, return_to_start=False)
+
+        graph = VisibilityGraph(area.boundary, area.obstacles or [], self.safety_margin)
+        path: List[Waypoint] = []
+        for k, flip in zip(order, flipped):
+            coords = clusters[k][::-1] if flip else clusters[k]
+            waypoints = [
+                Waypoint(
+                    position=Point(float(x), float(y)),
+                    speed=area.speed,
+                    blade_height=area.blade_height,
+                    action="move",
+                )
+                for x, y in coords
+            ]
+            waypoints = self._add_turning_waypoints(waypoints, area)
+
+            if path or start is not None:
+                transit = graph.shortest_path(position, coords[0])
+                path.extend(self._transit_waypoints(transit, area))
+            path.append(replace(waypoints[0], action="blade_on"))
+            path.extend(waypoints[1:])
+            position = coords[-1]
+
+        return path
+
+    def load_gap_fill(
+        self,
+        area_id: str,
+        missed: Any,
+        start: Optional[Tuple[float, float]] = None,
+    ) -> bool:
+        """
+        Boşluk doldurma rotasını yükle.
+
+        Rota kapsama durumuna bağlı olduğundan önbelleğe alınmaz ve görev
+        günlüğünden devam ettirilmez (plan kimliği yoktur).
+        """
+        if area_id not in self.areas:
+            self.logger.error(f"Alan bulunamadı: {area_id}")
+            return False
+
+        area = self.areas[area_id]
+        path = self.plan_gap_fill(area, missed, start)
+        if not path:
+            self.logger.info(f"Doldurulacak boşluk yok: {area_id}")
+            return False
+
+        self.cancel_stream()
+        self.current_area = area
+        self.current_path = PathArray.from_waypoints(path)
+        self.current_plan_hash = None
+        self.current_plan_id = None
+        self.current_mission = None
+        self.current_waypoint_index = 0
+
+        self.logger.info(f"Boşluk doldurma yüklendi: {area_id}, {len(path)} waypoint")
         return True
 
+    def plan_key(self, area: Area) -> str:
+        """Alan ve robot parametrelerinden rota önbellek anahtarı"""
+        return PlanCache.compute_key(
+            area,
+            blade_width=self.blade_width,
+            robot_width=self.robot_width,
+            turning_radius=self.turning_radius,
+            safety_margin=self.safety_margin,
+            headland_passes=self.headland_passes,
+            simplify_ratio=self.simplify_ratio,
+        )
+
     def _plan_path(self, area: Area) -> List[Waypoint]:
         """Ana rota planlama fonksiyonu"""
-        if area.pattern == PatternType.LAWN_MOWER:
-            return self._lawn_mower_pattern(area)
-        elif area.pattern == PatternType.SPIRAL:
-            return self._spiral_pattern(area)
+        return list(self._iter_plan_waypoints(area))
+
+    def _iter_plan_waypoints(self, area: Area) -> Iterator[Waypoint]:
+        """
+        Rotayı waypoint waypoint üret (sadeleştirilmiş).
+
+        Şerit uçları vektörel olarak baştan hesaplanır; pahalı kısım olan
+        dönüş manevraları robot ilerledikçe (tembel) planlanır.
+        """
+        if area.pattern == PatternType.SPIRAL:
+            waypoints = self._spiral_pattern(area)
         elif area.pattern == PatternType.PERIMETER_FIRST:
-            return self._perimeter_first_pattern(area)
+            waypoints = self._iter_perimeter_first(area)
+        elif area.pattern == PatternType.BOUSTROPHEDON:
+            waypoints = self._iter_turning_waypoints(
+                self._boustrophedon_stripes(area), area
+            )
         else:
-            return self._lawn_mower_pattern(area)  # Varsayılan
+            # Biçerdöver (varsayılan)
+            waypoints = self._iter_turning_waypoints(
+                self._lawn_mower_stripes(area), area
+            )
+        yield from self._iter_simplified(waypoints)
+
+    def _iter_simplified(self, waypoints: Iterable[Waypoint]) -> Iterator[Waypoint]:
+        """
+        Rotayı aynı hız, bıçak ve eylemli ardışık parçalar halinde sadeleştir.
+
+        simplify_path özellik değişimlerini zaten tuttuğundan sonuç tüm
+        rotanın tek seferde sadeleştirilmesiyle aynıdır; üretim tembel kalır.
+        """
+        tolerance = self.blade_width * self.simplify_ratio
+        runs = groupby(waypoints, key=lambda wp: (wp.speed, wp.blade_height, wp.action))
+        for _, run in runs:
+            yield from simplify_path(list(run), tolerance)
+
+    def iter_plan(
+        self, area: Area, chunk_size: Optional[int] = None
+    ) -> Iterator[PathArray]:
+        """Alanın rotasını chunk_size waypoint'lik PathArray parçaları olarak üret"""
+        chunk_size = chunk_size or self.stream_chunk_size
+        self.resolve_sweep_angle(area)
+
+        chunk: List[Waypoint] = []
+        for waypoint in self._iter_plan_waypoints(area):
+            chunk.append(waypoint)
+            if len(chunk) >= chunk_size:
+                yield PathArray.from_waypoints(chunk)
+                chunk = []
+        if chunk:
+            yield PathArray.from_waypoints(chunk)
 
     def _lawn_mower_pattern(self, area: Area) -> List[Waypoint]:
-        """Biçerdöver deseni - paralel çizgiler"""
+        """Biçerdöver deseni - paralel çizgiler (scanline kırpma ile)"""
+        return self._add_turning_waypoints(self._lawn_mower_stripes(area), area)
+
+    def _lawn_mower_stripes(self, area: Area) -> List[Waypoint]:
+        """Biçerdöver şerit uçları (dönüş manevraları eklenmeden)"""
         waypoints = []
 
-        # Alan sınırlarını bul
-        min_x = min(p.x for p in area.boundary)
-        max_x = max(p.x for p in area.boundary)
-        min_y = min(p.y for p in area.boundary)
-        max_y = max(p.y for p in area.boundary)
+        boundary = polygon_to_array(area.boundary)
+        if len(boundary) < 3:
+            return waypoints
 
-        # Güvenlik marjını ekle
-        min_x += self.safety_margin
-        max_x -= self.safety_margin
-        min_y += self.safety_margin
-        max_y -= self.safety_margin
+        # Şeritler döndürülmüş çerçevede x eksenine paralel çizilir
+        sweep_angle = self.resolve_sweep_angle(area)
+        boundary = rotate_points(boundary, -sweep_angle)
+
+        # Şerit y değerleri (güvenlik marjı dahil)
+        min_y = boundary[:, 1].min() + self.safety_margin
+        max_y = boundary[:, 1].max() - self.safety_margin
 
         # Çizgi aralığını hesapla
         line_spacing = self.blade_width * (1 - area.overlap)
+        stripe_ys = np.arange(min_y, max_y + 1e-9, line_spacing)
+
+        # Tüm şeritleri tüm kenarlarla tek seferde kesiştir
+        stripe_index, x_start, x_end = scanline_segments([boundary], stripe_ys)
+
+        # Segment uçlarına güvenlik marjı uygula
+        x_start = x_start + self.safety_margin
+        x_end = x_end - self.safety_margin
+        keep = x_end >= x_start
+        stripe_index, x_start, x_end = stripe_index[keep], x_start[keep], x_end[keep]
 
-        # Y yönünde çizgiler oluştur
-        y = min_y
         direction = 1  # 1: sağa, -1: sola
+        bounds = np.searchsorted(stripe_index, np.arange(len(stripe_ys) + 1))
+        coords = []
 
-        while y <= max_y:
-            if direction == 1:
-                # Soldan sağa
-                start_point = Point(min_x, y)
-                end_point = Point(max_x, y)
-            else:
-                # Sağdan sola
-                start_point = Point(max_x, y)
-                end_point = Point(min_x, y)
+        for i, y in enumerate(stripe_ys):
+            lo, hi = bounds[i], bounds[i + 1]
+            if lo == hi:
+                continue
 
-            # Alan içinde mi kontrol et
-            if self._point_in_polygon(start_point, area.boundary):
-                waypoints.append(
-                    Waypoint(
-                        position=start_point,
-                        speed=area.speed,
-                        blade_height=area.blade_height,
-                        action="move",
-                    )
-                )
+            # Aynı şeritteki birden fazla segment hareket yönünde sıralanır
+            segments = list(zip(x_start[lo:hi], x_end[lo:hi]))
+            if direction == -1:
+                segments = [(end, start) for start, end in reversed(segments)]
 
-            if self._point_in_polygon(end_point, area.boundary):
-                waypoints.append(
-                    Waypoint(
-                        position=end_point,
-                        speed=area.speed,
-                        blade_height=area.blade_height,
-                        action="move",
-                    )
-                )
+            for seg_start, seg_end in segments:
+                coords.append((seg_start, y))
+                coords.append((seg_end, y))
 
             # Sonraki çizgiye geç
-            y += line_spacing
             direction *= -1
 
-        # Dönüş waypoint'leri ekle
-        waypoints = self._add_turning_waypoints(waypoints)
+        # Dünya çerçevesine geri döndür
+        for x, y in rotate_points(np.array(coords).reshape(-1, 2), sweep_angle):
+            waypoints.append(
+                Waypoint(
+                    position=Point(float(x), float(y)),
+                    speed=area.speed,
+                    blade_height=area.blade_height,
+                    action="move",
+                )
+            )
 
         return waypoints
 
-    def _spiral_pattern(self, area: Area) -> List[Waypoint]:
-        """Spiral desen"""
-        waypoints = []
+    def resolve_sweep_angle(self, area: Area) -> float:
+        """
+        Alanın şerit yönü; belirlenmemişse optimize edip alana kaydet.
 
-        # Alan merkezini bul
-        center_x = sum(p.x for p in area.boundary) / len(area.boundary)
-        center_y = sum(p.y for p in area.boundary) / len(area.boundary)
-        center = Point(center_x, center_y)
+        Yalnızca biçerdöver deseni şerit yönü kullanır.
+        """
+        if area.sweep_angle is not None:
+            return area.sweep_angle
+        if area.pattern != PatternType.LAWN_MOWER:
+            return 0.0
+
+        angle = optimize_sweep_angle(
+            [area.boundary],
+            self.blade_width * (1 - area.overlap),
+            turn_cost=self._turn_cost(area),
+            margin=self.safety_margin,
+        )
+        area.sweep_angle = angle if angle is not None else 0.0
+        self.logger.info(
+            f"Şerit yönü seçildi: {area.id}, {math.degrees(area.sweep_angle):.1f}°"
+        )
+        return area.sweep_angle
+
+    def _turn_cost(self, area: Area) -> float:
+        """Bir şerit geçişinin maliyeti: biçme hızında eşdeğer mesafe"""
+        spacing = self.blade_width * (1 - area.overlap)
+        turn = TurnPlanner(
+            turning_radius=self.turning_radius,
+            turn_speed=area.speed * 0.5,
+            max_angular=self.max_angular_speed,
+        ).plan((0.0, 0.0, 0.0), (0.0, spacing, math.pi))
+        return turn.duration * area.speed
 
-        # Spiral parametreleri
-        max_radius = max(p.distance_to(center) for p in area.boundary)
-        radius_step = self.blade_width * (1 - area.overlap)
-        angle_step = 0.1  # radyan
+    def _spiral_pattern(self, area: Area) -> List[Waypoint]:
+        """Spiral desen (kontur paralel, dıştan içe)"""
+        spacing = self.blade_width * (1 - area.overlap)
+        points = contour_spiral(
+            area.boundary,
+            self.safety_margin,
+            spacing,
+            obstacles=area.obstacles,
+        )
+        return [
+            Waypoint(
+                position=Point(float(x), float(y)),
+                speed=area.speed,
+                blade_height=area.blade_height,
+                action="move",
+            )
+            for x, y in points
+        ]
 
-        radius = radius_step
-        angle = 0
+    def _perimeter_first_pattern(self, area: Area) -> List[Waypoint]:
+        """Önce çevre (headland_passes iç içe halka), sonra iç kısım"""
+        return list(self._iter_perimeter_first(area))
 
-        while radius < max_radius:
-            x = center.x + radius * math.cos(angle)
-            y = center.y + radius * math.sin(angle)
-            point = Point(x, y)
+    def _iter_perimeter_first(self, area: Area) -> Iterator[Waypoint]:
+        """Önce çevre deseninin waypoint üreteci"""
+        spacing = self.blade_width * (1 - area.overlap)
 
-            if self._point_in_polygon(point, area.boundary):
-                waypoints.append(
-                    Waypoint(
-                        position=point,
-                        speed=area.speed,
+        # Çevre halkaları: sınırdan safety_margin, sonra şerit aralığıyla içe
+        position = None
+        levels = offset_rings(
+            area.boundary, self.safety_margin, spacing, count=self.headland_passes
+        )
+        for level in levels:
+            for ring in level:
+                ring = self._rotate_ring(ring, position)
+                for x, y in np.vstack((ring, ring[:1])):
+                    yield Waypoint(
+                        position=Point(float(x), float(y)),
+                        speed=area.speed * 0.7,  # Çevrede daha yavaş
                         blade_height=area.blade_height,
                         action="move",
                     )
-                )
+                position = ring[0]
 
-            angle += angle_step
-            radius += radius_step * angle_step / (2 * math.pi)
+        # İç kısım için biçerdöver deseni (son halkadan bir şerit içeride)
+        inner_area = self._shrink_area(area, self.headland_passes * spacing)
+        if inner_area:
+            yield from self._iter_turning_waypoints(
+                self._lawn_mower_stripes(inner_area), inner_area
+            )
 
-        return waypoints
+    @staticmethod
+    def _rotate_ring(ring: np.ndarray, position: Optional[np.ndarray]) -> np.ndarray:
+        """Halkayı verilen konuma en yakın köşeden başlat"""
+        if position is None:
+            return ring
+        start = int(np.argmin(np.hypot(*(ring - position).T)))
+        return np.roll(ring, -start, axis=0)
+
+    def _boustrophedon_pattern(self, area: Area) -> List[Waypoint]:
+        """
+        Boustrophedon hücre ayrıştırma deseni.
+
+        Alan engeller etrafında monoton hücrelere bölünür, her hücre kendi
+        içinde şerit şerit biçilir ve hücreler en yakın komşu sırasıyla,
+        engellerin etrafından dolaşan geçiş yollarıyla bağlanır.
+        """
+        return self._add_turning_waypoints(self._boustrophedon_stripes(area), area)
+
+    def _boustrophedon_stripes(self, area: Area) -> List[Waypoint]:
+        """Boustrophedon şerit uçları ve hücre geçişleri (dönüşler eklenmeden)"""
+        boundary = polygon_to_array(area.boundary)
+        if len(boundary) < 3:
+            return []
 
-    def _perimeter_first_pattern(self, area: Area) -> List[Waypoint]:
-        """Önce çevre, sonra iç kısım"""
-        waypoints = []
+        obstacles = [polygon_to_array(obs) for obs in (area.obstacles or [])]
+        cells = self._decompose_cells(area, boundary, obstacles)
+        if not cells:
+            return []
 
-        # Çevre waypoint'leri
-        for i, point in enumerate(area.boundary):
-            waypoints.append(
-                Waypoint(
-                    position=Point(point.x, point.y),
-                    speed=area.speed * 0.7,  # Çevrede daha yavaş
-                    blade_height=area.blade_height,
-                    action="move",
-                )
-            )
+        graph = None
+        waypoints: List[Waypoint] = []
+        position = None
+        remaining = list(range(len(cells)))
+
+        while remaining:
+            # Sıradaki hücre ve giriş köşesi: mevcut konuma en yakın olan
+            best = None
+            for cell_id in remaining:
+                for from_top in (False, True):
+                    y, x0, x1 = cells[cell_id][-1 if from_top else 0]
+                    for reverse_first in (False, True):
+                        entry_x = x1 if reverse_first else x0
+                        cost = (
+                            0.0
+                            if position is None
+                            else math.hypot(entry_x - position[0], y - position[1])
+                        )
+                        if best is None or cost < best[0]:
+                            best = (cost, cell_id, from_top, reverse_first)
+
+            _, cell_id, from_top, reverse_first = best
+            remaining.remove(cell_id)
+            stripes = self._cell_stripes(cells[cell_id], from_top, reverse_first)
+
+            # Hücreler arası geçiş (gerekirse engellerin etrafından)
+            if position is not None:
+                if graph is None:
+                    graph = VisibilityGraph(boundary, obstacles, self.safety_margin)
+                transit = graph.shortest_path(position, stripes[0][0])
+                for x, y in transit[1:-1]:
+                    waypoints.append(
+                        Waypoint(
+                            position=Point(float(x), float(y)),
+                            speed=area.speed,
+                            blade_height=area.blade_height,
+                            action="move",
+                        )
+                    )
 
-        # İlk noktaya dön
-        if area.boundary:
-            waypoints.append(
-                Waypoint(
-                    position=Point(area.boundary[0].x, area.boundary[0].y),
-                    speed=area.speed * 0.7,
-                    blade_height=area.blade_height,
-                    action="move",
-                )
-            )
+            for start, end in stripes:
+                for x, y in (start, end):
+                    waypoints.append(
+                        Waypoint(
+                            position=Point(float(x), float(y)),
+                            speed=area.speed,
+                            blade_height=area.blade_height,
+                            action="move",
+                        )
+                    )
 
-        # İç kısım için biçerdöver deseni
-        inner_area = self._shrink_area(area, self.blade_width)
-        if inner_area:
-            inner_waypoints = self._lawn_mower_pattern(inner_area)
-            waypoints.extend(inner_waypoints)
+            position = stripes[-1][1]
 
         return waypoints
 
-    def _add_turning_waypoints(self, waypoints: List[Waypoint]) -> List[Waypoint]:
-        """Dönüş waypoint'leri ekle"""
-        if len(waypoints) < 2:
-            return waypoints
+    def _decompose_cells(
+        self, area: Area, boundary: np.ndarray, obstacles: List[np.ndarray]
+    ) -> List[List[Tuple[float, float, float]]]:
+        """
+        Şerit segmentlerini monoton hücrelere grupla.
+
+        Ardışık şeritlerde birebir örtüşen segmentler aynı hücreye eklenir;
+        bölünme veya birleşme (engel başlangıcı/bitişi) yeni hücre açar.
+        Her hücre (y, x_start, x_end) satırlarından oluşur.
+        """
+        min_y = boundary[:, 1].min() + self.safety_margin
+        max_y = boundary[:, 1].max() - self.safety_margin
+        line_spacing = self.blade_width * (1 - area.overlap)
+        stripe_ys = np.arange(min_y, max_y + 1e-9, line_spacing)
 
-        enhanced_waypoints = [waypoints[0]]
+        stripe_index, x_start, x_end = scanline_segments(
+            [boundary] + obstacles, stripe_ys
+        )
+        x_start = x_start + self.safety_margin
+        x_end = x_end - self.safety_margin
+        keep = x_end >= x_start
+        stripe_index, x_start, x_end = stripe_index[keep], x_start[keep], x_end[keep]
+        bounds = np.searchsorted(stripe_index, np.arange(len(stripe_ys) + 1))
+
+        cells: List[List[Tuple[float, float, float]]] = []
+        open_cells: List[int] = []  # Önceki şeritteki segmentlerin hücreleri
+        previous: List[Tuple[float, float]] = []
+
+        for i, y in enumerate(stripe_ys):
+            current = list(
+                zip(
+                    x_start[bounds[i] : bounds[i + 1]], x_end[bounds[i] : bounds[i + 1]]
+                )
+            )
 
-        for i in range(1, len(waypoints)):
-            prev_wp = waypoints[i - 1]
-            curr_wp = waypoints[i]
+            # Önceki ve mevcut segmentler arası örtüşme
+            overlaps = [
+                [j for j, (c0, c1) in enumerate(current) if c0 <= p1 and p0 <= c1]
+                for p0, p1 in previous
+            ]
+            overlap_count = [0] * len(current)
+            for links in overlaps:
+                for j in links:
+                    overlap_count[j] += 1
+
+            next_cells = []
+            for j, (c0, c1) in enumerate(current):
+                parents = [k for k, links in enumerate(overlaps) if j in links]
+                if (
+                    len(parents) == 1
+                    and overlap_count[j] == 1
+                    and len(overlaps[parents[0]]) == 1
+                ):
+                    cell_id = open_cells[parents[0]]
+                else:
+                    cells.append([])
+                    cell_id = len(cells) - 1
+
+                cells[cell_id].append((float(y), float(c0), float(c1)))
+                next_cells.append(cell_id)
+
+            open_cells = next_cells
+            previous = current
+
+        return cells
+
+    def _cell_stripes(
+        self,
+        cell: List[Tuple[float, float, float]],
+        from_top: bool,
+        reverse_first: bool,
+    ) -> List[Tuple[Tuple[float, float], Tuple[float, float]]]:
+        """Hücre şeritlerini verilen giriş köşesine göre zikzak sırala"""
+        rows = cell[::-1] if from_top else cell
+        stripes = []
+        reverse = reverse_first
+
+        for y, x0, x1 in rows:
+            if reverse:
+                stripes.append(((x1, y), (x0, y)))
+            else:
+                stripes.append(((x0, y), (x1, y)))
+            reverse = not reverse
+
+        return stripes
 
-            # Açı değişimi hesapla
-            if i < len(waypoints) - 1:
+    def _add_turning_waypoints(
+        self, waypoints: List[Waypoint], area: Optional[Area] = None
+    ) -> List[Waypoint]:
+        """
+        Dönüş manevralarını ekle.
+
+        Şerit sonu -> sonraki şerit başı geçişleri dönüş yarıçapına uygun
+        Dubins yolu (U, Ω veya S dönüşü) ile değiştirilir. Alan verilirse
+        manevra alan içinde ve engelsiz kalmalıdır; sığmayan geçişlerde
+        yerinde dönüş (eski davranış) kullanılır. Eklenen yol ve süre
+        last_turn_report içinde raporlanır.
+        """
+        return list(self._iter_turning_waypoints(waypoints, area))
+
+    def _iter_turning_waypoints(
+        self, waypoints: List[Waypoint], area: Optional[Area] = None
+    ) -> Iterator[Waypoint]:
+        """_add_turning_waypoints üreteci (manevralar sırayla planlanır)"""
+        report = {
+            "turn_count": 0,
+            "pivot_count": 0,
+            "added_length": 0.0,
+            "added_time": 0.0,
+            "kinds": {},
+            "progress": 0.0,  # İşlenen waypoint oranı (akış planlama için)
+        }
+        self.last_turn_report = report
+        if len(waypoints) < 2:
+            yield from waypoints
+            return
+
+        positions = polygon_to_array(waypoints)
+        seg = np.diff(positions, axis=0)
+        seg_len = np.hypot(seg[:, 0], seg[:, 1])
+        seg_heading = np.arctan2(seg[:, 1], seg[:, 0])
+        # corner[i]: waypoint i'deki yön değişimi (i = 1..n-2)
+        corner = np.abs(self._wrap_angles(np.diff(seg_heading)))
+        corner = np.concatenate(([0.0], corner, [0.0]))
+
+        is_free = None
+        if area is not None:
+            boundary = area.prepared_boundary()
+            obstacles = area.prepared_obstacles()
+
+            def is_free(points):
+                return boundary.contains_many(points) & ~contains_any(obstacles, points)
+
+        max_connector = 2 * self.turning_radius + 2 * self.blade_width
+
+        yield waypoints[0]
+        n = len(waypoints)
+        i = 1
+        while i < n:
+            curr_wp = waypoints[i]
+            report["progress"] = i / n
+
+            # Şerit geçişi: i ve i+1 ardışık keskin köşeler, arada kısa bağlantı
+            if (
+                i + 2 < n
+                and corner[i] > math.pi / 4
+                and corner[i + 1] > math.pi / 4
+                and 0 < seg_len[i] <= max_connector
+            ):
                 next_wp = waypoints[i + 1]
+                turn_planner = TurnPlanner(
+                    turning_radius=self.turning_radius,
+                    turn_speed=curr_wp.speed * 0.5,
+                    max_angular=self.max_angular_speed,
+                )
+                start = (positions[i][0], positions[i][1], seg_heading[i - 1])
+                end = (positions[i + 1][0], positions[i + 1][1], seg_heading[i + 1])
+                maneuver = turn_planner.plan(
+                    start,
+                    end,
+                    is_free=is_free,
+                    max_retreat=min(seg_len[i - 1], seg_len[i + 1]) / 3,
+                )
 
-                # Dönüş açısı
-                angle1 = prev_wp.position.angle_to(curr_wp.position)
-                angle2 = curr_wp.position.angle_to(next_wp.position)
-                turn_angle = abs(angle2 - angle1)
-
-                # Büyük dönüşler için ara waypoint ekle
-                if turn_angle > math.pi / 4:  # 45 derece
-                    turn_wp = Waypoint(
-                        position=curr_wp.position,
-                        speed=curr_wp.speed * 0.5,  # Dönüşte yavaşla
-                        blade_height=curr_wp.blade_height,
-                        action="turn",
+                report["turn_count"] += 1
+                report["kinds"][maneuver.kind] = (
+                    report["kinds"].get(maneuver.kind, 0) + 1
+                )
+                connector_time = seg_len[i] / max(next_wp.speed, 1e-6)
+                report["added_length"] += float(maneuver.length - seg_len[i])
+                report["added_time"] += float(maneuver.duration - connector_time)
+
+                if maneuver.kind == "pivot":
+                    report["pivot_count"] += 1
+                    for wp in (curr_wp, next_wp):
+                        yield replace(wp, speed=wp.speed * 0.5, action="turn")
+                        yield wp
+                else:
+                    exit_point = positions[i] - maneuver.retreat * np.array(
+                        [math.cos(start[2]), math.sin(start[2])]
+                    )
+                    entry_point = positions[i + 1] + maneuver.retreat * np.array(
+                        [math.cos(end[2]), math.sin(end[2])]
                     )
-                    enhanced_waypoints.append(turn_wp)
+                    yield replace(curr_wp, position=Point(*map(float, exit_point)))
+                    for x, y in maneuver.points:
+                        yield replace(
+                            curr_wp,
+                            position=Point(float(x), float(y)),
+                            speed=turn_planner.turn_speed,
+                            action="turn",
+                        )
+                    yield replace(next_wp, position=Point(*map(float, entry_point)))
+
+                i += 2
+                continue
+
+            # Tek keskin köşe: yerinde dönüş
+            if i < n - 1 and corner[i] > math.pi / 4:
+                turn_wp = Waypoint(
+                    position=curr_wp.position,
+                    speed=curr_wp.speed * 0.5,  # Dönüşte yavaşla
+                    blade_height=curr_wp.blade_height,
+                    action="turn",
+                )
+                yield turn_wp
+                report["pivot_count"] += 1
+                report["added_time"] += float(corner[i] / self.max_angular_speed)
 
-            enhanced_waypoints.append(curr_wp)
+            yield curr_wp
+            i += 1
 
-        return enhanced_waypoints
+        report["progress"] = 1.0
+
+    @staticmethod
+    def _wrap_angles(angles: np.ndarray) -> np.ndarray:
+        """Açıları [-π, π) aralığına getir (vektörel)"""
+        return (angles + np.pi) % (2 * np.pi) - np.pi
 
     def _point_in_polygon(self, point: Point, polygon: List[Point]) -> bool:
         """Nokta polygon içinde mi kontrolü (Ray Casting)"""
-        x, y = point.x, point.y
-        n = len(polygon)
-        inside = False
-
-        p1x, p1y = polygon[0].x, polygon[0].y
-        for i in range(1, n + 1):
-            p2x, p2y = polygon[i % n].x, polygon[i % n].y
-            if y > min(p1y, p2y):
-                if y <= max(p1y, p2y):
-                    if x <= max(p1x, p2x):
-                        if p1y != p2y:
-                            xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
-                        if p1x == p2x or x <= xinters:
-                            inside = not inside
-            p1x, p1y = p2x, p2y
-
-        return inside
+        return self.point_in_polygon(point, polygon)
 
     def _shrink_area(self, area: Area, margin: float) -> Optional[Area]:
-        """Alanı küçült (iç çevre için)"""
-        # Basit implementasyon - geliştirilmesi gerekebilir
-        shrunken_boundary = []
-
-        for point in area.boundary:
-            # Her noktayı merkeze doğru kaydır
-            center_x = sum(p.x for p in area.boundary) / len(area.boundary)
-            center_y = sum(p.y for p in area.boundary) / len(area.boundary)
-
-            dx = point.x - center_x
-            dy = point.y - center_y
-            length = math.sqrt(dx**2 + dy**2)
-
-            if length > margin:
-                factor = (length - margin) / length
-                new_x = center_x + dx * factor
-                new_y = center_y + dy * factor
-                shrunken_boundary.append(Point(new_x, new_y))
-
-        if len(shrunken_boundary) >= 3:
-            return Area(
-                id=area.id + "_inner",
-                name=area.name + " (İç)",
-                boundary=shrunken_boundary,
-                pattern=area.pattern,
-                blade_height=area.blade_height,
-                speed=area.speed,
-                overlap=area.overlap,
-            )
+        """Alanı kenar ötelemesiyle küçült (iç çevre için)"""
+        rings = offset_polygon(area.boundary, margin)
+        if not rings:
+            return None
 
-        return None
+        # Dar boğazda alan bölünürse en büyük parça kullanılır
+        return Area(
+            id=area.id + "_inner",
+            name=area.name + " (İç)",
+            boundary=[Point(float(x), float(y)) for x, y in rings[0]],
+            obstacles=area.obstacles,
+            pattern=area.pattern,
+            blade_height=area.blade_height,
+            speed=area.speed,
+            overlap=area.overlap,
+            sweep_angle=area.sweep_angle,
+        )
 
     def get_next_waypoint(
         self, current_position: Dict[str, float]
     ) -> Optional[Waypoint]:
         """Sonraki waypoint'i al"""
+        self._fill_stream(self.current_waypoint_index + self.lookahead_waypoints)
+        if self.planning_error is not None:
+            return None
+        if self._resume_index is not None:
+            # Devam noktası planlanana kadar bekle
+            if self._stream is not None and self._resume_index >= len(
+                self.current_path
+            ):
+                return None
+            self._apply_resume(self._resume_index)
         if not self.current_path or self.current_waypoint_index >= len(
             self.current_path
         ):
             return None
 
-        current_waypoint = self.current_path[self.current_waypoint_index]
-        current_pos = Point(current_position["x"], current_position["y"])
-
         # Waypoint'e ulaştık mı?
-        distance = current_pos.distance_to(current_waypoint.position)
-        if distance < 0.5:  # 50cm tolerans
-            self.current_waypoint_index += 1
-            self.logger.debug(f"Waypoint {self.current_waypoint_index-1} tamamlandı")
+        index = self.current_waypoint_index
+        current = self.current_path[index].position
+        x, y = current_position["x"], current_position["y"]
+        if math.hypot(current.x - x, current.y - y) < self.waypoint_tolerance:
+            self.current_waypoint_index = index + 1
+            self.logger.debug(f"Waypoint {index} tamamlandı")
+        elif not self._on_track(x, y, index):
+            # Sapma sonrası ilerideki bir waypoint'e ulaşıldıysa aradakiler
+            # atlanır. Yarıçap komşu şerit/halka aralığının yarısından küçük
+            # ve yön segmentle uyuşmalı; aksi halde komşu şeride atlanır.
+            reached = self.waypoint_index().nearest_forward(
+                x,
+                y,
+                index + 1,
+                index + self.lookahead_waypoints,
+                self.reacquire_radius(),
+                current_position.get("heading"),
+                self.reacquire_heading_error,
+            )
+            if reached is not None:
+                self.logger.info(
+                    f"Rota yeniden yakalandı: waypoint {index} -> {reached}"
+                )
+                self.current_waypoint_index = reached + 1
+                self._track_leg = reached + 1
 
         # Sonraki waypoint varsa döndür
+        self._fill_stream(self.current_waypoint_index)
         if self.current_waypoint_index < len(self.current_path):
             return self.current_path[self.current_waypoint_index]
 
         return None
 
-    def get_remaining_path(self) -> List[Waypoint]:
-        """Kalan rotayı al"""
+    def _on_track(self, x: float, y: float, index: int) -> bool:
+        """
+        Robot, en son üzerinde görüldüğü segmentten mevcut waypoint'e kadarki
+        rota parçasına yeniden yakalama yarıçapı kadar yakın mı?
+
+        Ulaşma toleransı ince rota kıvrımlarında (spiral merkezi) indeksi
+        robotun önüne geçirebildiğinden yalnızca son segmente bakılmaz.
+        """
+        first = max(1, index - self.lookahead_waypoints)
+        if self._track_leg <= index:
+            first = max(first, self._track_leg)
+        if first > index:
+            return False
+
+        points = self.waypoint_index().points
+        start = points[first - 1 : index]
+        delta = points[first : index + 1] - start
+        length_sq = np.einsum("ij,ij->i", delta, delta)
+        offset = np.array([x, y]) - start
+        t = np.clip(
+            np.einsum("ij,ij->i", offset, delta)
+            / np.where(length_sq > 0, length_sq, 1.0),
+            0.0,
+            1.0,
+        )
+        error = offset - delta * t[:, None]
+        radius = self.reacquire_radius()
+        hits = np.flatnonzero(np.einsum("ij,ij->i", error, error) <= radius * radius)
+        if not len(hits):
+            return False
+        self._track_leg = first + int(hits[0])
+        return True
+
+    def reacquire_radius(self) -> float:
+        """Yeniden yakalama yarıçapı (en dar şerit/halka aralığına göre)"""
+        if self.current_mission:
+            areas = [
+                self.areas[a] for a in self.current_mission.order if a in self.areas
+            ]
+        else:
+            areas = [self.current_area] if self.current_area else []
+        overlap = max((area.overlap for area in areas), default=Area.overlap)
+        spacing = self.blade_width * (1 - overlap)
+        return min(self.waypoint_tolerance, self.reacquire_ratio * spacing)
+
+    def waypoint_index(self) -> WaypointIndex:
+        """Mevcut rota için uzamsal indeks (rota değişince yeniden kurulur)"""
+        if (
+            self._waypoint_index is None
+            or self._indexed_path is not self.current_path
+            or len(self._waypoint_index) != len(self.current_path)
+        ):
+            if self._indexed_path is not self.current_path:
+                self._track_leg = 0
+            self._waypoint_index = WaypointIndex(self.current_path, self.blade_width)
+            self._indexed_path = self.current_path
+        return self._waypoint_index
+
+    def get_remaining_path(self) -> PathArray:
+        """Kalan rota (PathArray ise kopyasız görünüm)"""
         if not self.current_path:
-            return []
+            return PathArray.empty()
 
         return self.current_path[self.current_waypoint_index :]
 
@@ -586,23 +1496,106 @@ class PathPlanner:
         total = len(self.current_path)
         completed = self.current_waypoint_index
         progress = (completed / total) * 100 if total > 0 else 0
+        metrics = self.current_metrics()
 
         return {
             "progress": progress,
             "completed_waypoints": completed,
             "total_waypoints": total,
             "current_area": self.current_area.name if self.current_area else None,
+            "distance_remaining": metrics.length_remaining(completed),
+            "time_remaining": metrics.time_remaining(completed),
+            "planning": self.planning,  # Kalan değerler üretilmiş kısım için
+            "planning_progress": self.planning_progress(),
         }
 
+    def path_metrics(self, path: List[Waypoint]) -> PathMetrics:
+        """Robotun ivme ve dönüş sınırlarıyla rota metrikleri"""
+        return path_metrics(
+            path,
+            max_accel=self.max_acceleration,
+            max_decel=self.max_deceleration,
+            max_lateral_accel=self.max_lateral_accel,
+            max_angular=self.max_angular_speed,
+        )
+
+    def current_metrics(self) -> PathMetrics:
+        """Mevcut rotanın metrikleri (rota değişince yeniden hesaplanır)"""
+        if (
+            self._metrics is None
+            or self._metrics_path is not self.current_path
+            or len(self._metrics.cumulative_time) != len(self.current_path)
+        ):
+            self._metrics = self.path_metrics(self.current_path)
+            self._metrics_path = self.current_path
+        return self._metrics
+
     def reset_path(self):
         """Rotayı sıfırla"""
         self.current_waypoint_index = 0
         self.logger.info("Rota sıfırlandı")
 
+    def stripe_start_index(self, index: int) -> int:
+        """
+        İndeksin içinde bulunduğu şeridin başlangıcı.
+
+        Şerit başı son dönüş noktasıdır; çok alanlı görevlerde alan girişi
+        ("blade_on") ve geçiş başı ("blade_off") da sınır sayılır.
+        """
+        if index >= len(self.current_path):
+            return len(self.current_path)
+        index = max(index, 0)
+        path = PathArray.from_waypoints(self.current_path[: index + 1])
+        starts = np.flatnonzero(path.action_mask("turn", "blade_on", "blade_off"))
+        return int(starts[-1]) if len(starts) else index
+
+    def blade_enabled(self, index: Optional[int] = None) -> Optional[bool]:
+        """
+        İndeksteki waypoint'e giden segmentte bıçak açık mı.
+
+        Segment, başlangıcından önceki son "blade_on"/"blade_off" eylemine
+        uyar (coverage_report ile aynı kural); öncesinde böyle bir eylem
+        yoksa None.
+        """
+        if index is None:
+            index = self.current_waypoint_index
+        path = PathArray.from_waypoints(self.current_path[: max(index, 1)])
+        toggles = np.flatnonzero(path.action_mask("blade_on", "blade_off"))
+        if not len(toggles):
+            return None
+        return bool(path.action[toggles[-1]] != action_code("blade_off"))
+
+    def resume_from(self, completed_index: int) -> int:
+        """
+        Yarım kalan şeridin başından devam et.
+
+        Kontrol noktası akışta henüz planlanmadıysa beklenmez; indeks
+        get_next_waypoint tarafından o nokta planlanınca uygulanır. Bu
+        durumda (şerit başı henüz bilinmediğinden) completed_index döner.
+        """
+        self._fill_stream(completed_index)
+        if self._stream is not None and completed_index >= len(self.current_path):
+            self._resume_index = completed_index
+            self.current_waypoint_index = completed_index
+            self.logger.info(f"Devam noktası planlanıyor: waypoint {completed_index}")
+            return completed_index
+        self._apply_resume(completed_index)
+        return self.current_waypoint_index
+
+    def _apply_resume(self, completed_index: int):
+        """Devam indeksini şerit başına ayarla"""
+        self._resume_index = None
+        self.current_waypoint_index = self.stripe_start_index(completed_index)
+        self.logger.info(
+            f"Rota {self.current_waypoint_index}/{len(self.current_path)} "
+            f"waypoint'inden devam ediyor"
+        )
+
     def add_area(self, area: Area):
         """Yeni alan ekle"""
         self.areas[area.id] = area
         self._save_areas()
+        self.area_changed(area.id)
         self.logger.info(f"Yeni alan eklendi: {area.name}")
 
     def remove_area(self, area_id: str):
@@ -610,6 +1603,8 @@ class PathPlanner:
         if area_id in self.areas:
             del self.areas[area_id]
             self._save_areas()
+            self.plan_cache.invalidate(area_id)
+            self.area_changed(area_id)
             self.logger.info(f"Alan silindi: {area_id}")
 
     def get_areas(self) -> Dict[str, Dict[str, Any]]:
@@ -623,6 +1618,7 @@ class PathPlanner:
                 "pattern": area.pattern.value,
                 "blade_height": area.blade_height,
                 "speed": area.speed,
+                "sweep_angle": area.sweep_angle,
             }
         return result
 
@@ -631,19 +1627,18 @@ class PathPlanner:
         if area_id not in self.areas:
             return 0
 
-        area = self.areas[area_id]
-
-        # Alan büyüklüğünü hesapla (basit poligon alanı)
-        area_size = self._calculate_polygon_area(area.boundary)
-
-        # Biçme hızı ve robot genişliği ile süre hesapla
-        coverage_rate = area.speed * self.blade_width  # m²/s
-        total_time = area_size / coverage_rate  # saniye
+        path = self.area_path(self.areas[area_id])
+        return self.estimate_path_time(path) / 60  # dakikaya çevir
 
-        # Dönüş ve hareket süreleri için %20 ekle
-        total_time *= 1.2
+    def estimate_path_time(self, path: List[Waypoint]) -> float:
+        """
+        Rotanın süresi (saniye).
 
-        return total_time / 60  # dakikaya çevir
+        Her segment hedef waypoint'in hızıyla, ivme/yavaşlama ve viraj
+        sınırlarına uyan trapez profille sürülür; keskin köşelerde yerinde
+        dönüş süresi eklenir (bkz. path_metrics).
+        """
+        return self.path_metrics(path).total_time
 
     def normalize_angle(self, angle: float) -> float:
         """Açıyı [-π, π) aralığına normalize et - testlerin beklediği fonksiyon"""
@@ -693,23 +1688,18 @@ class PathPlanner:
         if len(polygon) < 3:
             return False
 
-        x, y = point.x, point.y
-        n = len(polygon)
-        inside = False
-
-        p1x, p1y = polygon[0].x, polygon[0].y
-        for i in range(1, n + 1):
-            p2x, p2y = polygon[i % n].x, polygon[i % n].y
-            if y > min(p1y, p2y):
-                if y <= max(p1y, p2y):
-                    if x <= max(p1x, p2x):
-                        if p1y != p2y:
-                            xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
-                        if p1x == p2x or x <= xinters:
-                            inside = not inside
-            p1x, p1y = p2x, p2y
-
-        return inside
+        return self._prepared_polygon(polygon).contains(point)
+
+    def _prepared_polygon(self, polygon: List[Point]) -> PreparedPolygon:
+        """Koordinat anahtarıyla önbellekteki hazırlanmış poligonu döndür"""
+        key = tuple((p.x, p.y) for p in polygon)
+        prepared = self._polygon_cache.get(key)
+        if prepared is None:
+            if len(self._polygon_cache) >= self.polygon_cache_size:
+                self._polygon_cache.clear()
+            prepared = PreparedPolygon(polygon)
+            self._polygon_cache[key] = prepared
+        return prepared
 
     def load_area_from_config(self, config: Dict[str, Any]) -> Area:
         """Konfigürasyondan alan yükle - testlerin beklediği fonksiyon"""
@@ -753,87 +1743,79 @@ class PathPlanner:
     ) -> List[Waypoint]:
         """Biçerdöver deseni oluştur - testlerin beklediği fonksiyon"""
         try:
-            waypoints = []
-
-            # Alan sınırlarını bul
-            min_x = min(p.x for p in area.boundary)
-            max_x = max(p.x for p in area.boundary)
-            min_y = min(p.y for p in area.boundary)
-            max_y = max(p.y for p in area.boundary)
-
-            # Şerit bazlı hareket
-            current_y = min_y + stripe_width / 2
-            direction = 1  # 1: sağa, -1: sola
-
-            while current_y < max_y:
-                if direction == 1:
-                    # Soldan sağa
-                    start_x = min_x
-                    end_x = max_x
-                else:
-                    # Sağdan sola
-                    start_x = max_x
-                    end_x = min_x
-
-                # Şerit boyunca waypoint'ler
-                num_points = max(2, int(abs(end_x - start_x) / 0.5))
-                for i in range(num_points):
-                    t = i / (num_points - 1) if num_points > 1 else 0
-                    x = start_x + t * (end_x - start_x)
-                    point = Point(x, current_y)
-
-                    # Noktanın alan içinde olup olmadığını kontrol et
-                    if self.point_in_polygon(point, area.boundary):
-                        waypoint = Waypoint(
-                            position=point,
-                            speed=area.speed,
-                            blade_height=area.blade_height,
-                            action="move",
-                        )
-                        waypoints.append(waypoint)
-
-                current_y += stripe_width
-                direction *= -1
-
-            return waypoints
+            return list(self.iter_lawn_mower_pattern(area, stripe_width))
 
         except Exception as e:
             self.logger.error(f"Lawn mower pattern oluşturma hatası: {e}")
             return []
 
+    def iter_lawn_mower_pattern(
+        self, area: Area, stripe_width: float = 0.5
+    ) -> Iterator[Waypoint]:
+        """Biçerdöver deseni üreteci (şeritler sırayla, sadeleştirilmiş üretilir)"""
+        # Alan sınırlarını bul
+        boundary = area.prepared_boundary()
+        if len(boundary) < 3:
+            return
+        tolerance = self.blade_width * self.simplify_ratio
+        min_x, min_y = boundary.min_x, boundary.min_y
+        max_x, max_y = boundary.max_x, boundary.max_y
+
+        # Şerit bazlı hareket
+        current_y = min_y + stripe_width / 2
+        direction = 1  # 1: sağa, -1: sola
+
+        while current_y < max_y:
+            if direction == 1:
+                # Soldan sağa
+                start_x = min_x
+                end_x = max_x
+            else:
+                # Sağdan sola
+                start_x = max_x
+                end_x = min_x
+
+            # Şerit boyunca waypoint'ler (alan içi kontrolü tek geçişte)
+            num_points = max(2, int(abs(end_x - start_x) / 0.5))
+            xs = np.linspace(start_x, end_x, num_points)
+            samples = np.column_stack([xs, np.full(num_points, current_y)])
+            inside = samples[boundary.contains_many(samples)]
+            if len(inside):
+                # Şerit üzerindeki eşdoğrusal örnekler atılır
+                n = len(inside)
+                yield from simplify_path(
+                    PathArray(
+                        inside,
+                        np.full(n, area.speed),
+                        np.full(n, area.blade_height),
+                        np.full(n, action_code("move")),
+                    ),
+                    tolerance,
+                )
+
+            current_y += stripe_width
+            direction *= -1
+
     def generate_spiral_pattern(
         self, area: Area, step_size: float = 0.5
     ) -> List[Waypoint]:
         """Spiral desen oluştur - testlerin beklediği fonksiyon"""
         try:
-            waypoints = []
-            center = self.get_area_center(area.boundary)
-
-            # Spiral parametreleri - dışarıdan içeriye
-            angle = 0
-            max_radius = max(self.euclidean_distance(center, p) for p in area.boundary)
-            radius = max_radius
-
-            while radius > step_size:
-                x = center.x + radius * math.cos(angle)
-                y = center.y + radius * math.sin(angle)
-                point = Point(x, y)
-
-                # Alan içinde mi kontrol et
-                if self.point_in_polygon(point, area.boundary):
-                    waypoint = Waypoint(
-                        position=point,
-                        speed=area.speed,
-                        blade_height=area.blade_height,
-                        action="move",
-                    )
-                    waypoints.append(waypoint)
-
-                # Spiral daralt (içeriye doğru)
-                angle += 0.1  # radyan
-                radius -= step_size * 0.01
-
-            return waypoints
+            points = contour_spiral(
+                area.boundary,
+                step_size / 2,
+                step_size,
+                obstacles=area.obstacles,
+            )
+            return [
+                Waypoint(
+                    position=Point(float(x), float(y)),
+                    speed=area.speed,
+                    blade_height=area.blade_height,
+                    action="move",
+                )
+                for x, y in points
+            ]
 
         except Exception as e:
             self.logger.error(f"Spiral pattern oluşturma hatası: {e}")
@@ -847,68 +1829,58 @@ class PathPlanner:
                 path = self.generate_lawn_mower_pattern(area)
             elif area.pattern == PatternType.SPIRAL:
                 path = self.generate_spiral_pattern(area)
+            elif area.pattern == PatternType.BOUSTROPHEDON:
+                path = self._boustrophedon_pattern(area)
             else:
                 self.logger.warning(f"Desteklenmeyen pattern: {area.pattern}")
                 path = self.generate_lawn_mower_pattern(area)
 
             # Engel kaçınma uygula
             if area.obstacles:
-                path = self._apply_obstacle_avoidance(path, area.obstacles)
+                path = self._apply_obstacle_avoidance(path, area.prepared_obstacles())
 
-            return path
+            return list(self._iter_simplified(path))
 
         except Exception as e:
             self.logger.error(f"Rota oluşturma hatası: {e}")
             return []
 
     def _apply_obstacle_avoidance(
-        self, path: List[Waypoint], obstacles: List[List[Point]]
+        self, path: List[Waypoint], obstacles: List[Any]
     ) -> List[Waypoint]:
         """Path'e engel kaçınma uygula"""
-        filtered_path = []
+        if not path or not obstacles:
+            return path
 
-        for waypoint in path:
-            # Waypoint herhangi bir engel içinde mi kontrol et
-            in_obstacle = False
-            for obstacle in obstacles:
-                if self.point_in_polygon(waypoint.position, obstacle):
-                    in_obstacle = True
-                    break
+        prepared = [
+            obs if isinstance(obs, PreparedPolygon) else PreparedPolygon(obs)
+            for obs in obstacles
+        ]
 
-            # Engel içinde değilse ekle
-            if not in_obstacle:
-                filtered_path.append(waypoint)
+        # Tüm waypoint'leri tüm engellere karşı tek geçişte sınıflandır
+        in_obstacle = contains_any(prepared, path)
 
-        return filtered_path
+        return [wp for wp, blocked in zip(path, in_obstacle) if not blocked]
 
-    def optimize_path(self, waypoints: List[Waypoint]) -> List[Waypoint]:
-        """Rotayı optimize et - testlerin beklediği fonksiyon"""
-        if len(waypoints) < 2:
+    def optimize_path(
+        self, waypoints: List[Waypoint], tolerance: Optional[float] = None
+    ) -> List[Waypoint]:
+        """
+        Rotayı Douglas-Peucker ile sadeleştir.
+
+        Atılan noktalar sadeleştirilmiş rotadan en fazla tolerance (varsayılan
+        blade_width * simplify_ratio) uzaktadır. Hız, bıçak ve eylem
+        değişimleri korunur. PathArray girişi PathArray, liste girişi liste
+        döndürür.
+        """
+        if len(waypoints) < 3:
             return waypoints
+        if tolerance is None:
+            tolerance = self.blade_width * self.simplify_ratio
 
-        optimized = [waypoints[0]]  # İlk waypoint'i koru
-
-        for i in range(1, len(waypoints) - 1):
-            current = waypoints[i]
-            prev = optimized[-1]
-            next_wp = waypoints[i + 1]
-
-            # Düz çizgi kontrolü - eğer üç nokta neredeyse düz çizgide ise orta noktayı atla
-            vec1 = (
-                current.position.x - prev.position.x,
-                current.position.y - prev.position.y,
-            )
-            vec2 = (
-                next_wp.position.x - current.position.x,
-                next_wp.position.y - current.position.y,
-            )
-
-            # Cross product ile doğrusallık kontrolü
-            cross = vec1[0] * vec2[1] - vec1[1] * vec2[0]
-            if abs(cross) > 0.1:  # Threshold
-                optimized.append(current)
-
-        optimized.append(waypoints[-1])  # Son waypoint'i koru
+        optimized = simplify_path(waypoints, tolerance)
+        if not isinstance(waypoints, PathArray):
+            optimized = list(optimized)
 
         self.logger.info(
             f"Rota optimize edildi: {len(waypoints)} -> {len(optimized)} waypoint"
@@ -961,83 +1933,72 @@ class PathPlanner:
         if not path:
             return False
 
+        xy = polygon_to_array(path)
+
         # Path noktalarının alan içinde olup olmadığını kontrol et
-        for wp in path:
-            if not self.point_in_polygon(wp.position, area.boundary):
-                return False
+        if not area.prepared_boundary().contains_many(xy).all():
+            return False
 
         # Engellerde olmadığını kontrol et
-        for wp in path:
-            for obstacle in area.obstacles:
-                if self.point_in_polygon(wp.position, obstacle):
-                    return False
+        if contains_any(area.prepared_obstacles(), xy).any():
+            return False
 
         return True
 
     def check_path_continuity(self, path: List[Waypoint], max_gap: float) -> bool:
         """Path'in sürekliliğini kontrol et - testlerin beklediği fonksiyon"""
-        if len(path) < 2:
-            return True
-
-        for i in range(len(path) - 1):
-            distance = path[i].position.distance_to(path[i + 1].position)
-            if distance > max_gap:
-                return False
-        return True
+        return bool(np.all(segment_lengths(polygon_to_array(path)) <= max_gap))
 
     def calculate_coverage(self, path: List[Waypoint], area: Area) -> float:
         """Path'in alan kapsamasını hesapla - testlerin beklediği fonksiyon"""
         if not path or not area.boundary:
             return 0.0
 
-        # Basitleştirilmiş coverage hesaplama
-        # Path noktalarının alan içinde kaç tanesinin olduğunu say
-        covered_points = 0
-        total_points = len(path)
-
-        for wp in path:
-            if self.point_in_polygon(wp.position, area.boundary):
-                covered_points += 1
-
-        return covered_points / max(total_points, 1)
+        return self.coverage_report(path, area).coverage
+
+    def coverage_report(
+        self, path: List[Waypoint], area: Area, min_missed_area: float = 0.0
+    ) -> CoverageReport:
+        """
+        Bıçak izinin ızgara kapsama raporu.
+
+        Rota blade_width genişliğinde süpürülür; "blade_off" ile "blade_on"
+        arasındaki geçiş segmentleri biçim sayılmaz.
+        """
+        path = PathArray.from_waypoints(path)
+
+        # Her segment, kendisinden önceki son blade_on/blade_off durumunda
+        toggles = np.flatnonzero(path.action_mask("blade_on", "blade_off"))
+        last = np.searchsorted(toggles, np.arange(len(path) - 1), side="right") - 1
+        cutting = np.ones(max(len(path) - 1, 0), dtype=bool)
+        known = last >= 0
+        cutting[known] = path.action[toggles[last[known]]] != action_code("blade_off")
+
+        return coverage_report(
+            area.boundary,
+            path.xy,
+            self.blade_width,
+            obstacles=area.obstacles,
+            resolution=self.coverage_resolution,
+            cutting=cutting,
+            min_missed_area=min_missed_area,
+        )
 
     def calculate_path_length(self, path: List[Waypoint]) -> float:
         """Path uzunluğunu hesapla - testlerin beklediği fonksiyon"""
-        if len(path) < 2:
-            return 0.0
-
-        total_length = 0.0
-        for i in range(len(path) - 1):
-            total_length += path[i].position.distance_to(path[i + 1].position)
-
-        return total_length
+        return float(np.sum(segment_lengths(polygon_to_array(path))))
 
     def generate_perimeter_path(
         self, area: Area, offset: float = 0.0
     ) -> List[Waypoint]:
         """Çevre path'i oluştur - testlerin beklediği fonksiyon"""
-        waypoints = []
+        if offset != 0:
+            rings = offset_polygon(area.boundary, offset)
+            points = [Point(float(x), float(y)) for x, y in rings[0]] if rings else []
+        else:
+            points = list(area.boundary)
 
-        # Basit çevre path - sınır noktalarını waypoint olarak ekle
-        for i, point in enumerate(area.boundary):
-            # Offset hesapla (basitleştirilmiş)
-            if offset > 0:
-                # Merkeze doğru offset
-                center = self.get_area_center(area.boundary)
-                direction_x = center.x - point.x
-                direction_y = center.y - point.y
-                length = math.sqrt(direction_x**2 + direction_y**2)
-                if length > 0:
-                    direction_x /= length
-                    direction_y /= length
-                    offset_point = Point(
-                        point.x + direction_x * offset, point.y + direction_y * offset
-                    )
-                    waypoints.append(Waypoint(offset_point))
-                else:
-                    waypoints.append(Waypoint(point))
-            else:
-                waypoints.append(Waypoint(point))
+        waypoints = [Waypoint(point) for point in points]
 
         # İlk noktayı sona ekle (kapalı döngü)
         if waypoints:
@@ -1047,28 +2008,29 @@ class PathPlanner:
 
     def get_path_statistics(self, path: List[Waypoint], area: Area) -> Dict[str, float]:
         """Path istatistiklerini al - testlerin beklediği fonksiyon"""
+        metrics = self.path_metrics(path)
         stats = {
-            "total_length": self.calculate_path_length(path),
-            "coverage": self.calculate_coverage(path, area),
+            "total_length": metrics.total_length,
+            "coverage": 0.0,
             "waypoint_count": float(len(path)),
             "area_size": self.calculate_polygon_area(area.boundary),
         }
 
-        if len(path) > 1:
-            stats["average_speed"] = 0.5  # Varsayılan hız
-            stats["estimated_time"] = stats["total_length"] / stats["average_speed"]
-        else:
-            stats["average_speed"] = 0.0
-            stats["estimated_time"] = 0.0
+        if path and area.boundary:
+            report = self.coverage_report(path, area)
+            stats["coverage"] = report.coverage
+            stats["covered_area"] = report.covered_area
+            stats["missed_area"] = report.missed_area
+            stats["double_cut_percent"] = report.double_cut_percent
+
+        stats["estimated_time"] = metrics.total_time
+        stats["average_speed"] = (
+            metrics.total_length / metrics.total_time if metrics.total_time > 0 else 0.0
+        )
+        stats["max_curvature"] = metrics.max_curvature
 
         return stats
 
-    def combine_paths(self, paths: List[List[Waypoint]]) -> List[Waypoint]:
+    def combine_paths(self, paths: List[List[Waypoint]]) -> PathArray:
         """Birden fazla path'i birleştir - testlerin beklediği fonksiyon"""
-        combined_path = []
-
-        for path in paths:
-            if path:
-                combined_path.extend(path)
-
-        return combined_path
+        return PathArray.concatenate(paths)
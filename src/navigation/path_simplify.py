@@ -0,0 +1,101 @@
+"""
+Rota Sadeleştirme Modülü
+Ramer-Douglas-Peucker ile metrik hata sınırlı waypoint azaltma
+"""
+
+from typing import Any, Optional
+
+import numpy as np
+
+from .path_array import PathArray
+
+
+def _segment_distances(points: np.ndarray, start: np.ndarray, end: np.ndarray):
+    """Noktaların [start, end] doğru parçasına uzaklıkları"""
+    seg = end - start
+    length_sq = float(seg @ seg)
+    rel = points - start
+    if length_sq < 1e-18:
+        return np.hypot(rel[:, 0], rel[:, 1])
+    t = np.clip((rel @ seg) / length_sq, 0.0, 1.0)
+    off = rel - t[:, None] * seg
+    return np.hypot(off[:, 0], off[:, 1])
+
+
+def rdp_mask(
+    points: Any, tolerance: float, keep: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Ramer-Douglas-Peucker ile tutulacak noktaların maskesi.
+
+    Özyineleme yerine yığın kullanılır; her aralıktaki uzaklıklar tek
+    vektörel adımda hesaplanır. Atılan her nokta, kendisini kapsayan
+    sadeleştirilmiş segmente en fazla tolerance uzaklıktadır.
+
+    Args:
+        points: (N, 2) noktalar
+        tolerance: izin verilen en büyük sapma (metre)
+        keep: her durumda tutulacak noktalar (N,) (ör. eylem değişimleri)
+    """
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+    n = len(points)
+    mask = np.zeros(n, dtype=bool)
+    if n == 0:
+        return mask
+    mask[[0, -1]] = True
+    if keep is not None:
+        mask |= keep
+
+    # Zorunlu noktalar rotayı bağımsız parçalara böler
+    anchors = np.flatnonzero(mask)
+    stack = [(int(lo), int(hi)) for lo, hi in zip(anchors[:-1], anchors[1:])]
+
+    while stack:
+        lo, hi = stack.pop()
+        if hi - lo < 2:
+            continue
+        distances = _segment_distances(points[lo + 1 : hi], points[lo], points[hi])
+        worst = int(np.argmax(distances))
+        if distances[worst] > tolerance:
+            split = lo + 1 + worst
+            mask[split] = True
+            stack.append((lo, split))
+            stack.append((split, hi))
+
+    return mask
+
+
+def attribute_breaks(path: PathArray) -> np.ndarray:
+    """
+    Hız, bıçak yüksekliği veya eylemin değiştiği noktalar (her iki taraf).
+
+    Bıçak aç/kapa ve dur komutları her zaman korunur.
+    """
+    n = len(path)
+    keep = np.zeros(n, dtype=bool)
+    if n < 2:
+        return keep
+
+    changed = (
+        (np.diff(path.speed) != 0)
+        | (np.diff(path.blade_height) != 0)
+        | (np.diff(path.action) != 0)
+    )
+    keep[:-1] |= changed
+    keep[1:] |= changed
+    keep |= path.action_mask("stop", "blade_on", "blade_off")
+    return keep
+
+
+def simplify_path(path: Any, tolerance: float) -> PathArray:
+    """
+    Rotayı geometrik olarak tolerance içinde kalarak sadeleştir.
+
+    Özellik (hız, bıçak, eylem) değişimleri korunduğundan sürüş davranışı
+    değişmez; yalnızca aynı özellikli ara noktalar atılır.
+    """
+    path = PathArray.from_waypoints(path)
+    if len(path) < 3 or tolerance <= 0:
+        return path
+    mask = rdp_mask(path.xy, tolerance, attribute_breaks(path))
+    return path.take(np.flatnonzero(mask))
@@ -0,0 +1,84 @@
+"""
+Rota Akışı Modülü
+Rota parçalarını arka plan thread'inde üretip sınırlı bir tamponda tutar
+"""
+
+import logging
+import queue
+import threading
+from typing import Iterator, Optional
+
+from .path_array import PathArray
+
+_END = object()  # Üretici bitti işareti
+
+
+class PathStream:
+    """
+    Arka planda üretilen rota parçaları için sınırlı tampon.
+
+    Üretici thread tampon dolunca bekler; böylece planlama robotun
+    ilerlemesinden en fazla buffer_chunks parça öndedir ve bellek sınırlı
+    kalır. Üreticideki hata error'a yazılır ve akış biter.
+    """
+
+    def __init__(self, chunks: Iterator[PathArray], buffer_chunks: int = 4):
+        self.logger = logging.getLogger("PathStream")
+        self.error: Optional[Exception] = None
+        self.done = False  # Son parça tüketildi (veya iptal edildi)
+
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max(buffer_chunks, 1))
+        self._cancelled = threading.Event()
+        self._thread = threading.Thread(
+            target=self._produce, args=(chunks,), name="PathStream", daemon=True
+        )
+        self._thread.start()
+
+    def _produce(self, chunks: Iterator[PathArray]):
+        """Üretici thread: parçaları tampona yaz"""
+        try:
+            for chunk in chunks:
+                if not self._put(chunk):
+                    return
+        except Exception as e:
+            self.error = e
+            if not self._cancelled.is_set():
+                self.logger.error(f"Rota akışı hatası: {e}")
+        self._put(_END)
+
+    def _put(self, item: object) -> bool:
+        """Tampona yaz (iptal edilirse False)"""
+        while not self._cancelled.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def get(self, block: bool = False, timeout: Optional[float] = None):
+        """
+        Sonraki parça.
+
+        Hazır parça yoksa (block=False) veya akış bittiyse None döner;
+        ikisini ayırmak için done kullanılır.
+        """
+        if self.done:
+            return None
+        try:
+            item = self._queue.get(block=block, timeout=timeout)
+        except queue.Empty:
+            return None
+        if item is _END:
+            self.done = True
+            return None
+        return item
+
+    def cancel(self):
+        """Üretimi durdur (üretici bir sonraki parçada çıkar)"""
+        self._cancelled.set()
+        self.done = True
+
+    def join(self, timeout: Optional[float] = None):
+        """Üretici thread'in bitmesini bekle"""
+        self._thread.join(timeout)
@@ -0,0 +1,158 @@
+"""
+Rota Takip Modülü
+Pure pursuit (ileri bakış) ile kalan rotaya karşı sürekli eğrilik komutu üretir
+"""
+
+import math
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from .polygon_geometry import polygon_to_array
+
+
+class PurePursuitTracker:
+    """
+    Pure pursuit rota takipçisi.
+
+    Robot rotaya izdüşürülür, izdüşümden yay uzunluğu boyunca ileri bakış
+    mesafesi kadar ilerlenir ve o noktaya giden çemberin eğriliği komut
+    olarak verilir. Dur-dön-git yerine sürekli (v, ω) üretir.
+    """
+
+    def __init__(
+        self,
+        lookahead_min: float = 0.4,
+        lookahead_gain: float = 0.8,
+        max_linear: float = 1.0,
+        max_angular: float = 1.0,
+        max_lateral_accel: float = 0.5,
+        max_decel: float = 0.5,
+        search_window: int = 20,
+    ):
+        self.lookahead_min = lookahead_min  # Minimum ileri bakış (metre)
+        self.lookahead_gain = lookahead_gain  # Hıza bağlı ileri bakış (saniye)
+        self.max_linear = max_linear
+        self.max_angular = max_angular
+        self.max_lateral_accel = max_lateral_accel  # Virajda yanal ivme sınırı
+        self.max_decel = max_decel  # Rota sonunda yavaşlama
+        self.search_window = search_window  # İleri bakışta incelenen segment sayısı
+
+        self.last_linear = 0.0
+        self._path_ref: Optional[Any] = None
+        self._points = np.zeros((0, 2))
+
+    def _path_points(self, path: Any) -> np.ndarray:
+        """Waypoint listesini bir kez diziye çevir (rota değişince yenile)"""
+        if self._path_ref is not path or len(self._points) != len(path):
+            self._points = polygon_to_array(path)
+            self._path_ref = path
+        return self._points
+
+    def lookahead_distance(self) -> float:
+        """Mevcut hıza göre ileri bakış mesafesi"""
+        return self.lookahead_min + self.lookahead_gain * abs(self.last_linear)
+
+    def compute_command(
+        self,
+        pose: Dict[str, float],
+        path: Any,
+        start_index: int,
+        speed: float = 0.5,
+    ) -> Dict[str, float]:
+        """
+        Kalan rotaya göre hız komutu hesapla.
+
+        Args:
+            pose: {"x", "y", "heading"} robot pozu
+            path: Waypoint listesi veya (N, 2) dizi
+            start_index: Sıradaki hedef waypoint indeksi
+            speed: İstenen seyir hızı (m/s)
+
+        Returns:
+            {"linear", "angular", "curvature", "target_x", "target_y"}
+        """
+        points = self._path_points(path)
+        if start_index >= len(points):
+            self.last_linear = 0.0
+            return {"linear": 0.0, "angular": 0.0, "curvature": 0.0}
+
+        robot = np.array([pose["x"], pose["y"]], dtype=float)
+        heading = pose.get("heading", 0.0)
+
+        # Takip edilecek polyline: önceki waypoint -> hedef -> ileri pencere.
+        # İzdüşüm yalnızca hedefe giden segmente yapılır; komşu şeritler
+        # birbirine yakın olduğundan en yakın segment araması şerit atlatır.
+        hi = min(start_index + self.search_window, len(points) - 1)
+        if start_index == 0:
+            local = np.vstack((robot, points[: hi + 1]))
+        else:
+            local = points[start_index - 1 : hi + 1]
+
+        seg_start = local[:-1]
+        seg_vec = local[1:] - seg_start
+        seg_len = np.hypot(seg_vec[:, 0], seg_vec[:, 1])
+
+        t = 0.0
+        if seg_len[0] > 0:
+            t = float(np.dot(robot - seg_start[0], seg_vec[0]) / seg_len[0] ** 2)
+            t = min(max(t, 0.0), 1.0)
+
+        # İzdüşümden itibaren yay uzunluğu boyunca ileri bakış noktası
+        travelled = np.concatenate(([0.0], np.cumsum(seg_len))) - t * seg_len[0]
+        remaining = max(float(travelled[-1]), 0.0)
+        if hi < len(points) - 1:
+            remaining = math.inf  # Rota sonu pencerenin dışında
+        lookahead = self.lookahead_distance()
+
+        k = int(np.searchsorted(travelled[1:], lookahead))
+        if k >= len(seg_len):
+            target = local[-1]
+        else:
+            ratio = (lookahead - travelled[k]) / seg_len[k] if seg_len[k] else 0.0
+            target = seg_start[k] + seg_vec[k] * ratio
+
+        # Hedef noktayı robot çerçevesine çevir
+        dx, dy = target - robot
+        cos_h, sin_h = math.cos(heading), math.sin(heading)
+        local_x = cos_h * dx + sin_h * dy
+        local_y = -sin_h * dx + cos_h * dy
+        distance_sq = local_x**2 + local_y**2
+
+        if distance_sq < 1e-9:
+            self.last_linear = 0.0
+            return {"linear": 0.0, "angular": 0.0, "curvature": 0.0}
+
+        curvature = 2.0 * local_y / distance_sq
+
+        # Hedef arkada kaldıysa yerinde dön
+        if local_x < 0 and abs(local_y) < -local_x:
+            angular = math.copysign(self.max_angular, local_y or 1.0)
+            self.last_linear = 0.0
+            return {
+                "linear": 0.0,
+                "angular": angular,
+                "curvature": curvature,
+                "target_x": float(target[0]),
+                "target_y": float(target[1]),
+            }
+
+        # Hız sınırları: seyir hızı, yanal ivme, rota sonunda durma
+        linear = min(speed, self.max_linear)
+        if abs(curvature) > 1e-6:
+            linear = min(linear, math.sqrt(self.max_lateral_accel / abs(curvature)))
+        linear = min(linear, math.sqrt(2.0 * self.max_decel * remaining))
+
+        angular = linear * curvature
+        if abs(angular) > self.max_angular:
+            angular = math.copysign(self.max_angular, angular)
+            linear = self.max_angular / abs(curvature)
+
+        self.last_linear = linear
+        return {
+            "linear": linear,
+            "angular": angular,
+            "curvature": curvature,
+            "target_x": float(target[0]),
+            "target_y": float(target[1]),
+        }
@@ -0,0 +1,110 @@
+"""
+Rota Önbelleği Modülü
+Planlanmış rotaları alan geometrisi hash'i ile diskte saklar
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+
+from .path_array import PathArray
+
+# Planlama algoritması değiştiğinde artırılmalı; eski kayıtlar geçersiz olur
+PLANNER_VERSION = 6
+
+
+class PlanCache:
+    """İçerik adresli, LRU tahliyeli rota önbelleği"""
+
+    def __init__(self, cache_dir: str, max_entries: int = 32):
+        self.logger = logging.getLogger("PlanCache")
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+
+    @staticmethod
+    def compute_key(area: Any, **params: Any) -> str:
+        """Geometri, desen ve planlama parametrelerinden sha256 anahtarı"""
+        boundary, obstacles = area.geometry_key()
+        payload = {
+            "version": PLANNER_VERSION,
+            "boundary": boundary,
+            "obstacles": obstacles,
+            "pattern": area.pattern.value,
+            "overlap": area.overlap,
+            "speed": area.speed,
+            "blade_height": area.blade_height,
+            "sweep_angle": area.sweep_angle,
+            "params": params,
+        }
+        encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def _file_name(self, area_id: str, key: str) -> Path:
+        safe_id = re.sub(r"[^A-Za-z0-9_.-]", "_", area_id)
+        return self.cache_dir / f"{safe_id}-{key}.npz"
+
+    def _area_files(self, area_id: str) -> Sequence[Path]:
+        if not self.cache_dir.is_dir():
+            return []
+        safe_id = re.sub(r"[^A-Za-z0-9_.-]", "_", area_id)
+        pattern = re.compile(re.escape(safe_id) + r"-[0-9a-f]{64}\.npz$")
+        return [p for p in self.cache_dir.iterdir() if pattern.match(p.name)]
+
+    def get(self, area_id: str, key: str) -> Optional[Dict[str, np.ndarray]]:
+        """Önbellekteki rota dizilerini döndür (yoksa None)"""
+        path = self._file_name(area_id, key)
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                arrays = {name: data[name] for name in data.files}
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.warning(f"Bozuk önbellek kaydı siliniyor: {path.name} ({e})")
+            path.unlink(missing_ok=True)
+            return None
+
+        # LRU için erişim zamanını güncelle
+        os.utime(path)
+        return arrays
+
+    def put(self, area_id: str, key: str, waypoints: Sequence[Any]):
+        """Rotayı (PathArray veya Waypoint listesi) sıkıştırarak kaydet"""
+        arrays = PathArray.from_waypoints(waypoints).to_arrays()
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            path = self._file_name(area_id, key)
+            tmp_path = path.with_suffix(".tmp")
+            with open(tmp_path, "wb") as f:
+                np.savez_compressed(f, **arrays)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.logger.warning(f"Rota önbelleğe yazılamadı: {e}")
+            return
+
+        self._evict()
+
+    def invalidate(self, area_id: str, keep: Optional[str] = None) -> int:
+        """Alana ait kayıtları sil (keep anahtarı hariç)"""
+        removed = 0
+        for path in self._area_files(area_id):
+            if keep is not None and path.name.endswith(f"-{keep}.npz"):
+                continue
+            path.unlink(missing_ok=True)
+            removed += 1
+
+        if removed:
+            self.logger.debug(f"{area_id} için {removed} önbellek kaydı silindi")
+        return removed
+
+    def _evict(self):
+        """En eski erişilen kayıtları max_entries sınırına kadar sil"""
+        entries = sorted(self.cache_dir.glob("*.npz"), key=lambda p: p.stat().st_mtime)
+        for path in entries[: max(0, len(entries) - self.max_entries)]:
+            path.unlink(missing_ok=True)
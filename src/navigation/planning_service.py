@@ -0,0 +1,217 @@
+"""
+Planlama Servisi Modülü
+Rota planlamayı process havuzunda çalıştırır; parçalar üretildikçe kontrol
+tarafına aktarılır, iş ilerlemesi raporlanır ve eskiyen işler iptal edilir
+"""
+
+import logging
+import multiprocessing
+import queue
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Dict, Optional
+
+from .path_array import PathArray
+
+# İşçi planlayıcıya aktarılan robot/planlama parametreleri
+PLANNER_PARAMS = (
+    "blade_width",
+    "robot_width",
+    "turning_radius",
+    "max_angular_speed",
+    "safety_margin",
+    "headland_passes",
+    "stream_chunk_size",
+)
+
+
+def _put(out: Any, cancelled: Any, item: tuple) -> bool:
+    """Sınırlı kuyruğa yaz (iş iptal edilirse False)"""
+    while not cancelled.is_set():
+        try:
+            out.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _plan_worker(
+    config_path: str, area: Any, params: Dict[str, Any], out: Any, cancelled: Any
+) -> int:
+    """
+    İşçi process: alanı planla, parçaları kuyruğa yaz.
+
+    Kuyruk mesajları: ("chunk", diziler, ilerleme), ("done",) veya
+    ("error", mesaj). Üretilen waypoint sayısını döndürür.
+    """
+    from .path_planner import PathPlanner
+
+    count = 0
+    try:
+        planner = PathPlanner(config_path=config_path)
+        for name, value in params.items():
+            setattr(planner, name, value)
+
+        for chunk in planner.iter_plan(area):
+            count += len(chunk)
+            progress = planner.last_turn_report.get("progress", 0.0)
+            if not _put(out, cancelled, ("chunk", chunk.to_arrays(), progress)):
+                return count
+    except Exception as e:
+        _put(out, cancelled, ("error", f"{type(e).__name__}: {e}"))
+        return count
+
+    _put(out, cancelled, ("done",))
+    return count
+
+
+class PlanJob:
+    """
+    Tek alanın planlama işi.
+
+    PathStream ile aynı arayüzü (get, done, error, cancel, join) sunar;
+    PathPlanner akış planlamada ikisini ayırt etmez.
+    """
+
+    def __init__(
+        self, area_id: str, plan_key: str, future: Future, out: Any, cancelled: Any
+    ):
+        self.area_id = area_id
+        self.plan_key = plan_key
+        self.error: Optional[Exception] = None
+        self.done = False  # Son parça tüketildi (veya iptal edildi)
+        self.cancelled = False
+        self.progress = 0.0  # Planlanan şerit oranı (0-1)
+        self.waypoints = 0  # Aktarılan waypoint sayısı
+
+        self._future = future
+        self._out = out
+        self._cancelled = cancelled
+
+    def get(self, block: bool = False, timeout: Optional[float] = None):
+        """Sonraki parça (hazır değilse veya iş bittiyse None)"""
+        if self.done:
+            return None
+        try:
+            message = self._out.get(block=block, timeout=timeout)
+        except queue.Empty:
+            # İşçi process beklenmedik şekilde öldüyse kuyruğa bir şey gelmez
+            if self._future.done() and self._future.exception() is not None:
+                self.error = self._future.exception()
+                self.done = True
+            return None
+
+        if message[0] == "chunk":
+            chunk = PathArray.from_arrays(message[1])
+            self.progress = message[2]
+            self.waypoints += len(chunk)
+            return chunk
+
+        if message[0] == "error":
+            self.error = RuntimeError(message[1])
+        else:
+            self.progress = 1.0
+        self.done = True
+        return None
+
+    def cancel(self):
+        """İşi iptal et (başlamadıysa hiç çalışmaz)"""
+        self._cancelled.set()
+        self._future.cancel()
+        self.cancelled = True
+        self.done = True
+
+    def join(self, timeout: Optional[float] = None):
+        """İşçinin bitmesini bekle"""
+        if not self._future.cancelled():
+            self._future.exception(timeout)
+
+    def status(self) -> Dict[str, Any]:
+        """İş durumu (web arayüzü için)"""
+        return {
+            "area_id": self.area_id,
+            "progress": self.progress,
+            "waypoints": self.waypoints,
+            "done": self.done,
+            "error": str(self.error) if self.error else None,
+        }
+
+
+class PlanningService:
+    """
+    Rota planlamayı kontrol thread'inden ayrı process'lerde çalıştırır.
+
+    Her alan için en fazla bir iş tutulur; yeni iş veya alan düzenlemesi
+    eski işi iptal eder. Process havuzu ve kuyruk yöneticisi ilk işte
+    başlatılır. Thread'li süreçte fork güvenli olmadığından varsayılan
+    başlatma yöntemi "spawn"dır.
+    """
+
+    def __init__(
+        self, max_workers: int = 1, buffer_chunks: int = 4, start_method: str = "spawn"
+    ):
+        self.logger = logging.getLogger("PlanningService")
+        self.max_workers = max_workers
+        self.buffer_chunks = buffer_chunks
+        self.start_method = start_method
+        self.jobs: Dict[str, PlanJob] = {}
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._manager = None
+
+    def _start(self):
+        """Process havuzunu ve kuyruk yöneticisini başlat"""
+        if self._executor is None:
+            context = multiprocessing.get_context(self.start_method)
+            self._manager = context.Manager()
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers, mp_context=context
+            )
+
+    def submit(self, planner: Any, area: Any) -> PlanJob:
+        """Alanın planlama işini başlat (aynı alanın eski işi iptal edilir)"""
+        self.cancel(area.id)
+        self._start()
+
+        planner.resolve_sweep_angle(area)
+        params = {name: getattr(planner, name) for name in PLANNER_PARAMS}
+        out = self._manager.Queue(maxsize=max(self.buffer_chunks, 1))
+        cancelled = self._manager.Event()
+        future = self._executor.submit(
+            _plan_worker, planner.config_path, area, params, out, cancelled
+        )
+
+        job = PlanJob(area.id, planner.plan_key(area), future, out, cancelled)
+        self.jobs[area.id] = job
+        self.logger.info(f"Planlama işi başlatıldı: {area.id}")
+        return job
+
+    def cancel(self, area_id: str, keep_key: Optional[str] = None) -> bool:
+        """
+        Alanın işini iptal et.
+
+        keep_key verilirse ve iş aynı rota anahtarıyla planlıyorsa (alan
+        düzenlemesi planı etkilemiyorsa) iş korunur.
+        """
+        job = self.jobs.get(area_id)
+        if job is None or (keep_key is not None and job.plan_key == keep_key):
+            return False
+        del self.jobs[area_id]
+        if not job.done:
+            job.cancel()
+            self.logger.info(f"Planlama işi iptal edildi: {area_id}")
+        return True
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        """Tüm işlerin durumu"""
+        return {area_id: job.status() for area_id, job in self.jobs.items()}
+
+    def shutdown(self):
+        """Tüm işleri iptal et ve process'leri kapat"""
+        for area_id in list(self.jobs):
+            self.cancel(area_id)
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._manager.shutdown()
+            self._executor = None
+            self._manager = None
@@ -0,0 +1,711 @@
+"""
+Poligon Geometri Modülü
+Rota planlama için NumPy tabanlı vektörel poligon işlemleri
+"""
+
+import math
+from typing import Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+def polygon_to_array(polygon: Any) -> np.ndarray:
+    """Point/Waypoint listesi, PathArray, (x, y) çiftleri veya dizi -> (N, 2) dizi"""
+    if isinstance(polygon, np.ndarray):
+        return np.asarray(polygon, dtype=float).reshape(-1, 2)
+
+    # PathArray: konumlar zaten bitişik dizide
+    if isinstance(getattr(polygon, "xy", None), np.ndarray):
+        return polygon.xy
+
+    if len(polygon) == 0:
+        return np.zeros((0, 2))
+
+    if hasattr(polygon[0], "x"):
+        return np.array([(p.x, p.y) for p in polygon], dtype=float)
+
+    if hasattr(polygon[0], "position"):
+        return np.array([(w.position.x, w.position.y) for w in polygon], dtype=float)
+
+    return np.asarray(polygon, dtype=float).reshape(-1, 2)
+
+
+def edge_arrays(
+    rings: Sequence[np.ndarray],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Tüm halkaların kenarlarını (x0, y0, x1, y1) dizileri olarak döndür"""
+    starts = []
+    ends = []
+    for ring in rings:
+        if len(ring) < 3:
+            continue
+        starts.append(ring)
+        ends.append(np.roll(ring, -1, axis=0))
+
+    if not starts:
+        empty = np.zeros(0)
+        return empty, empty, empty, empty
+
+    p0 = np.concatenate(starts)
+    p1 = np.concatenate(ends)
+    return p0[:, 0], p0[:, 1], p1[:, 0], p1[:, 1]
+
+
+def rotate_points(points: Any, angle: float) -> np.ndarray:
+    """Noktaları orijin etrafında angle radyan döndür"""
+    xy = polygon_to_array(points)
+    c, s = np.cos(angle), np.sin(angle)
+    return xy @ np.array([[c, s], [-s, c]])
+
+
+def scanline_segments(
+    rings: Sequence[Any], ys: Sequence[float]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Yatay tarama çizgilerini poligon kenarlarıyla tek seferde kesiştir.
+
+    Tüm şerit x kenar kesişimleri tek bir (S, E) matris işlemiyle hesaplanır.
+    Birden fazla halka verilirse çift-tek (even-odd) kuralı uygulanır; yani
+    ilk halka sınır, diğerleri delik (engel) olarak davranır.
+
+    Returns:
+        (stripe_index, x_start, x_end): Şerit sırasına ve x'e göre sıralı
+        iç segmentler. Bir şeritte birden fazla segment olabilir.
+    """
+    arrays = [polygon_to_array(ring) for ring in rings]
+    x0, y0, x1, y1 = edge_arrays(arrays)
+    ys = np.asarray(ys, dtype=float)
+
+    if len(x0) == 0 or len(ys) == 0:
+        empty = np.zeros(0)
+        return np.zeros(0, dtype=int), empty, empty
+
+    y = ys[:, None]
+
+    # Yarı açık kural: (y0 < y) != (y1 < y) -> köşe noktaları bir kez sayılır
+    crosses = (y0 < y) != (y1 < y)
+    dy = np.where(y1 == y0, 1.0, y1 - y0)
+    xs = x0 + (y - y0) * (x1 - x0) / dy
+    xs = np.where(crosses, xs, np.inf)
+    xs.sort(axis=1)
+
+    # Sıralı kesişimler çiftler halinde iç segmentleri verir
+    max_crossings = int(crosses.sum(axis=1).max(initial=0))
+    max_crossings -= max_crossings % 2
+    starts = xs[:, 0:max_crossings:2]
+    ends = xs[:, 1:max_crossings:2]
+
+    valid = np.isfinite(ends) & (ends > starts)
+    stripe_index, column = np.nonzero(valid)
+
+    return stripe_index, starts[stripe_index, column], ends[stripe_index, column]
+
+
+def scanline_intervals(rings: Sequence[Any], ys: Sequence[float]) -> List[np.ndarray]:
+    """Her şerit için (k, 2) [x_start, x_end] dizisi listesi döndür"""
+    stripe_index, x_start, x_end = scanline_segments(rings, ys)
+    bounds = np.searchsorted(stripe_index, np.arange(len(ys) + 1))
+    segments = np.stack([x_start, x_end], axis=1)
+
+    return [segments[bounds[i] : bounds[i + 1]] for i in range(len(ys))]
+
+
+class PreparedPolygon:
+    """
+    Kenar dizileri ve sınır kutusu önceden hesaplanmış poligon.
+
+    Aynı poligona karşı çok sayıda nokta sorgulanacaksa bir kez hazırlanır,
+    sonra contains_many ile N nokta tek vektörel geçişte sınıflandırılır.
+    """
+
+    # Tek seferde işlenecek maksimum (nokta x kenar) eleman sayısı
+    max_chunk_elements = 1_000_000
+
+    def __init__(self, polygon: Any):
+        self.vertices = polygon_to_array(polygon)
+        self.x0, self.y0, self.x1, self.y1 = edge_arrays([self.vertices])
+
+        # Kesişim x'i için eğim (yatay kenarlar hiç kesişmediğinden 0)
+        dy = self.y1 - self.y0
+        horizontal = dy == 0
+        self.inv_slope = np.where(
+            horizontal, 0.0, (self.x1 - self.x0) / np.where(horizontal, 1.0, dy)
+        )
+
+        if len(self.vertices):
+            self.min_x, self.min_y = self.vertices.min(axis=0)
+            self.max_x, self.max_y = self.vertices.max(axis=0)
+        else:
+            self.min_x = self.min_y = np.inf
+            self.max_x = self.max_y = -np.inf
+
+    def __len__(self) -> int:
+        return len(self.vertices)
+
+    def contains(self, point: Any) -> bool:
+        """Tek nokta sorgusu"""
+        if hasattr(point, "x"):
+            xy = np.array([[point.x, point.y]])
+        else:
+            xy = np.asarray(point, dtype=float).reshape(1, 2)
+        return bool(self.contains_many(xy)[0])
+
+    def contains_many(self, points: Any) -> np.ndarray:
+        """
+        N noktayı tek geçişte sınıflandır (Ray Casting, vektörel).
+
+        Sınır davranışı PathPlanner.point_in_polygon ile aynıdır.
+        """
+        xy = polygon_to_array(points)
+        result = np.zeros(len(xy), dtype=bool)
+
+        if len(self.vertices) < 3 or len(xy) == 0:
+            return result
+
+        # Sınır kutusu ön filtresi
+        candidates = np.nonzero(
+            (xy[:, 0] >= self.min_x)
+            & (xy[:, 0] <= self.max_x)
+            & (xy[:, 1] >= self.min_y)
+            & (xy[:, 1] <= self.max_y)
+        )[0]
+
+        chunk = max(1, self.max_chunk_elements // len(self.x0))
+        for start in range(0, len(candidates), chunk):
+            idx = candidates[start : start + chunk]
+            x = xy[idx, 0:1]
+            y = xy[idx, 1:2]
+
+            crosses = (self.y0 < y) != (self.y1 < y)
+            x_inters = self.x0 + (y - self.y0) * self.inv_slope
+            hits = crosses & (x <= x_inters)
+
+            # Tek sayıda kesişim -> içeride
+            result[idx] = (np.count_nonzero(hits, axis=1) % 2) == 1
+
+        return result
+
+
+def contains_any(polygons: Sequence[PreparedPolygon], points: Any) -> np.ndarray:
+    """Noktalar poligonlardan herhangi birinin içinde mi?"""
+    xy = polygon_to_array(points)
+    result = np.zeros(len(xy), dtype=bool)
+
+    for polygon in polygons:
+        result |= polygon.contains_many(xy)
+
+    return result
+
+
+def signed_area(ring: Any) -> float:
+    """Halka için işaretli alan (saat yönü tersi pozitif)"""
+    xy = polygon_to_array(ring)
+    if len(xy) < 3:
+        return 0.0
+    x, y = xy[:, 0], xy[:, 1]
+    return 0.5 * float(np.dot(x, np.roll(y, -1)) - np.dot(np.roll(x, -1), y))
+
+
+def segments_cross_edges(
+    starts: np.ndarray,
+    ends: np.ndarray,
+    edges: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+    eps: float = 1e-9,
+) -> np.ndarray:
+    """
+    M segmentin herhangi bir kenarı kesip kesmediğini döndür (M,).
+
+    Sadece gerçek (proper) kesişimler sayılır; uç noktada temas kesişim değildir.
+    """
+    x0, y0, x1, y1 = edges
+    starts = polygon_to_array(starts)
+    ends = polygon_to_array(ends)
+    result = np.zeros(len(starts), dtype=bool)
+
+    if len(x0) == 0 or len(starts) == 0:
+        return result
+
+    ex = x1 - x0
+    ey = y1 - y0
+    chunk = max(1, PreparedPolygon.max_chunk_elements // len(x0))
+
+    for lo in range(0, len(starts), chunk):
+        px = starts[lo : lo + chunk, 0:1]
+        py = starts[lo : lo + chunk, 1:2]
+        dx = ends[lo : lo + chunk, 0:1] - px
+        dy = ends[lo : lo + chunk, 1:2] - py
+
+        # Kenar uçlarının segmente göre yönelimi
+        d1 = dx * (y0 - py) - dy * (x0 - px)
+        d2 = dx * (y1 - py) - dy * (x1 - px)
+        # Segment uçlarının kenara göre yönelimi
+        d3 = ex * (py - y0) - ey * (px - x0)
+        d4 = ex * (py + dy - y0) - ey * (px + dx - x0)
+
+        hits = (d1 * d2 < -eps) & (d3 * d4 < -eps)
+        result[lo : lo + chunk] = hits.any(axis=1)
+
+    return result
+
+
+def point_segment_distance(
+    points: Any, edges: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+) -> np.ndarray:
+    """Her noktanın kenarlara en kısa mesafesi (N,)"""
+    xy = polygon_to_array(points)
+    x0, y0, x1, y1 = edges
+    result = np.full(len(xy), np.inf)
+    if len(x0) == 0 or len(xy) == 0:
+        return result
+
+    ex = x1 - x0
+    ey = y1 - y0
+    length_sq = np.maximum(ex * ex + ey * ey, 1e-18)
+    chunk = max(1, PreparedPolygon.max_chunk_elements // len(x0))
+
+    for lo in range(0, len(xy), chunk):
+        px = xy[lo : lo + chunk, 0:1]
+        py = xy[lo : lo + chunk, 1:2]
+        t = np.clip(((px - x0) * ex + (py - y0) * ey) / length_sq, 0.0, 1.0)
+        dx = x0 + t * ex - px
+        dy = y0 + t * ey - py
+        result[lo : lo + chunk] = np.sqrt((dx * dx + dy * dy).min(axis=1))
+
+    return result
+
+
+def _clean_ring(ring: np.ndarray, eps: float = 1e-9) -> np.ndarray:
+    """Ardışık çakışan noktaları ve kapanış tekrarını at"""
+    if len(ring) < 2:
+        return ring
+    step = np.hypot(*(np.roll(ring, -1, axis=0) - ring).T)
+    return ring[step > eps]
+
+
+def _raw_offset(
+    ring: np.ndarray, distance: float, join: str, miter_limit: float, arc_step: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Kenarları sol normalleri yönünde ötele ve köşeleri birleştir.
+
+    Sağa dönen köşelerdeki boşluk yay ("round") veya sınırlı miter ile
+    kapatılır. Sola dönen köşelerde ötelenmiş kenarlar tam uzunlukta
+    bırakılıp köşenin kendisi üzerinden bağlanır; böylece gerçek sınır
+    her zaman ham eğrinin kesişim noktalarıyla ayrılan parçalarından oluşur.
+
+    Returns:
+        (points, centers): centers[k], points[k] -> points[k + 1] segmenti
+        bir yay kirişiyse yayın merkezi, değilse NaN
+    """
+    edge = np.roll(ring, -1, axis=0) - ring
+    length = np.hypot(edge[:, 0], edge[:, 1])
+    normal = np.stack([-edge[:, 1], edge[:, 0]], axis=1) / length[:, None]
+
+    points = []
+    centers = []
+    for k in range(len(ring)):
+        n0, n1 = normal[k - 1], normal[k]
+        vertex = ring[k]
+        turn = float(n0[0] * n1[1] - n0[1] * n1[0])
+        dot = float(n0 @ n1)
+
+        if abs(turn) < 1e-9 and dot > 0:
+            points.append(vertex + distance * n1)
+        elif turn > 0:
+            points.extend((vertex + distance * n0, vertex, vertex + distance * n1))
+        elif join == "round":
+            start = math.atan2(n0[1], n0[0])
+            sweep = math.atan2(turn, dot)
+            if sweep > 0:
+                sweep -= 2 * math.pi
+            steps = max(1, int(math.ceil(-sweep / arc_step)))
+            angles = start + sweep * np.arange(steps + 1) / steps
+            points.extend(
+                vertex + distance * np.stack([np.cos(angles), np.sin(angles)], axis=1)
+            )
+            centers.extend([vertex] * steps)
+        else:
+            miter = (n0 + n1) / max(1 + dot, 1e-9)
+            if 1 + dot > 1e-9 and np.hypot(*miter) <= miter_limit:
+                points.append(vertex + distance * miter)
+            else:
+                points.extend((vertex + distance * n0, vertex + distance * n1))
+
+        centers.extend([(np.nan, np.nan)] * (len(points) - len(centers)))
+
+    return np.array(points), np.array(centers, dtype=float)
+
+
+def _overlapping_pairs(
+    starts: np.ndarray, ends: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sınır kutuları örtüşen segment çiftleri (i < j).
+
+    Segmentler kutu başlangıcına (min x) göre sıralanır; her segment
+    yalnızca x aralığı içinde başlayan segmentlerle eşlenir (sweep).
+    """
+    lo = np.minimum(starts, ends)
+    hi = np.maximum(starts, ends)
+    order = np.argsort(lo[:, 0], kind="stable")
+    sorted_lo = lo[order, 0]
+
+    last = np.searchsorted(sorted_lo, hi[order, 0], side="right")
+    counts = np.maximum(last - np.arange(len(order)) - 1, 0)
+    first = np.repeat(np.arange(len(order)), counts)
+    offset = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    a, b = order[first], order[first + 1 + offset]
+
+    overlap = (lo[a, 1] <= hi[b, 1]) & (lo[b, 1] <= hi[a, 1])
+    a, b = a[overlap], b[overlap]
+    return np.minimum(a, b), np.maximum(a, b)
+
+
+def _self_intersections(
+    ring: np.ndarray, eps: float = 1e-9
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Kapalı halkanın komşu olmayan kenar kesişimleri (i, t, j, u, nokta).
+
+    Değme noktaları da kesişim sayılır; halkayı değme noktasından bölmek
+    parçaların sınıflandırılmasını değiştirmez.
+    """
+    n = len(ring)
+    d = np.roll(ring, -1, axis=0) - ring
+    i, j = _overlapping_pairs(ring, ring + d)
+    keep = (j - i >= 2) & ~((i == 0) & (j == n - 1))
+    i, j = i[keep], j[keep]
+
+    denom = d[i, 0] * d[j, 1] - d[i, 1] * d[j, 0]
+    diff = ring[j] - ring[i]
+    safe = np.where(np.abs(denom) < eps, 1.0, denom)
+    t = (diff[:, 0] * d[j, 1] - diff[:, 1] * d[j, 0]) / safe
+    u = (diff[:, 0] * d[i, 1] - diff[:, 1] * d[i, 0]) / safe
+    # Yarı açık [0, 1): köşede değen kesişimler bir kez sayılır
+    hit = (np.abs(denom) >= eps) & (t > -eps) & (t < 1 - eps)
+    hit &= (u > -eps) & (u < 1 - eps)
+
+    i, j, t, u = i[hit], j[hit], np.clip(t[hit], 0.0, 1.0), u[hit]
+    return i, t, j, u, ring[i] + t[:, None] * d[i]
+
+
+def _split_segments(
+    ring: np.ndarray, centers: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Halkayı kesişim noktalarından alt segmentlere böl.
+
+    Returns:
+        (starts, ends, centers, start_node, end_node): Alt segmentler
+        bulundukları kenarın yay merkezini taşır.
+    """
+    i, t, j, u, crossing = _self_intersections(ring)
+
+    on_edge = {}
+    for h in range(len(i)):
+        on_edge.setdefault(int(i[h]), []).append((t[h], h))
+        on_edge.setdefault(int(j[h]), []).append((u[h], h))
+
+    points = []
+    edge_of = []
+    for k in range(len(ring)):
+        points.append(ring[k])
+        edge_of.append(k)
+        for _, h in sorted(on_edge.get(k, [])):
+            points.append(crossing[h])
+            edge_of.append(k)
+
+    # Düğüm kimliği konumdur: çakışan köşe ve kesişimler aynı düğümdür
+    points = np.array(points)
+    _, nodes = np.unique(np.round(points, 7), axis=0, return_inverse=True)
+    nodes = nodes.reshape(-1)
+    return (
+        points,
+        np.roll(points, -1, axis=0),
+        centers[edge_of],
+        nodes,
+        np.roll(nodes, -1),
+    )
+
+
+def chain_segments(
+    starts: np.ndarray, start_node: np.ndarray, end_node: np.ndarray
+) -> List[np.ndarray]:
+    """
+    Uç uca eklenen segmentlerden kapalı halkalar oluştur.
+
+    Ucu boşta kalan segmentler (tolerans sınırındaki kısa çıkıntılar)
+    önce ayıklanır.
+    """
+    alive = np.ones(len(starts), dtype=bool)
+    while True:
+        has_next = np.isin(end_node, start_node[alive])
+        has_prev = np.isin(start_node, end_node[alive])
+        dangling = alive & ~(has_next & has_prev)
+        if not dangling.any():
+            break
+        alive &= ~dangling
+    starts, start_node, end_node = starts[alive], start_node[alive], end_node[alive]
+
+    outgoing = {}
+    for k, node in enumerate(start_node):
+        outgoing.setdefault(int(node), []).append(k)
+
+    used = np.zeros(len(starts), dtype=bool)
+    loops = []
+    for first in range(len(starts)):
+        if used[first]:
+            continue
+        chain = []
+        k = first
+        while k is not None and not used[k]:
+            used[k] = True
+            chain.append(k)
+            candidates = [c for c in outgoing.get(int(end_node[k]), []) if not used[c]]
+            k = candidates[0] if candidates else None
+
+        # Yalnızca başladığı düğüme dönen zincirler halkadır
+        if end_node[chain[-1]] == start_node[chain[0]]:
+            loops.append(starts[chain])
+
+    return loops
+
+
+def offset_polygon(
+    polygon: Any,
+    distance: float,
+    join: str = "round",
+    miter_limit: float = 2.0,
+    arc_step: float = math.radians(15),
+) -> List[np.ndarray]:
+    """
+    Poligonu kenar ötelemesiyle içe (distance > 0) veya dışa (< 0) kaydır.
+
+    Ham ötelenmiş eğri kendini kestiği noktalardan parçalara bölünür,
+    orijinal sınıra distance'tan yakın kalan parçalar atılır ve kalanlar
+    halkalara birleştirilir. Dar boğazlarda alan birden fazla parçaya
+    ayrılabilir; dışa ötelemede oluşan delikler atlanır.
+
+    Args:
+        polygon: Halka noktaları
+        distance: Öteleme mesafesi (metre)
+        join: İçbükey köşe birleşimi, "round" (tam) veya "miter"
+        miter_limit: Miter uzunluğu sınırı (distance katı), aşılırsa kesik köşe
+        arc_step: Yay birleşimlerinde açı adımı (radyan)
+
+    Returns:
+        Alana göre büyükten küçüğe sıralı, saat yönü tersi halkalar
+    """
+    ring = _clean_ring(polygon_to_array(polygon))
+    area = signed_area(ring)
+    if len(ring) < 3 or abs(area) < 1e-12:
+        return []
+    if distance == 0:
+        return [ring if area > 0 else ring[::-1]]
+
+    # Öteleme her zaman sola yapılır: içe için CCW, dışa için CW halka
+    inward = distance > 0
+    d = abs(distance)
+    work = ring if (area > 0) == inward else ring[::-1]
+    raw, centers = _raw_offset(work, d, join, miter_limit, arc_step)
+    distinct = np.hypot(*(np.roll(raw, -1, axis=0) - raw).T) > 1e-9
+    raw, centers = raw[distinct], centers[distinct]
+
+    # Alt segmentlerden yalnızca orijinal sınıra en az d uzaklıkta ve doğru
+    # tarafta kalanlar gerçek öteleme sınırıdır. Yay kirişlerinde orta nokta
+    # yay üzerine izdüşürülerek sınanır.
+    starts, ends, centers, start_node, end_node = _split_segments(raw, centers)
+    keep = np.hypot(*(ends - starts).T) > 1e-12
+    middle = (starts + ends) / 2
+    arc = ~np.isnan(centers[:, 0])
+    radial = middle[arc] - centers[arc]
+    radial_length = np.maximum(np.hypot(radial[:, 0], radial[:, 1]), 1e-12)
+    middle[arc] = centers[arc] + radial * (d / radial_length)[:, None]
+    # Kiriş kesişimleri gerçek yay kesişiminden en fazla sehim kadar sapar
+    tolerance = d * (1 - math.cos(arc_step / 2)) + 1e-7 * d
+    keep &= point_segment_distance(middle, edge_arrays([ring])) >= d - tolerance
+    keep &= PreparedPolygon(ring).contains_many(middle) == inward
+
+    result = []
+    for loop in chain_segments(starts[keep], start_node[keep], end_node[keep]):
+        loop = _clean_ring(loop)
+        if len(loop) >= 3 and signed_area(loop) * (1 if inward else -1) > 1e-12:
+            result.append(loop if inward else loop[::-1])
+    result.sort(key=signed_area, reverse=True)
+    return result
+
+
+def offset_rings(
+    polygon: Any,
+    first: float,
+    spacing: float,
+    count: Optional[int] = None,
+    **kwargs: Any,
+) -> List[List[np.ndarray]]:
+    """
+    İç içe K öteleme halkası: first, first + spacing, ...
+
+    Her halka orijinal poligondan doğrudan ötelenir (hata birikmez).
+    count verilmezse alan tükenene kadar devam edilir.
+
+    Returns:
+        Her mesafe için offset_polygon sonucu (boş olanlardan önce durur)
+    """
+    rings = []
+    k = 0
+    while count is None or k < count:
+        level = offset_polygon(polygon, first + k * spacing, **kwargs)
+        if not level:
+            break
+        rings.append(level)
+        k += 1
+    return rings
+
+
+class VisibilityGraph:
+    """
+    Engeller etrafında en kısa geçiş yolu için görünürlük grafı.
+
+    Düğümler, engel köşelerinin dışarı ve sınır köşelerinin içeri doğru
+    clearance kadar kaydırılmış halleridir. Her sorguda sadece başlangıç ve
+    bitiş çevresindeki pencere içinde kalan kenar ve düğümler kullanılır;
+    yol bulunamazsa pencere büyütülür.
+    """
+
+    def __init__(self, boundary: Any, obstacles: Sequence[Any], clearance: float):
+        self.boundary = PreparedPolygon(boundary)
+        self.obstacles = [PreparedPolygon(obs) for obs in obstacles]
+        self.clearance = clearance
+
+        rings = [self.boundary.vertices] + [obs.vertices for obs in self.obstacles]
+        self.edges = edge_arrays(rings)
+        x0, y0, x1, y1 = self.edges
+        self.edge_min = np.stack([np.minimum(x0, x1), np.minimum(y0, y1)], axis=1)
+        self.edge_max = np.stack([np.maximum(x0, x1), np.maximum(y0, y1)], axis=1)
+
+        candidates = [self._offset_vertices(self.boundary.vertices, -clearance)]
+        candidates += [
+            self._offset_vertices(obs.vertices, clearance) for obs in self.obstacles
+        ]
+        nodes = np.concatenate(candidates)
+        self.nodes = nodes[self._free(nodes)] if len(nodes) else nodes
+
+        if len(rings[0]):
+            self.extent = float(np.ptp(np.concatenate(rings), axis=0).max())
+        else:
+            self.extent = 0.0
+
+    @staticmethod
+    def _offset_vertices(ring: np.ndarray, distance: float) -> np.ndarray:
+        """Köşeleri açıortay boyunca halkanın dışına (negatifse içine) kaydır"""
+        if len(ring) < 3:
+            return np.zeros((0, 2))
+
+        # Saat yönü tersinde dış normal (dy, -dx)
+        orientation = 1.0 if signed_area(ring) > 0 else -1.0
+        edge = np.roll(ring, -1, axis=0) - ring
+        length = np.hypot(edge[:, 0], edge[:, 1])
+        length[length == 0] = 1.0
+        normal = orientation * np.stack([edge[:, 1], -edge[:, 0]], axis=1)
+        normal /= length[:, None]
+
+        prev_normal = np.roll(normal, 1, axis=0)
+        bisector = prev_normal + normal
+        norm = np.hypot(bisector[:, 0], bisector[:, 1])
+        norm[norm < 1e-9] = 1.0
+        bisector /= norm[:, None]
+
+        # Miter uzunluğu, çok sivri köşelerde sınırlandırılır
+        cos_half = np.maximum(np.einsum("ij,ij->i", bisector, normal), 0.3)
+        return ring + bisector * (distance / cos_half)[:, None]
+
+    def _free(self, points: np.ndarray) -> np.ndarray:
+        """Noktalar sınır içinde ve engellerin dışında mı?"""
+        free = self.boundary.contains_many(points)
+        return free & ~contains_any(self.obstacles, points)
+
+    def _visible(self, starts: np.ndarray, ends: np.ndarray, edges) -> np.ndarray:
+        """Segmentler hiçbir kenarı kesmeden serbest alanda mı?"""
+        clear = ~segments_cross_edges(starts, ends, edges)
+        return clear & self._free((starts + ends) / 2)
+
+    def visible(self, start: Sequence[float], goal: Sequence[float]) -> bool:
+        """İki nokta arası düz çizgi serbest mi?"""
+        start = np.asarray(start, dtype=float)[None]
+        goal = np.asarray(goal, dtype=float)[None]
+        return bool(self._visible(start, goal, self.edges)[0])
+
+    def shortest_path(
+        self, start: Sequence[float], goal: Sequence[float]
+    ) -> np.ndarray:
+        """
+        start -> goal en kısa serbest yol (uçlar dahil (K, 2) dizi).
+
+        Yol bulunamazsa düz çizgi döndürülür.
+        """
+        start = np.asarray(start, dtype=float)
+        goal = np.asarray(goal, dtype=float)
+        direct = np.array([start, goal])
+
+        if len(self.nodes) == 0 or self.visible(start, goal):
+            return direct
+
+        # Pencere: başlangıç-bitiş kutusu, yol bulunamadıkça büyütülür
+        margin = max(4 * self.clearance, 1.0)
+        while True:
+            lo = np.minimum(start, goal) - margin
+            hi = np.maximum(start, goal) + margin
+            route = self._search(start, goal, lo, hi)
+            if route is not None:
+                return route
+            if margin > self.extent:
+                return direct
+            margin *= 2
+
+    def _search(
+        self, start: np.ndarray, goal: np.ndarray, lo: np.ndarray, hi: np.ndarray
+    ) -> Optional[np.ndarray]:
+        """Pencere içindeki yerel graf üzerinde Dijkstra"""
+        in_window = np.all((self.nodes >= lo) & (self.nodes <= hi), axis=1)
+        local = self.nodes[in_window]
+        edge_mask = np.all(self.edge_max >= lo, axis=1) & np.all(
+            self.edge_min <= hi, axis=1
+        )
+        edges = tuple(arr[edge_mask] for arr in self.edges)
+
+        points = np.vstack([start, goal, local])
+        n = len(points)
+        if n == 2:
+            return None
+
+        # Yerel görünürlük matrisi (0: başlangıç, 1: bitiş)
+        i, j = np.triu_indices(n, k=1)
+        visible = self._visible(points[i], points[j], edges)
+        i, j = i[visible], j[visible]
+        weights = np.full((n, n), np.inf)
+        distance = np.hypot(*(points[i] - points[j]).T)
+        weights[i, j] = distance
+        weights[j, i] = distance
+
+        cost = weights[0].copy()
+        cost[0] = 0.0
+        previous = np.zeros(n, dtype=int)
+        done = np.zeros(n, dtype=bool)
+        done[0] = True
+
+        while not done[1]:
+            current = int(np.argmin(np.where(done, np.inf, cost)))
+            if done[current] or not np.isfinite(cost[current]):
+                return None
+            done[current] = True
+
+            candidate = cost[current] + weights[current]
+            better = (candidate < cost) & ~done
+            cost[better] = candidate[better]
+            previous[better] = current
+
+        route = [1]
+        while route[-1] != 0:
+            route.append(int(previous[route[-1]]))
+
+        return points[route[::-1]]
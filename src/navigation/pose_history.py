@@ -0,0 +1,192 @@
+"""
+Poz Geçmişi Modülü
+Robot pozlarını zaman damgasıyla sabit kapasiteli halkada tutar; sensör
+örneklerinin alındığı andaki poz enterpolasyonla sorgulanır
+"""
+
+import math
+from typing import Any, Optional
+
+import numpy as np
+
+from .kalman_odometry import Position
+
+# Satır sütunları
+T, X, Y, HEADING, VAR_X, VAR_Y, VAR_HEADING = range(7)
+
+
+def _wrap(angles: np.ndarray) -> np.ndarray:
+    """Açıları [-pi, pi) aralığına getir"""
+    return np.remainder(angles + np.pi, 2 * np.pi) - np.pi
+
+
+class PoseHistory:
+    """
+    Zaman damgalı poz halkası (t, x, y, heading, varyans köşegeni).
+
+    Her satır hem i hem i + slots konumuna yazılır (ayna tampon); böylece
+    son capacity poz her zaman bitişik bir dilimdir ve window() kopyasız
+    görünüm döndürür. Tek yazıcı (odometri) satırı yazdıktan sonra yazma
+    konumu ve poz sayısını tek bir demet olarak yayımlar; okuyucular
+    kilitsiz sorgular. Halkada bir yedek yuva bulunduğundan yazılan satır
+    hiçbir zaman yayımlanmış pencerenin içinde olmaz. Zaman damgaları
+    azalmamalıdır.
+    """
+
+    def __init__(self, capacity: int = 2048, max_extrapolation: float = 0.1):
+        self.capacity = capacity
+        self.max_extrapolation = max_extrapolation  # Son pozdan sonra kabul (s)
+        self._slots = capacity + 1  # Yazılan satır için yedek yuva
+        self._rows = np.zeros((2 * self._slots, 7))
+        self._span = (0, 0)  # (sonraki yazma konumu, geçerli poz sayısı)
+
+    def __len__(self) -> int:
+        return self._span[1]
+
+    def _view(self) -> np.ndarray:
+        """Geçerli pozlar (eskiden yeniye, kopyasız)"""
+        head, count = self._span
+        start = (head - count) % self._slots
+        return self._rows[start : start + count]
+
+    @property
+    def times(self) -> np.ndarray:
+        """Zaman damgaları (kopyasız)"""
+        return self._view()[:, T]
+
+    def append(
+        self,
+        timestamp: float,
+        x: float,
+        y: float,
+        heading: float,
+        var_x: float = 0.0,
+        var_y: float = 0.0,
+        var_heading: float = 0.0,
+    ) -> bool:
+        """Poz ekle (son pozdan eskiyse False, aynı zamandaysa üzerine yazar)"""
+        head, count = self._span
+        if count:
+            last = self._rows[(head - 1) % self._slots, T]
+            if timestamp < last:
+                return False
+            if timestamp == last:
+                # Son poz yayından çekilip yeniden yazılır
+                head -= 1
+                count -= 1
+                self._span = (head, count)
+
+        row = (timestamp, x, y, heading, var_x, var_y, var_heading)
+        slot = head % self._slots
+        self._rows[slot] = row
+        self._rows[slot + self._slots] = row
+        self._span = (head + 1, min(count + 1, self.capacity))
+        return True
+
+    def record(self, odometry: Any, timestamp: Optional[float] = None) -> bool:
+        """Odometri filtresinin mevcut pozunu ve varyanslarını ekle"""
+        state, P = odometry.state, odometry.P
+        return self.append(
+            odometry.last_update_time if timestamp is None else timestamp,
+            float(state[0]),
+            float(state[1]),
+            float(state[2]),
+            float(P[0, 0]),
+            float(P[1, 1]),
+            float(P[2, 2]),
+        )
+
+    def truncate(self, after: float):
+        """after'dan sonraki pozları at (ölçüm yeniden oynatılırken)"""
+        times = self.times
+        removed = len(times) - int(np.searchsorted(times, after, side="right"))
+        head, count = self._span
+        self._span = (head - removed, count - removed)
+
+    def clear(self):
+        """Geçmişi temizle"""
+        self._span = (0, 0)
+
+    def window(
+        self, start: Optional[float] = None, end: Optional[float] = None
+    ) -> np.ndarray:
+        """start <= t <= end aralığındaki satırlar (kopyasız görünüm)"""
+        view = self._view()
+        times = view[:, T]
+        first = 0 if start is None else int(np.searchsorted(times, start, "left"))
+        last = len(view) if end is None else int(np.searchsorted(times, end, "right"))
+        return view[first:last]
+
+    def interpolate(self, timestamps: Any) -> np.ndarray:
+        """
+        Zamanlar için enterpolasyonlu satırlar (n x 7).
+
+        Aralık dışındaki zamanlar NaN satır döner; son pozdan sonra
+        max_extrapolation içindeki zamanlar son poza sabitlenir.
+        """
+        timestamps = np.atleast_1d(np.asarray(timestamps, dtype=float))
+        view = self._view()
+        result = np.full((len(timestamps), 7), np.nan)
+        if not len(view):
+            return result
+
+        times = view[:, T]
+        clamped = np.where(
+            (timestamps > times[-1])
+            & (timestamps <= times[-1] + self.max_extrapolation),
+            times[-1],
+            timestamps,
+        )
+        valid = (clamped >= times[0]) & (clamped <= times[-1])
+        query = clamped[valid]
+
+        upper = np.clip(np.searchsorted(times, query, "right"), 1, len(view) - 1)
+        if len(view) == 1:
+            rows = np.repeat(view[:1], len(query), axis=0)
+        else:
+            before, after = view[upper - 1], view[upper]
+            span = after[:, T] - before[:, T]
+            ratio = np.divide(
+                query - before[:, T], span, out=np.ones_like(span), where=span > 0
+            )[:, None]
+            rows = before + (after - before) * ratio
+            # Yön en kısa açı farkı üzerinden enterpole edilir
+            turn = _wrap(after[:, HEADING] - before[:, HEADING])
+            rows[:, HEADING] = _wrap(before[:, HEADING] + turn * ratio[:, 0])
+
+        rows[:, T] = timestamps[valid]
+        result[valid] = rows
+        return result
+
+    def pose_at(self, timestamp: float) -> Optional[Position]:
+        """
+        Verilen andaki poz (O(log n) arama + doğrusal enterpolasyon)
+
+        Geçmiş dışındaki zamanlar için None.
+        """
+        view = self._view()
+        if not len(view):
+            return None
+
+        times = view[:, T]
+        if timestamp >= times[-1]:
+            if timestamp - times[-1] > self.max_extrapolation:
+                return None
+            row = view[-1]
+            return Position(
+                float(row[X]), float(row[Y]), float(row[HEADING]), timestamp
+            )
+        if timestamp < times[0]:
+            return None
+
+        upper = int(np.searchsorted(times, timestamp, "right"))
+        t0, x0, y0, h0 = view[upper - 1, :4].tolist()
+        t1, x1, y1, h1 = view[upper, :4].tolist()
+        ratio = (timestamp - t0) / (t1 - t0) if t1 > t0 else 1.0
+        turn = math.remainder(h1 - h0, 2 * math.pi)
+        return Position(
+            x0 + (x1 - x0) * ratio,
+            y0 + (y1 - y0) * ratio,
+            math.remainder(h0 + turn * ratio, 2 * math.pi),
+            timestamp,
+        )
@@ -0,0 +1,153 @@
+"""
+Şerit Yönü Optimizasyon Modülü
+Aday tarama açılarını toplu scanline ile değerlendirip en az dönüş + en kısa
+yol veren şerit yönünü seçer
+"""
+
+import math
+from typing import Any, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .polygon_geometry import edge_arrays, polygon_to_array, rotate_points
+
+# Tek seferde işlenecek maksimum (şerit x kenar) eleman sayısı
+MAX_CHUNK_ELEMENTS = 1_000_000
+
+
+def convex_hull(points: Any) -> np.ndarray:
+    """Monotone chain dışbükey zarf (saat yönü tersine)"""
+    xy = np.unique(polygon_to_array(points), axis=0)
+    if len(xy) < 3:
+        return xy
+
+    def half(pts):
+        hull = []
+        for p in pts:
+            while len(hull) >= 2:
+                (ax, ay), (bx, by) = hull[-2], hull[-1]
+                if (bx - ax) * (p[1] - ay) - (by - ay) * (p[0] - ax) > 0:
+                    break
+                hull.pop()
+            hull.append(p)
+        return hull[:-1]
+
+    return np.array(half(xy) + half(xy[::-1]))
+
+
+def candidate_angles(boundary: Any, resolution: float = math.radians(5)) -> np.ndarray:
+    """
+    Aday şerit açıları [0, π).
+
+    Dönen kumpas (rotating calipers) ilkesi: minimum genişlik bir zarf
+    kenarına paralel ölçülür, bu yüzden zarf kenar yönleri her zaman
+    adaydır. Bunlara düzgün açı ızgarası eklenir.
+    """
+    hull = convex_hull(boundary)
+    edges = np.roll(hull, -1, axis=0) - hull
+    edge_angles = np.arctan2(edges[:, 1], edges[:, 0]) % math.pi
+    grid = np.arange(0.0, math.pi, resolution)
+
+    angles = np.concatenate((edge_angles, grid))
+    angles = np.round(angles, 9) % math.pi
+    return np.unique(angles)
+
+
+def sweep_statistics(
+    rings: Sequence[Any],
+    angles: Sequence[float],
+    spacing: float,
+    margin: float = 0.0,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Her açı için şerit segment sayısı ve toplam segment uzunluğu.
+
+    Halkalar açıya göre döndürülür; tüm açıların tüm şeritleri, şerit
+    başına kendi açısının kenarlarıyla tek (S, E) işlemde kesiştirilir.
+    Segment uçlarından margin kırpılır (_lawn_mower_pattern ile aynı).
+
+    Returns:
+        (segment_counts, total_lengths): (A,) diziler
+    """
+    angles = np.asarray(angles, dtype=float)
+    arrays = [polygon_to_array(ring) for ring in rings]
+    counts = np.zeros(len(angles), dtype=int)
+    lengths = np.zeros(len(angles))
+    if not arrays or len(arrays[0]) < 3 or len(angles) == 0:
+        return counts, lengths
+
+    # (A, E) döndürülmüş kenar dizileri
+    rotated = [edge_arrays([rotate_points(r, -a) for r in arrays]) for a in angles]
+    x0, y0, x1, y1 = (np.stack(parts) for parts in zip(*rotated))
+
+    # Açı başına şerit y'leri (sınır halkasının y aralığında)
+    boundary_y = np.stack([rotate_points(arrays[0], -a)[:, 1] for a in angles])
+    stripe_angle = []
+    stripe_y = []
+    for k, (lo, hi) in enumerate(zip(boundary_y.min(axis=1), boundary_y.max(axis=1))):
+        ys = np.arange(lo + margin, hi - margin + 1e-9, spacing)
+        stripe_angle.append(np.full(len(ys), k))
+        stripe_y.append(ys)
+    stripe_angle = np.concatenate(stripe_angle)
+    stripe_y = np.concatenate(stripe_y)
+
+    n_edges = x0.shape[1]
+    chunk = max(1, MAX_CHUNK_ELEMENTS // max(n_edges, 1))
+    for lo in range(0, len(stripe_y), chunk):
+        k = stripe_angle[lo : lo + chunk]
+        y = stripe_y[lo : lo + chunk, None]
+        ex0, ey0, ex1, ey1 = x0[k], y0[k], x1[k], y1[k]
+
+        # Yarı açık kural: scanline_segments ile aynı
+        crosses = (ey0 < y) != (ey1 < y)
+        dy = np.where(ey1 == ey0, 1.0, ey1 - ey0)
+        xs = np.where(crosses, ex0 + (y - ey0) * (ex1 - ex0) / dy, np.inf)
+        xs.sort(axis=1)
+
+        max_crossings = int(crosses.sum(axis=1).max(initial=0))
+        max_crossings -= max_crossings % 2
+        with np.errstate(invalid="ignore"):
+            seg = xs[:, 1:max_crossings:2] - xs[:, 0:max_crossings:2]
+        seg = np.where(np.isfinite(seg), seg - 2 * margin, -1.0)
+
+        valid = seg >= 0
+        np.add.at(counts, k, valid.sum(axis=1))
+        np.add.at(lengths, k, np.where(valid, seg, 0.0).sum(axis=1))
+
+    return counts, lengths
+
+
+def optimize_sweep_angle(
+    rings: Sequence[Any],
+    spacing: float,
+    turn_cost: float,
+    margin: float = 0.0,
+    resolution: float = math.radians(5),
+) -> Optional[float]:
+    """
+    Dönüş sayısı x turn_cost + toplam şerit uzunluğunu en aza indiren açı.
+
+    Args:
+        rings: İlk halka sınır, diğerleri engel
+        spacing: Şerit aralığı (metre)
+        turn_cost: Bir şerit geçişinin metre cinsinden maliyeti
+        margin: Segment uçlarından kırpılan güvenlik marjı
+
+    Returns:
+        Radyan cinsinden açı; alan geçersizse None
+    """
+    if not rings or len(polygon_to_array(rings[0])) < 3:
+        return None
+
+    angles = candidate_angles(rings[0], resolution)
+    counts, lengths = sweep_statistics(rings, angles, spacing, margin)
+
+    cost = np.maximum(counts - 1, 0) * turn_cost + lengths
+    cost = np.where(counts > 0, cost, np.inf)
+    if not np.isfinite(cost).any():
+        return None
+
+    # Eşitlikte x eksenine en yakın açı (mevcut davranış) tercih edilir
+    best = np.flatnonzero(cost <= cost.min() + 1e-9)
+    deviation = np.minimum(angles[best], math.pi - angles[best])
+    return float(angles[best[np.argmin(deviation)]])
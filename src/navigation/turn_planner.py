@@ -0,0 +1,239 @@
+"""
+Dönüş Planlama Modülü
+Şerit geçişleri için dönüş yarıçapına uygun (Dubins) dönüş manevraları üretir
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+_TWO_PI = 2 * math.pi
+
+# Manevra türleri: aynı yönlü CSC -> U dönüşü, CCC -> Ω (ampul) dönüşü
+_KINDS = {
+    "LSL": "u_turn",
+    "RSR": "u_turn",
+    "LSR": "s_turn",
+    "RSL": "s_turn",
+    "RLR": "omega",
+    "LRL": "omega",
+}
+
+
+def _mod2pi(angle: float) -> float:
+    return angle % _TWO_PI
+
+
+@dataclass
+class TurnManeuver:
+    """Şerit geçişi manevrası"""
+
+    kind: str  # "u_turn", "s_turn", "omega", "pivot"
+    word: str  # Dubins kelimesi ("LSL", ...) veya "PIVOT"
+    points: np.ndarray  # Ara noktalar (başlangıç ve bitiş hariç), (K, 2)
+    length: float  # Yol uzunluğu (metre)
+    duration: float  # Tahmini süre (saniye)
+    retreat: float = 0.0  # Dönüşe sığmak için şerit uçlarından geri çekilme
+
+
+class TurnPlanner:
+    """Dubins yolları ile dönüş üretici; en ucuz uygulanabilir manevrayı seçer"""
+
+    def __init__(
+        self,
+        turning_radius: float = 0.3,
+        turn_speed: float = 0.25,
+        max_angular: float = 1.0,
+        sample_step: float = 0.1,
+    ):
+        self.turning_radius = turning_radius
+        self.turn_speed = turn_speed  # Dönüş sırasında ileri hız (m/s)
+        self.max_angular = max_angular  # Yerinde dönüş açısal hızı (rad/s)
+        self.sample_step = sample_step  # Örnekleme aralığı (metre)
+        self.retreat_cost = 4.0  # Geri çekilme metresi başına maliyet (metre)
+
+    def dubins_candidates(
+        self, start: Tuple[float, float, float], end: Tuple[float, float, float]
+    ) -> List[Tuple[str, Tuple[float, float, float]]]:
+        """
+        Altı Dubins kelimesinin geçerli olanları.
+
+        Returns:
+            [(kelime, (t, p, q))] - segment uzunlukları yarıçap biriminde
+        """
+        r = self.turning_radius
+        dx = end[0] - start[0]
+        dy = end[1] - start[1]
+        d = math.hypot(dx, dy) / r
+        theta = _mod2pi(math.atan2(dy, dx))
+        a = _mod2pi(start[2] - theta)
+        b = _mod2pi(end[2] - theta)
+
+        sa, sb, ca, cb = math.sin(a), math.sin(b), math.cos(a), math.cos(b)
+        c_ab = math.cos(a - b)
+        candidates = []
+
+        p_sq = 2 + d * d - 2 * c_ab + 2 * d * (sa - sb)
+        if p_sq >= 0:
+            tmp = math.atan2(cb - ca, d + sa - sb)
+            candidates.append(
+                ("LSL", (_mod2pi(-a + tmp), math.sqrt(p_sq), _mod2pi(b - tmp)))
+            )
+
+        p_sq = 2 + d * d - 2 * c_ab + 2 * d * (sb - sa)
+        if p_sq >= 0:
+            tmp = math.atan2(ca - cb, d - sa + sb)
+            candidates.append(
+                ("RSR", (_mod2pi(a - tmp), math.sqrt(p_sq), _mod2pi(-b + tmp)))
+            )
+
+        p_sq = -2 + d * d + 2 * c_ab + 2 * d * (sa + sb)
+        if p_sq >= 0:
+            p = math.sqrt(p_sq)
+            tmp = math.atan2(-ca - cb, d + sa + sb) - math.atan2(-2.0, p)
+            candidates.append(("LSR", (_mod2pi(-a + tmp), p, _mod2pi(-b + tmp))))
+
+        p_sq = -2 + d * d + 2 * c_ab - 2 * d * (sa + sb)
+        if p_sq >= 0:
+            p = math.sqrt(p_sq)
+            tmp = math.atan2(ca + cb, d - sa - sb) - math.atan2(2.0, p)
+            candidates.append(("RSL", (_mod2pi(a - tmp), p, _mod2pi(b - tmp))))
+
+        tmp = (6 - d * d + 2 * c_ab + 2 * d * (sa - sb)) / 8
+        if abs(tmp) <= 1:
+            p = _mod2pi(_TWO_PI - math.acos(tmp))
+            t = _mod2pi(a - math.atan2(ca - cb, d - sa + sb) + p / 2)
+            candidates.append(("RLR", (t, p, _mod2pi(a - b - t + p))))
+
+        tmp = (6 - d * d + 2 * c_ab + 2 * d * (sb - sa)) / 8
+        if abs(tmp) <= 1:
+            p = _mod2pi(_TWO_PI - math.acos(tmp))
+            t = _mod2pi(-a - math.atan2(ca - cb, d + sa - sb) + p / 2)
+            candidates.append(("LRL", (t, p, _mod2pi(b - a - t + p))))
+
+        return candidates
+
+    def sample(
+        self,
+        start: Tuple[float, float, float],
+        word: str,
+        lengths: Tuple[float, float, float],
+    ) -> np.ndarray:
+        """Dubins yolunu sample_step aralıklarla örnekle (başlangıç hariç)"""
+        r = self.turning_radius
+        x, y, heading = start
+        points = []
+
+        for segment, normalized in zip(word, lengths):
+            length = normalized * r
+            steps = max(1, int(math.ceil(length / self.sample_step)))
+            delta = normalized / steps
+            for _ in range(steps):
+                if segment == "L":
+                    x += r * (math.sin(heading + delta) - math.sin(heading))
+                    y += r * (math.cos(heading) - math.cos(heading + delta))
+                    heading += delta
+                elif segment == "R":
+                    x += r * (math.sin(heading) - math.sin(heading - delta))
+                    y += r * (math.cos(heading - delta) - math.cos(heading))
+                    heading -= delta
+                else:
+                    x += delta * r * math.cos(heading)
+                    y += delta * r * math.sin(heading)
+                points.append((x, y))
+
+        return np.array(points).reshape(-1, 2)
+
+    def pivot(
+        self,
+        start: Tuple[float, float, float],
+        end: Tuple[float, float, float],
+    ) -> TurnManeuver:
+        """Yerinde dön - düz git - yerinde dön (her zaman uygulanabilir)"""
+        dx = end[0] - start[0]
+        dy = end[1] - start[1]
+        distance = math.hypot(dx, dy)
+        heading = math.atan2(dy, dx) if distance > 0 else start[2]
+
+        rotation = abs(self._wrap(heading - start[2])) + abs(
+            self._wrap(end[2] - heading)
+        )
+        return TurnManeuver(
+            kind="pivot",
+            word="PIVOT",
+            points=np.zeros((0, 2)),
+            length=distance,
+            duration=distance / self.turn_speed + rotation / self.max_angular,
+        )
+
+    def plan(
+        self,
+        start: Tuple[float, float, float],
+        end: Tuple[float, float, float],
+        is_free: Optional[Callable[[np.ndarray], np.ndarray]] = None,
+        max_retreat: float = 0.0,
+    ) -> TurnManeuver:
+        """
+        En ucuz uygulanabilir manevrayı seç.
+
+        Dar başlıkta (headland) kısa yollar sığmıyorsa şerit uçları
+        sample_step adımlarla geri çekilerek de denenir. Geri çekilme,
+        biçilmeden kalan uçlar sonradan tekrar sürüleceği için
+        retreat_cost katsayısıyla maliyete eklenir.
+
+        Args:
+            start: Şerit çıkış pozu (x, y, heading)
+            end: Sonraki şerit giriş pozu (x, y, heading)
+            is_free: Noktaların alan içinde ve engelsiz olduğunu döndüren
+                fonksiyon; verilmezse tüm Dubins yolları uygulanabilir sayılır
+            max_retreat: Şerit uçlarından en fazla geri çekilme (metre)
+
+        Returns:
+            Dubins yolu; hiçbiri uygulanabilir değilse yerinde dönüş
+        """
+        out_x, out_y = math.cos(start[2]), math.sin(start[2])
+        in_x, in_y = math.cos(end[2]), math.sin(end[2])
+        limit = min(max_retreat, 2 * self.turning_radius + self.sample_step)
+
+        best: Optional[TurnManeuver] = None
+        best_cost = math.inf
+        retreat = 0.0
+        while retreat <= limit + 1e-9 and self.retreat_cost * retreat < best_cost:
+            s = (start[0] - out_x * retreat, start[1] - out_y * retreat, start[2])
+            e = (end[0] + in_x * retreat, end[1] + in_y * retreat, end[2])
+
+            candidates = sorted(
+                self.dubins_candidates(s, e), key=lambda item: sum(item[1])
+            )
+            for word, lengths in candidates:
+                length = sum(lengths) * self.turning_radius
+                cost = length + self.retreat_cost * retreat
+                if cost >= best_cost:
+                    break
+
+                points = self.sample(s, word, lengths)
+                if is_free is not None and not np.all(is_free(points)):
+                    continue
+
+                best_cost = cost
+                best = TurnManeuver(
+                    kind=_KINDS[word],
+                    word=word,
+                    points=points[:-1],
+                    length=length,
+                    duration=length / self.turn_speed,
+                    retreat=retreat,
+                )
+                break
+
+            if is_free is None:
+                break
+            retreat += self.sample_step
+
+        return best if best is not None else self.pivot(start, end)
+
+    @staticmethod
+    def _wrap(angle: float) -> float:
+        return (angle + math.pi) % _TWO_PI - math.pi
@@ -0,0 +1,255 @@
+"""
+Unicycle EKF Odometri Modülü
+Enkoder artışlarıyla sürülen tekerlek bisikleti (unicycle) modeli üzerinde
+Genişletilmiş Kalman Filtresi; IMU yönü ve jiroskop hızı ölçüm olarak işlenir
+"""
+
+import math
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from .kalman_odometry import KalmanOdometry
+
+
+def unicycle_motion(
+    x: float,
+    y: float,
+    theta: float,
+    left_distance: float,
+    right_distance: float,
+    wheel_base: float,
+    dt: float,
+) -> Tuple[float, float, float, float, float]:
+    """
+    Orta nokta unicycle modeli.
+
+    Tekerlek yollarından (metre) yeni [x, y, theta, v, omega] durumu;
+    yön normalize edilmez.
+    """
+    ds = (left_distance + right_distance) / 2
+    dtheta = (right_distance - left_distance) / wheel_base
+    mid = theta + dtheta / 2
+    return (
+        x + ds * math.cos(mid),
+        y + ds * math.sin(mid),
+        theta + dtheta,
+        ds / dt,
+        dtheta / dt,
+    )
+
+
+class UnicycleEKF(KalmanOdometry):
+    """
+    Unicycle kinematiğiyle Genişletilmiş Kalman Filtresi
+    State Vector: [x, y, heading, v, angular_velocity]
+
+    Tahmin enkoder artışlarıyla yapılır: F = ∂f/∂x ve G = ∂f/∂(dl, dr)
+    Jacobian'larıyla P = F P Fᵀ + G U Gᵀ + Q dt. Enkoder gürültüsü U kat
+    edilen tekerlek yoluyla orantılıdır. Enkoder konumu ölçüm olarak
+    kullanılmaz; IMU yönü ve jiroskop hızı skaler güncellemelerle işlenir.
+    KalmanOdometry ile aynı arayüzü sunar.
+    """
+
+    OMEGA = 4  # Durum vektöründe açısal hız indeksi
+
+    def __init__(
+        self, simulate: bool = False, clock: Optional[Callable[[], float]] = None
+    ):
+        super().__init__(simulate=simulate, clock=clock)
+        self.logger.info("Unicycle EKF modeli kullanılıyor")
+
+        # Durum vektörü [x, y, theta, v, omega]
+        self.state = np.zeros(5)
+        self.P = np.eye(5) * 0.1
+
+        # Süreç gürültüsü (saniye başına; kayma ve ivmelenme)
+        self.Q = np.diag([1e-6, 1e-6, 1e-6, 0.05, 0.05])
+
+        # Tekerlek yolu varyansı (m² / kat edilen metre)
+        self.wheel_noise = 1e-4
+
+        # Jiroskop ölçüm gürültüsü (rad/s)²
+        self.R_gyro = np.diag([1e-4])
+
+        # Çekirdek tamponları
+        self._allocate_buffers()
+        self._F = np.eye(5)
+        self._G = np.zeros((5, 2))
+        self._scaled_G = np.zeros((5, 2))
+        self._input_variance = np.zeros(2)
+        self._row = np.zeros(5)
+        self._product = np.zeros((5, 5))
+
+    def predict(self, dt: float):
+        """
+        Sabit hız tahmini (enkoder verisi olmadan zaman ilerletme)
+
+        Durum v ve omega ile ilerletilir; F hız terimlerine göre de
+        türev içerir.
+        """
+        state, P, F = self.state, self.P, self._F
+        theta, v, omega = float(state[2]), float(state[3]), float(state[4])
+        mid = theta + omega * dt / 2
+        c, s = math.cos(mid), math.sin(mid)
+
+        state[0] += v * dt * c
+        state[1] += v * dt * s
+        state[2] = self._normalize_angle(theta + omega * dt)
+
+        # F = I + konumun (theta, v, omega) türevleri + theta'nın omega türevi
+        F[0, 2], F[0, 3], F[0, 4] = -v * dt * s, dt * c, -v * dt * dt * s / 2
+        F[1, 2], F[1, 3], F[1, 4] = v * dt * c, dt * s, v * dt * dt * c / 2
+        F[2, 4] = dt
+        np.matmul(F, P, out=self._product)
+        np.matmul(self._product, F.T, out=P)
+
+        np.multiply(self.Q, dt, out=self._outer)
+        P += self._outer
+
+        if self.keep_prior:
+            self._keep_prior(F.copy())
+
+    def predict_motion(self, left_distance: float, right_distance: float, dt: float):
+        """
+        Enkoder artışlarıyla (tekerlek yolları, metre) tahmin aşaması
+
+        v ve omega artışlardan yeniden hesaplandığından önceki durumdan
+        bağımsızdır: F'nin hız satırları sıfır, belirsizlikleri G U Gᵀ'den
+        gelir.
+        """
+        if dt <= 0:
+            return
+        state, P, G = self.state, self.P, self._G
+        b = self.wheel_base
+        theta = float(state[2])
+        x, y, new_theta, v, omega = unicycle_motion(
+            float(state[0]),
+            float(state[1]),
+            theta,
+            left_distance,
+            right_distance,
+            b,
+            dt,
+        )
+
+        ds = (left_distance + right_distance) / 2
+        mid = theta + (right_distance - left_distance) / (2 * b)
+        c, s = math.cos(mid), math.sin(mid)
+
+        # F P Fᵀ: F = I + (x, y <- theta) terimleri; önce satırlar, sonra sütunlar
+        row = self._row
+        np.multiply(P[2], -ds * s, out=row)
+        P[0] += row
+        np.multiply(P[2], ds * c, out=row)
+        P[1] += row
+        np.multiply(P[:, 2], -ds * s, out=row)
+        P[:, 0] += row
+        np.multiply(P[:, 2], ds * c, out=row)
+        P[:, 1] += row
+        P[3:, :] = 0.0
+        P[:, 3:] = 0.0
+
+        # Girdi Jacobian'ı G = ∂f/∂(dl, dr)
+        h = ds / (2 * b)
+        G[0, 0], G[0, 1] = 0.5 * c + h * s, 0.5 * c - h * s
+        G[1, 0], G[1, 1] = 0.5 * s - h * c, 0.5 * s + h * c
+        G[2, 0], G[2, 1] = -1 / b, 1 / b
+        G[3, 0], G[3, 1] = 0.5 / dt, 0.5 / dt
+        G[4, 0], G[4, 1] = -1 / (b * dt), 1 / (b * dt)
+
+        variance = self._input_variance
+        variance[0] = self.wheel_noise * abs(left_distance)
+        variance[1] = self.wheel_noise * abs(right_distance)
+        np.multiply(G, variance, out=self._scaled_G)
+        np.matmul(self._scaled_G, G.T, out=self._outer)
+        P += self._outer
+
+        np.multiply(self.Q, dt, out=self._outer)
+        P += self._outer
+
+        state[0], state[1] = x, y
+        state[2] = self._normalize_angle(new_theta)
+        state[3], state[4] = v, omega
+
+        self.total_distance += abs(ds)
+
+        if self.keep_prior:
+            F = np.eye(5)
+            F[0, 2], F[1, 2] = -ds * s, ds * c
+            F[3, 3] = F[4, 4] = 0.0
+            self._keep_prior(F)
+
+    def update_encoder(
+        self,
+        left_ticks: int,
+        right_ticks: int,
+        ticks_per_revolution: int,
+        timestamp: Optional[float] = None,
+    ):
+        """
+        Enkoder artışlarıyla tahmin (enkoder ölçüm değil, model girdisidir)
+        """
+        current_time = self._now() if timestamp is None else timestamp
+        dt = current_time - self.last_update_time
+
+        if dt <= 0:
+            return
+
+        distance_per_tick = 2 * np.pi * self.wheel_radius / ticks_per_revolution
+        self.predict_motion(
+            left_ticks * distance_per_tick, right_ticks * distance_per_tick, dt
+        )
+        self.last_update_time = current_time
+
+    def update_imu(self, heading: float, angular_velocity: float = None):
+        """
+        IMU yönü ve jiroskop hızıyla güncelleme
+        """
+        heading = self._normalize_angle(heading - self.heading_offset)
+        self._scalar_update(
+            self.HEADING,
+            heading - float(self.state[self.HEADING]),
+            float(self.R_imu[0, 0]),
+        )
+
+        if angular_velocity is not None:
+            self._scalar_update(
+                self.OMEGA,
+                angular_velocity - float(self.state[self.OMEGA]),
+                float(self.R_gyro[0, 0]),
+            )
+
+    def get_velocity(self) -> Dict[str, float]:
+        """Mevcut hızı döndür"""
+        theta, v = float(self.state[2]), float(self.state[3])
+        return {
+            "linear_x": v * math.cos(theta),
+            "linear_y": v * math.sin(theta),
+            "angular": float(self.state[4]),
+            "linear": v,
+        }
+
+    def _velocity_variances(self) -> Tuple[float, float]:
+        """Doğrusal ve açısal hız varyansları"""
+        return float(self.P[3, 3]), float(self.P[4, 4])
+
+    def predict_state(self, dt: float) -> Dict[str, float]:
+        """Durumu değiştirmeden sabit hız tahmini"""
+        temp_state = self.state.copy()
+        temp_P = self.P.copy()
+
+        self.predict(dt)
+        velocity = self.get_velocity()
+        predicted_state = {
+            "x": self.state[0],
+            "y": self.state[1],
+            "heading": self.state[2],
+            "vx": velocity["linear_x"],
+            "vy": velocity["linear_y"],
+            "angular_velocity": self.state[4],
+        }
+
+        self.state[:] = temp_state
+        self.P[...] = temp_P
+        return predicted_state
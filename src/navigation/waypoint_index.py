@@ -0,0 +1,117 @@
+"""
+Waypoint Uzamsal İndeks Modülü
+Rota noktalarını düzgün ızgarada kovalayarak en yakın ileri waypoint sorgusu
+"""
+
+import math
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from .polygon_geometry import polygon_to_array
+
+
+class WaypointIndex:
+    """
+    Düzgün ızgara tabanlı waypoint indeksi.
+
+    Her hücre, o hücreye düşen waypoint indekslerini sıralı tutar; böylece
+    [start, stop) penceresindeki adaylar hücre başına ikili aramayla bulunur.
+    headings[i], i. waypoint'ten çıkan segmentin yönüdür (son waypoint ve
+    sıfır uzunluklu segmentler önceki segmentin yönünü alır).
+    """
+
+    def __init__(self, waypoints: Any, cell_size: float = 0.5):
+        self.cell_size = float(cell_size)
+        self.points = polygon_to_array(waypoints)
+        self.buckets: Dict[Tuple[int, int], np.ndarray] = {}
+        self.headings = self._segment_headings(self.points)
+
+        if len(self.points) == 0:
+            return
+
+        cells = np.floor(self.points / self.cell_size).astype(np.int64)
+        order = np.lexsort((np.arange(len(cells)), cells[:, 1], cells[:, 0]))
+        sorted_cells = cells[order]
+
+        # Hücre değişim noktalarında böl
+        change = np.any(np.diff(sorted_cells, axis=0) != 0, axis=1)
+        starts = np.concatenate(([0], np.flatnonzero(change) + 1))
+        ends = np.append(starts[1:], len(order))
+        for lo, hi in zip(starts, ends):
+            cx, cy = sorted_cells[lo]
+            self.buckets[(int(cx), int(cy))] = order[lo:hi]
+
+    @staticmethod
+    def _segment_headings(points: np.ndarray) -> np.ndarray:
+        """Her waypoint'ten çıkan segmentin yönü (radyan)"""
+        if len(points) < 2:
+            return np.zeros(len(points))
+
+        delta = np.diff(points, axis=0)
+        valid = np.any(delta != 0, axis=1)
+        headings = np.append(np.arctan2(delta[:, 1], delta[:, 0]), 0.0)
+
+        # Yönsüz waypoint'ler önceki (baştakiler ilk) geçerli segmentin yönünü alır
+        source = np.where(np.append(valid, False), np.arange(len(points)), -1)
+        np.maximum.accumulate(source, out=source)
+        first = np.flatnonzero(valid)
+        source[source < 0] = first[0] if len(first) else 0
+        return headings[source]
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def nearest_forward(
+        self,
+        x: float,
+        y: float,
+        start: int,
+        stop: int,
+        radius: float,
+        heading: Optional[float] = None,
+        max_heading_error: float = math.pi / 4,
+    ) -> Optional[int]:
+        """
+        [start, stop) aralığında (x, y)'ye radius içindeki en yakın waypoint.
+
+        heading verilirse segment yönü heading'den max_heading_error'dan
+        fazla sapan waypoint'ler elenir. Eşit mesafede küçük indeks tercih
+        edilir. Bulunamazsa None.
+        """
+        if start >= stop or not self.buckets:
+            return None
+
+        reach = int(math.ceil(radius / self.cell_size))
+        cx = int(math.floor(x / self.cell_size))
+        cy = int(math.floor(y / self.cell_size))
+
+        candidates = []
+        for i in range(cx - reach, cx + reach + 1):
+            for j in range(cy - reach, cy + reach + 1):
+                bucket = self.buckets.get((i, j))
+                if bucket is None:
+                    continue
+                lo = np.searchsorted(bucket, start)
+                hi = np.searchsorted(bucket, stop)
+                if lo < hi:
+                    candidates.append(bucket[lo:hi])
+
+        if not candidates:
+            return None
+
+        indices = np.concatenate(candidates)
+        delta = self.points[indices] - (x, y)
+        dist_sq = np.einsum("ij,ij->i", delta, delta)
+
+        within = dist_sq <= radius * radius
+        if heading is not None:
+            error = np.remainder(self.headings[indices] - heading + np.pi, 2 * np.pi)
+            within &= np.abs(error - np.pi) <= max_heading_error
+        if not within.any():
+            return None
+
+        indices = indices[within]
+        dist_sq = dist_sq[within]
+        best = np.lexsort((indices, dist_sq))[0]
+        return int(indices[best])
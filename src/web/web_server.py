@@ -139,28 +139,47 @@ class WebServer:
 
         @self.app.route("/api/areas/<area_id>/start", methods=["POST"])
         def api_start_mowing(area_id):
-            """Biçme görevini başlat"""
+            """Biçme görevini başlat ("resume": false ile baştan)"""
             if self.main_controller:
-                success = self.main_controller.start_mowing_task(area_id)
+                data = request.get_json(silent=True) or {}
+                success = self.main_controller.start_mowing_task(
+                    area_id, data.get("resume", True) is not False
+                )
+                return jsonify({"success": success})
+            return jsonify({"error": "Main controller not available"}), 503
+
+        @self.app.route("/api/areas/<area_id>/gap_fill", methods=["POST"])
+        def api_gap_fill(area_id):
+            """Alanda biçilmemiş kalan bölgeleri biç"""
+            if self.main_controller:
+                success = self.main_controller.start_gap_fill(area_id)
                 return jsonify({"success": success})
             return jsonify({"error": "Main controller not available"}), 503
 
         @self.app.route("/api/tasks/start_mowing", methods=["POST"])
         def api_tasks_start_mowing():
-            """Web arayüzü için biçme görevini başlat (alan ID'siz)"""
+            """
+            Web arayüzü için biçme görevini başlat.
+
+            area_ids yoksa ilk alan biçilir; tüm alanlar yalnızca
+            "all_areas": true ile açıkça istenirse tek görevde biçilir.
+            "resume": false kontrol noktasını yok sayıp görevi baştan başlatır.
+            """
             if self.main_controller:
-                # Varsayılan veya ilk alanı kullan
-                area_id = None
-                if self.path_planner and self.path_planner.areas:
-                    area_id = next(iter(self.path_planner.areas.keys()))
-                if not area_id:
+                data = request.get_json(silent=True) or {}
+                area_ids = data.get("area_ids")
+                if not area_ids and self.path_planner and self.path_planner.areas:
+                    areas = list(self.path_planner.areas.keys())
+                    area_ids = areas if data.get("all_areas") is True else areas[:1]
+                if not area_ids:
                     return (
                         jsonify(
                             {"success": False, "error": "Hiçbir alan tanımlı değil"}
                         ),
                         400,
                     )
-                success = self.main_controller.start_mowing_task(area_id)
+                resume = data.get("resume", True) is not False
+                success = self.main_controller.start_mission(area_ids, resume)
                 return jsonify({"success": success})
             return (
                 jsonify({"success": False, "error": "Main controller not available"}),
@@ -198,11 +217,15 @@ class WebServer:
                         id=area_id,
                         name=name,
                         boundary=[Point(p["x"], p["y"]) for p in boundary],
-                        obstacles=[],
+                        obstacles=[
+                            [Point(p["x"], p["y"]) for p in obstacle]
+                            for obstacle in data.get("obstacles", [])
+                        ],
                         pattern=PatternType(data.get("pattern", "lawn_mower")),
                         blade_height=data.get("blade_height", 5),
                         speed=data.get("speed", 0.5),
                         overlap=data.get("overlap", 0.1),
+                        sweep_angle=data.get("sweep_angle"),
                     )
 
                     # Path planner'a ekle
@@ -251,9 +274,21 @@ class WebServer:
                         area.boundary = [
                             Point(p["x"], p["y"]) for p in data["boundary"]
                         ]
+                        # Yeni sınır için şerit yönü yeniden optimize edilir
+                        area.sweep_angle = None
+                    if "sweep_angle" in data:
+                        area.sweep_angle = data["sweep_angle"]
+                    if "obstacles" in data:
+                        from src.navigation.path_planner import Point
+
+                        area.obstacles = [
+                            [Point(p["x"], p["y"]) for p in obstacle]
+                            for obstacle in data["obstacles"]
+                        ]
 
-                    # Değişiklikleri kaydet
+                    # Değişiklikleri kaydet, eskiyen planlama işlerini iptal et
                     self.path_planner._save_areas()
+                    self.path_planner.area_changed(area_id)
 
                     self.logger.info(f"Alan güncellendi: {area_id}")
                     return jsonify({"success": True})
@@ -269,10 +304,8 @@ class WebServer:
             """Alan sil"""
             try:
                 if self.path_planner and area_id in self.path_planner.areas:
-                    del self.path_planner.areas[area_id]
-                    self.path_planner._save_areas()
-
-                    self.logger.info(f"Alan silindi: {area_id}")
+                    # Önbellekteki rotaları da siler
+                    self.path_planner.remove_area(area_id)
                     return jsonify({"success": True})
                 else:
                     return jsonify({"success": False, "error": "Area not found"}), 404
@@ -299,6 +332,7 @@ class WebServer:
                         "blade_height": area.blade_height,
                         "speed": area.speed,
                         "overlap": area.overlap,
+                        "sweep_angle": area.sweep_angle,
                     }
                     return jsonify(area_data)
                 else:
@@ -313,10 +347,8 @@ class WebServer:
             """Biçme görevini durdur"""
             try:
                 if self.main_controller:
-                    # Robotu IDLE durumuna geçir
-                    from src.core.main_controller import RobotState
-
-                    self.main_controller.state = RobotState.IDLE
+                    # Görevi iptal et ve robotu IDLE durumuna geçir
+                    self.main_controller.stop_mowing_task()
 
                     # Motorları durdur
                     if self.motor_controller:
@@ -378,10 +410,8 @@ class WebServer:
             """Biçme görevini durdur"""
             try:
                 if self.main_controller:
-                    # Robotu IDLE durumuna geçir
-                    from src.core.main_controller import RobotState
-
-                    self.main_controller.state = RobotState.IDLE
+                    # Görevi iptal et ve robotu IDLE durumuna geçir
+                    self.main_controller.stop_mowing_task()
 
                     # Tüm motorları durdur
                     if self.motor_controller:
@@ -433,6 +463,14 @@ class WebServer:
                 self.logger.error(f"Navigation API hatası: {e}")
                 return jsonify({"success": False, "error": str(e), "navigation": None})
 
+        @self.app.route("/api/coverage")
+        def api_coverage():
+            """Canlı kapsama haritası (since sürümünden sonra değişen karolar)"""
+            if self.main_controller:
+                since = request.args.get("since", 0, type=int)
+                return jsonify(self.main_controller.coverage_map.delta(since))
+            return jsonify({"error": "Main controller not available"}), 503
+
         @self.app.route("/video_feed")
         def video_feed():
             """Kamera video stream"""
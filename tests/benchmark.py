@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+"""
+Benchmark Helpers
+Duvar saati süresi ölçen testler için isteğe bağlı işaretleyici
+"""
+
+import os
+import unittest
+
+# Süre sınırları makineye bağlıdır; varsayılan test koşusunda atlanır
+BENCHMARKS_ENABLED = os.environ.get("MOWER_BENCHMARKS") == "1"
+
+
+def benchmark(test):
+    """Testi kıyaslama olarak işaretle (yalnızca MOWER_BENCHMARKS=1 ile çalışır)"""
+    return unittest.skipUnless(
+        BENCHMARKS_ENABLED, "kıyaslama testi (MOWER_BENCHMARKS=1 ile çalışır)"
+    )(test)
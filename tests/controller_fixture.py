@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Controller Test Fixture
+Test planlayıcısına bağlı MainController kurulumu (ortak yardımcı)
+"""
+
+from pathlib import Path
+from unittest.mock import patch
+
+from src.core.main_controller import MainController
+from src.core.mission_journal import MissionJournal
+from src.hardware.motor_controller import MotorController
+from src.navigation.path_tracker import PurePursuitTracker
+
+
+class ControllerFixtureMixin:
+    """
+    self.planner ve self.temp_dir tanımlayan test sınıfları için.
+
+    Görev günlüğü ve kapsama haritası geçici dizine yazılır.
+    """
+
+    def _controller(self, simulated: bool = False) -> MainController:
+        """MainController oluştur (simulated: simülasyon motoru ve takipçi)"""
+        with patch.object(MainController, "_setup_logging"):
+            controller = MainController(config_path="nonexistent_config.json")
+        controller.logger = self.planner.logger
+        controller.path_planner = self.planner
+        controller.mission_journal = MissionJournal(
+            str(Path(self.temp_dir.name) / "journal.jsonl")
+        )
+        controller.coverage_path = str(Path(self.temp_dir.name) / "coverage.npz")
+        if simulated:
+            controller.motor_controller = MotorController(simulate=True)
+            controller.path_tracker = PurePursuitTracker()
+        return controller
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Contour Planner Test Suite
+Kontur paralel spiral rota testleri
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Proje kök dizinini path'e ekle
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.navigation.contour_planner import contour_spiral, resample_polyline
+from src.navigation.path_planner import PathPlanner, Point, Area, PatternType
+from src.navigation.polygon_geometry import (
+    PreparedPolygon,
+    edge_arrays,
+    point_segment_distance,
+)
+
+
+class TestResamplePolyline(unittest.TestCase):
+    """Sabit yay uzunluğu örnekleme testleri"""
+
+    def test_uniform_spacing(self):
+        """Düz çizgide aralıklar eşit ve spacing'den büyük olmamalı"""
+        points = resample_polyline([(0, 0), (0.3, 0), (1.0, 0), (2.1, 0)], 0.5)
+        steps = np.diff(points[:, 0])
+
+        np.testing.assert_allclose(steps, 2.1 / 5)
+        np.testing.assert_array_almost_equal(points[-1], [2.1, 0])
+
+    def test_corners_kept(self):
+        """Keskin köşeler örneklemede korunmalı"""
+        points = resample_polyline([(0, 0), (1.1, 0), (1.1, 1.1)], 0.5)
+
+        self.assertTrue(np.any(np.all(np.isclose(points, [1.1, 0]), axis=1)))
+
+    def test_arc_chords_merged(self):
+        """Yay birleşimlerinin kısa kirişleri tek tek nokta üretmemeli"""
+        angles = np.linspace(0, np.pi / 2, 50)
+        arc = np.stack([np.cos(angles), np.sin(angles)], axis=1)
+        points = resample_polyline(arc, 0.5)
+
+        self.assertLess(len(points), 6)
+
+
+class TestContourSpiral(unittest.TestCase):
+    """Kontur paralel spiral testleri"""
+
+    SQUARE = [(0, 0), (8, 0), (8, 8), (0, 8)]
+
+    def _uncovered(self, path, polygon, radius):
+        grid = np.mgrid[0:10:0.05, 0:10:0.05].reshape(2, -1).T
+        grid = grid[PreparedPolygon(polygon).contains_many(grid)]
+        segments = (path[:-1, 0], path[:-1, 1], path[1:, 0], path[1:, 1])
+        return np.mean(point_segment_distance(grid, segments) > radius)
+
+    def test_square_coverage(self):
+        """Kare alan tek sürekli rota ile kaplanmalı"""
+        path = contour_spiral(self.SQUARE, 0.2, 0.45)
+        steps = np.hypot(*np.diff(path, axis=0).T)
+
+        self.assertTrue(PreparedPolygon(self.SQUARE).contains_many(path).all())
+        self.assertLessEqual(steps.max(), 0.45 + 1e-9)
+        self.assertLess(self._uncovered(path, self.SQUARE, 0.25), 0.001)
+
+    def test_outside_in(self):
+        """Rota sınırdan başlayıp içeride bitmeli"""
+        path = contour_spiral(self.SQUARE, 0.2, 0.45)
+        edges = edge_arrays([np.array(self.SQUARE, dtype=float)])
+        distances = point_segment_distance(path, edges)
+
+        self.assertAlmostEqual(distances[0], 0.2)
+        self.assertGreater(distances[-1], 3.0)
+
+    def test_split_area(self):
+        """Dar boğazda ayrılan iki kol da biçilmeli"""
+        dumbbell = [
+            (0, 0), (4, 0), (4, 1.5), (6, 1.5), (6, 0), (10, 0),
+            (10, 4), (6, 4), (6, 2.5), (4, 2.5), (4, 4), (0, 4),
+        ]  # fmt: skip
+        path = contour_spiral(dumbbell, 0.2, 0.45)
+
+        self.assertTrue(PreparedPolygon(dumbbell).contains_many(path).all())
+        self.assertLess(self._uncovered(path, dumbbell, 0.25), 0.01)
+
+    def test_planner_spiral_pattern(self):
+        """SPIRAL deseni alan dışına nokta üretmemeli"""
+        planner = PathPlanner(config_path="nonexistent_areas.json")
+        boundary = [Point(0, 0), Point(10, 0), Point(10, 4), Point(3, 9), Point(0, 6)]
+        area = Area(
+            id="spiral",
+            name="spiral",
+            boundary=boundary,
+            obstacles=[],
+            pattern=PatternType.SPIRAL,
+        )
+        path = planner._spiral_pattern(area)
+        points = np.array([[wp.position.x, wp.position.y] for wp in path])
+
+        self.assertGreater(len(path), 0)
+        self.assertTrue(PreparedPolygon(boundary).contains_many(points).all())
+        # Nokta sayısı rota uzunluğu / şerit aralığı mertebesinde olmalı
+        length = np.hypot(*np.diff(points, axis=0).T).sum()
+        spacing = planner.blade_width * (1 - area.overlap)
+        self.assertLess(len(path), 2 * length / spacing)
+
+
+if __name__ == "__main__":
+    # Test suite oluştur
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+
+    # Test sınıflarını ekle
+    test_classes = [
+        TestResamplePolyline,
+        TestContourSpiral,
+    ]
+
+    for test_class in test_classes:
+        tests = loader.loadTestsFromTestCase(test_class)
+        suite.addTests(tests)
+
+    # Test runner
+    runner = unittest.TextTestRunner(verbosity=2, descriptions=True, failfast=False)
+
+    print("🌀 Contour Planner Test Suite Başlatılıyor...")
+    print("=" * 60)
+
+    result = runner.run(suite)
+
+    print("=" * 60)
+    print(f"✅ Başarılı: {result.testsRun - len(result.failures) - len(result.errors)}")
+    print(f"❌ Başarısız: {len(result.failures)}")
+    print(f"⚠️  Hata: {len(result.errors)}")
+
+    if result.wasSuccessful():
+        print("🎉 Tüm testler başarılı!")
+        sys.exit(0)
+    else:
+        print("💥 Bazı testler başarısız!")
+        sys.exit(1)
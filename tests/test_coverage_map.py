@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Coverage Map Test Suite
+Izgara kapsama haritası ve kapsama raporu testleri
+"""
+
+import unittest
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Proje kök dizinini path'e ekle
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.navigation.contour_planner import resample_polyline
+from src.navigation.coverage_map import CoverageGrid, coverage_report
+from src.navigation.path_planner import PathPlanner, Point, Waypoint, Area
+from src.navigation.polygon_geometry import signed_area
+from tests.benchmark import benchmark
+
+
+def _stripes(size, spacing, width):
+    """Kare alanda boustrophedon şeritleri"""
+    points = []
+    for k, y in enumerate(np.arange(width / 2, size, spacing)):
+        xs = (width / 2, size - width / 2)
+        if k % 2:
+            xs = xs[::-1]
+        points += [(xs[0], y), (xs[1], y)]
+    return np.array(points)
+
+
+class TestCoverageGrid(unittest.TestCase):
+    """Izgara rasterleştirme testleri"""
+
+    SQUARE = [(0, 0), (10, 0), (10, 10), (0, 10)]
+
+    def test_single_swath(self):
+        """Tek geçişin alanı bıçak genişliği x uzunluk olmalı"""
+        report = coverage_report(self.SQUARE, [(0, 5), (10, 5)], 1.0, resolution=0.05)
+
+        self.assertAlmostEqual(report.covered_area, 10.0, delta=0.2)
+        self.assertAlmostEqual(report.target_area, 100.0)
+        self.assertEqual(report.double_cut_area, 0.0)
+
+    def test_missed_polygons(self):
+        """Kaçırılan bölgeler geçişin iki yanındaki dikdörtgenler olmalı"""
+        report = coverage_report(self.SQUARE, [(0, 5), (10, 5)], 1.0)
+        polygons = sorted(report.missed_polygons, key=lambda ring: ring[:, 1].min())
+
+        self.assertEqual(len(polygons), 2)
+        for ring in polygons:
+            self.assertEqual(len(ring), 4)
+            self.assertAlmostEqual(signed_area(ring), 45.0, delta=0.6)
+
+    def test_overlap_is_double_cut(self):
+        """Şerit örtüşmesi çift biçim olarak ölçülmeli"""
+        path = _stripes(10, 0.45, 0.5)
+        report = coverage_report(self.SQUARE, path, 0.5, resolution=0.05)
+
+        self.assertGreater(report.coverage, 0.98)
+        self.assertAlmostEqual(report.double_cut_percent, 10.0, delta=1.0)
+
+    def test_dense_sampling_not_double_cut(self):
+        """Sık örneklenmiş rota ardışık segmentlerde çift biçim üretmemeli"""
+        path = _stripes(10, 0.45, 0.5)
+        sparse = coverage_report(self.SQUARE, path, 0.5, resolution=0.05)
+        dense = coverage_report(
+            self.SQUARE, resample_polyline(path, 0.05), 0.5, resolution=0.05
+        )
+
+        self.assertAlmostEqual(dense.covered_area, sparse.covered_area, delta=0.1)
+        self.assertAlmostEqual(
+            dense.double_cut_percent, sparse.double_cut_percent, delta=0.5
+        )
+
+    def test_obstacle_not_target(self):
+        """Engel hücreleri hedef alandan düşülmeli"""
+        obstacle = [(4, 4), (6, 4), (6, 6), (4, 6)]
+        grid = CoverageGrid(self.SQUARE, [obstacle], resolution=0.1)
+
+        self.assertAlmostEqual(grid.target.sum() * 0.01, 96.0)
+
+    def test_cutting_mask(self):
+        """Bıçak kapalı segmentler biçim sayılmamalı"""
+        path = [(0, 2), (10, 2), (10, 8), (0, 8)]
+        report = coverage_report(
+            self.SQUARE, path, 1.0, cutting=np.array([True, False, True])
+        )
+
+        self.assertAlmostEqual(report.covered_area, 20.0, delta=0.5)
+
+    def test_hectare_field(self):
+        """Bir hektarlık alan 0.1 m çözünürlükte değerlendirilebilmeli"""
+        field_ = [(0, 0), (100, 0), (100, 100), (0, 100)]
+        path = resample_polyline(_stripes(100, 0.45, 0.5), 0.5)
+
+        report = coverage_report(field_, path, 0.5, resolution=0.1)
+
+        self.assertGreater(report.coverage, 0.99)
+
+    @benchmark
+    def test_hectare_speed(self):
+        """Bir hektarlık değerlendirme bir saniyenin altında bitmeli"""
+        field_ = [(0, 0), (100, 0), (100, 100), (0, 100)]
+        path = resample_polyline(_stripes(100, 0.45, 0.5), 0.5)
+
+        start = time.perf_counter()
+        coverage_report(field_, path, 0.5, resolution=0.1)
+        elapsed = time.perf_counter() - start
+
+        self.assertLess(elapsed, 1.0)
+
+
+class TestPlannerCoverage(unittest.TestCase):
+    """PathPlanner kapsama raporu testleri"""
+
+    def setUp(self):
+        self.planner = PathPlanner(config_path="nonexistent_test_config.json")
+        self.area = Area(
+            id="coverage",
+            name="coverage",
+            boundary=[Point(0, 0), Point(10, 0), Point(10, 10), Point(0, 10)],
+            obstacles=[],
+        )
+
+    def test_transit_not_counted(self):
+        """blade_off ile blade_on arası geçiş biçim sayılmamalı"""
+        path = [
+            Waypoint(Point(0, 2), action="blade_off"),
+            Waypoint(Point(10, 2)),
+            Waypoint(Point(10, 8), action="blade_on"),
+            Waypoint(Point(0, 8)),
+        ]
+        report = self.planner.coverage_report(path, self.area)
+
+        self.assertAlmostEqual(report.covered_area, 5.0, delta=0.3)
+
+    def test_path_statistics(self):
+        """İstatistikler gerçek biçilen alanı içermeli"""
+        path = self.planner._plan_path(self.area)
+        stats = self.planner.get_path_statistics(path, self.area)
+
+        self.assertGreater(stats["coverage"], 0.95)
+        self.assertGreater(stats["covered_area"], 95.0)
+        self.assertIn("double_cut_percent", stats)
+
+
+if __name__ == "__main__":
+    # Test suite oluştur
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+
+    # Test sınıflarını ekle
+    test_classes = [
+        TestCoverageGrid,
+        TestPlannerCoverage,
+    ]
+
+    for test_class in test_classes:
+        tests = loader.loadTestsFromTestCase(test_class)
+        suite.addTests(tests)
+
+    # Test runner
+    runner = unittest.TextTestRunner(verbosity=2, descriptions=True, failfast=False)
+
+    print("🟩 Coverage Map Test Suite Başlatılıyor...")
+    print("=" * 60)
+
+    result = runner.run(suite)
+
+    print("=" * 60)
+    print(f"✅ Başarılı: {result.testsRun - len(result.failures) - len(result.errors)}")
+    print(f"❌ Başarısız: {len(result.failures)}")
+    print(f"⚠️  Hata: {len(result.errors)}")
+
+    if result.wasSuccessful():
+        print("🎉 Tüm testler başarılı!")
+        sys.exit(0)
+    else:
+        print("💥 Bazı testler başarısız!")
+        sys.exit(1)
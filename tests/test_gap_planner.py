@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Gap Planner Test Suite
+Biçilmemiş bölgeleri hedefleyen boşluk doldurma rotası testleri
+"""
+
+import unittest
+import sys
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+
+# Proje kök dizinini path'e ekle
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.main_controller import MainController, RobotState
+from src.core.mission_journal import MissionJournal
+from src.navigation.gap_planner import gap_polygons, gap_stripes
+from src.navigation.path_planner import PathPlanner, Point, Waypoint, Area
+from src.navigation.polygon_geometry import PreparedPolygon, signed_area
+
+SQUARE = [(0, 0), (10, 0), (10, 10), (0, 10)]
+
+
+def _stripe_path(skip=()):
+    """Kare alanda şerit rotası; skip'teki şeritlerde bıçak kapalı"""
+    path = []
+    blade_on = True
+    for k, y in enumerate(np.linspace(0.25, 9.75, 22)):
+        xs = (0.25, 9.75) if k % 2 == 0 else (9.75, 0.25)
+        action = "move"
+        if (k in skip) == blade_on:
+            blade_on = not blade_on
+            action = "blade_on" if blade_on else "blade_off"
+        path.append(Waypoint(Point(xs[0], y), action=action))
+        path.append(Waypoint(Point(xs[1], y)))
+    return path
+
+
+class TestGapStripes(unittest.TestCase):
+    """Tek boşluk şeritleme testleri"""
+
+    def test_thin_gap_single_stripe(self):
+        """Şerit aralığından ince boşluk tek şeritle kaplanmalı"""
+        gap = [(2, 4.8), (8, 4.8), (8, 5.1), (2, 5.1)]
+        coords = gap_stripes(gap, [SQUARE], 0.45, 1.0)
+
+        self.assertEqual(len(coords), 2)
+        np.testing.assert_allclose(coords[:, 1], 4.95, atol=1e-9)
+        self.assertAlmostEqual(abs(coords[1, 0] - coords[0, 0]), 6.0)
+
+    def test_stripes_follow_gap_direction(self):
+        """Dikey boşluk dikey şeritlerle kaplanmalı"""
+        gap = [(4, 1), (5, 1), (5, 9), (4, 9)]
+        coords = gap_stripes(gap, [SQUARE], 0.45, 1.0)
+
+        self.assertEqual(len(coords), 6)
+        np.testing.assert_allclose(coords[0::2, 0], coords[1::2, 0], atol=1e-9)
+
+    def test_obstacle_and_margin(self):
+        """Şeritler engel ve sınırdan margin kadar uzak kalmalı"""
+        obstacle = [(4, 4), (6, 4), (6, 6), (4, 6)]
+        gap = [(0, 4.5), (10, 4.5), (10, 5.5), (0, 5.5)]
+        coords = gap_stripes(gap, [SQUARE, obstacle], 0.45, 1.0, margin=0.2)
+
+        blocked = PreparedPolygon(
+            [(3.85, 3.85), (6.15, 3.85), (6.15, 6.15), (3.85, 6.15)]
+        )
+        for start, end in zip(coords[0::2], coords[1::2]):
+            samples = np.linspace(start, end, 50)
+            self.assertFalse(blocked.contains_many(samples).any())
+            self.assertTrue(np.all((samples >= 0.2 - 1e-9) & (samples <= 9.8 + 1e-9)))
+
+    def test_small_gaps_dropped(self):
+        """min_area'dan küçük boşluklar elenmeli"""
+        small = [(1, 1), (1.1, 1), (1.1, 1.1), (1, 1.1)]
+        large = [(2, 2), (2, 3), (3, 3), (3, 2)]  # Saat yönünde
+        gaps = gap_polygons([small, large], min_area=0.05)
+
+        self.assertEqual(len(gaps), 1)
+        self.assertGreater(signed_area(gaps[0]), 0)  # Saat yönü tersine çevrildi
+
+
+class TestPlannerGapFill(unittest.TestCase):
+    """PathPlanner boşluk doldurma testleri"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.planner = PathPlanner(
+            config_path=str(Path(self.temp_dir.name) / "areas.json")
+        )
+        self.area = Area(
+            id="gaps",
+            name="gaps",
+            boundary=[Point(x, y) for x, y in SQUARE],
+            obstacles=[],
+        )
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_fills_missed_stripes(self):
+        """Atlanan şeritler doldurulunca kapsama tamamlanmalı"""
+        path = _stripe_path(skip=(4, 5, 15))
+        before = self.planner.coverage_report(path, self.area)
+        self.assertLess(before.coverage, 0.9)
+
+        gap_path = self.planner.plan_gap_fill(self.area, before, start=(0, 0))
+        after = self.planner.coverage_report(path + gap_path, self.area)
+
+        self.assertGreater(after.coverage, 0.99)
+        # Boşluk rotası tam yeniden planlamadan çok daha kısa olmalı
+        full = self.planner._plan_path(self.area)
+        self.assertLess(
+            self.planner.calculate_path_length(gap_path),
+            0.35 * self.planner.calculate_path_length(full),
+        )
+
+    def test_transits_blade_off(self):
+        """Boşluklar arası geçişte bıçak kapalı, boşluk girişinde açık olmalı"""
+        path = _stripe_path(skip=(2, 18))
+        report = self.planner.coverage_report(path, self.area)
+        gap_path = self.planner.plan_gap_fill(self.area, report, start=(0, 0))
+
+        actions = [wp.action for wp in gap_path]
+        self.assertEqual(actions[0], "blade_off")
+        self.assertEqual(actions.count("blade_on"), 2)
+        self.assertEqual(actions.count("blade_off"), 2)
+
+        # Bıçak açıkken yalnızca boşluk şeritleri sürülmeli
+        gaps = [PreparedPolygon(ring) for ring in report.missed_polygons]
+        blade_on = False
+        for wp in gap_path:
+            if wp.action in ("blade_on", "blade_off"):
+                blade_on = wp.action == "blade_on"
+            if blade_on and wp.action != "turn":
+                point = (wp.position.x, wp.position.y)
+                distance = min(
+                    abs(point[1] - ring.vertices[:, 1].mean()) for ring in gaps
+                )
+                self.assertLess(distance, 0.3)
+
+    def test_no_gaps(self):
+        """Eksiksiz kapsamada boş rota dönmeli"""
+        report = self.planner.coverage_report(_stripe_path(), self.area)
+        self.assertEqual(self.planner.plan_gap_fill(self.area, report), [])
+
+    def test_load_gap_fill(self):
+        """Yüklenen boşluk rotası önbellek ve günlük kimliği taşımamalı"""
+        self.planner.add_area(self.area)
+        report = self.planner.coverage_report(_stripe_path(skip=(7,)), self.area)
+
+        self.assertTrue(self.planner.load_gap_fill("gaps", report, (0, 0)))
+        self.assertIsNone(self.planner.current_plan_id)
+        self.assertEqual(self.planner.current_waypoint_index, 0)
+        self.assertFalse(self.planner.load_gap_fill("missing", report))
+
+
+class TestControllerGapFill(unittest.TestCase):
+    """MainController boşluk doldurma entegrasyonu"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.planner = PathPlanner(
+            config_path=str(Path(self.temp_dir.name) / "areas.json")
+        )
+        self.planner.add_area(
+            Area(
+                id="lawn",
+                name="lawn",
+                boundary=[Point(0, 0), Point(10, 0), Point(10, 6), Point(0, 6)],
+                obstacles=[],
+            )
+        )
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_gap_fill_keeps_coverage(self):
+        """Boşluk doldurma canlı haritayı temizlememeli"""
+        with patch.object(MainController, "_setup_logging"):
+            controller = MainController(config_path="nonexistent_config.json")
+        controller.logger = self.planner.logger
+        controller.path_planner = self.planner
+        controller.mission_journal = MissionJournal(
+            str(Path(self.temp_dir.name) / "journal.jsonl")
+        )
+        controller.coverage_path = str(Path(self.temp_dir.name) / "coverage.npz")
+        controller.odometry = SimpleNamespace(
+            get_position_dict=lambda: {"x": 1.0, "y": 1.0, "heading": 0.0}
+        )
+        controller.coverage_map.add_path([(0, 1), (10, 1), (10, 3), (0, 3)])
+        covered = controller.coverage_map.covered_cells
+
+        self.assertTrue(controller.start_gap_fill("lawn"))
+        self.assertEqual(controller.state, RobotState.MOWING)
+        self.assertEqual(controller.coverage_map.covered_cells, covered)
+        self.assertIsNone(controller.mission_journal.last_checkpoint())
+
+        # Görev sürerken yeni boşluk doldurma başlatılamaz
+        self.assertFalse(controller.start_gap_fill("lawn"))
+
+
+if __name__ == "__main__":
+    # Test suite oluştur
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+
+    # Test sınıflarını ekle
+    test_classes = [
+        TestGapStripes,
+        TestPlannerGapFill,
+        TestControllerGapFill,
+    ]
+
+    for test_class in test_classes:
+        tests = loader.loadTestsFromTestCase(test_class)
+        suite.addTests(tests)
+
+    # Test runner
+    runner = unittest.TextTestRunner(verbosity=2, descriptions=True, failfast=False)
+
+    print("🟫 Gap Planner Test Suite Başlatılıyor...")
+    print("=" * 60)
+
+    result = runner.run(suite)
+
+    print("=" * 60)
+    print(f"✅ Başarılı: {result.testsRun - len(result.failures) - len(result.errors)}")
+    print(f"❌ Başarısız: {len(result.failures)}")
+    print(f"⚠️  Hata: {len(result.errors)}")
+
+    if result.wasSuccessful():
+        print("🎉 Tüm testler başarılı!")
+        sys.exit(0)
+    else:
+        print("💥 Bazı testler başarısız!")
+        sys.exit(1)
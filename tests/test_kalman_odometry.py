@@ -25,6 +25,7 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.navigation.kalman_odometry import KalmanOdometry, Position
+from tests.benchmark import benchmark
 
 
 class TestKalmanOdometry(unittest.TestCase):
@@ -211,6 +212,109 @@ class TestKalmanFilter(unittest.TestCase):
         self.assertGreater(dtheta, 0)  # Sola dönüş (pozitif)
 
 
+class TestFilterCore(unittest.TestCase):
+    """Tahsissiz filtre çekirdeği testleri"""
+
+    def setUp(self):
+        self.odometry = KalmanOdometry(simulate=True)
+        rng = np.random.default_rng(7)
+        A = rng.normal(size=(6, 6))
+        self.odometry.P[:] = A @ A.T * 0.1 + np.eye(6) * 0.01
+        self.odometry.state[:] = [1.0, 2.0, 0.3, 0.5, 0.1, 0.2]
+
+    def _reference(self, z, H, R):
+        """Klasik toplu Kalman güncellemesi"""
+        x, P = self.odometry.state.copy(), self.odometry.P.copy()
+        y = z - H @ x
+        S = H @ P @ H.T + R
+        K = P @ H.T @ np.linalg.inv(S)
+        return x + K @ y, (np.eye(6) - K @ H) @ P
+
+    def test_position_update_matches_reference(self):
+        """Blok enkoder güncellemesi toplu güncellemeyle aynı olmalı"""
+        z = np.array([1.2, 1.9, 0.35])
+        H = np.eye(3, 6)
+        R = np.array([[0.02, 0.005, 0.0], [0.005, 0.03, 0.001], [0.0, 0.001, 0.01]])
+        x_ref, P_ref = self._reference(z, H, R)
+
+        self.odometry.correction_step(z, H, R)
+
+        np.testing.assert_allclose(self.odometry.state, x_ref, atol=1e-12)
+        np.testing.assert_allclose(self.odometry.P, P_ref, atol=1e-12)
+
+    def test_scalar_update_matches_reference(self):
+        """Skaler yön güncellemesi toplu güncellemeyle aynı olmalı"""
+        z = np.array([0.25])
+        H = np.zeros((1, 6))
+        H[0, 2] = 1.0
+        R = np.array([[0.01]])
+        x_ref, P_ref = self._reference(z, H, R)
+
+        self.odometry.correction_step(z, H, R)
+
+        np.testing.assert_allclose(self.odometry.state, x_ref, atol=1e-12)
+        np.testing.assert_allclose(self.odometry.P, P_ref, atol=1e-12)
+
+    def test_generic_update_matches_reference(self):
+        """Genel H için Joseph/Cholesky yolu da aynı sonucu vermeli"""
+        z = np.array([3.1, 0.4])
+        H = np.array([[1, 1, 0, 0, 0, 0], [0, 0, 0, 1, 0, 1]], dtype=float)
+        R = np.diag([0.05, 0.02])
+        x_ref, P_ref = self._reference(z, H, R)
+
+        self.odometry.correction_step(z, H, R)
+
+        np.testing.assert_allclose(self.odometry.state, x_ref, atol=1e-12)
+        np.testing.assert_allclose(self.odometry.P, P_ref, atol=1e-12)
+
+    def test_in_place_buffers(self):
+        """Durum ve kovaryans yerinde güncellenmeli"""
+        state, P = self.odometry.state, self.odometry.P
+        t0 = time.time()
+
+        for i in range(50):
+            self.odometry.last_update_time = t0
+            with patch("time.time", return_value=t0 + 0.005):
+                self.odometry.update_encoder(i, i + 2, 1000)
+            self.odometry.update_imu(0.01 * i, 0.0)
+
+        self.assertIs(self.odometry.state, state)
+        self.assertIs(self.odometry.P, P)
+        self.assertTrue(np.allclose(P, P.T))
+        self.assertGreater(np.min(np.linalg.eigvalsh(P)), 0)
+
+    def _fuse_one_second(self):
+        """200 Hz enkoder + IMU füzyonu, 1 saniyelik veri (süre döner)"""
+        clock = iter(time.time() + 0.005 * np.arange(1, 202))
+        self.odometry.last_update_time = next(clock)
+        with patch("time.time", lambda: next(clock)):
+            start = time.perf_counter()
+            for i in range(200):
+                self.odometry.update_encoder(10, 12, 1000)
+                self.odometry.update_imu(0.1, 0.0)
+            return time.perf_counter() - start
+
+    def test_fusion_rate(self):
+        """200 Hz füzyon tamponları yerinde kullanmalı, P pozitif tanımlı kalmalı"""
+        state, P = self.odometry.state, self.odometry.P
+
+        self._fuse_one_second()
+
+        self.assertIs(self.odometry.state, state)
+        self.assertIs(self.odometry.P, P)
+        self.assertTrue(np.all(np.isfinite(state)))
+        self.assertTrue(np.allclose(P, P.T))
+        self.assertGreater(np.min(np.linalg.eigvalsh(P)), 0)
+
+    @benchmark
+    def test_fusion_speed(self):
+        """Enkoder + IMU füzyonu 200 Hz'in çok üstünde çalışmalı"""
+        elapsed = self._fuse_one_second()
+
+        # 200 adım 1 saniyelik veri; bütçenin %10'undan az sürmeli
+        self.assertLess(elapsed, 0.1)
+
+
 class TestNumericalStability(unittest.TestCase):
     """Sayısal kararlılık testleri"""
 
@@ -407,6 +511,7 @@ if __name__ == "__main__":
     test_classes = [
         TestKalmanOdometry,
         TestKalmanFilter,
+        TestFilterCore,
         TestNumericalStability,
         TestIntegration,
         TestStatistics,
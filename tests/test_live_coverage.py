@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Live Coverage Test Suite
+Canlı kapsama haritası, kayıt ve delta testleri
+"""
+
+import unittest
+import sys
+import base64
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import numpy as np
+
+# Proje kök dizinini path'e ekle
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.main_controller import RobotState
+from src.navigation.live_coverage import LiveCoverageMap
+from src.navigation.path_planner import PathPlanner, Point, Area
+from tests.controller_fixture import ControllerFixtureMixin
+
+
+class TestLiveCoverageMap(unittest.TestCase):
+    """Karo tabanlı kapsama haritası testleri"""
+
+    def setUp(self):
+        self.map = LiveCoverageMap(resolution=0.1, blade_width=0.5)
+
+    def test_incremental_updates(self):
+        """Bıçak açıkken ardışık pozlar tek iz oluşturmalı"""
+        for x in np.arange(0.0, 5.01, 0.05):
+            self.map.update(x, 1.0, cutting=True)
+
+        # 5 m x 0.5 m şerit + uç yarım diskleri
+        self.assertAlmostEqual(self.map.covered_area, 2.5 + np.pi * 0.0625, delta=0.1)
+
+    def test_blade_off_not_recorded(self):
+        """Bıçak kapalıyken geçilen yol biçilmiş sayılmamalı"""
+        self.map.update(0.0, 0.0, cutting=True)
+        self.map.update(1.0, 0.0, cutting=True)
+        area = self.map.covered_area
+        self.map.update(3.0, 0.0, cutting=False)
+        self.map.update(3.0, 0.0, cutting=True)
+
+        self.assertAlmostEqual(self.map.covered_area, area + np.pi * 0.0625, delta=0.05)
+
+    def test_repeat_pass_not_counted(self):
+        """Aynı yerden tekrar geçmek alanı artırmamalı"""
+        self.map.add_path([(0, 0), (4, 0)])
+        area = self.map.covered_area
+        self.assertEqual(self.map.add_path([(4, 0), (0, 0)]), 0)
+        self.assertEqual(self.map.covered_area, area)
+
+    def test_negative_coordinates(self):
+        """Negatif koordinatlar doğru karolara düşmeli"""
+        self.map.add_path([(-3, -3), (3, 3)])
+
+        covered = self.map.covered([(-2, -2), (2, 2), (2, -2)])
+        np.testing.assert_array_equal(covered, [True, True, False])
+        self.assertIn((-1, -1), self.map.tiles)
+
+    def test_bounded_tiles(self):
+        """Karo sınırı aşılınca yeni hücreler atlanmalı"""
+        bounded = LiveCoverageMap(tile_size=16, max_tiles=2)
+        bounded.add_path([(0, 0.8), (10, 0.8)])
+
+        self.assertEqual(len(bounded.tiles), 2)
+        self.assertGreater(bounded.dropped_cells, 0)
+
+    def test_delta(self):
+        """Delta yalnızca değişen karoları göndermeli"""
+        self.map.add_path([(0, 1), (3, 1)])
+        full = self.map.delta(0)
+        self.map.add_path([(10, 1), (11, 1)])
+        delta = self.map.delta(full["version"])
+
+        self.assertEqual(len(delta["tiles"]), 1)
+        self.assertEqual((delta["tiles"][0]["x"], delta["tiles"][0]["y"]), (1, 0))
+        bits = base64.b64decode(delta["tiles"][0]["bits"])
+        self.assertEqual(len(bits), 64 * 64 // 8)
+
+        # Temizlendikten sonra eski sürümle gelen istemci sıfırlanmalı
+        self.map.clear()
+        self.assertTrue(self.map.delta(delta["version"])["reset"])
+
+    def test_save_and_load(self):
+        """Kaydedilen harita aynı alanı ve metadata'yı geri yüklemeli"""
+        self.map.add_path([(0, 0), (5, 5)])
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = str(Path(temp_dir) / "coverage.npz")
+            self.assertTrue(self.map.save(path, plan_id="a", plan_hash="h"))
+
+            restored = LiveCoverageMap(resolution=0.1)
+            metadata = restored.load(path)
+
+        self.assertEqual(metadata, {"plan_id": "a", "plan_hash": "h"})
+        self.assertEqual(restored.covered_cells, self.map.covered_cells)
+        self.assertEqual(restored.tiles.keys(), self.map.tiles.keys())
+
+    def test_missed_polygons(self):
+        """Canlı haritadan kaçırılan bölgeler çıkarılabilmeli"""
+        self.map.add_path([(0, 5), (10, 5)])
+        boundary = [(0, 0), (10, 0), (10, 10), (0, 10)]
+        report = self.map.coverage_grid(boundary).report()
+
+        self.assertAlmostEqual(report.covered_area, 5.0, delta=0.2)
+        self.assertEqual(len(report.missed_polygons), 2)
+
+
+class TestControllerCoverage(ControllerFixtureMixin, unittest.TestCase):
+    """MainController kapsama entegrasyonu"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.planner = PathPlanner(
+            config_path=str(Path(self.temp_dir.name) / "areas.json")
+        )
+        self.planner.add_area(
+            Area(
+                id="lawn",
+                name="lawn",
+                boundary=[Point(0, 0), Point(10, 0), Point(10, 6), Point(0, 6)],
+                obstacles=[],
+            )
+        )
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _drive(self, controller, points):
+        """Her pozda bir kontrol adımı ve bir navigasyon adımı çalıştır"""
+        for x, y in points:
+            controller.odometry = SimpleNamespace(
+                get_position_dict=lambda x=x, y=y: {"x": x, "y": y, "heading": 0.0}
+            )
+            controller._state_machine()
+            controller._update_coverage()
+
+    def test_area_covered_stat(self):
+        """Bıçak çalışırken area_covered artmalı"""
+        controller = self._controller(simulated=True)
+        controller.start_mowing_task("lawn")
+        self._drive(controller, [(1, 1), (2, 1), (3, 1)])
+
+        self.assertGreater(controller.stats["area_covered"], 0.9)
+        self.assertEqual(
+            controller.get_status()["area_covered"], controller.stats["area_covered"]
+        )
+
+    def test_blade_follows_mowing_state(self):
+        """Bıçak biçme başlayınca çalışmalı, batarya dönüşünde durmalı"""
+        controller = self._controller(simulated=True)
+        self._drive(controller, [(1, 1), (3, 1)])
+        self.assertFalse(controller.motor_controller.blade_running)
+        self.assertEqual(controller.stats["area_covered"], 0)
+
+        controller.start_mowing_task("lawn")
+        self._drive(controller, [(1, 1), (3, 1)])
+        self.assertTrue(controller.motor_controller.blade_running)
+        covered = controller.stats["area_covered"]
+        self.assertGreater(covered, 0.9)
+
+        controller.power_manager = Mock(get_battery_level=Mock(return_value=5))
+        controller._handle_mowing_state()
+        self.assertEqual(controller.state, RobotState.RETURNING_TO_CHARGE)
+        self.assertFalse(controller.motor_controller.blade_running)
+        self._drive(controller, [(5, 1), (7, 1)])
+        self.assertEqual(controller.stats["area_covered"], covered)
+
+    def test_coverage_survives_restart(self):
+        """Devam eden görevde kaydedilen kapsama geri yüklenmeli"""
+        controller = self._controller(simulated=True)
+        controller.start_mowing_task("lawn")
+        self._drive(controller, [(1, 1), (2.5, 1), (4, 1)])
+        covered = controller.coverage_map.covered_cells
+        controller._checkpoint_mission(force=True)
+
+        restarted = self._controller(simulated=True)
+        self.planner.reset_path()
+        self.assertTrue(restarted._resume_interrupted_mission(boot=True))
+        self.assertEqual(restarted.coverage_map.covered_cells, covered)
+
+        # Yeni (devam etmeyen) görev haritayı temizler
+        restarted.state = RobotState.IDLE
+        restarted.start_mowing_task("lawn", resume=False)
+        self.assertEqual(restarted.coverage_map.covered_cells, 0)
+
+
+if __name__ == "__main__":
+    # Test suite oluştur
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+
+    # Test sınıflarını ekle
+    test_classes = [
+        TestLiveCoverageMap,
+        TestControllerCoverage,
+    ]
+
+    for test_class in test_classes:
+        tests = loader.loadTestsFromTestCase(test_class)
+        suite.addTests(tests)
+
+    # Test runner
+    runner = unittest.TextTestRunner(verbosity=2, descriptions=True, failfast=False)
+
+    print("🟢 Live Coverage Test Suite Başlatılıyor...")
+    print("=" * 60)
+
+    result = runner.run(suite)
+
+    print("=" * 60)
+    print(f"✅ Başarılı: {result.testsRun - len(result.failures) - len(result.errors)}")
+    print(f"❌ Başarısız: {len(result.failures)}")
+    print(f"⚠️  Hata: {len(result.errors)}")
+
+    if result.wasSuccessful():
+        print("🎉 Tüm testler başarılı!")
+        sys.exit(0)
+    else:
+        print("💥 Bazı testler başarısız!")
+        sys.exit(1)
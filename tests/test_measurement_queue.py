@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Measurement Queue Test Suite
+SPSC ölçüm halkası, zaman sıralı füzyon ve geç ölçüm yeniden oynatma testleri
+"""
+
+import unittest
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import numpy as np
+
+# Proje kök dizinini path'e ekle
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.hardware.motor_controller import MotorController
+from src.hardware.sensor_manager import SensorManager, SensorType
+from src.navigation.kalman_odometry import KalmanOdometry
+from src.navigation.measurement_queue import MeasurementQueue, SensorRing
+from src.navigation.unicycle_ekf import UnicycleEKF
+
+
+def _samples(count=200, dt=0.05, seed=0):
+    """Zaman damgalı enkoder ve IMU örnekleri (tür, zaman, değerler)"""
+    rng = np.random.default_rng(seed)
+    samples = []
+    heading = 0.0
+    for i in range(count):
+        t = 100.0 + i * dt
+        left, right = rng.integers(20, 40, 2)
+        heading += (right - left) * 2 * np.pi * 0.1 / 1000 / 0.5
+        samples.append(("encoder", t, (int(left), int(right))))
+        samples.append(("imu", t + dt / 2, (heading + rng.normal(0, 0.01), 0.1)))
+    return samples
+
+
+def _push(queue, sample):
+    """Örneği kuyruğa ekle"""
+    kind, t, values = sample
+    if kind == "encoder":
+        queue.push_encoder(t, *values)
+    else:
+        queue.push_imu(t, *values)
+
+
+class TestSensorRing(unittest.TestCase):
+    """SPSC halka testleri"""
+
+    def test_wraparound_and_full(self):
+        """Halka dolunca düşürmeli, boşaldıkça sarmalı"""
+        ring = SensorRing(capacity=4)
+        for i in range(6):
+            ring.push(float(i), i, i)
+        self.assertEqual(ring.dropped, 2)
+
+        timestamps, values = ring.drain()
+        self.assertEqual(timestamps, [0.0, 1.0, 2.0, 3.0])
+        self.assertEqual(values[3][:2], [3.0, 3.0])
+
+        for i in range(3):
+            ring.push(float(10 + i), i)
+        self.assertEqual(ring.drain()[0], [10.0, 11.0, 12.0])
+        self.assertEqual(len(ring), 0)
+
+    def test_concurrent_producer(self):
+        """Üretici thread ile eşzamanlı boşaltmada ölçüm kaybolmamalı"""
+        ring = SensorRing(capacity=64)
+        received = []
+
+        def produce():
+            for i in range(5000):
+                while not ring.push(float(i), i):
+                    time.sleep(0.0001)
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        while producer.is_alive() or len(ring):
+            received.extend(ring.drain()[0])
+            time.sleep(0.0005)
+        producer.join()
+
+        self.assertEqual(received, [float(i) for i in range(5000)])
+
+
+class TestMeasurementQueue(unittest.TestCase):
+    """Zaman sıralı füzyon testleri"""
+
+    def _run(self, odometry, order, batch=1):
+        """Örnekleri verilen sırada, batch'ler halinde işle"""
+        queue = MeasurementQueue(odometry, replay_window=0.5)
+        for i in range(0, len(order), batch):
+            for sample in order[i : i + batch]:
+                _push(queue, sample)
+            queue.process()
+        return queue
+
+    def test_timestamps_drive_dt(self):
+        """dt çağrı zamanından değil örnekleme zamanından hesaplanmalı"""
+        odometry = UnicycleEKF(simulate=True)
+        queue = MeasurementQueue(odometry)
+        queue.push_encoder(5.0, 0, 0)
+        queue.push_encoder(5.1, 100, 100)
+        queue.process()
+
+        distance = 100 / 1000 * 2 * np.pi * odometry.wheel_radius
+        self.assertAlmostEqual(odometry.state[3], distance / 0.1)
+        self.assertEqual(odometry.last_update_time, 5.1)
+
+    def test_out_of_order_matches_ordered(self):
+        """Geç gelen ölçümler sıralı işlemeyle aynı sonucu vermeli"""
+        samples = _samples()
+        rng = np.random.default_rng(1)
+        # Her örnek 0-0.2 s gecikmeyle ulaşıyor
+        arrival = [t + rng.uniform(0, 0.2) for _, t, _ in samples]
+        shuffled = [samples[i] for i in np.argsort(arrival)]
+
+        for odometry_class in (UnicycleEKF, KalmanOdometry):
+            with self.subTest(model=odometry_class.__name__):
+                ordered = odometry_class(simulate=True)
+                self._run(ordered, samples, batch=1)
+                delayed = odometry_class(simulate=True)
+                queue = self._run(delayed, shuffled, batch=3)
+
+                self.assertGreater(queue.late, 0)
+                self.assertEqual(queue.stale, 0)
+                self.assertEqual(queue.applied, len(samples))
+                np.testing.assert_allclose(delayed.state, ordered.state, atol=1e-12)
+                np.testing.assert_allclose(delayed.P, ordered.P, atol=1e-12)
+
+    def test_stale_dropped(self):
+        """Yeniden oynatma penceresinden eski ölçüm atılmalı"""
+        odometry = UnicycleEKF(simulate=True)
+        queue = MeasurementQueue(odometry, replay_window=0.2)
+        queue.push_imu(10.0, 0.1)
+        queue.process()
+        state = odometry.state.copy()
+
+        queue.push_imu(9.5, 1.0)
+        self.assertEqual(queue.process(), 0)
+        self.assertEqual(queue.stale, 1)
+        np.testing.assert_array_equal(odometry.state, state)
+
+    def test_gps_update(self):
+        """GPS ölçümü konumu çekmeli ve belirsizliği azaltmalı"""
+        odometry = UnicycleEKF(simulate=True)
+        queue = MeasurementQueue(odometry)
+        before = odometry.get_position_uncertainty()["x_std"]
+        queue.push_gps(1.0, 2.0, -1.0, 0.01)
+        queue.process()
+
+        self.assertGreater(odometry.state[0], 1.5)
+        self.assertLess(odometry.state[1], -0.5)
+        self.assertLess(odometry.get_position_uncertainty()["x_std"], before)
+
+
+class TestSensorProducers(unittest.TestCase):
+    """Donanım okumalarının zaman damgasıyla kuyruğa yazılması"""
+
+    def test_motor_encoder_samples(self):
+        """Motor izleme döngüsünün enkoder artışları filtreye ulaşmalı"""
+        odometry = UnicycleEKF(simulate=True)
+        queue = MeasurementQueue(odometry)
+        motors = MotorController(simulate=True)
+        motors.measurement_queue = queue
+        motors.set_drive_speed(0.5, 0.0)
+
+        motors.last_encoder_time = 100.0
+        with patch("time.time", side_effect=[100.1, 100.2]):
+            motors._update_encoders()
+            motors._update_encoders()
+        queue.process()
+
+        self.assertEqual(queue.last_timestamp, 100.2)
+        self.assertEqual(odometry.last_update_time, 100.2)
+        self.assertAlmostEqual(odometry.state[3], 0.5, delta=0.02)
+
+    def test_imu_samples(self):
+        """Gerçek IMU yönü okunduğu zamanla ve radyana çevrilerek yazılmalı"""
+        odometry = UnicycleEKF(simulate=True)
+        queue = MeasurementQueue(odometry)
+        sensors = SensorManager(simulate=True)
+        sensors.simulate = False
+        sensors.imu = Mock(
+            euler=(90.0, 2.0, 0.0), temperature=25.0, calibration_status=(3, 3, 3, 3)
+        )
+        sensors.measurement_queue = queue
+
+        with patch("time.time", return_value=50.0):
+            sensors._read_imu()
+        queue.process()
+
+        self.assertEqual(queue.last_timestamp, 50.0)
+        self.assertEqual(sensors.readings[SensorType.IMU].timestamp, 50.0)
+        self.assertLess(odometry.state[2], -1.0)
+
+
+if __name__ == "__main__":
+    # Test suite oluştur
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+
+    # Test sınıflarını ekle
+    test_classes = [
+        TestSensorRing,
+        TestMeasurementQueue,
+        TestSensorProducers,
+    ]
+
+    for test_class in test_classes:
+        tests = loader.loadTestsFromTestCase(test_class)
+        suite.addTests(tests)
+
+    # Test runner
+    runner = unittest.TextTestRunner(verbosity=2, descriptions=True, failfast=False)
+
+    print("🟫 Measurement Queue Test Suite Başlatılıyor...")
+    print("=" * 60)
+
+    result = runner.run(suite)
+
+    print("=" * 60)
+    print(f"✅ Başarılı: {result.testsRun - len(result.failures) - len(result.errors)}")
+    print(f"❌ Başarısız: {len(result.failures)}")
+    print(f"⚠️  Hata: {len(result.errors)}")
+
+    if result.wasSuccessful():
+        print("🎉 Tüm testler başarılı!")
+        sys.exit(0)
+    else:
+        print("💥 Bazı testler başarısız!")
+        sys.exit(1)
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Mission Journal Test Suite
+Görev kontrol noktası ve kaldığı yerden devam testleri
+"""
+
+import unittest
+import sys
+import tempfile
+from pathlib import Path
+from unittest.mock import Mock
+
+# Proje kök dizinini path'e ekle
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.main_controller import RobotState
+from src.core.mission_journal import MissionJournal
+from src.navigation.path_planner import PathPlanner, Point, Area
+from tests.controller_fixture import ControllerFixtureMixin
+
+
+class TestMissionJournal(unittest.TestCase):
+    """Görev günlüğü testleri"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.temp_dir.name) / "journal.jsonl"
+        self.journal = MissionJournal(str(self.path), min_interval=5.0)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _line_count(self):
+        return len(self.path.read_text(encoding="utf-8").splitlines())
+
+    def test_rate_bounded_progress(self):
+        """min_interval içinde yalnızca zorunlu kayıtlar yazılmalı"""
+        self.journal.start("area", "hash", 0)
+
+        self.assertFalse(self.journal.record_progress("area", "hash", 3))
+        self.assertTrue(self.journal.record_progress("area", "hash", 4, force=True))
+        # Aynı indeks tekrar yazılmamalı
+        self.assertFalse(self.journal.record_progress("area", "hash", 4, force=True))
+
+        self.assertEqual(self._line_count(), 2)
+        self.assertEqual(self.journal.last_checkpoint()["index"], 4)
+
+    def test_checkpoint_survives_restart(self):
+        """Yeni örnek diskteki son kaydı okumalı, yarım satırı atlamalı"""
+        self.journal.start("area", "hash", 0)
+        self.journal.record_progress("area", "hash", 12, force=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write('{"event": "progr')  # Çökme sırasında yarım kalan satır
+
+        checkpoint = MissionJournal(str(self.path)).last_checkpoint()
+
+        self.assertEqual(checkpoint["area_id"], "area")
+        self.assertEqual(checkpoint["plan_hash"], "hash")
+        self.assertEqual(checkpoint["index"], 12)
+
+    def test_completed_mission(self):
+        """Tamamlanan görevden sonra devam edilecek kayıt olmamalı"""
+        self.journal.start("area", "hash", 0)
+        self.journal.complete("area", "hash", 40)
+
+        self.assertIsNone(self.journal.last_checkpoint())
+        self.assertIsNone(MissionJournal(str(self.path)).last_checkpoint())
+
+    def test_auto_resume_events(self):
+        """Yalnızca şarj için bırakılan veya çöken görev sürdürülmeli"""
+        self.journal.start("area", "hash", 0)
+        self.assertIsNone(self.journal.resumable_checkpoint())
+        self.assertEqual(self.journal.resumable_checkpoint(boot=True)["index"], 0)
+
+        self.journal.suspend("area", "hash", 7)
+        self.assertEqual(self.journal.resumable_checkpoint()["index"], 7)
+
+        self.journal.cancel("area", "hash", 7)
+        self.assertIsNone(self.journal.resumable_checkpoint())
+        self.assertIsNone(
+            MissionJournal(str(self.path)).resumable_checkpoint(boot=True)
+        )
+        # Operatör yine de iptal edilen şeritten elle devam edebilir
+        self.assertEqual(self.journal.last_checkpoint()["index"], 7)
+
+    def test_compaction(self):
+        """Boyut sınırı aşılınca dosya son kayda indirilmeli"""
+        journal = MissionJournal(str(self.path), min_interval=0.0, max_bytes=500)
+        for index in range(50):
+            journal.record_progress("area", "hash", index)
+
+        self.assertLess(self.path.stat().st_size, 1000)
+        self.assertEqual(MissionJournal(str(self.path)).last_checkpoint()["index"], 49)
+
+
+class TestMissionResume(ControllerFixtureMixin, unittest.TestCase):
+    """Kaldığı yerden devam testleri"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.planner = PathPlanner(
+            config_path=str(Path(self.temp_dir.name) / "areas.json")
+        )
+        self.planner.add_area(
+            Area(
+                id="resume_area",
+                name="resume_test",
+                boundary=[Point(0, 0), Point(10, 0), Point(10, 6), Point(0, 6)],
+                obstacles=[],
+            )
+        )
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_stripe_start_index(self):
+        """Devam noktası yarım kalan şeridin başı olmalı"""
+        self.planner.load_area("resume_area")
+        path = self.planner.current_path
+        # Dönüş manevrasından sonraki ilk şerit waypoint'leri
+        stripe_starts = [
+            i
+            for i in range(1, len(path))
+            if path[i].action != "turn" and path[i - 1].action == "turn"
+        ]
+
+        index = self.planner.resume_from(stripe_starts[1] + 1)
+
+        self.assertEqual(index, stripe_starts[1] - 1)
+        self.assertEqual(self.planner.stripe_start_index(0), 0)
+        self.assertEqual(self.planner.stripe_start_index(len(path)), len(path))
+
+    def test_resume_after_restart(self):
+        """Çökme sonrası görev kontrol noktasından devam etmeli"""
+        controller = self._controller()
+        self.assertTrue(controller.start_mowing_task("resume_area"))
+        self.planner.current_waypoint_index = 9
+        controller._checkpoint_mission(force=True)
+
+        # Yeniden başlatma
+        restarted = self._controller()
+        self.planner.reset_path()
+        self.assertFalse(restarted._resume_interrupted_mission())
+        self.assertTrue(restarted._resume_interrupted_mission(boot=True))
+
+        self.assertEqual(restarted.state, RobotState.MOWING)
+        self.assertEqual(
+            self.planner.current_waypoint_index, self.planner.stripe_start_index(9)
+        )
+        self.assertGreater(self.planner.current_waypoint_index, 0)
+
+    def _charge(self, controller):
+        """Şarjı tamamla (şarj durumu sonrası devam kararı)"""
+        controller.power_manager = Mock(get_battery_level=Mock(return_value=100))
+        controller.state = RobotState.CHARGING
+        controller._handle_charging_state()
+
+    def test_resume_after_low_battery(self):
+        """Batarya için bırakılan görev şarjdan sonra sürdürülmeli"""
+        controller = self._controller()
+        controller.start_mowing_task("resume_area")
+        self.planner.current_waypoint_index = 9
+        controller.motor_controller = Mock()
+        controller.odometry = Mock()
+        controller.power_manager = Mock(get_battery_level=Mock(return_value=5))
+        controller._handle_mowing_state()
+        self.assertEqual(controller.state, RobotState.RETURNING_TO_CHARGE)
+
+        self._charge(controller)
+
+        self.assertEqual(controller.state, RobotState.MOWING)
+        self.assertEqual(
+            self.planner.current_waypoint_index, self.planner.stripe_start_index(9)
+        )
+
+    def test_no_resume_after_stop(self):
+        """Durdurulan veya acil durdurulan görev kendiliğinden başlamamalı"""
+        for stop in ("stop_mowing_task", "emergency_stop"):
+            with self.subTest(stop=stop):
+                controller = self._controller()
+                self.assertTrue(controller.start_mowing_task("resume_area", False))
+                self.planner.current_waypoint_index = 9
+                controller._checkpoint_mission(force=True)
+
+                getattr(controller, stop)()
+                controller.clear_emergency_stop()
+                self._charge(controller)
+                self.assertEqual(controller.state, RobotState.IDLE)
+
+                # Açılışta da devam edilmez
+                restarted = self._controller()
+                self.assertFalse(restarted._resume_interrupted_mission(boot=True))
+                self.assertEqual(restarted.state, RobotState.IDLE)
+
+    def test_fresh_start_after_cancel(self):
+        """resume=False ile iptal edilen görev baştan başlamalı"""
+        controller = self._controller()
+        self.assertTrue(controller.start_mowing_task("resume_area"))
+        self.planner.current_waypoint_index = 9
+        controller._checkpoint_mission(force=True)
+        controller.stop_mowing_task()
+
+        self.assertTrue(controller.start_mowing_task("resume_area", resume=False))
+
+        self.assertEqual(self.planner.current_waypoint_index, 0)
+        self.assertEqual(controller.mission_journal.last_checkpoint()["index"], 0)
+
+        # Varsayılan başlatma ise iptal edilen şeritten devam eder
+        self.planner.current_waypoint_index = 9
+        controller._checkpoint_mission(force=True)
+        controller.stop_mowing_task()
+        self.assertTrue(controller.start_mowing_task("resume_area"))
+        self.assertEqual(
+            self.planner.current_waypoint_index, self.planner.stripe_start_index(9)
+        )
+
+    def test_no_resume_when_geometry_changed(self):
+        """Rota değiştiyse eski kontrol noktası kullanılmamalı"""
+        controller = self._controller()
+        controller.start_mowing_task("resume_area")
+        self.planner.current_waypoint_index = 9
+        controller._checkpoint_mission(force=True)
+
+        self.planner.areas["resume_area"].overlap = 0.3
+        controller.state = RobotState.IDLE
+        controller.start_mowing_task("resume_area")
+
+        self.assertEqual(self.planner.current_waypoint_index, 0)
+
+
+if __name__ == "__main__":
+    # Test suite oluştur
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+
+    # Test sınıflarını ekle
+    test_classes = [
+        TestMissionJournal,
+        TestMissionResume,
+    ]
+
+    for test_class in test_classes:
+        tests = loader.loadTestsFromTestCase(test_class)
+        suite.addTests(tests)
+
+    # Test runner
+    runner = unittest.TextTestRunner(verbosity=2, descriptions=True, failfast=False)
+
+    print("📒 Mission Journal Test Suite Başlatılıyor...")
+    print("=" * 60)
+
+    result = runner.run(suite)
+
+    print("=" * 60)
+    print(f"✅ Başarılı: {result.testsRun - len(result.failures) - len(result.errors)}")
+    print(f"❌ Başarısız: {len(result.failures)}")
+    print(f"⚠️  Hata: {len(result.errors)}")
+
+    if result.wasSuccessful():
+        print("🎉 Tüm testler başarılı!")
+        sys.exit(0)
+    else:
+        print("💥 Bazı testler başarısız!")
+        sys.exit(1)
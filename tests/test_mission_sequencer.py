@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Mission Sequencer Test Suite
+Çok alanlı görev sıralama ve geçiş yolu testleri
+"""
+
+import unittest
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import numpy as np
+
+# Proje kök dizinini path'e ekle
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.main_controller import RobotState
+from src.hardware.motor_controller import MotorController
+from src.navigation.mission_sequencer import MissionSequencer, order_areas
+from src.navigation.path_planner import PathPlanner, Point, Area
+from tests.controller_fixture import ControllerFixtureMixin
+
+
+def _square(x, y, size):
+    return [
+        Point(x, y),
+        Point(x + size, y),
+        Point(x + size, y + size),
+        Point(x, y + size),
+    ]
+
+
+class TestOrderAreas(unittest.TestCase):
+    """Ziyaret sırası testleri"""
+
+    def _tour_length(self, start, entries, exits, order, flipped):
+        position = np.asarray(start, dtype=float)
+        total = 0.0
+        for k, flip in zip(order, flipped):
+            entry, exit_ = (exits[k], entries[k]) if flip else (entries[k], exits[k])
+            total += np.hypot(*(entry - position))
+            position = exit_
+        return total + np.hypot(*(position - start))
+
+    def test_points_on_line(self):
+        """Doğru üzerindeki alanlar sırayla gidilip dönülmeli"""
+        entries = np.array([[30.0, 0.0], [10.0, 0.0], [20.0, 0.0]])
+        order, flipped = order_areas((0, 0), entries, entries.copy())
+
+        self.assertEqual(order, [1, 2, 0])
+        self.assertAlmostEqual(
+            self._tour_length((0, 0), entries, entries, order, flipped), 60.0
+        )
+
+    def test_reversal_shortens_tour(self):
+        """Alan çıkışı girişten yakınsa alan ters sürülmeli"""
+        entries = np.array([[10.0, 0.0]])
+        exits = np.array([[1.0, 0.0]])
+        order, flipped = order_areas((0, 0), entries, exits, return_to_start=False)
+
+        self.assertEqual(order, [0])
+        self.assertEqual(flipped, [True])
+
+    def test_two_opt_not_worse_than_nearest_neighbour(self):
+        """2-opt sonrası tur en yakın komşu turundan uzun olmamalı"""
+        rng = np.random.default_rng(3)
+        entries = rng.uniform(0, 50, (12, 2))
+        exits = entries + rng.uniform(-5, 5, (12, 2))
+
+        order, flipped = order_areas((0, 0), entries, exits)
+        nn_order, nn_flipped = order_areas((0, 0), entries, exits, max_passes=0)
+
+        self.assertEqual(sorted(order), list(range(12)))
+        self.assertLessEqual(
+            self._tour_length((0, 0), entries, exits, order, flipped),
+            self._tour_length((0, 0), entries, exits, nn_order, nn_flipped) + 1e-9,
+        )
+
+
+class TestMissionSequencer(unittest.TestCase):
+    """Geçiş yolu testleri"""
+
+    def test_transit_avoids_obstacle(self):
+        """Geçiş engelin içinden geçmemeli"""
+        obstacle = np.array([[4.0, -2.0], [6.0, -2.0], [6.0, 2.0], [4.0, 2.0]])
+        paths = {"far": np.array([[10.0, 0.0], [12.0, 0.0]])}
+
+        plan = MissionSequencer(clearance=0.3).sequence(
+            (0.0, 0.0), paths, [obstacle], return_to_start=False
+        )
+
+        self.assertEqual(plan.order, ["far"])
+        self.assertEqual(len(plan.transits), 1)
+        self.assertGreater(len(plan.transits[0]), 2)
+        self.assertGreater(plan.transit_length, 10.0)
+
+    def test_empty_paths_skipped(self):
+        """Boş rotalı alanlar göreve eklenmemeli"""
+        paths = {"empty": np.zeros((0, 2)), "a": np.array([[1.0, 0.0], [2.0, 0.0]])}
+        plan = MissionSequencer().sequence((0.0, 0.0), paths)
+
+        self.assertEqual(plan.order, ["a"])
+        self.assertEqual(len(plan.transits), 2)
+
+
+class TestPlannerMission(ControllerFixtureMixin, unittest.TestCase):
+    """PathPlanner ve MainController görev entegrasyonu"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.planner = PathPlanner(
+            config_path=str(Path(self.temp_dir.name) / "areas.json")
+        )
+        for area_id, x in (("west", 2.0), ("east", 20.0)):
+            self.planner.add_area(
+                Area(id=area_id, name=area_id, boundary=_square(x, 2, 6), obstacles=[])
+            )
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_combined_plan(self):
+        """Tek rota: istasyondan yakın alan, geçiş, uzak alan ve dönüş"""
+        self.assertTrue(self.planner.load_mission(["east", "west"], (0.0, 0.0)))
+        path = self.planner.current_path
+
+        self.assertEqual(self.planner.current_mission.order, ["west", "east"])
+        self.assertEqual([wp.action for wp in path].count("blade_on"), 2)
+        self.assertEqual(path[0].action, "blade_off")
+        self.assertEqual(path[-1].action, "stop")
+        self.assertAlmostEqual(path[-1].position.x, 0.0)
+        self.assertEqual(self.planner.current_plan_id, "mission:east,west")
+
+        west = len(self.planner.area_path(self.planner.areas["west"]))
+        east = len(self.planner.area_path(self.planner.areas["east"]))
+        self.assertGreater(len(path), west + east)
+
+    def test_streamed_mission(self):
+        """Akışla yüklenen görev arka planda planlanıp aynı rotayı vermeli"""
+        threads = set()
+        plan_path = self.planner._plan_path
+
+        def record_thread(area):
+            threads.add(threading.current_thread())
+            return plan_path(area)
+
+        with patch.object(self.planner, "_plan_path", side_effect=record_thread):
+            self.assertTrue(
+                self.planner.load_mission(["east", "west"], (0.0, 0.0), stream=True)
+            )
+            plan_hash = self.planner.current_plan_hash
+            self._wait_planned()
+
+        self.assertEqual(len(threads), 1)
+        self.assertNotIn(threading.current_thread(), threads)
+        self.assertIsNone(self.planner.planning_error)
+        self.assertEqual(self.planner.current_mission.order, ["west", "east"])
+        streamed = self.planner.current_path
+
+        # Alan rotaları önbellekte: akışsız yükleme aynı görevi verir
+        self.assertTrue(self.planner.load_mission(["west", "east"], (0.0, 0.0)))
+        self.assertEqual(self.planner.current_plan_hash, plan_hash)
+        self.assertEqual(streamed, self.planner.current_path)
+
+    def test_unknown_area(self):
+        """Bilinmeyen alan görevi reddedilmeli"""
+        self.assertFalse(self.planner.load_mission(["west", "nope"], (0.0, 0.0)))
+
+    def _wait_planned(self):
+        """Akış planlama bitene kadar rotayı doldur"""
+        while self.planner.planning:
+            self.planner._fill_stream(len(self.planner.current_path), wait=True)
+
+    def test_mission_resume(self):
+        """Çok alanlı görev kontrol noktasından devam etmeli"""
+        controller = self._controller()
+        self.assertTrue(controller.start_mission(["west", "east"]))
+        self._wait_planned()
+        entries = [
+            i
+            for i, wp in enumerate(self.planner.current_path)
+            if wp.action == "blade_on"
+        ]
+        self.planner.current_waypoint_index = entries[1] + 1
+        controller._checkpoint_mission(force=True)
+
+        restarted = self._controller()
+        self.planner.reset_path()
+        self.assertTrue(restarted._resume_interrupted_mission(boot=True))
+        self.assertEqual(restarted.state, RobotState.MOWING)
+
+        # Devam indeksi rota o noktaya kadar planlanınca uygulanır
+        deadline = time.time() + 30.0
+        while self.planner.get_next_waypoint({"x": 1e6, "y": 1e6}) is None:
+            self.assertLess(time.time(), deadline)
+        self.assertEqual(self.planner.current_waypoint_index, entries[1])
+
+    def test_plan_error_not_completed(self):
+        """Planlaması hata veren görev tamamlanmış sayılmamalı"""
+        controller = self._controller()
+        controller.motor_controller = MotorController(simulate=True)
+        controller.odometry = Mock(
+            get_position_dict=Mock(return_value={"x": 0, "y": 0, "heading": 0})
+        )
+
+        with patch.object(
+            self.planner, "_plan_path", side_effect=RuntimeError("geometri hatası")
+        ):
+            self.assertTrue(controller.start_mission(["west", "east"]))
+            deadline = time.time() + 30.0
+            while controller.state == RobotState.MOWING:
+                self.assertLess(time.time(), deadline)
+                controller._handle_mowing_state()
+
+        self.assertEqual(controller.state, RobotState.ERROR)
+        self.assertIn("geometri hatası", self.planner.planning_error)
+        self.assertFalse(self.planner.planning)
+        checkpoint = controller.mission_journal.last_checkpoint()
+        self.assertEqual(checkpoint["event"], "start")
+        key = self.planner.plan_key(self.planner.areas["west"])
+        self.assertIsNone(self.planner.plan_cache.get("west", key))
+
+    def test_transit_blade_actions(self):
+        """Geçişlerde bıçak kapanmalı, alan girişlerinde açılmalı"""
+        controller = self._controller(simulated=True)
+        # Rotadan uzak poz: indeks yalnızca testte ilerletilir
+        controller.odometry = Mock(
+            get_position_dict=Mock(return_value={"x": -50, "y": -50, "heading": 0})
+        )
+        self.assertTrue(controller.start_mission(["west", "east"]))
+        self._wait_planned()
+        path = self.planner.current_path
+        entries = [i for i, wp in enumerate(path) if wp.action == "blade_on"]
+        transits = [i for i, wp in enumerate(path) if wp.action == "blade_off"]
+        self.assertEqual(len(transits), 3)
+
+        for index, cutting in (
+            (entries[0] + 1, True),
+            (transits[1] + 1, False),
+            (entries[1] + 1, True),
+            (len(path) - 1, False),
+        ):
+            self.planner.current_waypoint_index = index
+            controller._handle_mowing_state()
+            self.assertEqual(self.planner.current_waypoint_index, index)
+            self.assertEqual(controller.motor_controller.blade_running, cutting)
+            self.assertEqual(self.planner.blade_enabled(), cutting)
+
+
+if __name__ == "__main__":
+    # Test suite oluştur
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+
+    # Test sınıflarını ekle
+    test_classes = [
+        TestOrderAreas,
+        TestMissionSequencer,
+        TestPlannerMission,
+    ]
+
+    for test_class in test_classes:
+        tests = loader.loadTestsFromTestCase(test_class)
+        suite.addTests(tests)
+
+    # Test runner
+    runner = unittest.TextTestRunner(verbosity=2, descriptions=True, failfast=False)
+
+    print("🗺️  Mission Sequencer Test Suite Başlatılıyor...")
+    print("=" * 60)
+
+    result = runner.run(suite)
+
+    print("=" * 60)
+    print(f"✅ Başarılı: {result.testsRun - len(result.failures) - len(result.errors)}")
+    print(f"❌ Başarısız: {len(result.failures)}")
+    print(f"⚠️  Hata: {len(result.errors)}")
+
+    if result.wasSuccessful():
+        print("🎉 Tüm testler başarılı!")
+        sys.exit(0)
+    else:
+        print("💥 Bazı testler başarısız!")
+        sys.exit(1)
@@ -15,7 +15,13 @@ from unittest.mock import Mock, patch
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from src.core.main_controller import MainController
+from src.hardware.motor_controller import MotorController
+from src.navigation.measurement_queue import MeasurementQueue
 from src.navigation.obstacle_avoidance import ObstacleAvoidance, Obstacle, ObstacleType
+from src.navigation.path_array import Point, Waypoint
+from src.navigation.pose_history import PoseHistory
+from src.navigation.unicycle_ekf import UnicycleEKF
 
 
 class TestObstacleAvoidance(unittest.TestCase):
@@ -217,6 +223,96 @@ class TestMultiSensorFusion(unittest.TestCase):
         self.assertEqual(len(clustered), 2)
 
 
+class TestGeoreference(unittest.TestCase):
+    """Örnek anındaki pozla dünya koordinatı testleri"""
+
+    def setUp(self):
+        self.avoidance = ObstacleAvoidance(simulate=True)
+        self.avoidance.pose_history = PoseHistory()
+        # Robot 1 m/s ile x yönünde, t=10.5'te sola döner
+        self.avoidance.pose_history.append(10.0, 0.0, 0.0, 0.0)
+        self.avoidance.pose_history.append(10.5, 0.5, 0.0, 0.0)
+        self.avoidance.pose_history.append(11.0, 0.5, 0.0, math.pi / 2)
+
+    def test_lidar_uses_sample_pose(self):
+        """LIDAR taraması alındığı andaki pozla yerleştirilmeli"""
+        self.avoidance.update_lidar_data([(2.0, 0.0)], timestamp=10.25)
+        obs = self.avoidance.lidar_data[0]
+
+        self.assertAlmostEqual(obs.world_x, 2.25)
+        self.assertAlmostEqual(obs.world_y, 0.0)
+        self.assertEqual(obs.timestamp, 10.25)
+
+        self.avoidance.update_lidar_data([(2.0, 0.0)], timestamp=11.0)
+        obs = self.avoidance.lidar_data[0]
+        self.assertAlmostEqual(obs.world_x, 0.5)
+        self.assertAlmostEqual(obs.world_y, 2.0)
+
+    def test_without_pose(self):
+        """Geçmiş dışındaki örnekler robot merkezli kalmalı"""
+        self.avoidance.update_lidar_data([(2.0, 0.0)], timestamp=5.0)
+
+        self.assertIsNone(self.avoidance.lidar_data[0].world_x)
+
+    def test_cluster_keeps_world(self):
+        """Birleştirilen engeller dünya koordinatını korumalı"""
+        self.avoidance.update_ir_sensors({"ir_0": 1.0}, timestamp=10.0)
+        self.avoidance.update_lidar_data([(0.7, -0.7)], timestamp=10.0)
+        self.avoidance.fuse_sensor_data()
+
+        self.assertEqual(len(self.avoidance.detected_obstacles), 1)
+        self.assertAlmostEqual(
+            self.avoidance.detected_obstacles[0].world_y, -0.7, places=2
+        )
+
+    def test_late_pose_georeferenced(self):
+        """Poz geçmişi örnek anına yetişince engel yerleştirilmeli"""
+        self.avoidance.update_ir_sensors({"ir_1": 1.0}, timestamp=11.5)
+        obs = self.avoidance.detected_obstacles[0]
+        self.assertIsNone(obs.world_x)
+
+        self.avoidance.pose_history.append(12.0, 0.5, 1.0, math.pi / 2)
+        self.avoidance.update_ir_sensors({}, timestamp=12.0)
+        self.assertAlmostEqual(obs.world_x, 0.5 - math.sqrt(0.5))
+        self.assertAlmostEqual(obs.world_y, 0.5 + math.sqrt(0.5))
+
+    def test_controller_sample_time(self):
+        """Enkoderle dolan poz geçmişi kontrol döngüsündeki IR okumasını yerleştirmeli"""
+        history = PoseHistory()
+        self.avoidance.pose_history = history
+        queue = MeasurementQueue(UnicycleEKF(simulate=True), pose_history=history)
+        motors = MotorController(simulate=True)
+        motors.measurement_queue = queue
+        motors.set_drive_speed(0.5, 0.0)
+        motors.last_encoder_time = 10.0
+        with patch("time.time", side_effect=[10.0, 10.1, 10.2]):
+            for _ in range(3):
+                motors._update_encoders()
+        queue.process()
+        x = history.pose_at(10.2).x
+        self.assertGreater(x, 0.05)
+
+        with patch.object(MainController, "_setup_logging"):
+            controller = MainController(config_path="nonexistent_config.json")
+        controller.logger = self.avoidance.logger
+        controller.path_planner = Mock(
+            planning=False,
+            current_plan_id=None,
+            get_next_waypoint=Mock(return_value=Waypoint(Point(5.0, 0.0))),
+        )
+        controller.motor_controller = motors
+        controller.odometry = queue.odometry
+        controller.obstacle_avoidance = self.avoidance
+        self.avoidance.get_real_ir_readings = Mock(return_value={"ir_0": 1.0})
+
+        with patch("time.time", return_value=10.25):
+            controller._handle_mowing_state()
+
+        obs = self.avoidance.detected_obstacles[0]
+        self.assertEqual(obs.timestamp, 10.25)
+        self.assertAlmostEqual(obs.world_x, x + math.sqrt(0.5), places=3)
+
+
 class TestRecoveryBehavior(unittest.TestCase):
     """Recovery davranışı testleri"""
 
@@ -359,6 +455,7 @@ if __name__ == "__main__":
     test_classes = [
         TestObstacleAvoidance,
         TestMultiSensorFusion,
+        TestGeoreference,
         TestRecoveryBehavior,
         TestVelocitySmoothing,
         TestStatistics,
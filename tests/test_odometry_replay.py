@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Odometry Replay Test Suite
+Sanal saat, kayıt oynatma, RTS yumuşatıcı ve toplu Q/R ayarı testleri
+"""
+
+import unittest
+import sys
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+
+# Proje kök dizinini path'e ekle
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.navigation.kalman_odometry import KalmanOdometry, OdometrySimulator
+from src.navigation.measurement_queue import MeasurementQueue
+from src.navigation.odometry_replay import (
+    ManualClock,
+    SensorLog,
+    position_rmse,
+    replay,
+    synthesize_log,
+    tune,
+)
+from src.navigation.unicycle_ekf import UnicycleEKF
+from tests.benchmark import benchmark
+
+# Düz, dönüş, düz, ters dönüş (biçme şeridi)
+SEGMENTS = [(0.5, 0.0, 20.0), (0.3, 0.3, 10.0), (0.5, 0.0, 20.0), (0.3, -0.3, 10.0)]
+
+
+class TestManualClock(unittest.TestCase):
+    """Enjekte edilen saat testleri"""
+
+    def test_filter_uses_clock(self):
+        """Filtre zamanı time.time yerine verilen saatten almalı"""
+        clock = ManualClock(50.0)
+        odometry = UnicycleEKF(simulate=True, clock=clock)
+        self.assertEqual(odometry.last_update_time, 50.0)
+
+        clock.advance(0.1)
+        odometry.update_encoder(100, 100, 1000)
+        self.assertEqual(odometry.last_update_time, 50.1)
+        self.assertGreater(odometry.state[3], 0.0)
+        self.assertEqual(odometry.get_position().timestamp, 50.1)
+
+    def test_simulator_does_not_sleep(self):
+        """Simülatör gerçek zamanlı değilse beklememeli"""
+        odometry = KalmanOdometry(simulate=True)
+        simulator = OdometrySimulator(odometry)
+
+        with patch("time.sleep") as sleep:
+            simulator.simulate_movement(0.5, 0.1, 5.0)
+        sleep.assert_not_called()
+
+        self.assertAlmostEqual(simulator.sim_time, odometry.last_update_time)
+        error = simulator.get_error()
+        self.assertEqual(set(error), {"x_error", "y_error", "heading_error"})
+        self.assertLess(error["heading_error"], 0.1)
+
+
+class TestSensorLog(unittest.TestCase):
+    """Sensör kaydı testleri"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_sorted_by_time_and_kind(self):
+        """Satırlar zaman, sonra tür sırasına dizilmeli"""
+        log = SensorLog.from_records(
+            [(1.0, 1, [0.1, 0.0]), (1.0, 0, [5, 5, 1000]), (0.5, 2, [1, 2, 0.1])]
+        )
+        self.assertEqual(log.times.tolist(), [0.5, 1.0, 1.0])
+        self.assertEqual(log.kinds.tolist(), [2, 0, 1])
+        self.assertEqual(log.values[2].tolist(), [0.1, 0.0, 0.0])
+
+    def test_save_load_roundtrip(self):
+        """Kaydedilen log aynen geri yüklenmeli"""
+        log, _ = synthesize_log([(0.5, 0.1, 2.0)], gps_every=10)
+        path = Path(self.test_dir) / "logs" / "mission.npz"
+
+        self.assertTrue(log.save(str(path)))
+        loaded = SensorLog.load(str(path))
+        np.testing.assert_array_equal(loaded.times, log.times)
+        np.testing.assert_array_equal(loaded.kinds, log.kinds)
+        np.testing.assert_array_equal(loaded.values, log.values)
+        self.assertIsNone(SensorLog.load(str(Path(self.test_dir) / "yok.npz")))
+
+
+class TestReplay(unittest.TestCase):
+    """Kayıt oynatma ve yumuşatma testleri"""
+
+    @classmethod
+    def setUpClass(cls):
+        # Kayan tekerlekler ve 2 s'de bir GPS konumu
+        cls.log, cls.truth = synthesize_log(
+            SEGMENTS, wheel_noise=1e-2, imu_noise=0.1, gps_every=40, gps_noise=0.1
+        )
+
+    def test_matches_measurement_queue(self):
+        """Oynatma canlı kuyrukla aynı filtre sonucunu vermeli"""
+        live = UnicycleEKF(simulate=True)
+        queue = MeasurementQueue(live, record=True)
+        for t, kind, values in zip(
+            self.log.times.tolist(), self.log.kinds.tolist(), self.log.values.tolist()
+        ):
+            queue.rings[kind].push(t, *values)
+            queue.process()
+
+        result = replay(
+            SensorLog.from_records(queue.recorded), UnicycleEKF(simulate=True)
+        )
+        np.testing.assert_allclose(result.states[-1], live.state, atol=1e-12)
+        np.testing.assert_allclose(result.covariances[-1], live.P, atol=1e-12)
+        self.assertEqual(len(result.times), len(self.truth))
+        np.testing.assert_array_equal(result.times, self.truth[:, 0])
+
+    def test_ten_minutes(self):
+        """10 dakikalık kayıt baştan sona oynatılabilmeli"""
+        log, _ = synthesize_log([(0.5, 0.05, 600.0)], dt=0.05)
+        result = replay(log, UnicycleEKF(simulate=True))
+
+        self.assertEqual(len(result.times), 12001)
+
+    @benchmark
+    def test_ten_minutes_in_seconds(self):
+        """10 dakikalık kayıt birkaç saniyenin altında oynatılmalı"""
+        log, _ = synthesize_log([(0.5, 0.05, 600.0)], dt=0.05)
+        start = time.perf_counter()
+        replay(log, UnicycleEKF(simulate=True))
+        elapsed = time.perf_counter() - start
+
+        self.assertLess(elapsed, 5.0)
+
+    def test_smoother_improves_trajectory(self):
+        """RTS izi filtreden daha az belirsiz, GPS aralarında daha doğru olmalı"""
+        for odometry_class in (UnicycleEKF, KalmanOdometry):
+            with self.subTest(model=odometry_class.__name__):
+                result = replay(self.log, odometry_class(simulate=True), smooth=True)
+
+                # Son epokta yumuşatılmış ve filtre tahmini aynıdır
+                np.testing.assert_allclose(
+                    result.smoothed_states[-1], result.states[-1]
+                )
+                variance = np.trace(result.covariances[:, :3, :3], axis1=1, axis2=2)
+                smoothed_variance = np.trace(
+                    result.smoothed_covariances[:, :3, :3], axis1=1, axis2=2
+                )
+                self.assertTrue(np.all(smoothed_variance <= variance + 1e-12))
+                self.assertLess(smoothed_variance[1], variance[1])
+
+        odometry = UnicycleEKF(simulate=True)
+        odometry.wheel_noise = 1e-2  # Gürültüler kayıtla eşleşiyor
+        odometry.R_imu = np.array([[0.01]])
+        result = replay(self.log, odometry, smooth=True)
+        filtered = position_rmse(result, self.truth)
+        self.assertLess(
+            position_rmse(result, self.truth, smoothed=True), 0.8 * filtered
+        )
+
+    def test_tune_prefers_matching_noise(self):
+        """Toplu ayar gerçeğe yakın IMU gürültüsünü seçmeli"""
+        log, truth = synthesize_log(SEGMENTS, imu_noise=0.3, seed=5)
+        candidates = [
+            {"R_imu": np.array([[0.001]])},
+            {"R_imu": np.array([[0.09]])},
+        ]
+
+        scores = tune(log, lambda: UnicycleEKF(simulate=True), candidates, truth)
+        self.assertEqual(len(scores), 2)
+        self.assertLess(scores[0][0], scores[1][0])
+        self.assertIs(scores[0][1], candidates[1])
+
+
+if __name__ == "__main__":
+    # Test suite oluştur
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+
+    # Test sınıflarını ekle
+    test_classes = [
+        TestManualClock,
+        TestSensorLog,
+        TestReplay,
+    ]
+
+    for test_class in test_classes:
+        tests = loader.loadTestsFromTestCase(test_class)
+        suite.addTests(tests)
+
+    # Test runner
+    runner = unittest.TextTestRunner(verbosity=2, descriptions=True, failfast=False)
+
+    print("⏪ Odometry Replay Test Suite Başlatılıyor...")
+    print("=" * 60)
+
+    result = runner.run(suite)
+
+    print("=" * 60)
+    print(f"✅ Başarılı: {result.testsRun - len(result.failures) - len(result.errors)}")
+    print(f"❌ Başarısız: {len(result.failures)}")
+    print(f"⚠️  Hata: {len(result.errors)}")
+
+    if result.wasSuccessful():
+        print("🎉 Tüm testler başarılı!")
+        sys.exit(0)
+    else:
+        print("💥 Bazı testler başarısız!")
+        sys.exit(1)
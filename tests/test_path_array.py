@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Path Array Test Suite
+Dizi tabanlı rota (structure-of-arrays) testleri
+"""
+
+import unittest
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+# Proje kök dizinini path'e ekle
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.navigation.path_array import PathArray
+from src.navigation.path_planner import PathPlanner, Point, Waypoint, Area
+from src.navigation.polygon_geometry import polygon_to_array
+
+
+def _waypoints(n):
+    """Farklı eylem ve hızlarda test rotası"""
+    actions = ("move", "turn", "blade_off", "blade_on")
+    return [
+        Waypoint(
+            Point(float(i), float(i % 7)),
+            speed=0.5 + 0.01 * (i % 3),
+            blade_height=3 + i % 4,
+            action=actions[i % 4],
+        )
+        for i in range(n)
+    ]
+
+
+class TestPathArray(unittest.TestCase):
+    """PathArray temel davranış testleri"""
+
+    def test_waypoint_view(self):
+        """İndeks Waypoint döndürmeli, liste ile eşit olmalı"""
+        waypoints = _waypoints(20)
+        path = PathArray.from_waypoints(waypoints)
+
+        self.assertEqual(len(path), 20)
+        self.assertEqual(path[5], waypoints[5])
+        self.assertEqual(path[-1], waypoints[-1])
+        self.assertEqual(list(path), waypoints)
+        self.assertEqual(path, waypoints)
+
+    def test_slice_is_view(self):
+        """Dilimleme kopya oluşturmamalı"""
+        path = PathArray.from_waypoints(_waypoints(50))
+        tail = path[10:]
+
+        self.assertIsInstance(tail, PathArray)
+        self.assertTrue(np.shares_memory(tail.xy, path.xy))
+        self.assertTrue(np.shares_memory(tail.action, path.action))
+        self.assertEqual(tail[0], path[10])
+        self.assertEqual(path[::-1][0], path[49])
+
+    def test_concatenate(self):
+        """Birleştirme liste ve PathArray'i birlikte kabul etmeli"""
+        first = PathArray.from_waypoints(_waypoints(3))
+        second = _waypoints(4)
+
+        combined = first + second
+        self.assertEqual(len(combined), 7)
+        self.assertEqual(combined[3:], second)
+        self.assertEqual(len(second + first), 7)
+        self.assertEqual(len(PathArray.concatenate([[], first, PathArray.empty()])), 3)
+
+    def test_polygon_to_array(self):
+        """Konum dizisi kopyalanmadan kullanılmalı"""
+        path = PathArray.from_waypoints(_waypoints(10))
+        self.assertIs(polygon_to_array(path), path.xy)
+
+    def test_memory(self):
+        """Bellek kullanımı Waypoint listesinin onda birinden az olmalı"""
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        waypoints = _waypoints(20000)
+        list_bytes = tracemalloc.get_traced_memory()[0] - before
+        tracemalloc.stop()
+
+        path = PathArray.from_waypoints(waypoints)
+        self.assertLess(path.nbytes * 10, list_bytes)
+
+
+class TestPlannerPathArray(unittest.TestCase):
+    """PathPlanner entegrasyonu"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.planner = PathPlanner(
+            config_path=str(Path(self.temp_dir.name) / "areas.json")
+        )
+        self.planner.add_area(
+            Area(
+                id="array",
+                name="array",
+                boundary=[Point(0, 0), Point(12, 0), Point(12, 8), Point(0, 8)],
+                obstacles=[],
+            )
+        )
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_current_path_is_array(self):
+        """Yüklenen rota PathArray olmalı, kalan rota görünüm olmalı"""
+        self.assertTrue(self.planner.load_area("array"))
+        path = self.planner.current_path
+        self.assertIsInstance(path, PathArray)
+
+        self.planner.current_waypoint_index = 10
+        remaining = self.planner.get_remaining_path()
+        self.assertEqual(len(remaining), len(path) - 10)
+        self.assertTrue(np.shares_memory(remaining.xy, path.xy))
+
+    def test_statistics_match_list(self):
+        """İstatistikler liste ve PathArray için aynı olmalı"""
+        self.planner.load_area("array")
+        path = self.planner.current_path
+        waypoints = list(path)
+        area = self.planner.areas["array"]
+
+        self.assertAlmostEqual(
+            self.planner.estimate_path_time(path),
+            self.planner.estimate_path_time(waypoints),
+        )
+        self.assertEqual(
+            self.planner.coverage_report(path, area).covered_area,
+            self.planner.coverage_report(waypoints, area).covered_area,
+        )
+
+    def test_stripe_start_index(self):
+        """Şerit başı dizi üzerinden de bulunmalı"""
+        self.planner.load_area("array")
+        path = self.planner.current_path
+        # Dönüş manevrasının son noktası şeridin başıdır
+        turn = path.action_mask("turn")
+        last_turns = np.flatnonzero(turn[:-1] & ~turn[1:])
+        start = int(last_turns[len(last_turns) // 2])
+
+        self.assertEqual(self.planner.stripe_start_index(start + 1), start)
+        self.assertEqual(self.planner.stripe_start_index(0), 0)
+
+
+if __name__ == "__main__":
+    # Test suite oluştur
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+
+    # Test sınıflarını ekle
+    test_classes = [
+        TestPathArray,
+        TestPlannerPathArray,
+    ]
+
+    for test_class in test_classes:
+        tests = loader.loadTestsFromTestCase(test_class)
+        suite.addTests(tests)
+
+    # Test runner
+    runner = unittest.TextTestRunner(verbosity=2, descriptions=True, failfast=False)
+
+    print("🟦 Path Array Test Suite Başlatılıyor...")
+    print("=" * 60)
+
+    result = runner.run(suite)
+
+    print("=" * 60)
+    print(f"✅ Başarılı: {result.testsRun - len(result.failures) - len(result.errors)}")
+    print(f"❌ Başarısız: {len(result.failures)}")
+    print(f"⚠️  Hata: {len(result.errors)}")
+
+    if result.wasSuccessful():
+        print("🎉 Tüm testler başarılı!")
+        sys.exit(0)
+    else:
+        print("💥 Bazı testler başarısız!")
+        sys.exit(1)
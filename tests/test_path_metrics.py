@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Path Metrics Test Suite
+Vektörel rota metrikleri ve ivme sınırlı süre tahmini testleri
+"""
+
+import unittest
+import sys
+import math
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Proje kök dizinini path'e ekle
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.navigation.path_array import PathArray
+from src.navigation.path_metrics import path_metrics
+from src.navigation.path_planner import PathPlanner, Point, Waypoint, Area
+from tests.benchmark import benchmark
+
+
+class TestPathMetrics(unittest.TestCase):
+    """Metrik hesaplama testleri"""
+
+    def test_trapezoid_profile(self):
+        """Düz segment: hızlanma + seyir + yavaşlama"""
+        metrics = path_metrics(np.array([[0, 0], [10, 0]]))
+
+        # 0.5 m/s'ye 0.5 m/s² ile 1 s'de çıkılır (0.25 m); seyir 9.5 m
+        self.assertAlmostEqual(metrics.total_time, 1.0 + 19.0 + 1.0)
+        self.assertAlmostEqual(metrics.total_length, 10.0)
+
+    def test_short_segment_triangle(self):
+        """Kısa segmentte seyir hızına ulaşılamamalı"""
+        metrics = path_metrics(np.array([[0, 0], [0.1, 0]]))
+
+        # Tepe hız sqrt(a * L) = sqrt(0.05)
+        self.assertAlmostEqual(metrics.total_time, 2 * math.sqrt(0.05) / 0.5)
+
+    def test_pivot_corner(self):
+        """Keskin köşede durup yerinde dönmeli"""
+        metrics = path_metrics(np.array([[0, 0], [10, 0], [10, 10]]), max_angular=1.0)
+
+        self.assertEqual(metrics.vertex_speed[1], 0.0)
+        self.assertAlmostEqual(metrics.pivot_time[1], math.pi / 2)
+        self.assertAlmostEqual(metrics.total_time, 2 * 21.0 + math.pi / 2)
+
+    def test_curvature_speed_limit(self):
+        """Sık örneklenmiş yayda hız yanal ivme ile sınırlanmalı"""
+        radius = 0.3
+        angles = np.linspace(0, math.pi, 60)
+        arc = radius * np.stack((np.cos(angles), np.sin(angles)), axis=1)
+        straight = np.array([[radius, -5.0]])
+        path = np.vstack((straight, arc))
+
+        metrics = path_metrics(path, max_lateral_accel=0.1)
+        self.assertAlmostEqual(
+            np.median(np.abs(metrics.curvature[2:-1])), 1 / radius, places=2
+        )
+        self.assertLessEqual(
+            metrics.vertex_speed[2:].max(), math.sqrt(0.1 * radius) + 1e-3
+        )
+
+    def test_zero_length_segments(self):
+        """Tekrarlanan nokta sahte yön değişimi üretmemeli"""
+        metrics = path_metrics(np.array([[0, 0], [5, 0], [5, 0], [10, 0]]))
+
+        np.testing.assert_allclose(metrics.heading_change, 0.0)
+        self.assertAlmostEqual(metrics.total_time, 21.0)
+
+    def _long_path(self):
+        """100 bin waypoint'lik rastgele yürüyüş"""
+        xy = np.cumsum(np.random.default_rng(1).normal(size=(100000, 2)), axis=0)
+        n = len(xy)
+        return PathArray(xy, np.full(n, 0.5), np.full(n, 5), np.zeros(n))
+
+    def test_long_path(self):
+        """100 bin waypoint tek geçişte hesaplanmalı"""
+        path = self._long_path()
+
+        metrics = path_metrics(path[:])
+
+        self.assertEqual(len(metrics.cumulative_time), len(path))
+        self.assertTrue(np.all(np.diff(metrics.cumulative_time) >= 0))
+
+    @benchmark
+    def test_speed(self):
+        """100 bin waypoint yarım saniyenin altında hesaplanmalı"""
+        path = self._long_path()
+
+        start = time.perf_counter()
+        path_metrics(path[:])
+        elapsed = time.perf_counter() - start
+
+        self.assertLess(elapsed, 0.5)
+
+
+class TestPlannerMetrics(unittest.TestCase):
+    """PathPlanner entegrasyonu"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.planner = PathPlanner(
+            config_path=str(Path(self.temp_dir.name) / "areas.json")
+        )
+        self.planner.add_area(
+            Area(
+                id="metrics",
+                name="metrics",
+                boundary=[Point(0, 0), Point(10, 0), Point(10, 6), Point(0, 6)],
+                obstacles=[],
+            )
+        )
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_time_remaining(self):
+        """Kalan süre ilerledikçe azalmalı ve toplam süreyle başlamalı"""
+        self.planner.load_area("metrics")
+        total = self.planner.estimate_path_time(self.planner.current_path)
+
+        progress = self.planner.get_progress()
+        self.assertAlmostEqual(progress["time_remaining"], total)
+
+        self.planner.current_waypoint_index = len(self.planner.current_path) // 2
+        halfway = self.planner.get_progress()
+        self.assertLess(halfway["time_remaining"], total)
+        self.assertGreater(halfway["time_remaining"], 0.0)
+        self.assertLess(halfway["distance_remaining"], progress["distance_remaining"])
+
+    def test_statistics(self):
+        """İstatistikler kinematik süre tahminini kullanmalı"""
+        path = self.planner.current_path = self.planner.area_path(
+            self.planner.areas["metrics"]
+        )
+        stats = self.planner.get_path_statistics(path, self.planner.areas["metrics"])
+
+        self.assertAlmostEqual(
+            stats["total_length"], self.planner.calculate_path_length(list(path))
+        )
+        self.assertGreater(stats["estimated_time"], stats["total_length"] / 0.5)
+        self.assertLess(stats["average_speed"], 0.5)
+        self.assertGreater(stats["max_curvature"], 0.0)
+
+    def test_continuity(self):
+        """Süreklilik kontrolü PathArray ile de çalışmalı"""
+        path = PathArray.from_waypoints(
+            [Waypoint(Point(0, 0)), Waypoint(Point(1, 0)), Waypoint(Point(4, 0))]
+        )
+        self.assertTrue(self.planner.check_path_continuity(path, 3.0))
+        self.assertFalse(self.planner.check_path_continuity(path, 2.0))
+        self.assertTrue(self.planner.check_path_continuity(path[:1], 0.1))
+
+
+if __name__ == "__main__":
+    # Test suite oluştur
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+
+    # Test sınıflarını ekle
+    test_classes = [
+        TestPathMetrics,
+        TestPlannerMetrics,
+    ]
+
+    for test_class in test_classes:
+        tests = loader.loadTestsFromTestCase(test_class)
+        suite.addTests(tests)
+
+    # Test runner
+    runner = unittest.TextTestRunner(verbosity=2, descriptions=True, failfast=False)
+
+    print("🟪 Path Metrics Test Suite Başlatılıyor...")
+    print("=" * 60)
+
+    result = runner.run(suite)
+
+    print("=" * 60)
+    print(f"✅ Başarılı: {result.testsRun - len(result.failures) - len(result.errors)}")
+    print(f"❌ Başarısız: {len(result.failures)}")
+    print(f"⚠️  Hata: {len(result.errors)}")
+
+    if result.wasSuccessful():
+        print("🎉 Tüm testler başarılı!")
+        sys.exit(0)
+    else:
+        print("💥 Bazı testler başarısız!")
+        sys.exit(1)
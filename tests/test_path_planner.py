@@ -8,6 +8,8 @@ import unittest
 import sys
 import math
 import json
+import os
+import tempfile
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -16,6 +18,12 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.navigation.path_planner import PathPlanner, Point, Waypoint, Area, PatternType
+from src.navigation.waypoint_index import WaypointIndex
+from src.navigation.polygon_geometry import (
+    edge_arrays,
+    polygon_to_array,
+    segments_cross_edges,
+)
 
 
 class TestPathPlanner(unittest.TestCase):
@@ -123,6 +131,35 @@ class TestPathPlanner(unittest.TestCase):
             self.planner.point_in_polygon(last_point, self.test_area.boundary)
         )
 
+    def test_lawn_mower_concave_area(self):
+        """L şeklindeki alanda şeritler kaybolmamalı"""
+        l_area = Area(
+            id="l_shape_area",
+            name="l_shape",
+            boundary=[
+                Point(0, 0),
+                Point(15, 0),
+                Point(15, 8),
+                Point(8, 8),
+                Point(8, 15),
+                Point(0, 15),
+            ],
+            obstacles=[],
+            pattern=PatternType.LAWN_MOWER,
+        )
+
+        path = self.planner._lawn_mower_pattern(l_area)
+
+        # Üst koldaki (y > 8) şeritler de planlanmalı
+        upper_points = [wp.position for wp in path if wp.position.y > 8.5]
+        self.assertGreater(len(upper_points), 0)
+
+        # Hiçbir nokta alan dışında olmamalı
+        for wp in path:
+            self.assertTrue(self.planner.point_in_polygon(wp.position, l_area.boundary))
+            if wp.position.y > 8.5:
+                self.assertLessEqual(wp.position.x, 8.0)
+
     def test_spiral_pattern(self):
         """Spiral desen oluşturma testi"""
         spiral_area = Area(
@@ -162,6 +199,17 @@ class TestPathPlanner(unittest.TestCase):
         result = self.planner.point_in_polygon(boundary_point, polygon)
         # Sınır durumu implementation'a bağlı
 
+    def test_point_in_polygon_cache(self):
+        """Aynı poligon için hazırlanmış poligon yeniden kullanılmalı"""
+        polygon = [Point(0, 0), Point(4, 0), Point(4, 4), Point(0, 4)]
+
+        self.planner.point_in_polygon(Point(2, 2), polygon)
+        first = self.planner._prepared_polygon(polygon)
+        self.planner.point_in_polygon(Point(1, 3), list(polygon))
+
+        self.assertIs(first, self.planner._prepared_polygon(polygon))
+        self.assertEqual(len(self.planner._polygon_cache), 1)
+
     def test_obstacle_avoidance_planning(self):
         """Engel kaçınmalı planlama testi"""
         # Engelli alan oluştur
@@ -185,6 +233,48 @@ class TestPathPlanner(unittest.TestCase):
             for obstacle in obstacle_area.obstacles:
                 self.assertFalse(self.planner.point_in_polygon(wp.position, obstacle))
 
+    def test_boustrophedon_planning(self):
+        """Hücre ayrıştırmalı desen engellerin içinden geçmemeli"""
+        obstacle_area = Area(
+            id="boustrophedon_test_area",
+            name="boustrophedon_test",
+            boundary=[Point(0, 0), Point(20, 0), Point(20, 15), Point(0, 15)],
+            obstacles=[
+                [Point(5, 5), Point(8, 5), Point(8, 8), Point(5, 8)],
+                [Point(12, 4), Point(15, 4), Point(15, 10), Point(12, 10)],
+            ],
+            pattern=PatternType.BOUSTROPHEDON,
+        )
+
+        path = self.planner.generate_path(obstacle_area)
+
+        self.assertGreater(len(path), 0)
+        self.assertTrue(self.planner.validate_path(path, obstacle_area))
+
+        # Ardışık waypoint'ler arasındaki hiçbir segment engeli kesmemeli
+        xy = polygon_to_array(path)
+        edges = edge_arrays([polygon_to_array(obs) for obs in obstacle_area.obstacles])
+        self.assertFalse(segments_cross_edges(xy[:-1], xy[1:], edges).any())
+
+    def test_boustrophedon_cells(self):
+        """Ortadaki engel alanı birden fazla hücreye bölmeli"""
+        area = Area(
+            id="cell_test_area",
+            name="cell_test",
+            boundary=self.test_area.boundary,
+            obstacles=[[Point(3, 3), Point(7, 3), Point(7, 7), Point(3, 7)]],
+            pattern=PatternType.BOUSTROPHEDON,
+        )
+
+        cells = self.planner._decompose_cells(
+            area,
+            polygon_to_array(area.boundary),
+            [polygon_to_array(obs) for obs in area.obstacles],
+        )
+
+        # Alt, sol, sağ ve üst hücreler
+        self.assertEqual(len(cells), 4)
+
     def test_path_optimization(self):
         """Path optimizasyonu testi"""
         # Basit zigzag path oluştur
@@ -253,6 +343,42 @@ class TestPathValidation(unittest.TestCase):
         is_valid = self.planner.validate_path(invalid_path, self.test_area)
         self.assertFalse(is_valid)
 
+    def test_prepared_polygon_cache(self):
+        """Hazırlanmış poligonlar önbellekten gelmeli, geometri değişince yenilenmeli"""
+        first = self.test_area.prepared_boundary()
+        self.assertIs(first, self.test_area.prepared_boundary())
+
+        self.test_area.boundary = [
+            Point(0, 0),
+            Point(20, 0),
+            Point(20, 20),
+            Point(0, 20),
+        ]
+        second = self.test_area.prepared_boundary()
+
+        self.assertIsNot(first, second)
+        self.assertTrue(second.contains(Point(15, 15)))
+
+    def test_validate_path_with_obstacles(self):
+        """Engel içindeki waypoint path'i geçersiz kılmalı"""
+        area = Area(
+            id="validation_obstacle_area",
+            name="validation_obstacle",
+            boundary=self.test_area.boundary,
+            obstacles=[[Point(4, 4), Point(6, 4), Point(6, 6), Point(4, 6)]],
+        )
+
+        self.assertTrue(
+            self.planner.validate_path(
+                [Waypoint(Point(1, 1)), Waypoint(Point(8, 8))], area
+            )
+        )
+        self.assertFalse(
+            self.planner.validate_path(
+                [Waypoint(Point(1, 1)), Waypoint(Point(5, 5))], area
+            )
+        )
+
     def test_path_continuity(self):
         """Path süreklilik testi"""
         # Kesikli path
@@ -285,8 +411,13 @@ class TestPathValidation(unittest.TestCase):
 
         coverage = self.planner.calculate_coverage(grid_path, self.test_area)
 
-        # Yüksek kapsama olmalı
-        self.assertGreater(coverage, 0.8)  # %80'in üstü
+        # 1 m aralıklı sütunlar 0.5 m bıçakla alanın ancak yarısını biçer
+        self.assertGreater(coverage, 0.4)
+        self.assertLess(coverage, 0.8)
+
+        # Planlanan biçerdöver rotası alanın neredeyse tamamını biçmeli
+        path = self.planner._plan_path(self.test_area)
+        self.assertGreater(self.planner.calculate_coverage(path, self.test_area), 0.95)
 
     def test_path_length_calculation(self):
         """Path uzunluğu hesaplama testi"""
@@ -317,6 +448,7 @@ class TestPatternGeneration(unittest.TestCase):
             PatternType.LAWN_MOWER,
             PatternType.SPIRAL,
             PatternType.PERIMETER_FIRST,
+            PatternType.BOUSTROPHEDON,
         ]
 
         for pattern in patterns:
@@ -344,6 +476,35 @@ class TestPatternGeneration(unittest.TestCase):
         # Dar şerit daha fazla waypoint üretmeli
         self.assertGreater(len(narrow_path), len(wide_path))
 
+    def test_stripe_turn_maneuvers(self):
+        """Şerit geçişleri alan içinde kalan dönüş manevralarıyla yapılmalı"""
+        path = self.planner._plan_path(self.square_area)
+        report = self.planner.last_turn_report
+
+        self.assertGreater(report["turn_count"], 0)
+        self.assertEqual(report["pivot_count"], 0)
+        self.assertGreater(report["added_length"], 0.0)
+        self.assertTrue(self.planner.validate_path(path, self.square_area))
+
+        # Dönüş noktaları arasında keskin köşe olmamalı
+        turn_points = [wp for wp in path if wp.action == "turn"]
+        self.assertGreater(len(turn_points), report["turn_count"])
+
+    def test_estimate_completion_time(self):
+        """Süre tahmini rota ve dönüş sürelerini içermeli"""
+        self.planner.areas[self.square_area.id] = self.square_area
+        path = self.planner._plan_path(self.square_area)
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            self.planner.plan_cache.cache_dir = Path(cache_dir)
+            minutes = self.planner.estimate_completion_time(self.square_area.id)
+        stripe_time = self.planner.calculate_path_length(path) / 0.5
+
+        self.assertAlmostEqual(
+            minutes * 60, self.planner.estimate_path_time(path), places=6
+        )
+        self.assertGreater(minutes * 60, stripe_time)
+
     def test_boundary_following(self):
         """Sınır takip etme testi"""
         perimeter_path = self.planner.generate_perimeter_path(
@@ -408,6 +569,202 @@ class TestUtilityFunctions(unittest.TestCase):
         self.assertAlmostEqual(manhattan, 7.0, places=2)
 
 
+class TestWaypointIndex(unittest.TestCase):
+    """Waypoint uzamsal indeks testleri"""
+
+    def setUp(self):
+        self.planner = PathPlanner(config_path="nonexistent_test_config.json")
+        area = Area(
+            id="index_area",
+            name="index_test",
+            boundary=[Point(0, 0), Point(30, 0), Point(30, 20), Point(0, 20)],
+            obstacles=[],
+        )
+        self.planner.current_path = self.planner.generate_path(area)
+
+    def test_matches_linear_scan(self):
+        """Izgara sorgusu doğrusal tarama ile aynı sonucu vermeli"""
+        path = self.planner.current_path
+        index = WaypointIndex(path, cell_size=0.5)
+
+        for x, y, start in [(0.3, 0.3, 0), (29.5, 5.1, 10), (15, 10, 0), (3, 7, 40)]:
+            stop = start + 50
+            expected = None
+            best = None
+            for i in range(start, min(stop, len(path))):
+                d = Point(x, y).distance_to(path[i].position)
+                if d <= 1.0 and (best is None or d < best):
+                    expected, best = i, d
+
+            self.assertEqual(index.nearest_forward(x, y, start, stop, 1.0), expected)
+
+    def test_reacquire_after_detour(self):
+        """Sapma sonrası ilerideki waypoint'e ulaşınca rota yeniden yakalanmalı"""
+        path = self.planner.current_path
+        target = 12
+        position = path[target].position
+
+        self.planner.get_next_waypoint({"x": position.x, "y": position.y})
+
+        self.assertEqual(self.planner.current_waypoint_index, target + 1)
+
+    def test_no_jump_beyond_lookahead(self):
+        """İleri bakış penceresinin dışındaki waypoint'ler atlanmamalı"""
+        self.planner.lookahead_waypoints = 5
+        position = self.planner.current_path[30].position
+
+        self.planner.get_next_waypoint({"x": position.x, "y": position.y})
+
+        self.assertEqual(self.planner.current_waypoint_index, 0)
+
+    def test_heading_filter(self):
+        """Ters yöndeki segmentin waypoint'i yeniden yakalanmamalı"""
+        index = WaypointIndex([(0, 0), (4, 0), (4, 0.45), (0, 0.45)])
+        self.assertEqual(index.headings.tolist()[:2], [0.0, math.pi / 2])
+
+        self.assertEqual(index.nearest_forward(0.1, 0.4, 0, 4, 0.2), 3)
+        self.assertIsNone(index.nearest_forward(0.1, 0.4, 0, 4, 0.2, heading=0.0))
+        self.assertEqual(index.nearest_forward(0.1, 0.4, 0, 4, 0.2, heading=math.pi), 3)
+
+    def test_drive_planned_path_without_jumps(self):
+        """Rota tam sürüldüğünde indeks hiçbir zaman ileri atlamamalı"""
+        for pattern in (
+            PatternType.LAWN_MOWER,
+            PatternType.SPIRAL,
+            PatternType.PERIMETER_FIRST,
+        ):
+            with self.subTest(pattern=pattern.value):
+                with tempfile.TemporaryDirectory() as temp_dir:
+                    planner = PathPlanner(
+                        config_path=str(Path(temp_dir) / "areas.json")
+                    )
+                    planner.add_area(
+                        Area(
+                            id="drive",
+                            name="drive",
+                            boundary=[
+                                Point(0, 0),
+                                Point(8, 0),
+                                Point(8, 5.6),
+                                Point(0, 5.6),
+                            ],
+                            obstacles=[],
+                            pattern=pattern,
+                        )
+                    )
+                    planner.load_area("drive")
+                    self._drive(planner)
+
+    def _drive(self, planner, step=0.05):
+        """Rotayı segment segment sür, her adımda indeks en fazla 1 artmalı"""
+        points = planner.current_path.xy.copy()
+        previous = planner.current_waypoint_index
+        for start, end in zip(points[:-1], points[1:]):
+            delta = end - start
+            length = math.hypot(*delta)
+            heading = math.atan2(delta[1], delta[0])
+            for k in range(1, max(1, math.ceil(length / step)) + 1):
+                x, y = start + delta * min(1.0, k * step / length if length else 1)
+                planner.get_next_waypoint({"x": x, "y": y, "heading": heading})
+                index = planner.current_waypoint_index
+                self.assertLessEqual(index, previous + 1, f"{previous} -> {index}")
+                previous = index
+
+        self.assertEqual(previous, len(points))
+
+    def test_reacquire_after_detour_on_stripe(self):
+        """Engelden dönen robot aynı yöndeki ileri waypoint'i yakalamalı"""
+        path = self.planner.current_path
+        self.planner.current_waypoint_index = 3
+        target = path[6].position
+        following = path[7].position
+        heading = math.atan2(following.y - target.y, following.x - target.x)
+
+        # Ters yönde gelirken yakalanmaz, segment yönünde gelirken yakalanır
+        position = {"x": target.x, "y": target.y, "heading": heading + math.pi}
+        self.planner.get_next_waypoint(position)
+        self.assertEqual(self.planner.current_waypoint_index, 3)
+
+        position["heading"] = heading
+        self.planner.get_next_waypoint(position)
+        self.assertEqual(self.planner.current_waypoint_index, 7)
+
+
+class TestPlanCache(unittest.TestCase):
+    """Rota önbelleği testleri"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.config_path = str(Path(self.temp_dir.name) / "areas.json")
+        self.planner = PathPlanner(config_path=self.config_path)
+        self.planner.add_area(
+            Area(
+                id="cache_area",
+                name="cache_test",
+                boundary=[Point(0, 0), Point(12, 0), Point(12, 8), Point(0, 8)],
+                obstacles=[],
+            )
+        )
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _cache_files(self):
+        return sorted(self.planner.plan_cache.cache_dir.glob("*.npz"))
+
+    def test_plan_survives_restart(self):
+        """Önbellekten yüklenen rota planlanan ile aynı olmalı"""
+        self.assertTrue(self.planner.load_area("cache_area"))
+        planned = self.planner.current_path
+        self.assertEqual(len(self._cache_files()), 1)
+
+        restarted = PathPlanner(config_path=self.config_path)
+        with patch.object(restarted, "_plan_path") as plan_path:
+            self.assertTrue(restarted.load_area("cache_area"))
+            plan_path.assert_not_called()
+
+        self.assertEqual(restarted.current_plan_hash, self.planner.current_plan_hash)
+        self.assertEqual(restarted.current_path, planned)
+
+    def test_invalidate_on_area_change(self):
+        """Alan geometrisi değişince eski kayıt silinmeli"""
+        self.planner.load_area("cache_area")
+        old_hash = self.planner.current_plan_hash
+
+        area = self.planner.areas["cache_area"]
+        area.boundary = [Point(0, 0), Point(14, 0), Point(14, 8), Point(0, 8)]
+        self.planner._save_areas()
+
+        self.assertEqual(self._cache_files(), [])
+        self.assertNotEqual(self.planner.plan_key(area), old_hash)
+
+    def test_invalidate_on_area_removal(self):
+        """Silinen alanın kayıtları diskte kalmamalı"""
+        self.planner.load_area("cache_area")
+        self.assertEqual(len(self._cache_files()), 1)
+
+        self.planner.remove_area("cache_area")
+
+        self.assertEqual(self._cache_files(), [])
+        self.assertNotIn("cache_area", PathPlanner(self.config_path).areas)
+
+    def test_lru_eviction(self):
+        """Kayıt sayısı sınırı aşılınca en eski kayıt silinmeli"""
+        cache = self.planner.plan_cache
+        cache.max_entries = 2
+        path = [Waypoint(Point(0, 0)), Waypoint(Point(1, 0), action="turn")]
+
+        for age, key in enumerate(("a" * 64, "b" * 64)):
+            cache.put("lru", key, path)
+            stamp = 1_000_000 + age
+            os.utime(cache._file_name("lru", key), (stamp, stamp))
+        cache.put("lru", "c" * 64, path)
+
+        self.assertEqual(len(self._cache_files()), 2)
+        self.assertIsNone(cache.get("lru", "a" * 64))
+        self.assertEqual(cache.get("lru", "c" * 64)["action"].tolist(), [0, 1])
+
+
 class TestIntegration(unittest.TestCase):
     """Entegrasyon testleri"""
 
@@ -493,6 +850,8 @@ if __name__ == "__main__":
         TestPathValidation,
         TestPatternGeneration,
         TestUtilityFunctions,
+        TestWaypointIndex,
+        TestPlanCache,
         TestIntegration,
     ]
 
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Path Simplify Test Suite
+Douglas-Peucker rota sadeleştirme testleri
+"""
+
+import unittest
+import sys
+import math
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+# Proje kök dizinini path'e ekle
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.navigation.path_array import PathArray
+from src.navigation.path_planner import PathPlanner, Point, Waypoint, Area
+from src.navigation.path_simplify import rdp_mask, simplify_path
+
+
+def _max_deviation(points, simplified):
+    """Orijinal noktaların sadeleştirilmiş rotaya en büyük uzaklığı"""
+    worst = 0.0
+    for p in points:
+        best = math.inf
+        for a, b in zip(simplified[:-1], simplified[1:]):
+            seg = b - a
+            t = np.clip(np.dot(p - a, seg) / max(np.dot(seg, seg), 1e-18), 0, 1)
+            best = min(best, float(np.hypot(*(p - a - t * seg))))
+        worst = max(worst, best)
+    return worst
+
+
+class TestRdp(unittest.TestCase):
+    """Douglas-Peucker çekirdeği testleri"""
+
+    def test_collinear(self):
+        """Doğru üzerindeki ara noktalar atılmalı"""
+        points = np.stack((np.linspace(0, 10, 21), np.zeros(21)), axis=1)
+        mask = rdp_mask(points, 0.01)
+
+        self.assertEqual(np.flatnonzero(mask).tolist(), [0, 20])
+
+    def test_error_bound(self):
+        """Sapma toleransı aşmamalı"""
+        rng = np.random.default_rng(3)
+        points = np.cumsum(rng.normal(size=(300, 2)), axis=0)
+        mask = rdp_mask(points, 0.5)
+
+        self.assertLess(mask.sum(), len(points))
+        self.assertLessEqual(_max_deviation(points, points[mask]), 0.5 + 1e-9)
+
+    def test_backtracking_kept(self):
+        """Uç noktaların ötesine geri dönüş atlanmamalı"""
+        points = np.array([[0, 0], [10, 0], [5, 0]], dtype=float)
+        mask = rdp_mask(points, 0.1)
+
+        self.assertTrue(mask.all())
+
+    def test_keep_mask(self):
+        """Zorunlu noktalar korunmalı"""
+        points = np.stack((np.arange(10.0), np.zeros(10)), axis=1)
+        keep = np.zeros(10, dtype=bool)
+        keep[4] = True
+
+        self.assertEqual(
+            np.flatnonzero(rdp_mask(points, 0.1, keep)).tolist(), [0, 4, 9]
+        )
+
+
+class TestSimplifyPath(unittest.TestCase):
+    """Waypoint özellikleriyle sadeleştirme testleri"""
+
+    def test_attribute_changes_kept(self):
+        """Hız ve eylem değişimleri korunmalı"""
+        path = [Waypoint(Point(float(i), 0.0)) for i in range(10)]
+        path[3].action = "blade_off"
+        for wp in path[6:]:
+            wp.speed = 0.3
+
+        simplified = simplify_path(path, 0.05)
+        xs = [wp.position.x for wp in simplified]
+
+        self.assertEqual(xs, [0.0, 2.0, 3.0, 4.0, 5.0, 6.0, 9.0])
+        self.assertEqual(simplified[2].action, "blade_off")
+        self.assertEqual(simplified[-1].speed, 0.3)
+
+
+class TestPlannerOptimize(unittest.TestCase):
+    """PathPlanner.optimize_path entegrasyonu"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.planner = PathPlanner(
+            config_path=str(Path(self.temp_dir.name) / "areas.json")
+        )
+        self.area = Area(
+            id="simplify",
+            name="simplify",
+            boundary=[Point(0, 0), Point(20, 0), Point(20, 10), Point(0, 10)],
+            obstacles=[],
+        )
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _unsimplified(self, produce):
+        """Sadeleştirme kapalıyken üretilen rota"""
+        ratio = self.planner.simplify_ratio
+        self.planner.simplify_ratio = 0.0
+        try:
+            return produce()
+        finally:
+            self.planner.simplify_ratio = ratio
+
+    def test_stripe_reduction(self):
+        """Şerit deseni en az 10 kat küçülmeli, kapsama değişmemeli"""
+        raw = self._unsimplified(
+            lambda: self.planner.generate_lawn_mower_pattern(self.area)
+        )
+        path = self.planner.generate_lawn_mower_pattern(self.area)
+
+        self.assertIsInstance(path, list)
+        self.assertGreaterEqual(len(raw), 10 * len(path))
+        self.assertAlmostEqual(
+            self.planner.calculate_path_length(path),
+            self.planner.calculate_path_length(raw),
+        )
+        self.assertAlmostEqual(
+            self.planner.coverage_report(path, self.area).coverage,
+            self.planner.coverage_report(raw, self.area).coverage,
+            places=3,
+        )
+        # Üretilen rota zaten sadeleştirilmiş
+        self.assertEqual(len(self.planner.optimize_path(path)), len(path))
+
+    def test_planned_path_simplified(self):
+        """Planlanan, önbelleğe yazılan ve akışla gelen rota sadeleştirilmeli"""
+        raw = PathArray.from_waypoints(
+            self._unsimplified(lambda: self.planner._plan_path(self.area))
+        )
+        path = PathArray.from_waypoints(self.planner._plan_path(self.area))
+        chunks = list(self.planner.iter_plan(self.area, chunk_size=7))
+
+        self.assertLess(len(path), len(raw))
+        self.assertEqual(PathArray.concatenate(chunks), path)
+        self.assertLessEqual(_max_deviation(raw.xy, path.xy), 0.05 + 1e-9)
+        # Şerit başları (dönüşten sonraki ilk waypoint) korunur
+        turns = raw.action_mask("turn")
+        raw_entries = raw.xy[1:][turns[:-1] & ~turns[1:]]
+        turns = path.action_mask("turn")
+        np.testing.assert_array_equal(path.xy[1:][turns[:-1] & ~turns[1:]], raw_entries)
+
+        self.planner.area_path(self.area)
+        key = self.planner.plan_key(self.area)
+        cached = self.planner.plan_cache.get(self.area.id, key)
+        np.testing.assert_array_equal(cached["xy"], path.xy)
+
+    def test_tolerance_from_blade_width(self):
+        """Tolerans bıçak genişliğine bağlı olmalı"""
+        angles = np.linspace(0, math.pi, 200)
+        arc = PathArray.from_waypoints(
+            [Waypoint(Point(5 * math.cos(a), 5 * math.sin(a))) for a in angles]
+        )
+
+        narrow = self.planner.optimize_path(arc)
+        self.planner.blade_width = 2.0
+        wide = self.planner.optimize_path(arc)
+
+        self.assertIsInstance(narrow, PathArray)
+        self.assertLess(len(wide), len(narrow))
+        self.assertLessEqual(_max_deviation(arc.xy, narrow.xy), 0.05 + 1e-9)
+
+
+if __name__ == "__main__":
+    # Test suite oluştur
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+
+    # Test sınıflarını ekle
+    test_classes = [
+        TestRdp,
+        TestSimplifyPath,
+        TestPlannerOptimize,
+    ]
+
+    for test_class in test_classes:
+        tests = loader.loadTestsFromTestCase(test_class)
+        suite.addTests(tests)
+
+    # Test runner
+    runner = unittest.TextTestRunner(verbosity=2, descriptions=True, failfast=False)
+
+    print("🟧 Path Simplify Test Suite Başlatılıyor...")
+    print("=" * 60)
+
+    result = runner.run(suite)
+
+    print("=" * 60)
+    print(f"✅ Başarılı: {result.testsRun - len(result.failures) - len(result.errors)}")
+    print(f"❌ Başarısız: {len(result.failures)}")
+    print(f"⚠️  Hata: {len(result.errors)}")
+
+    if result.wasSuccessful():
+        print("🎉 Tüm testler başarılı!")
+        sys.exit(0)
+    else:
+        print("💥 Bazı testler başarısız!")
+        sys.exit(1)
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Path Stream Test Suite
+Arka planda parça parça rota üretimi ve ileri bakış tamponu testleri
+"""
+
+import unittest
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Proje kök dizinini path'e ekle
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.navigation.path_array import PathArray
+from src.navigation.path_planner import PathPlanner, PatternType, Point, Area
+from src.navigation.path_stream import PathStream
+
+
+def _chunks(count, produced):
+    """Üretilen parça sayısını kaydeden test üreteci"""
+    for i in range(count):
+        produced.append(i)
+        yield PathArray(np.full((2, 2), float(i)), [0.5] * 2, [5] * 2, [0] * 2)
+
+
+class TestPathStream(unittest.TestCase):
+    """PathStream tampon testleri"""
+
+    def test_bounded_buffer(self):
+        """Üretici tampon dolunca beklemeli"""
+        produced = []
+        stream = PathStream(_chunks(100, produced), buffer_chunks=2)
+        time.sleep(0.2)
+
+        # Tampondaki 2 parça + put'ta bekleyen 1 parça
+        self.assertLessEqual(len(produced), 3)
+
+        chunks = []
+        while not stream.done:
+            chunk = stream.get(block=True, timeout=1.0)
+            if chunk is not None:
+                chunks.append(chunk)
+        self.assertEqual(len(chunks), 100)
+        self.assertEqual(chunks[-1][0].position.x, 99.0)
+
+    def test_error(self):
+        """Üretici hatası akışı bitirmeli"""
+
+        def failing():
+            yield PathArray.empty()
+            raise RuntimeError("plan hatası")
+
+        stream = PathStream(failing())
+        self.assertIsNotNone(stream.get(block=True, timeout=1.0))
+        self.assertIsNone(stream.get(block=True, timeout=1.0))
+        self.assertTrue(stream.done)
+        self.assertIsInstance(stream.error, RuntimeError)
+
+    def test_cancel(self):
+        """İptal üretici thread'i durdurmalı"""
+        produced = []
+        stream = PathStream(_chunks(100, produced), buffer_chunks=1)
+        stream.cancel()
+        stream.join(timeout=1.0)
+
+        self.assertFalse(stream._thread.is_alive())
+        self.assertIsNone(stream.get())
+        self.assertLess(len(produced), 100)
+
+
+class TestPlannerStream(unittest.TestCase):
+    """PathPlanner akış planlama testleri"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.planner = PathPlanner(
+            config_path=str(Path(self.temp_dir.name) / "areas.json")
+        )
+        self.area = Area(
+            id="field",
+            name="field",
+            boundary=[Point(0, 0), Point(80, 0), Point(80, 60), Point(0, 60)],
+            obstacles=[],
+        )
+        self.planner.add_area(self.area)
+
+    def tearDown(self):
+        self.planner.cancel_stream()
+        self.temp_dir.cleanup()
+
+    def test_chunks_match_full_plan(self):
+        """Parçalar birleşince tam planla aynı olmalı"""
+        obstacle = [Point(30, 20), Point(40, 20), Point(40, 30), Point(30, 30)]
+        for pattern in (
+            PatternType.LAWN_MOWER,
+            PatternType.PERIMETER_FIRST,
+            PatternType.BOUSTROPHEDON,
+        ):
+            area = Area(
+                id=pattern.value,
+                name=pattern.value,
+                boundary=self.area.boundary,
+                obstacles=[obstacle],
+                pattern=pattern,
+            )
+            with self.subTest(pattern=pattern):
+                chunks = list(self.planner.iter_plan(area, chunk_size=50))
+                self.assertTrue(all(len(chunk) <= 50 for chunk in chunks))
+                self.assertEqual(
+                    PathArray.concatenate(chunks), self.planner._plan_path(area)
+                )
+
+    def test_streamed_mission(self):
+        """Rota parça parça yüklenmeli, sonunda tam rota önbelleğe yazılmalı"""
+        full = self.planner._plan_path(self.area)
+
+        self.assertTrue(self.planner.load_area("field", stream=True))
+        self.assertTrue(self.planner.planning)
+        self.assertLess(len(self.planner.current_path), len(full))
+
+        # Robot her waypoint'e ulaşıyor
+        while True:
+            waypoint = self.planner.get_next_waypoint({"x": 1e6, "y": 1e6})
+            if waypoint is None:
+                if not self.planner.planning:
+                    break
+                continue
+            ahead = len(self.planner.current_path) - self.planner.current_waypoint_index
+            self.assertLessEqual(
+                ahead,
+                self.planner.lookahead_waypoints + self.planner.stream_chunk_size + 1,
+            )
+            self.planner.get_next_waypoint(
+                {"x": waypoint.position.x, "y": waypoint.position.y}
+            )
+
+        self.assertFalse(self.planner.planning)
+        self.assertEqual(self.planner.current_path, full)
+        key = self.planner.plan_key(self.area)
+        self.assertIsNotNone(self.planner.plan_cache.get("field", key))
+
+    def test_resume_waits_for_stream(self):
+        """Devam noktası planlanana kadar beklenmeli, kontrol döngüsü bloklanmamalı"""
+        self.planner.load_area("field", stream=True)
+        self.assertEqual(self.planner.resume_from(1000), 1000)
+        self.assertLess(len(self.planner.current_path), 1000)
+
+        while self.planner.get_next_waypoint({"x": 1e6, "y": 1e6}) is None:
+            self.assertTrue(self.planner.planning)
+
+        self.assertGreater(len(self.planner.current_path), 1000)
+        self.assertLessEqual(self.planner.current_waypoint_index, 1000)
+        self.assertGreater(self.planner.current_waypoint_index, 900)
+
+    def test_reload_cancels_stream(self):
+        """Yeni alan yüklenince süren akış iptal edilmeli"""
+        self.planner.load_area("field", stream=True)
+        stream = self.planner._stream
+
+        self.planner.load_area("field")
+        stream.join(timeout=1.0)
+        self.assertFalse(self.planner.planning)
+        self.assertTrue(stream.done)
+        self.assertFalse(stream._thread.is_alive())
+
+
+if __name__ == "__main__":
+    # Test suite oluştur
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+
+    # Test sınıflarını ekle
+    test_classes = [
+        TestPathStream,
+        TestPlannerStream,
+    ]
+
+    for test_class in test_classes:
+        tests = loader.loadTestsFromTestCase(test_class)
+        suite.addTests(tests)
+
+    # Test runner
+    runner = unittest.TextTestRunner(verbosity=2, descriptions=True, failfast=False)
+
+    print("🟩 Path Stream Test Suite Başlatılıyor...")
+    print("=" * 60)
+
+    result = runner.run(suite)
+
+    print("=" * 60)
+    print(f"✅ Başarılı: {result.testsRun - len(result.failures) - len(result.errors)}")
+    print(f"❌ Başarısız: {len(result.failures)}")
+    print(f"⚠️  Hata: {len(result.errors)}")
+
+    if result.wasSuccessful():
+        print("🎉 Tüm testler başarılı!")
+        sys.exit(0)
+    else:
+        print("💥 Bazı testler başarısız!")
+        sys.exit(1)
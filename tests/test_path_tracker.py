@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Path Tracker Test Suite
+Pure pursuit rota takip testleri
+"""
+
+import unittest
+import sys
+import math
+from pathlib import Path
+
+import numpy as np
+
+# Proje kök dizinini path'e ekle
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.navigation.path_tracker import PurePursuitTracker
+
+
+class TestPurePursuitTracker(unittest.TestCase):
+    """Pure pursuit testleri"""
+
+    def setUp(self):
+        self.tracker = PurePursuitTracker()
+        self.stripes = np.array([[0, 0], [10, 0], [10, 1], [0, 1]], dtype=float)
+
+    def _simulate(self, pose, path, dt=0.05, steps=2000, tolerance=0.5):
+        """Tek tekerlekli kinematik ile kapalı döngü simülasyonu"""
+        x, y, heading = pose
+        index = 1
+        trace = []
+        for _ in range(steps):
+            command = self.tracker.compute_command(
+                {"x": x, "y": y, "heading": heading}, path, index, 0.5
+            )
+            x += command["linear"] * math.cos(heading) * dt
+            y += command["linear"] * math.sin(heading) * dt
+            heading += command["angular"] * dt
+            trace.append((x, y, command["linear"]))
+
+            if math.hypot(x - path[index][0], y - path[index][1]) < tolerance:
+                index += 1
+                if index >= len(path):
+                    break
+        return index, np.array(trace)
+
+    def test_straight_line(self):
+        """Rota üzerinde ve hizalıyken düz gitmeli"""
+        command = self.tracker.compute_command(
+            {"x": 2.0, "y": 0.0, "heading": 0.0}, self.stripes, 1, 0.5
+        )
+
+        self.assertAlmostEqual(command["linear"], 0.5)
+        self.assertAlmostEqual(command["angular"], 0.0)
+
+    def test_steers_back_to_path(self):
+        """Rotanın solundayken sağa (negatif açısal hız) dönmeli"""
+        command = self.tracker.compute_command(
+            {"x": 2.0, "y": 0.3, "heading": 0.0}, self.stripes, 1, 0.5
+        )
+
+        self.assertGreater(command["linear"], 0.0)
+        self.assertLess(command["angular"], 0.0)
+
+    def test_rotate_in_place_when_target_behind(self):
+        """Hedef arkadaysa yerinde dönmeli"""
+        command = self.tracker.compute_command(
+            {"x": 2.0, "y": 0.0, "heading": math.pi}, self.stripes, 1, 0.5
+        )
+
+        self.assertEqual(command["linear"], 0.0)
+        self.assertNotEqual(command["angular"], 0.0)
+
+    def test_closed_loop_tracking(self):
+        """Şerit boyunca durmadan ve rotaya yakın ilerlemeli"""
+        index, trace = self._simulate((0.0, 0.2, 0.0), self.stripes)
+
+        self.assertEqual(index, len(self.stripes))
+
+        # İlk şeritte yanal hata küçük kalmalı ve robot durmamalı
+        first_stripe = trace[(trace[:, 0] > 1.0) & (trace[:, 0] < 9.0)][:100]
+        self.assertLess(np.abs(first_stripe[:, 1]).max(), 0.1)
+        self.assertTrue((first_stripe[:, 2] > 0.3).all())
+
+    def test_decelerates_at_path_end(self):
+        """Rota sonuna yaklaşırken yavaşlamalı"""
+        command = self.tracker.compute_command(
+            {"x": 0.2, "y": 1.0, "heading": math.pi}, self.stripes, 3, 0.5
+        )
+
+        self.assertLess(command["linear"], 0.5)
+
+    def test_path_finished(self):
+        """Rota bittiyse dur"""
+        command = self.tracker.compute_command(
+            {"x": 0.0, "y": 1.0, "heading": 0.0}, self.stripes, 4, 0.5
+        )
+
+        self.assertEqual(command["linear"], 0.0)
+        self.assertEqual(command["angular"], 0.0)
+
+
+if __name__ == "__main__":
+    # Test suite oluştur
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+
+    # Test sınıflarını ekle
+    test_classes = [
+        TestPurePursuitTracker,
+    ]
+
+    for test_class in test_classes:
+        tests = loader.loadTestsFromTestCase(test_class)
+        suite.addTests(tests)
+
+    # Test runner
+    runner = unittest.TextTestRunner(verbosity=2, descriptions=True, failfast=False)
+
+    print("🧭 Path Tracker Test Suite Başlatılıyor...")
+    print("=" * 60)
+
+    result = runner.run(suite)
+
+    print("=" * 60)
+    print(f"✅ Başarılı: {result.testsRun - len(result.failures) - len(result.errors)}")
+    print(f"❌ Başarısız: {len(result.failures)}")
+    print(f"⚠️  Hata: {len(result.errors)}")
+
+    if result.wasSuccessful():
+        print("🎉 Tüm testler başarılı!")
+        sys.exit(0)
+    else:
+        print("💥 Bazı testler başarısız!")
+        sys.exit(1)
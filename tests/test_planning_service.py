@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Planning Service Test Suite
+Process havuzunda rota planlama, ilerleme ve iptal testleri
+"""
+
+import unittest
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+# Proje kök dizinini path'e ekle
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.main_controller import MainController, RobotState
+from src.navigation.path_array import PathArray
+from src.navigation.path_planner import PathPlanner, Point, Area
+from src.navigation.path_stream import PathStream
+from src.navigation.planning_service import PlanningService
+
+
+def _field(area_id="field", width=60):
+    """Test alanı"""
+    return Area(
+        id=area_id,
+        name=area_id,
+        boundary=[Point(0, 0), Point(width, 0), Point(width, 40), Point(0, 40)],
+        obstacles=[],
+    )
+
+
+def _drain(job, timeout=30.0):
+    """İşin tüm parçalarını topla"""
+    chunks = []
+    deadline = time.time() + timeout
+    while not job.done and time.time() < deadline:
+        chunk = job.get(block=True, timeout=1.0)
+        if chunk is not None:
+            chunks.append(chunk)
+    return chunks
+
+
+class TestPlanningService(unittest.TestCase):
+    """Process havuzu planlama testleri"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.service = PlanningService(max_workers=1, buffer_chunks=2)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.service.shutdown()
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.planner = PathPlanner(
+            config_path=str(Path(self.temp_dir.name) / "areas.json")
+        )
+        self.planner.add_area(_field())
+
+    def tearDown(self):
+        self.planner.cancel_stream()
+        self.temp_dir.cleanup()
+
+    def test_job_matches_local_plan(self):
+        """İşçinin ürettiği rota yerel planla aynı olmalı"""
+        area = self.planner.areas["field"]
+        job = self.service.submit(self.planner, area)
+        chunks = _drain(job)
+
+        self.assertTrue(job.done)
+        self.assertIsNone(job.error)
+        self.assertEqual(job.progress, 1.0)
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(PathArray.concatenate(chunks), self.planner._plan_path(area))
+        self.assertEqual(self.service.status()["field"]["waypoints"], job.waypoints)
+
+    def test_streamed_load(self):
+        """Planlayıcı servis üzerinden akışla yüklemeli ve önbelleğe yazmalı"""
+        self.planner.planning_service = self.service
+        self.assertTrue(self.planner.load_area("field", stream=True))
+        self.assertTrue(self.planner.planning)
+
+        deadline = time.time() + 30.0
+        while time.time() < deadline:
+            waypoint = self.planner.get_next_waypoint({"x": 1e6, "y": 1e6})
+            if waypoint is None:
+                if not self.planner.planning:
+                    break
+                continue
+            self.planner.get_next_waypoint(
+                {"x": waypoint.position.x, "y": waypoint.position.y}
+            )
+
+        area = self.planner.areas["field"]
+        self.assertFalse(self.planner.planning)
+        self.assertEqual(self.planner.current_path, self.planner._plan_path(area))
+        self.assertIsNotNone(
+            self.planner.plan_cache.get("field", self.planner.plan_key(area))
+        )
+
+    def test_edit_cancels_job(self):
+        """Sınır değişince iş iptal edilmeli, ad değişince sürmeli"""
+        self.planner.planning_service = self.service
+        self.planner.load_area("field", stream=True)
+        job = self.planner._stream
+
+        self.planner.areas["field"].name = "renamed"
+        self.planner.area_changed("field")
+        self.assertIs(self.planner._stream, job)
+        self.assertFalse(job.done)
+
+        self.planner.add_area(_field(width=30))
+        self.assertTrue(job.done)
+        self.assertFalse(self.planner.planning)
+        self.assertNotIn("field", self.service.jobs)
+        job.join(timeout=10.0)
+
+    def test_streamed_mission_jobs(self):
+        """Görev alanları servis işlerinde planlanmalı, sonuç aynı olmalı"""
+        self.planner.add_area(
+            Area(
+                id="yard",
+                name="yard",
+                boundary=[Point(80, 0), Point(100, 0), Point(100, 20), Point(80, 20)],
+                obstacles=[],
+            )
+        )
+        self.planner.planning_service = self.service
+        self.assertTrue(
+            self.planner.load_mission(["field", "yard"], (0.0, 0.0), stream=True)
+        )
+        self.assertEqual(set(self.service.jobs), {"field", "yard"})
+
+        deadline = time.time() + 60.0
+        while self.planner.planning and time.time() < deadline:
+            self.planner._fill_stream(len(self.planner.current_path), wait=True)
+
+        self.assertFalse(self.planner.planning)
+        self.assertIsNone(self.planner.planning_error)
+        streamed = self.planner.current_path
+
+        # İşlerin rotaları önbelleğe yazıldı: akışsız yükleme planlamaz
+        with patch.object(self.planner, "_plan_path") as plan_path:
+            self.assertTrue(self.planner.load_mission(["field", "yard"], (0.0, 0.0)))
+        plan_path.assert_not_called()
+        self.assertEqual(streamed, self.planner.current_path)
+
+
+class TestControllerPlanningWait(unittest.TestCase):
+    """Rotanın devamı beklenirken kontrol döngüsü davranışı"""
+
+    def test_waits_for_next_chunk(self):
+        """Parça gelmediyse görev bitmemeli, robot durmalı"""
+
+        def slow_chunks():
+            time.sleep(0.5)
+            yield PathArray.empty()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            planner = PathPlanner(config_path=str(Path(temp_dir) / "areas.json"))
+            with patch.object(MainController, "_setup_logging"):
+                controller = MainController(config_path="nonexistent_config.json")
+            controller.logger = planner.logger
+            controller.path_planner = planner
+            controller.motor_controller = MagicMock()
+            controller.odometry = SimpleNamespace(
+                get_position_dict=lambda: {"x": 0.0, "y": 0.0, "heading": 0.0}
+            )
+            controller.state = RobotState.MOWING
+            planner._stream = PathStream(slow_chunks())
+
+            controller._handle_mowing_state()
+
+            self.assertEqual(controller.state, RobotState.MOWING)
+            controller.motor_controller.set_drive_speed.assert_called_with(0.0, 0.0)
+            planner.cancel_stream()
+
+
+if __name__ == "__main__":
+    # Test suite oluştur
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+
+    # Test sınıflarını ekle
+    test_classes = [
+        TestPlanningService,
+        TestControllerPlanningWait,
+    ]
+
+    for test_class in test_classes:
+        tests = loader.loadTestsFromTestCase(test_class)
+        suite.addTests(tests)
+
+    # Test runner
+    runner = unittest.TextTestRunner(verbosity=2, descriptions=True, failfast=False)
+
+    print("🟨 Planning Service Test Suite Başlatılıyor...")
+    print("=" * 60)
+
+    result = runner.run(suite)
+
+    print("=" * 60)
+    print(f"✅ Başarılı: {result.testsRun - len(result.failures) - len(result.errors)}")
+    print(f"❌ Başarısız: {len(result.failures)}")
+    print(f"⚠️  Hata: {len(result.errors)}")
+
+    if result.wasSuccessful():
+        print("🎉 Tüm testler başarılı!")
+        sys.exit(0)
+    else:
+        print("💥 Bazı testler başarısız!")
+        sys.exit(1)
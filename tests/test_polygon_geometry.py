@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Polygon Geometry Test Suite
+Vektörel poligon işlemleri testleri
+"""
+
+import math
+import unittest
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Proje kök dizinini path'e ekle
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.navigation.path_planner import PathPlanner, Point, Area, PatternType
+from src.navigation.polygon_geometry import (
+    PreparedPolygon,
+    VisibilityGraph,
+    contains_any,
+    edge_arrays,
+    offset_polygon,
+    offset_rings,
+    point_segment_distance,
+    polygon_to_array,
+    scanline_intervals,
+    scanline_segments,
+    signed_area,
+)
+
+
+def _ray_cast(point, polygon):
+    """Skaler referans ışın izleme (min(y) < y <= max(y) kuralı)"""
+    x, y = point.x, point.y
+    n = len(polygon)
+    inside = False
+
+    p1x, p1y = polygon[0].x, polygon[0].y
+    for i in range(1, n + 1):
+        p2x, p2y = polygon[i % n].x, polygon[i % n].y
+        if min(p1y, p2y) < y <= max(p1y, p2y) and x <= max(p1x, p2x):
+            if p1x == p2x or x <= (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x:
+                inside = not inside
+        p1x, p1y = p2x, p2y
+
+    return inside
+
+
+class TestScanline(unittest.TestCase):
+    """Scanline kırpma testleri"""
+
+    def setUp(self):
+        # U şeklinde alan: ortada 4m genişliğinde boşluk
+        self.u_shape = [
+            (0, 0),
+            (10, 0),
+            (10, 10),
+            (7, 10),
+            (7, 3),
+            (3, 3),
+            (3, 10),
+            (0, 10),
+        ]
+
+    def test_polygon_to_array(self):
+        """Farklı giriş formatları testi"""
+        from_points = polygon_to_array([Point(0, 0), Point(1, 2)])
+        from_tuples = polygon_to_array([(0, 0), (1, 2)])
+
+        np.testing.assert_array_equal(from_points, from_tuples)
+        self.assertEqual(from_points.shape, (2, 2))
+
+    def test_single_segment_per_stripe(self):
+        """Kare alanda her şerit tek segment olmalı"""
+        square = [(0, 0), (10, 0), (10, 10), (0, 10)]
+        intervals = scanline_intervals([square], [1.0, 5.0, 9.0])
+
+        for stripe in intervals:
+            np.testing.assert_array_almost_equal(stripe, [[0.0, 10.0]])
+
+    def test_multiple_segments_per_stripe(self):
+        """İçbükey alanda şerit birden fazla segmente bölünmeli"""
+        intervals = scanline_intervals([self.u_shape], [1.0, 5.0])
+
+        np.testing.assert_array_almost_equal(intervals[0], [[0.0, 10.0]])
+        np.testing.assert_array_almost_equal(intervals[1], [[0.0, 3.0], [7.0, 10.0]])
+
+    def test_stripes_outside_polygon(self):
+        """Poligon dışındaki şeritler boş olmalı"""
+        intervals = scanline_intervals([self.u_shape], [-1.0, 11.0])
+
+        for stripe in intervals:
+            self.assertEqual(len(stripe), 0)
+
+    def test_holes(self):
+        """İkinci halka delik olarak çıkarılmalı"""
+        square = [(0, 0), (10, 0), (10, 10), (0, 10)]
+        hole = [(4, 4), (6, 4), (6, 6), (4, 6)]
+
+        stripe_index, x_start, x_end = scanline_segments([square, hole], [5.0])
+
+        np.testing.assert_array_equal(stripe_index, [0, 0])
+        np.testing.assert_array_almost_equal(x_start, [0.0, 6.0])
+        np.testing.assert_array_almost_equal(x_end, [4.0, 10.0])
+
+
+class TestPreparedPolygon(unittest.TestCase):
+    """Hazırlanmış poligon testleri"""
+
+    def setUp(self):
+        self.planner = PathPlanner(config_path="nonexistent_test_config.json")
+        self.polygon = [
+            Point(0, 0),
+            Point(10, 0),
+            Point(10, 10),
+            Point(7, 10),
+            Point(7, 3),
+            Point(3, 3),
+            Point(3, 10),
+            Point(0, 10),
+        ]
+
+    def test_matches_scalar_ray_cast(self):
+        """contains_many skaler point_in_polygon ile aynı sonucu vermeli"""
+        grid = np.array(
+            [(x, y) for x in np.arange(-1, 11.5, 0.5) for y in np.arange(-1, 11.5, 0.5)]
+        )
+        prepared = PreparedPolygon(self.polygon)
+
+        expected = [_ray_cast(Point(x, y), self.polygon) for x, y in grid]
+
+        np.testing.assert_array_equal(prepared.contains_many(grid), expected)
+
+    def test_single_point(self):
+        """Tek nokta sorgusu"""
+        prepared = PreparedPolygon(self.polygon)
+
+        self.assertTrue(prepared.contains(Point(1, 5)))
+        self.assertFalse(prepared.contains(Point(5, 5)))  # U'nun boşluğu
+        self.assertFalse(prepared.contains((20, 20)))
+
+    def test_contains_any(self):
+        """Birden fazla engel testi"""
+        obstacles = [
+            PreparedPolygon([(0, 0), (1, 0), (1, 1), (0, 1)]),
+            PreparedPolygon([(5, 5), (6, 5), (6, 6), (5, 6)]),
+        ]
+        points = [(0.5, 0.5), (5.5, 5.5), (3, 3)]
+
+        np.testing.assert_array_equal(
+            contains_any(obstacles, points), [True, True, False]
+        )
+
+    def test_degenerate_polygon(self):
+        """3'ten az köşeli poligon hiçbir noktayı içermemeli"""
+        prepared = PreparedPolygon([(0, 0), (1, 1)])
+
+        self.assertFalse(prepared.contains_many([(0.5, 0.5)]).any())
+
+
+class TestVisibilityGraph(unittest.TestCase):
+    """Engel etrafında geçiş yolu testleri"""
+
+    def setUp(self):
+        self.boundary = [(0, 0), (20, 0), (20, 20), (0, 20)]
+        self.obstacle = [(8, 8), (12, 8), (12, 12), (8, 12)]
+        self.graph = VisibilityGraph(self.boundary, [self.obstacle], clearance=0.3)
+
+    def test_direct_path(self):
+        """Engel yoksa düz çizgi"""
+        route = self.graph.shortest_path((1, 1), (19, 1))
+
+        np.testing.assert_array_almost_equal(route, [[1, 1], [19, 1]])
+
+    def test_path_around_obstacle(self):
+        """Engel arkasındaki hedefe dolaşarak gidilmeli"""
+        route = self.graph.shortest_path((5, 10), (15, 10))
+
+        self.assertGreater(len(route), 2)
+        self.assertTrue(self.graph.visible(route[0], route[1]))
+        for start, end in zip(route[:-1], route[1:]):
+            self.assertTrue(self.graph.visible(start, end))
+
+        # Yol uzunluğu düz mesafeden uzun ama makul olmalı
+        length = np.hypot(*np.diff(route, axis=0).T).sum()
+        self.assertGreater(length, 10.0)
+        self.assertLess(length, 16.0)
+
+
+class TestOffsetPolygon(unittest.TestCase):
+    """Kenar ötelemesi testleri"""
+
+    # U şekli: iki kol 2 m genişliğinde, aralarında 2 m boşluk
+    U_SHAPE = [(0, 0), (6, 0), (6, 6), (4, 6), (4, 2), (2, 2), (2, 6), (0, 6)]
+
+    def _distances(self, ring, polygon):
+        edges = edge_arrays([polygon_to_array(polygon)])
+        return point_segment_distance(ring, edges)
+
+    def test_square(self):
+        """Kare içe ötelenince köşeleri d kadar içeri kaymalı"""
+        rings = offset_polygon([(0, 0), (8, 0), (8, 8), (0, 8)], 0.5)
+
+        self.assertEqual(len(rings), 1)
+        self.assertAlmostEqual(signed_area(rings[0]), 49.0)
+        np.testing.assert_array_almost_equal(rings[0].min(axis=0), [0.5, 0.5])
+        np.testing.assert_array_almost_equal(rings[0].max(axis=0), [7.5, 7.5])
+
+    def test_concave_stays_inside(self):
+        """İçbükey alanda halka sınırdan tam d uzakta ve içeride olmalı"""
+        rings = offset_polygon(self.U_SHAPE, 0.4)
+
+        self.assertEqual(len(rings), 1)
+        np.testing.assert_allclose(self._distances(rings[0], self.U_SHAPE), 0.4)
+        self.assertTrue(PreparedPolygon(self.U_SHAPE).contains_many(rings[0]).all())
+
+    def test_split_at_narrow_neck(self):
+        """Dar boğaz kapanınca alan iki halkaya ayrılmalı"""
+        dumbbell = [
+            (0, 0), (4, 0), (4, 1.5), (6, 1.5), (6, 0), (10, 0),
+            (10, 4), (6, 4), (6, 2.5), (4, 2.5), (4, 4), (0, 4),
+        ]  # fmt: skip
+
+        self.assertEqual(len(offset_polygon(dumbbell, 0.4)), 1)
+        rings = offset_polygon(dumbbell, 0.8)
+        self.assertEqual(len(rings), 2)
+        for ring in rings:
+            self.assertGreater(signed_area(ring), 0)
+
+    def test_outward_rounds_corners(self):
+        """Dışa ötelemede dışbükey köşeler yay ile dönmeli"""
+        rings = offset_polygon([(0, 0), (4, 0), (4, 4), (0, 4)], -1.0)
+
+        self.assertEqual(len(rings), 1)
+        expected = 16 + 4 * 4 + math.pi
+        self.assertAlmostEqual(signed_area(rings[0]), expected, delta=0.1)
+        np.testing.assert_allclose(
+            self._distances(rings[0], [(0, 0), (4, 0), (4, 4), (0, 4)]), 1.0
+        )
+
+    def test_concentric_rings(self):
+        """Halkalar alan tükenince durmalı"""
+        levels = offset_rings([(0, 0), (4, 0), (4, 4), (0, 4)], 0.25, 0.5)
+
+        self.assertEqual(len(levels), 4)
+        areas = [signed_area(level[0]) for level in levels]
+        self.assertEqual(areas, sorted(areas, reverse=True))
+
+    def test_perimeter_first_headland(self):
+        """Önce çevre deseninde headland halkaları alan içinde kalmalı"""
+        planner = PathPlanner(config_path="nonexistent_areas.json")
+        area = Area(
+            id="u",
+            name="u",
+            boundary=[Point(x, y) for x, y in self.U_SHAPE],
+            obstacles=[],
+            pattern=PatternType.PERIMETER_FIRST,
+        )
+        path = planner._perimeter_first_pattern(area)
+        points = np.array([[wp.position.x, wp.position.y] for wp in path])
+
+        self.assertTrue(PreparedPolygon(self.U_SHAPE).contains_many(points).all())
+        count = next(i for i, wp in enumerate(path) if wp.speed != path[0].speed)
+        headland = points[:count]
+        self.assertAlmostEqual(path[0].speed, area.speed * 0.7)
+        distances = self._distances(headland, self.U_SHAPE)
+        self.assertGreaterEqual(distances.min(), planner.safety_margin - 1e-6)
+
+
+if __name__ == "__main__":
+    # Test suite oluştur
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+
+    # Test sınıflarını ekle
+    test_classes = [
+        TestScanline,
+        TestPreparedPolygon,
+        TestVisibilityGraph,
+        TestOffsetPolygon,
+    ]
+
+    for test_class in test_classes:
+        tests = loader.loadTestsFromTestCase(test_class)
+        suite.addTests(tests)
+
+    # Test runner
+    runner = unittest.TextTestRunner(verbosity=2, descriptions=True, failfast=False)
+
+    print("📐 Polygon Geometry Test Suite Başlatılıyor...")
+    print("=" * 60)
+
+    result = runner.run(suite)
+
+    print("=" * 60)
+    print(f"✅ Başarılı: {result.testsRun - len(result.failures) - len(result.errors)}")
+    print(f"❌ Başarısız: {len(result.failures)}")
+    print(f"⚠️  Hata: {len(result.errors)}")
+
+    if result.wasSuccessful():
+        print("🎉 Tüm testler başarılı!")
+        sys.exit(0)
+    else:
+        print("💥 Bazı testler başarısız!")
+        sys.exit(1)
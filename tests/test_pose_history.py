@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Pose History Test Suite
+Zaman damgalı poz halkası, enterpolasyon ve kopyasız pencere testleri
+"""
+
+import unittest
+import sys
+import math
+import threading
+from pathlib import Path
+
+import numpy as np
+
+# Proje kök dizinini path'e ekle
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.navigation.measurement_queue import MeasurementQueue
+from src.navigation.pose_history import PoseHistory, T, X, HEADING, VAR_X
+from src.navigation.unicycle_ekf import UnicycleEKF
+
+
+class TestPoseHistory(unittest.TestCase):
+    """Poz halkası testleri"""
+
+    def setUp(self):
+        self.history = PoseHistory(capacity=8, max_extrapolation=0.1)
+        for i in range(5):
+            self.history.append(float(i), float(i), 2.0 * i, 0.0, var_x=0.1 * i)
+
+    def test_interpolation(self):
+        """Ara zamanlardaki poz doğrusal enterpole edilmeli"""
+        pose = self.history.pose_at(2.25)
+
+        self.assertAlmostEqual(pose.x, 2.25)
+        self.assertAlmostEqual(pose.y, 4.5)
+        self.assertEqual(pose.timestamp, 2.25)
+        self.assertIsNone(self.history.pose_at(-0.5))
+        self.assertEqual(self.history.pose_at(4.05).x, 4.0)
+        self.assertIsNone(self.history.pose_at(4.5))
+
+    def test_heading_wraparound(self):
+        """Yön ±pi sınırında kısa yoldan enterpole edilmeli"""
+        history = PoseHistory()
+        history.append(0.0, 0.0, 0.0, math.pi - 0.1)
+        history.append(1.0, 0.0, 0.0, -math.pi + 0.1)
+
+        heading = history.pose_at(0.5).heading
+        self.assertAlmostEqual(abs(heading), math.pi)
+        rows = history.interpolate([0.25, 0.5, 2.0])
+        self.assertAlmostEqual(rows[0, HEADING], math.pi - 0.05)
+        self.assertAlmostEqual(abs(rows[1, HEADING]), math.pi)
+        self.assertTrue(np.isnan(rows[2]).all())
+
+    def test_batch_matches_scalar(self):
+        """Toplu enterpolasyon tekil sorgularla aynı olmalı"""
+        times = np.linspace(-0.5, 4.3, 30)
+        rows = self.history.interpolate(times)
+
+        for t, row in zip(times, rows):
+            pose = self.history.pose_at(t)
+            if pose is None:
+                self.assertTrue(np.isnan(row[X]))
+            else:
+                self.assertAlmostEqual(row[X], pose.x)
+        self.assertAlmostEqual(self.history.interpolate(1.5)[0, VAR_X], 0.15)
+
+    def test_wraparound_window_is_view(self):
+        """Halka dolunca eskiler düşmeli, pencere kopyasız olmalı"""
+        for i in range(5, 12):
+            self.history.append(float(i), float(i), 0.0, 0.0)
+
+        self.assertEqual(len(self.history), 8)
+        self.assertEqual(self.history.times.tolist(), [float(i) for i in range(4, 12)])
+
+        window = self.history.window(6.0, 9.0)
+        self.assertEqual(window[:, T].tolist(), [6.0, 7.0, 8.0, 9.0])
+        self.assertTrue(np.shares_memory(window, self.history._rows))
+
+    def test_order_and_truncate(self):
+        """Eski zaman reddedilmeli; truncate sonraki pozları atmalı"""
+        self.assertFalse(self.history.append(1.0, 0.0, 0.0, 0.0))
+        self.history.append(4.0, 40.0, 0.0, 0.0)
+        self.assertEqual(len(self.history), 5)
+        self.assertEqual(self.history.pose_at(4.0).x, 40.0)
+
+        for i in range(5, 12):
+            self.history.append(float(i), float(i), 0.0, 0.0)
+        self.history.truncate(8.5)
+        self.history.append(9.0, -9.0, 0.0, 0.0)
+
+        self.assertEqual(self.history.times.tolist(), [4.0, 5.0, 6.0, 7.0, 8.0, 9.0])
+        self.assertEqual(self.history.pose_at(9.0).x, -9.0)
+
+    def test_lock_free_reader(self):
+        """Yazım sürerken okunan pencere her zaman tutarlı olmalı"""
+        history = PoseHistory(capacity=16)
+        done = threading.Event()
+
+        def writer():
+            for i in range(100000):
+                history.append(float(i), float(i), 0.0, 0.0)
+            done.set()
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        checked = 0
+        while not done.is_set() or checked == 0:
+            # Kopya tek adımda alınır (yazıcı bir tur atıp satırları ezmeden)
+            view = history.window().copy()
+            times, xs = view[:, T], view[:, X]
+            self.assertLessEqual(len(times), 16)
+            self.assertTrue(np.all(np.diff(times) == 1.0), times)
+            np.testing.assert_array_equal(xs, times)
+            checked += 1
+        thread.join()
+        self.assertEqual(len(history), 16)
+
+
+class TestQueueRecording(unittest.TestCase):
+    """Ölçüm kuyruğunun poz kaydı testleri"""
+
+    def test_replay_rewrites_history(self):
+        """Geç ölçüm sonrası geçmiş sıralı işlemeyle aynı olmalı"""
+        samples = [(0.0, 0, 0)] + [(0.1 * i, 30, 30 + i) for i in range(1, 20)]
+
+        ordered_history = PoseHistory()
+        ordered = MeasurementQueue(
+            UnicycleEKF(simulate=True), pose_history=ordered_history
+        )
+        for t, left, right in samples:
+            ordered.push_encoder(t, left, right)
+            ordered.process()
+
+        delayed_history = PoseHistory()
+        delayed = MeasurementQueue(
+            UnicycleEKF(simulate=True), pose_history=delayed_history
+        )
+        # t=1.0 örneği üç adım geç ulaşıyor
+        samples.insert(13, samples.pop(10))
+        for t, left, right in samples:
+            delayed.push_encoder(t, left, right)
+            delayed.process()
+
+        self.assertEqual(delayed.late, 1)
+        np.testing.assert_allclose(
+            delayed_history.window(), ordered_history.window(), atol=1e-12
+        )
+
+
+if __name__ == "__main__":
+    # Test suite oluştur
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+
+    # Test sınıflarını ekle
+    test_classes = [
+        TestPoseHistory,
+        TestQueueRecording,
+    ]
+
+    for test_class in test_classes:
+        tests = loader.loadTestsFromTestCase(test_class)
+        suite.addTests(tests)
+
+    # Test runner
+    runner = unittest.TextTestRunner(verbosity=2, descriptions=True, failfast=False)
+
+    print("⬜ Pose History Test Suite Başlatılıyor...")
+    print("=" * 60)
+
+    result = runner.run(suite)
+
+    print("=" * 60)
+    print(f"✅ Başarılı: {result.testsRun - len(result.failures) - len(result.errors)}")
+    print(f"❌ Başarısız: {len(result.failures)}")
+    print(f"⚠️  Hata: {len(result.errors)}")
+
+    if result.wasSuccessful():
+        print("🎉 Tüm testler başarılı!")
+        sys.exit(0)
+    else:
+        print("💥 Bazı testler başarısız!")
+        sys.exit(1)
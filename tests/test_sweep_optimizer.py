@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Sweep Optimizer Test Suite
+Şerit yönü optimizasyon testleri
+"""
+
+import unittest
+import sys
+import math
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+# Proje kök dizinini path'e ekle
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.navigation.path_planner import PathPlanner, Point, Area
+from src.navigation.polygon_geometry import rotate_points, scanline_segments
+from src.navigation.sweep_optimizer import (
+    candidate_angles,
+    convex_hull,
+    optimize_sweep_angle,
+    sweep_statistics,
+)
+
+
+class TestSweepOptimizer(unittest.TestCase):
+    """Şerit yönü seçimi testleri"""
+
+    def setUp(self):
+        # 60m x 3m dar şerit, 0.5 radyan döndürülmüş
+        self.angle = 0.5
+        self.strip = rotate_points([(0, 0), (60, 0), (60, 3), (0, 3)], self.angle)
+        self.l_shape = [(0, 0), (15, 0), (15, 8), (8, 8), (8, 15), (0, 15)]
+
+    def test_convex_hull(self):
+        """İçbükey köşe zarfa dahil edilmemeli"""
+        hull = convex_hull(self.l_shape)
+
+        self.assertEqual(len(hull), 5)
+        self.assertNotIn((8.0, 8.0), [tuple(p) for p in hull])
+
+    def test_candidates_include_hull_edges(self):
+        """Zarf kenar yönleri aday olmalı"""
+        angles = candidate_angles(self.strip)
+
+        self.assertTrue(np.isclose(angles, self.angle).any())
+        self.assertTrue(((angles >= 0) & (angles < math.pi)).all())
+
+    def test_statistics_match_scanline(self):
+        """Toplu istatistik tek açılık scanline ile aynı olmalı"""
+        spacing, margin = 0.45, 0.2
+        angles = [0.0, 0.3, 1.2]
+        counts, lengths = sweep_statistics([self.l_shape], angles, spacing, margin)
+
+        for angle, count, length in zip(angles, counts, lengths):
+            ring = rotate_points(self.l_shape, -angle)
+            ys = np.arange(
+                ring[:, 1].min() + margin, ring[:, 1].max() - margin + 1e-9, spacing
+            )
+            _, x_start, x_end = scanline_segments([ring], ys)
+            seg = (x_end - margin) - (x_start + margin)
+
+            self.assertEqual(count, int((seg >= 0).sum()))
+            self.assertAlmostEqual(length, seg[seg >= 0].sum(), places=6)
+
+    def test_long_strip_orientation(self):
+        """Uzun dar alanda şeritler uzun kenara paralel olmalı"""
+        angle = optimize_sweep_angle([self.strip], spacing=0.45, turn_cost=3.0)
+
+        self.assertAlmostEqual(angle, self.angle, places=6)
+
+    def test_square_keeps_x_axis(self):
+        """Kare alanda eşitlikte mevcut x ekseni yönü korunmalı"""
+        square = [(0, 0), (10, 0), (10, 10), (0, 10)]
+        angle = optimize_sweep_angle([square], spacing=0.45, turn_cost=3.0)
+
+        self.assertEqual(angle, 0.0)
+
+
+class TestPlannerSweepAngle(unittest.TestCase):
+    """Rota planlayıcı entegrasyon testleri"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.config_path = str(Path(self.temp_dir.name) / "areas.json")
+        self.planner = PathPlanner(config_path=self.config_path)
+        strip = rotate_points([(0, 0), (40, 0), (40, 3), (0, 3)], 0.5)
+        self.area = Area(
+            id="strip_area",
+            name="strip",
+            boundary=[Point(float(x), float(y)) for x, y in strip],
+            obstacles=[],
+        )
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_fewer_turns_than_x_axis(self):
+        """Seçilen yön x eksenine göre daha az dönüş üretmeli"""
+        self.planner._plan_path(self.area)
+        optimized_turns = self.planner.last_turn_report["turn_count"]
+        self.assertAlmostEqual(self.area.sweep_angle, 0.5, places=6)
+
+        self.area.sweep_angle = 0.0
+        self.planner._plan_path(self.area)
+        x_axis_turns = self.planner.last_turn_report["turn_count"]
+
+        self.assertLess(optimized_turns, x_axis_turns)
+
+    def test_angle_persisted(self):
+        """Seçilen açı alan dosyasına kaydedilmeli"""
+        self.planner.add_area(self.area)
+        self.planner.load_area("strip_area")
+        self.planner._save_areas()
+
+        reloaded = PathPlanner(config_path=self.config_path)
+
+        self.assertAlmostEqual(reloaded.areas["strip_area"].sweep_angle, 0.5)
+        self.assertEqual(
+            reloaded.plan_key(reloaded.areas["strip_area"]),
+            self.planner.current_plan_hash,
+        )
+
+
+if __name__ == "__main__":
+    # Test suite oluştur
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+
+    # Test sınıflarını ekle
+    test_classes = [
+        TestSweepOptimizer,
+        TestPlannerSweepAngle,
+    ]
+
+    for test_class in test_classes:
+        tests = loader.loadTestsFromTestCase(test_class)
+        suite.addTests(tests)
+
+    # Test runner
+    runner = unittest.TextTestRunner(verbosity=2, descriptions=True, failfast=False)
+
+    print("🧮 Sweep Optimizer Test Suite Başlatılıyor...")
+    print("=" * 60)
+
+    result = runner.run(suite)
+
+    print("=" * 60)
+    print(f"✅ Başarılı: {result.testsRun - len(result.failures) - len(result.errors)}")
+    print(f"❌ Başarısız: {len(result.failures)}")
+    print(f"⚠️  Hata: {len(result.errors)}")
+
+    if result.wasSuccessful():
+        print("🎉 Tüm testler başarılı!")
+        sys.exit(0)
+    else:
+        print("💥 Bazı testler başarısız!")
+        sys.exit(1)
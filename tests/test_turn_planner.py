@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Turn Planner Test Suite
+Şerit geçişi dönüş manevrası testleri
+"""
+
+import unittest
+import sys
+import math
+from pathlib import Path
+
+import numpy as np
+
+# Proje kök dizinini path'e ekle
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.navigation.turn_planner import TurnPlanner
+
+
+class TestDubins(unittest.TestCase):
+    """Dubins yolu testleri"""
+
+    def setUp(self):
+        self.planner = TurnPlanner(turning_radius=0.3, sample_step=0.01)
+
+    def test_candidates_reach_goal(self):
+        """Tüm aday yollar hedef poza ulaşmalı"""
+        rng = np.random.default_rng(42)
+        for _ in range(200):
+            start = tuple(rng.uniform(-2, 2, 3))
+            end = tuple(rng.uniform(-2, 2, 3))
+
+            for word, lengths in self.planner.dubins_candidates(start, end):
+                final = self.planner.sample(start, word, lengths)[-1]
+                self.assertAlmostEqual(final[0], end[0], places=6)
+                self.assertAlmostEqual(final[1], end[1], places=6)
+
+    def test_wide_u_turn(self):
+        """Şerit aralığı 2r ise yarım çember U dönüşü seçilmeli"""
+        maneuver = self.planner.plan((10, 0, 0), (10, 0.6, math.pi))
+
+        self.assertEqual(maneuver.kind, "u_turn")
+        self.assertAlmostEqual(maneuver.length, math.pi * 0.3, places=6)
+
+    def test_narrow_omega_turn(self):
+        """Şerit aralığı 2r'den küçükse Ω dönüşü seçilmeli"""
+        maneuver = self.planner.plan((10, 0, 0), (10, 0.45, math.pi))
+
+        self.assertEqual(maneuver.kind, "omega")
+        self.assertGreater(maneuver.length, math.pi * 0.3)
+
+
+class TestTurnFeasibility(unittest.TestCase):
+    """Başlık (headland) sınırı testleri"""
+
+    def setUp(self):
+        self.planner = TurnPlanner(turning_radius=0.3)
+        self.start = (9.8, 0.5, 0.0)
+        self.end = (9.8, 0.95, math.pi)
+
+    def test_retreat_to_fit_headland(self):
+        """Manevra sığmıyorsa şerit uçları geri çekilmeli"""
+        maneuver = self.planner.plan(
+            self.start, self.end, is_free=lambda p: p[:, 0] <= 10.0, max_retreat=3.0
+        )
+
+        self.assertNotEqual(maneuver.kind, "pivot")
+        self.assertGreater(maneuver.retreat, 0.0)
+        self.assertLessEqual(maneuver.points[:, 0].max(), 10.0)
+
+    def test_pivot_fallback(self):
+        """Hiçbir manevra sığmıyorsa yerinde dönüş"""
+        maneuver = self.planner.plan(
+            self.start, self.end, is_free=lambda p: p[:, 0] <= 9.8
+        )
+
+        self.assertEqual(maneuver.kind, "pivot")
+        self.assertAlmostEqual(maneuver.length, 0.45)
+        # 2 x 90 derece yerinde dönüş + yanal hareket
+        self.assertAlmostEqual(maneuver.duration, 0.45 / 0.25 + math.pi, places=6)
+
+
+if __name__ == "__main__":
+    # Test suite oluştur
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+
+    # Test sınıflarını ekle
+    test_classes = [
+        TestDubins,
+        TestTurnFeasibility,
+    ]
+
+    for test_class in test_classes:
+        tests = loader.loadTestsFromTestCase(test_class)
+        suite.addTests(tests)
+
+    # Test runner
+    runner = unittest.TextTestRunner(verbosity=2, descriptions=True, failfast=False)
+
+    print("↩️  Turn Planner Test Suite Başlatılıyor...")
+    print("=" * 60)
+
+    result = runner.run(suite)
+
+    print("=" * 60)
+    print(f"✅ Başarılı: {result.testsRun - len(result.failures) - len(result.errors)}")
+    print(f"❌ Başarısız: {len(result.failures)}")
+    print(f"⚠️  Hata: {len(result.errors)}")
+
+    if result.wasSuccessful():
+        print("🎉 Tüm testler başarılı!")
+        sys.exit(0)
+    else:
+        print("💥 Bazı testler başarısız!")
+        sys.exit(1)
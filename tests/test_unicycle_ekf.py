@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Unicycle EKF Test Suite
+Enkoder artışlarıyla sürülen EKF modeli, Jacobian ve sürüklenme testleri
+"""
+
+import unittest
+import sys
+import math
+from pathlib import Path
+
+import numpy as np
+
+# Proje kök dizinini path'e ekle
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.navigation.unicycle_ekf import UnicycleEKF, unicycle_motion
+
+
+def _numerical_jacobians(state, dl, dr, wheel_base, dt, eps=1e-7):
+    """unicycle_motion'ın durum ve girdiye göre sayısal türevleri"""
+
+    def f(s, left, right):
+        return np.array(unicycle_motion(s[0], s[1], s[2], left, right, wheel_base, dt))
+
+    F = np.zeros((5, 5))
+    for i in range(5):
+        step = np.zeros(5)
+        step[i] = eps
+        F[:, i] = (f(state + step, dl, dr) - f(state - step, dl, dr)) / (2 * eps)
+    G = np.stack(
+        (
+            (f(state, dl + eps, dr) - f(state, dl - eps, dr)) / (2 * eps),
+            (f(state, dl, dr + eps) - f(state, dl, dr - eps)) / (2 * eps),
+        ),
+        axis=1,
+    )
+    return F, G
+
+
+class TestUnicycleModel(unittest.TestCase):
+    """Hareket modeli ve kovaryans yayılımı testleri"""
+
+    def setUp(self):
+        self.ekf = UnicycleEKF(simulate=True)
+
+    def test_straight_and_turn(self):
+        """Düz gidiş ve yerinde dönüş"""
+        self.ekf.predict_motion(0.1, 0.1, 0.2)
+        self.assertAlmostEqual(self.ekf.state[0], 0.1)
+        self.assertAlmostEqual(self.ekf.state[3], 0.5)
+
+        self.ekf.predict_motion(-0.05, 0.05, 0.2)
+        self.assertAlmostEqual(self.ekf.state[0], 0.1)
+        self.assertAlmostEqual(self.ekf.state[2], 0.2)
+        self.assertAlmostEqual(self.ekf.state[3], 0.0)
+        self.assertAlmostEqual(self.ekf.state[4], 1.0)
+
+    def test_covariance_matches_jacobians(self):
+        """P, sayısal Jacobian'larla hesaplanan F P Fᵀ + G U Gᵀ + Q dt olmalı"""
+        rng = np.random.default_rng(5)
+        A = rng.normal(size=(5, 5))
+        self.ekf.P[...] = A @ A.T * 0.01 + np.eye(5) * 0.001
+        self.ekf.state[:] = [1.0, -2.0, 0.7, 0.3, 0.1]
+        state, P = self.ekf.state.copy(), self.ekf.P.copy()
+        dl, dr, dt = 0.04, 0.06, 0.1
+
+        F, G = _numerical_jacobians(state, dl, dr, self.ekf.wheel_base, dt)
+        U = np.diag([self.ekf.wheel_noise * dl, self.ekf.wheel_noise * dr])
+        expected = F @ P @ F.T + G @ U @ G.T + self.ekf.Q * dt
+
+        buffer = self.ekf.P
+        self.ekf.predict_motion(dl, dr, dt)
+
+        np.testing.assert_allclose(self.ekf.P, expected, atol=1e-8)
+        self.assertIs(self.ekf.P, buffer)
+
+    def test_time_prediction(self):
+        """Enkodersiz tahmin sabit hız ve açısal hızla ilerlemeli"""
+        self.ekf.state[:] = [0.0, 0.0, 0.0, 1.0, 0.5]
+        predicted = self.ekf.predict_state(0.1)
+
+        self.assertGreater(predicted["x"], 0)
+        self.assertAlmostEqual(predicted["heading"], 0.05)
+        self.assertEqual(self.ekf.state[0], 0.0)
+
+
+class TestUnicycleMeasurements(unittest.TestCase):
+    """IMU ve jiroskop ölçüm testleri"""
+
+    def setUp(self):
+        self.ekf = UnicycleEKF(simulate=True)
+
+    def test_gyro_is_measurement(self):
+        """Jiroskop hızı durumu doğrudan yazmamalı, filtrelemeli"""
+        self.ekf.update_imu(0.0, 0.5)
+        omega = self.ekf.state[4]
+
+        self.assertGreater(omega, 0.0)
+        self.assertLess(omega, 0.5)
+        self.assertLess(self.ekf.P[4, 4], 0.1)
+
+    def test_interface(self):
+        """KalmanOdometry arayüzü çalışmalı"""
+        self.ekf.predict_motion(0.1, 0.12, 0.1)
+        stats = self.ekf.get_statistics()
+
+        self.assertIn("velocity", stats)
+        self.assertAlmostEqual(self.ekf.get_velocity()["linear"], 1.1)
+        self.assertEqual(
+            set(self.ekf.get_position_dict()), {"x", "y", "heading", "timestamp"}
+        )
+
+        self.ekf.set_position(1.0, 2.0, 0.5)
+        self.assertEqual(self.ekf.P.shape, (5, 5))
+        self.assertEqual(self.ekf.get_position().y, 2.0)
+
+
+class TestDrift(unittest.TestCase):
+    """Uzun süreli sürüklenme testi"""
+
+    def test_lawn_pattern_drift(self):
+        """10 dakikalık biçme deseninde hata 1 m altında, kovaryans çökmemeli"""
+        ekf = UnicycleEKF(simulate=True)
+        ekf.P[...] = np.eye(5) * 1e-6
+        rng = np.random.default_rng(11)
+        b, dt = ekf.wheel_base, 0.05
+        x = y = theta = 0.0
+
+        for step in range(12000):
+            # 20 m şerit, ardından yarım tur dönüş
+            phase = step % 600
+            v, omega = (0.5, 0.0) if phase < 480 else (0.25, math.pi / 6)
+            if (step // 600) % 2:
+                omega = -omega
+            dl = (v - omega * b / 2) * dt
+            dr = (v + omega * b / 2) * dt
+
+            # Gerçek hareket, sonra kaymalı enkoder okumaları
+            x, y, theta, _, _ = unicycle_motion(x, y, theta, dl, dr, b, dt)
+            noise = rng.normal(0, np.sqrt(ekf.wheel_noise * np.abs([dl, dr])))
+            ekf.predict_motion(dl + noise[0], dr + noise[1], dt)
+            ekf.update_imu(theta + rng.normal(0, 0.01), omega + rng.normal(0, 0.01))
+
+        error = math.hypot(ekf.state[0] - x, ekf.state[1] - y)
+        sigma = math.sqrt(np.trace(ekf.P[:2, :2]))
+
+        self.assertLess(error, 1.0)
+        # Konum ölçümü yok: belirsizlik kat edilen yolla büyümeli ve hatayı kapsamalı
+        self.assertGreater(sigma, 0.05)
+        self.assertLess(error, 4 * sigma)
+
+
+if __name__ == "__main__":
+    # Test suite oluştur
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+
+    # Test sınıflarını ekle
+    test_classes = [
+        TestUnicycleModel,
+        TestUnicycleMeasurements,
+        TestDrift,
+    ]
+
+    for test_class in test_classes:
+        tests = loader.loadTestsFromTestCase(test_class)
+        suite.addTests(tests)
+
+    # Test runner
+    runner = unittest.TextTestRunner(verbosity=2, descriptions=True, failfast=False)
+
+    print("🟪 Unicycle EKF Test Suite Başlatılıyor...")
+    print("=" * 60)
+
+    result = runner.run(suite)
+
+    print("=" * 60)
+    print(f"✅ Başarılı: {result.testsRun - len(result.failures) - len(result.errors)}")
+    print(f"❌ Başarısız: {len(result.failures)}")
+    print(f"⚠️  Hata: {len(result.errors)}")
+
+    if result.wasSuccessful():
+        print("🎉 Tüm testler başarılı!")
+        sys.exit(0)
+    else:
+        print("💥 Bazı testler başarısız!")
+        sys.exit(1)